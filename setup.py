@@ -100,6 +100,7 @@ setup(
         "pyarrow>=5.0.0",
         "pyscal>=0.7.5",
         "scipy>=1.2",
+        "segyio>=1.8",
         "statsmodels>=0.12.1",  # indirect dependency through https://plotly.com/python/linear-fits/
         "webviz-config>=0.3.8",
         "webviz-core-components>=0.5.6",
@@ -0,0 +1,117 @@
+import os
+import weakref
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xtgeo
+
+from webviz_subsurface._datainput.seismic_slice_engine import (
+    MAX_SHARED_SLICE_ENGINES,
+    SeismicSliceEngine,
+    _index_of,
+    get_seismic_slice_engine,
+)
+
+
+@pytest.fixture(name="cube_path")
+def fixture_cube_path(tmp_path: Path) -> Path:
+    values = np.random.default_rng(0).random((6, 5, 8), dtype=np.float32)
+    cube = xtgeo.Cube(
+        ncol=6,
+        nrow=5,
+        nlay=8,
+        xinc=12.5,
+        yinc=12.5,
+        zinc=4.0,
+        zori=1000.0,
+        values=values,
+    )
+    cube.ilines = np.arange(10, 16)
+    cube.xlines = np.arange(100, 105)
+    cube_path = tmp_path / "cube.segy"
+    cube.to_file(cube_path)
+    return cube_path
+
+
+def test_slices_equal_xtgeo_cube_slices(cube_path: Path) -> None:
+    cube = xtgeo.cube_from_file(cube_path)
+    engine = SeismicSliceEngine(cube_path)
+
+    assert np.array_equal(engine.ilines, cube.ilines)
+    assert np.array_equal(engine.xlines, cube.xlines)
+    assert np.allclose(engine.zslices, cube.zslices)
+
+    assert np.array_equal(engine.get_iline(12), cube.values[2, :, :].T)
+    assert np.array_equal(engine.get_xline(103), cube.values[:, 3, :].T)
+    assert np.array_equal(engine.get_zslice(1008.0), cube.values[:, :, 2].T)
+    assert engine.value_range() == (
+        pytest.approx(float(cube.values.min())),
+        pytest.approx(float(cube.values.max())),
+    )
+
+    with pytest.raises(ValueError):
+        engine.get_iline(99)
+
+
+def test_slices_are_cached_and_neighbours_prefetched(cube_path: Path) -> None:
+    engine = SeismicSliceEngine(cube_path, num_prefetch_lines=1)
+
+    iline = engine.get_iline(12)
+    assert not iline.flags.writeable
+    engine.wait_for_prefetch()
+    assert engine.cache.counters.misses == 1
+
+    # The neighbouring lines have been read in the background
+    engine.get_iline(11)
+    engine.get_iline(13)
+    assert engine.cache.counters.hits == 2
+    assert engine.get_iline(12) is iline
+
+
+def test_lookup_of_large_line_numbers_is_exact() -> None:
+    lines = np.array([100000, 100001, 100002])
+    assert _index_of(lines, 100001) == 1
+    with pytest.raises(ValueError):
+        _index_of(lines, 100003)
+
+    zslices = np.array([1000.0, 1004.0, 1008.0])
+    assert _index_of(zslices, 1004.0 + 1e-6, atol=1e-3) == 1
+    with pytest.raises(ValueError):
+        _index_of(zslices, 1004.1, atol=1e-3)
+
+
+def test_closed_engine_serves_cached_slices_only(cube_path: Path) -> None:
+    engine = SeismicSliceEngine(cube_path, num_prefetch_lines=0)
+    iline = engine.get_iline(12)
+    assert not engine.closed
+
+    engine.close()
+    assert engine.closed
+    assert engine.get_iline(12) is iline
+    with pytest.raises(ValueError):
+        engine.get_iline(13)
+
+    # Closing again is a no-op
+    engine.close()
+
+
+def test_evicted_shared_engines_are_released(cube_path: Path) -> None:
+    get_seismic_slice_engine.cache.clear()
+    engine = get_seismic_slice_engine(cube_path)
+    assert get_seismic_slice_engine(cube_path) is engine
+    engine.get_iline(12)
+    engine.wait_for_prefetch()
+    engine_ref = weakref.ref(engine)
+    del engine
+
+    # Each rewrite of the file gives a new engine, the oldest one is evicted
+    stat = cube_path.stat()
+    for rewrite in range(1, MAX_SHARED_SLICE_ENGINES + 1):
+        mtime_ns = stat.st_mtime_ns + rewrite * 1_000_000_000
+        os.utime(cube_path, ns=(stat.st_atime_ns, mtime_ns))
+        assert get_seismic_slice_engine(cube_path) is not engine_ref()
+
+    # Released, so the file is closed and the prefetch thread stopped
+    assert engine_ref() is None
+    assert get_seismic_slice_engine.cache.counters.evictions == 1
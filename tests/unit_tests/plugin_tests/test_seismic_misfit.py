@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from webviz_subsurface.plugins._seismic_misfit import (
+    map_plot_ens_data,
+    update_obs_sim_map_plot,
+)
+
+
+def _create_df(num_points: int = 40, num_reals: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed=0)
+    df = pd.DataFrame(
+        {
+            "ENSEMBLE": ["iter-0"] * num_points,
+            "region": rng.integers(1, 3, size=num_points),
+            "east": rng.uniform(0, 1000, size=num_points),
+            "north": rng.uniform(0, 1000, size=num_points),
+            "obs": rng.normal(size=num_points),
+            "obs_error": rng.uniform(0.1, 0.5, size=num_points),
+        }
+    )
+    for real in range(num_reals):
+        df[f"real-{real}"] = df["obs"] + rng.normal(size=num_points)
+    return df
+
+
+def test_map_plot_ens_data_is_memoized() -> None:
+    df = _create_df()
+    ensdf, ensdf_stat = map_plot_ens_data(df, "iter-0", [1], [0, 2])
+    assert ensdf["region"].eq(1).all()
+    assert [col for col in ensdf if col.startswith("real-")] == ["real-0", "real-2"]
+    assert len(ensdf_stat) == len(ensdf)
+
+    # Same selection, e.g. when zooming the maps, reuses the statistics
+    assert map_plot_ens_data(df, "iter-0", [1], [0, 2])[1] is ensdf_stat
+    assert map_plot_ens_data(df, "iter-0", [1, 2], [0, 2])[1] is not ensdf_stat
+
+
+def test_map_plot_without_slice() -> None:
+    ensdf, ensdf_stat = map_plot_ens_data(_create_df(), "iter-0", [1, 2], [0, 1, 2])
+    fig_maps, fig_slice = update_obs_sim_map_plot(
+        ensdf,
+        ensdf_stat,
+        "iter-0",
+        df_polygon=pd.DataFrame(),
+        obs_range=[-3.0, 3.0],
+        include_slice=False,
+    )
+    assert fig_maps is not None
+    assert fig_slice is None
+
+    _, fig_slice = update_obs_sim_map_plot(
+        ensdf, ensdf_stat, "iter-0", df_polygon=pd.DataFrame(), obs_range=[-3.0, 3.0]
+    )
+    assert fig_slice is not None
@@ -6,6 +6,7 @@ from pandas._testing import assert_frame_equal
 from webviz_subsurface._datainput.well_completions import remove_invalid_colors
 from webviz_subsurface.plugins._well_completions._business_logic import (
     extract_stratigraphy,
+    extract_wells,
     merge_compdat_and_connstatus,
 )
 
@@ -156,3 +157,69 @@ def test_merge_compdat_and_connstatus():
     assert_frame_equal(
         df_result, df_output, check_like=True
     )  # Ignore order of rows and columns
+
+
+def test_extract_wells():
+    """Checks the completion time series, where the events for each realization and
+    zone are carried forward in time, and KH is the sum over the open connections.
+    Well A2 is only present in realization 1, so its min/max only includes that
+    realization, while the fractions and the mean are over all realizations.
+    """
+    time_steps = ["2020-01-01", "2020-02-01", "2020-03-01"]
+    df = pd.DataFrame(
+        data={
+            "REAL": [0, 0, 0, 0, 1, 1],
+            "DATE": [
+                "2020-01-01",
+                "2020-01-01",
+                "2020-03-01",
+                "2020-02-01",
+                "2020-02-01",
+                "2020-01-01",
+            ],
+            "WELL": ["A1", "A1", "A1", "A1", "A1", "A2"],
+            "ZONE": ["Z1", "Z1", "Z1", "Z2", "Z1", "Z2"],
+            "OP/SH": ["OPEN", "OPEN", "SHUT", "SHUT", "OPEN", "OPEN"],
+            "KH": [10.0, 20.0, 30.0, 40.0, np.nan, 50.0],
+        }
+    )
+
+    wells = extract_wells(df, ["Z1", "Z2"], time_steps, [0, 1], {"A2": {"x": 1}})
+    assert wells == [
+        {
+            "name": "A1",
+            "completions": {
+                "Z1": {
+                    "t": [0, 1, 2],
+                    "open": [0.5, 1.0, 0.5],
+                    "shut": [0.0, 0.0, 0.5],
+                    "khMean": [15.0, 15.0, 0.0],
+                    "khMin": [0.0, 0.0, 0.0],
+                    "khMax": [30.0, 30.0, 0.0],
+                },
+                "Z2": {
+                    "t": [1],
+                    "open": [0.0],
+                    "shut": [0.5],
+                    "khMean": [0.0],
+                    "khMin": [0.0],
+                    "khMax": [0.0],
+                },
+            },
+            "attributes": {},
+        },
+        {
+            "name": "A2",
+            "completions": {
+                "Z2": {
+                    "t": [0],
+                    "open": [0.5],
+                    "shut": [0.0],
+                    "khMean": [25.0],
+                    "khMin": [50.0],
+                    "khMax": [50.0],
+                },
+            },
+            "attributes": {"x": 1},
+        },
+    ]
@@ -1,16 +1,24 @@
 import datetime
 import os
+import shutil
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from fmu.ensemble import ScratchEnsemble
+from pyarrow import feather
 
 from webviz_subsurface._providers import (
     EnsembleSummaryProviderFactory,
     Frequency,
     VectorMetadata,
 )
+from webviz_subsurface._providers.ensemble_summary_provider._csv_import import (
+    load_per_real_csv_files,
+)
+from webviz_subsurface._providers.provider_warmup import ProviderWarmUp
 
 
 # Helper function for generating per-realization CSV files based on aggregated CSV file
@@ -247,3 +255,117 @@ def test_create_from_ensemble_csv(testdata_folder: Path, tmp_path: Path) -> None
     assert vecdf.shape == (38, 3)
     assert vecdf.columns.tolist() == ["DATE", "REAL", "FOPR"]
     assert vecdf["REAL"].nunique() == 1
+
+
+def _write_synthetic_arrow_unsmry_file(
+    ens_root: Path, real: int, values: List[float]
+) -> None:
+    dates = [np.datetime64(f"2020-01-0{day + 1}", "ms") for day in range(len(values))]
+    table = pa.table(
+        {
+            "DATE": pa.array(dates, type=pa.timestamp("ms")),
+            "FOPT": pa.array(values, type=pa.float64()),
+        }
+    )
+    folder = ens_root / f"realization-{real}" / "iter-0" / "share/results/unsmry"
+    os.makedirs(folder, exist_ok=True)
+    feather.write_feather(table, folder / "DROGON.arrow")
+
+
+def test_arrow_unsmry_lazy_reimports_changed_realizations(tmp_path: Path) -> None:
+    ens_root = tmp_path / "ensemble"
+    ens_path = str(ens_root / "realization-*/iter-0")
+    for real in range(3):
+        _write_synthetic_arrow_unsmry_file(ens_root, real, [real, real + 1.0])
+
+    factory = EnsembleSummaryProviderFactory(
+        tmp_path / "storage", allow_storage_writes=True
+    )
+    provider = factory.create_from_arrow_unsmry_lazy(
+        ens_path=ens_path, rel_file_pattern="share/results/unsmry/*.arrow"
+    )
+    assert provider.realizations() == [0, 1, 2]
+
+    # Rerun realization 1 and remove realization 2
+    _write_synthetic_arrow_unsmry_file(ens_root, 1, [100.0, 101.0, 102.0])
+    shutil.rmtree(ens_root / "realization-2")
+
+    provider = factory.create_from_arrow_unsmry_lazy(
+        ens_path=ens_path, rel_file_pattern="share/results/unsmry/*.arrow"
+    )
+    assert provider.realizations() == [0, 1]
+    vecdf = provider.get_vectors_df(["FOPT"], resampling_frequency=None)
+    assert vecdf["REAL"].tolist() == [0, 0, 1, 1, 1]
+    assert vecdf["FOPT"].tolist() == [0.0, 1.0, 100.0, 101.0, 102.0]
+
+
+def test_create_same_lazy_provider_concurrently(tmp_path: Path) -> None:
+    ens_root = tmp_path / "ensemble"
+    ens_path = str(ens_root / "realization-*/iter-0")
+    for real in range(3):
+        _write_synthetic_arrow_unsmry_file(ens_root, real, [real, real + 1.0])
+
+    # Multiple ensembles referring to the same data share the backing store
+    factory = EnsembleSummaryProviderFactory(
+        tmp_path / "storage", allow_storage_writes=True
+    )
+    provider_dict = ProviderWarmUp(max_workers=8).create_concurrently(
+        "Lazy providers",
+        {
+            f"ens-{idx}": lambda: factory.create_from_arrow_unsmry_lazy(
+                ens_path=ens_path, rel_file_pattern="share/results/unsmry/*.arrow"
+            )
+            for idx in range(8)
+        },
+    )
+
+    for provider in provider_dict.values():
+        assert provider.realizations() == [0, 1, 2]
+        vecdf = provider.get_vectors_df(["FOPT"], resampling_frequency=None)
+        assert vecdf["FOPT"].tolist() == [0.0, 1.0, 1.0, 2.0, 2.0, 3.0]
+
+
+def test_create_from_per_realization_csv_files_in_parallel(tmp_path: Path) -> None:
+    ens_root = tmp_path / "ensemble"
+    for real in [0, 1, 5]:
+        folder = ens_root / f"realization-{real}" / "iter-0"
+        os.makedirs(folder)
+        pd.DataFrame(
+            {"DATE": ["2020-01-01", "2020-02-01"], "FOPT": [real, real + 1.0]}
+        ).to_csv(folder / "smry.csv", index=False)
+
+    factory = EnsembleSummaryProviderFactory(
+        tmp_path / "storage", allow_storage_writes=True, max_import_workers=2
+    )
+    provider = factory.create_from_per_realization_csv_file(
+        str(ens_root / "realization-*/iter-0"), "smry.csv"
+    )
+    assert provider.realizations() == [0, 1, 5]
+
+    vecdf = provider.get_vectors_df(["FOPT"], None, realizations=[5])
+    assert vecdf["FOPT"].tolist() == [5.0, 6.0]
+
+
+def test_load_per_real_csv_files_matches_fmu(tmp_path: Path) -> None:
+    ens_root = tmp_path / "ensemble"
+    for real in [0, 1, 3, 10]:
+        folder = ens_root / f"realization-{real}" / "iter-0" / "share"
+        os.makedirs(folder)
+        # Realization 1 has not produced the file
+        if real != 1:
+            pd.DataFrame(
+                {
+                    "DATE": ["2020-01-01", "2020-02-01"],
+                    "FOPT": [real, real + 0.5],
+                    "WELL": ["A", "B"],
+                }
+            ).to_csv(folder / "smry.csv", index=False)
+
+    ens_path = str(ens_root / "realization-*/iter-0")
+    df = load_per_real_csv_files(ens_path, "share/smry.csv", max_workers=2)
+    assert df["REAL"].tolist() == [0, 0, 3, 3, 10, 10]
+
+    # Same data as fmu-ensemble, which does not sort on REAL
+    fmu_df = ScratchEnsemble("tempEnsName", paths=ens_path).load_csv("share/smry.csv")
+    fmu_df = fmu_df.sort_values("REAL", kind="stable").reset_index(drop=True)
+    pd.testing.assert_frame_equal(df, fmu_df)
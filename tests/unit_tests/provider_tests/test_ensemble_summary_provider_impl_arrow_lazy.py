@@ -387,3 +387,161 @@ def test_create_with_repeated_dates(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError):
         _create_provider_obj_with_data(input_data, tmp_path)
+
+
+def test_backing_store_has_one_batch_per_realization(tmp_path: Path) -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                            "REAL",  "A",   "B"],
+        [np.datetime64("2023-12-20", "ms"),  2,      20.0,  21.0],
+        [np.datetime64("2023-12-21", "ms"),  2,      22.0,  23.0],
+        [np.datetime64("2023-12-20", "ms"),  0,      0.0,   1.0],
+        [np.datetime64("2023-12-20", "ms"),  1,      10.0,  11.0],
+        [np.datetime64("2023-12-21", "ms"),  1,      12.0,  13.0],
+    ]
+    # fmt:on
+    _create_provider_obj_with_data(input_data, tmp_path)
+
+    source = pa.memory_map(str(tmp_path / "dummy_key.arrow"), "r")
+    reader = pa.ipc.RecordBatchFileReader(source)
+    assert reader.num_record_batches == 3
+    for batch_idx, expected_real in enumerate([0, 1, 2]):
+        batch_reals = reader.get_batch(batch_idx).column(0).unique().to_pylist()
+        assert batch_reals == [expected_real]
+
+
+def test_get_vectors_for_subset_of_realizations(tmp_path: Path) -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                            "REAL",  "A",   "B"],
+        [np.datetime64("2023-12-20", "ms"),  0,      0.0,   1.0],
+        [np.datetime64("2023-12-20", "ms"),  1,      10.0,  11.0],
+        [np.datetime64("2023-12-21", "ms"),  1,      12.0,  13.0],
+        [np.datetime64("2023-12-20", "ms"),  2,      20.0,  21.0],
+        [np.datetime64("2023-12-21", "ms"),  2,      22.0,  23.0],
+    ]
+    # fmt:on
+    provider = _create_provider_obj_with_data(input_data, tmp_path)
+    assert provider.realizations() == [0, 1, 2]
+
+    vecdf = provider.get_vectors_df(
+        ["B"], resampling_frequency=None, realizations=[2, 0]
+    )
+    assert vecdf.columns.tolist() == ["DATE", "REAL", "B"]
+    assert vecdf["REAL"].tolist() == [0, 2, 2]
+    assert vecdf["B"].tolist() == [1.0, 21.0, 23.0]
+
+    vecdf = provider.get_vectors_df(
+        ["A"], resampling_frequency=None, realizations=[1, 99]
+    )
+    assert vecdf["REAL"].tolist() == [1, 1]
+    assert vecdf["A"].tolist() == [10.0, 12.0]
+
+    vecdf = provider.get_vectors_df(["A"], resampling_frequency=None, realizations=[99])
+    assert vecdf.shape == (0, 3)
+    assert vecdf.columns.tolist() == ["DATE", "REAL", "A"]
+
+
+def test_read_backing_store_without_batch_index(tmp_path: Path) -> None:
+    table = pa.Table.from_pydict(
+        {
+            "REAL": pa.array([0, 1, 1], pa.int32()),
+            "DATE": pa.array(
+                [
+                    np.datetime64("2023-12-20", "ms"),
+                    np.datetime64("2023-12-20", "ms"),
+                    np.datetime64("2023-12-21", "ms"),
+                ],
+                pa.timestamp("ms"),
+            ),
+            "A": [10.0, 12.0, 13.0],
+        }
+    )
+    with pa.OSFile(str(tmp_path / "no_index_key.arrow"), "wb") as sink:
+        with pa.RecordBatchFileWriter(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    provider = ProviderImplArrowLazy.from_backing_store(tmp_path, "no_index_key")
+    assert provider is not None
+    assert provider.realizations() == [0, 1]
+
+    vecdf = provider.get_vectors_df(["A"], resampling_frequency=None, realizations=[1])
+    assert vecdf["REAL"].tolist() == [1, 1]
+    assert vecdf["A"].tolist() == [12.0, 13.0]
+
+
+def test_write_backing_store_from_stream_with_differing_columns(
+    tmp_path: Path,
+) -> None:
+    dates = pa.array(
+        [np.datetime64("2020-01-01", "ms"), np.datetime64("2020-01-02", "ms")],
+        pa.timestamp("ms"),
+    )
+    table_a = pa.table({"DATE": dates, "A": [1.0, 2.0]})
+    table_ab = pa.table({"DATE": dates, "B": [30.0, 40.0], "A": [3.0, 4.0]})
+    unified_schema = pa.unify_schemas([table_a.schema, table_ab.schema])
+
+    # Realizations arrive out of order, as they would from a parallel import
+    ProviderImplArrowLazy.write_backing_store_from_per_realization_table_stream(
+        tmp_path, "stream_key", unified_schema, iter([(7, table_ab), (2, table_a)])
+    )
+    # The backing store itself must be sorted on REAL
+    with pa.memory_map(str(tmp_path / "stream_key.arrow"), "r") as source:
+        stored_table = pa.ipc.RecordBatchFileReader(source).read_all()
+    assert stored_table["REAL"].to_pylist() == [2, 2, 7, 7]
+
+    provider = ProviderImplArrowLazy.from_backing_store(tmp_path, "stream_key")
+    assert provider is not None
+    assert provider.realizations() == [2, 7]
+    assert provider.vector_names() == ["A", "B"]
+
+    vecdf = provider.get_vectors_df(["A", "B"], resampling_frequency=None)
+    assert vecdf["REAL"].tolist() == [2, 2, 7, 7]
+    assert vecdf["A"].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert vecdf["B"].isna().tolist() == [True, True, False, False]
+
+    assert provider.vector_names_filtered_by_value(exclude_constant_values=True) == [
+        "A",
+        "B",
+    ]
+
+
+def test_get_vectors_statistics_with_resampling(tmp_path: Path) -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                            "REAL",  "TOT_t",  "RATE_r"],
+        [np.datetime64("2020-01-01", "ms"),  1,      10.0,     1.0],
+        [np.datetime64("2020-01-03", "ms"),  1,      30.0,     3.0],
+        [np.datetime64("2020-01-01", "ms"),  2,      20.0,     2.0],
+        [np.datetime64("2020-01-03", "ms"),  2,      40.0,     4.0],
+        [np.datetime64("2020-01-01", "ms"),  3,      30.0,     5.0],
+        [np.datetime64("2020-01-02", "ms"),  3,      60.0,     6.0],
+    ]
+    # fmt:on
+    provider = _create_provider_obj_with_data(input_data, tmp_path)
+
+    statdf = provider.get_vectors_statistics_df(
+        ["TOT_t", "RATE_r"], resampling_frequency=Frequency.DAILY
+    )
+    vecdf = provider.get_vectors_df(
+        ["TOT_t", "RATE_r"], resampling_frequency=Frequency.DAILY
+    )
+
+    dates = sorted(vecdf["DATE"].unique())
+    assert statdf["DATE"].tolist() == dates
+    for vec_name in ["TOT_t", "RATE_r"]:
+        grouped = vecdf.groupby("DATE")[vec_name]
+        assert np.allclose(statdf[vec_name]["MEAN"], grouped.mean())
+        assert np.allclose(statdf[vec_name]["MIN"], grouped.min())
+        assert np.allclose(statdf[vec_name]["MAX"], grouped.max())
+        assert np.allclose(statdf[vec_name]["P10"], grouped.quantile(0.9))
+        assert np.allclose(statdf[vec_name]["P90"], grouped.quantile(0.1))
+        assert np.allclose(statdf[vec_name]["P50"], grouped.quantile(0.5))
+
+    # Realization 3 ends at 2020-01-02, so the last date only has 2 realizations
+    assert statdf["TOT_t"]["MEAN"].tolist()[-1] == 35.0
+
+    statdf = provider.get_vectors_statistics_df(
+        ["TOT_t"], resampling_frequency=None, realizations=[1, 2]
+    )
+    assert statdf["TOT_t"]["MEAN"].tolist() == [15.0, 35.0]
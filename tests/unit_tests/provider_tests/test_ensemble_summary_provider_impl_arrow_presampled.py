@@ -164,3 +164,52 @@ def test_get_vectors_for_date(provider: EnsembleSummaryProvider) -> None:
     vecdf = provider.get_vectors_for_date_df(date_to_get, ["A", "Z"])
     assert vecdf.shape == (1, 3)
     assert vecdf.columns.tolist() == ["REAL", "A", "Z"]
+
+
+def test_get_vectors_statistics(provider: EnsembleSummaryProvider) -> None:
+
+    # Served from the precomputed statistics
+    statdf = provider.get_vectors_statistics_df(["A", "C"], resampling_frequency=None)
+    assert statdf.shape == (2, 13)
+    assert statdf.columns.tolist()[0:7] == [
+        ("DATE", ""),
+        ("A", "MEAN"),
+        ("A", "MIN"),
+        ("A", "MAX"),
+        ("A", "P10"),
+        ("A", "P90"),
+        ("A", "P50"),
+    ]
+    assert isinstance(statdf["DATE"].iloc[0], datetime)
+    assert statdf["A"]["MEAN"].tolist() == [11.0, 13.0]
+    assert statdf["A"]["MIN"].tolist() == [10.0, 13.0]
+    assert statdf["A"]["MAX"].tolist() == [12.0, 13.0]
+    assert statdf["A"]["P10"].tolist() == pytest.approx([11.8, 13.0])
+    assert statdf["A"]["P90"].tolist() == pytest.approx([10.2, 13.0])
+    assert statdf["A"]["P50"].tolist() == [11.0, 13.0]
+    assert statdf["C"]["MEAN"].tolist() == [1.0, 1.0]
+
+    # Realization filter, computed on the fly
+    statdf = provider.get_vectors_statistics_df(
+        ["A"], resampling_frequency=None, realizations=[0]
+    )
+    assert statdf.shape == (1, 7)
+    assert statdf["A"]["MEAN"].tolist() == [10.0]
+    assert statdf["A"]["P10"].tolist() == [10.0]
+
+    # Filter that includes all realizations gives same result as no filter
+    statdf_all = provider.get_vectors_statistics_df(
+        ["A"], resampling_frequency=None, realizations=[0, 1]
+    )
+    statdf_none = provider.get_vectors_statistics_df(["A"], resampling_frequency=None)
+    pd.testing.assert_frame_equal(statdf_all, statdf_none)
+
+
+def test_default_get_vectors_statistics(provider: EnsembleSummaryProvider) -> None:
+    # The base class implementation, for providers without their own, must give
+    # the same result as the precomputed statistics
+    statdf_default = EnsembleSummaryProvider.get_vectors_statistics_df(
+        provider, ["A", "C"], resampling_frequency=None
+    )
+    statdf = provider.get_vectors_statistics_df(["A", "C"], resampling_frequency=None)
+    pd.testing.assert_frame_equal(statdf_default, statdf)
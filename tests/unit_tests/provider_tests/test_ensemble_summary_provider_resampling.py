@@ -5,7 +5,9 @@ from webviz_subsurface._providers.ensemble_summary_provider._resampling import (
     Frequency,
     generate_normalized_sample_dates,
     interpolate_backfill,
+    resample_segmented_multi_real_table,
     sample_segmented_multi_real_table_at_date,
+    sample_segmented_multi_real_table_at_dates,
 )
 
 
@@ -135,6 +137,52 @@ def test_interpolate_backfill() -> None:
     assert (y == expected_y).all()
 
 
+def test_resample_segmented_multi_real_table() -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                             "REAL",  "T",     "R"],
+        [np.datetime64("2020-01-01", "ms"),  0,       10.0,    1],
+        [np.datetime64("2020-01-04", "ms"),  0,       40.0,    4],
+        [np.datetime64("2020-01-06", "ms"),  0,       60.0,    6],
+        [np.datetime64("2020-01-03", "ms"),  1,       300.0,   30],
+        [np.datetime64("2020-01-02", "ms"),  2,       1000.0,  100],
+        [np.datetime64("2020-01-05", "ms"),  2,       4000.0,  400],
+    ]
+    # fmt:on
+
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int64()),
+            pa.field("T", pa.float32(), metadata={b"is_rate": b"False"}),
+            pa.field("R", pa.float32(), metadata={b"is_rate": b"True"}),
+        ]
+    )
+
+    table = _create_table_from_row_data(per_row_input_data=input_data, schema=schema)
+
+    res = resample_segmented_multi_real_table(table, Frequency.DAILY)
+    assert res.schema == schema
+    expected_dates = np.concatenate(
+        (
+            np.arange("2020-01-01", "2020-01-07", dtype="datetime64[D]"),
+            np.array(["2020-01-03"], dtype="datetime64[D]"),
+            np.arange("2020-01-02", "2020-01-06", dtype="datetime64[D]"),
+        )
+    )
+    assert (res["DATE"].to_numpy() == expected_dates).all()
+    assert res["REAL"].to_pylist() == [0] * 6 + [1] + [2] * 4
+    assert res["T"].to_pylist() == [10, 20, 30, 40, 50, 60, 300, 1000, 2000, 3000, 4000]
+    assert res["R"].to_pylist() == [1, 4, 4, 4, 6, 6, 30, 100, 400, 400, 400]
+
+    # Weekly sampling gives sample dates outside the raw date range for real 0,
+    # where non-rates are clamped to the first/last value and rates are 0
+    res = resample_segmented_multi_real_table(table, Frequency.WEEKLY)
+    assert res["REAL"].to_pylist() == [0, 0, 1, 1, 2, 2]
+    assert res["T"].to_pylist() == [10, 60, 300, 300, 1000, 4000]
+    assert res["R"].to_pylist() == [0, 6, 0, 0, 0, 0]
+
+
 def test_sample_segmented_multi_real_table_at_date_with_single_real() -> None:
     # pylint: disable=too-many-statements
     # fmt:off
@@ -323,3 +371,68 @@ def test_sample_segmented_multi_real_table_at_date() -> None:
     assert res["T"][1].as_py() == 3000
     assert res["R"][0].as_py() == 4
     assert res["R"][1].as_py() == 500
+
+
+def test_sample_segmented_multi_real_table_at_dates_vs_per_real_reference() -> None:
+    rng = np.random.default_rng(seed=1234)
+
+    # Realizations with varying date ranges, not ordered on REAL in the table
+    date_list = []
+    real_list = []
+    for real in [5, 1, 3, 0]:
+        num_dates = rng.integers(1, 10)
+        dates = np.datetime64("2020-01-01", "D") + np.sort(
+            rng.choice(30, size=num_dates, replace=False)
+        )
+        date_list.append(dates.astype("datetime64[ms]"))
+        real_list.append(np.full(num_dates, real))
+
+    dates_np = np.concatenate(date_list)
+    reals_np = np.concatenate(real_list)
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int64()),
+            pa.field("T", pa.float64(), metadata={b"is_rate": b"False"}),
+            pa.field("R", pa.float64(), metadata={b"is_rate": b"True"}),
+        ]
+    )
+    table = pa.table(
+        [
+            pa.array(dates_np),
+            pa.array(reals_np),
+            pa.array(rng.normal(size=len(dates_np))),
+            pa.array(rng.normal(size=len(dates_np))),
+        ],
+        schema=schema,
+    )
+
+    # Query dates before, inside, between and after the realizations' dates
+    query_dates = np.datetime64("2019-12-30", "ms") + np.arange(0, 35 * 24, 5).astype(
+        "timedelta64[h]"
+    )
+
+    res = sample_segmented_multi_real_table_at_dates(table, query_dates)
+    assert res.num_rows == len(query_dates) * 4
+
+    # Must give the same result as sampling one date at a time
+    single_date_tables = [
+        sample_segmented_multi_real_table_at_date(table, query_date)
+        for query_date in query_dates
+    ]
+    assert res.equals(pa.concat_tables(single_date_tables))
+
+    # Compare against plain interpolation of each realization separately
+    res_df = res.to_pandas()
+    for real in [0, 1, 3, 5]:
+        real_mask = reals_np == real
+        raw_x = dates_np[real_mask].astype(np.int64)
+        x = query_dates.astype(np.int64)
+        real_res_df = res_df[res_df["REAL"] == real]
+
+        expected_t = np.interp(x, raw_x, table["T"].to_numpy()[real_mask])
+        expected_r = interpolate_backfill(
+            x, raw_x, table["R"].to_numpy()[real_mask], 0, 0
+        )
+        np.testing.assert_allclose(real_res_df["T"].to_numpy(), expected_t)
+        np.testing.assert_allclose(real_res_df["R"].to_numpy(), expected_r)
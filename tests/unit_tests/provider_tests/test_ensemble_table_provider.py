@@ -167,3 +167,95 @@ def test_create_from_per_realization_csv_file(
     assert valdf["REAL"].unique() == [2]
     assert valdf["CONIDX"].nunique() == 24
     assert sorted(valdf["CONIDX"].unique()) == list(range(1, 25))
+
+
+def test_get_filtered_column_data(tmp_path: Path) -> None:
+    # fmt: off
+    input_data = [
+        ["REAL", "ZONE",  "REGION", "SOURCE", "STOIIP", "BULK"],
+        [     0, "Upper",        1,  "geo",     10.0,    100.0],
+        [     0, "Upper",        2,  "geo",     20.0,    200.0],
+        [     0, "Lower",        1,  "geo",     30.0,    300.0],
+        [     0, "Lower",        1,  "sim",     31.0,    310.0],
+        [     1, "Upper",        1,  "geo",     11.0,    110.0],
+        [     1, "Lower",        2,  "geo",     41.0,    410.0],
+        [     2, "Lower",        2,  "geo",     42.0,    420.0],
+    ]
+    # fmt: on
+    input_df = pd.DataFrame(input_data[1:], columns=input_data[0])
+
+    EnsembleTableProviderImplArrow.write_backing_store_from_ensemble_dataframe(
+        tmp_path, "arrow_key", input_df
+    )
+    EnsembleTableProviderImplInMemParquet.write_backing_store_from_ensemble_dataframe(
+        tmp_path, "parquet_key", input_df
+    )
+    arrow_provider = EnsembleTableProviderImplArrow.from_backing_store(
+        tmp_path, "arrow_key"
+    )
+    parquet_provider = EnsembleTableProviderImplInMemParquet.from_backing_store(
+        tmp_path, "parquet_key"
+    )
+    assert arrow_provider is not None and parquet_provider is not None
+
+    for provider in [arrow_provider, parquet_provider]:
+        df = provider.get_filtered_column_data(
+            ["STOIIP"], selector_filters={"SOURCE": "geo", "REGION": [2]}
+        )
+        assert df.columns.tolist() == ["REAL", "STOIIP"]
+        assert df["REAL"].tolist() == [0, 1, 2]
+        assert df["STOIIP"].tolist() == [20.0, 41.0, 42.0]
+
+        df = provider.get_filtered_column_data(
+            ["STOIIP", "BULK"],
+            realizations=[0, 1],
+            selector_filters={"SOURCE": ["geo"]},
+            groupby_sum=["REAL", "ZONE"],
+        )
+        assert df.columns.tolist() == ["REAL", "ZONE", "STOIIP", "BULK"]
+        assert df.values.tolist() == [
+            [0, "Lower", 30.0, 300.0],
+            [0, "Upper", 30.0, 300.0],
+            [1, "Lower", 41.0, 410.0],
+            [1, "Upper", 11.0, 110.0],
+        ]
+
+        df = provider.get_filtered_column_data(
+            ["STOIIP"], selector_filters={"ZONE": "Nonexisting"}, groupby_sum=["REAL"]
+        )
+        assert df.columns.tolist() == ["REAL", "STOIIP"]
+        assert df.empty
+
+
+def test_compact_arrow_backing_store(tmp_path: Path) -> None:
+    input_df = pd.DataFrame(
+        {
+            "REAL": [0, 0, 1, 1],
+            "ZONE": ["Upper", "Lower", "Upper", "Lower"],
+            "WELL": ["A-1", "A-2", "A-3", "A-4"],
+            "STOIIP": [0.5, 1.25, 1.0e6, float("nan")],
+            "HUGE": [1.0e300, 1.0, 2.0, 3.0],
+        }
+    )
+    EnsembleTableProviderImplArrow.write_backing_store_from_ensemble_dataframe(
+        tmp_path, "compact_key", input_df, compact=True
+    )
+    provider = EnsembleTableProviderImplArrow.from_backing_store(
+        tmp_path, "compact_key"
+    )
+    assert provider is not None
+
+    df = provider.get_column_data(["ZONE", "WELL", "STOIIP", "HUGE"])
+    assert isinstance(df["ZONE"].dtype, pd.CategoricalDtype)
+    assert df["ZONE"].tolist() == input_df["ZONE"].tolist()
+    # All values unique, so not dictionary encoded
+    assert df["WELL"].dtype == object
+    assert df["STOIIP"].dtype == "float32"
+    pd.testing.assert_series_equal(df["STOIIP"], input_df["STOIIP"], check_dtype=False)
+    # Not representable as float32
+    assert df["HUGE"].dtype == "float64"
+
+    df = provider.get_filtered_column_data(
+        ["STOIIP"], selector_filters={"ZONE": "Upper"}, groupby_sum=["ZONE"]
+    )
+    assert df.values.tolist() == [["Upper", 1000000.5]]
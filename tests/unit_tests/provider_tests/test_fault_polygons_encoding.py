@@ -0,0 +1,64 @@
+import json
+
+import numpy as np
+import pandas as pd
+import xtgeo
+
+from webviz_subsurface._providers.ensemble_fault_polygons_provider._fault_polygons_encoding import (
+    fault_polygons_to_geojson_bytes,
+    simplify_polyline,
+    simplify_polylines,
+)
+
+
+def test_simplify_polyline() -> None:
+    xy_arr = np.array([[0, 0], [1, 0.1], [2, -0.1], [3, 5], [4, 6], [5, 7], [6, 8.1]])
+
+    # Zero tolerance keeps all points
+    assert np.array_equal(simplify_polyline(xy_arr, 0), xy_arr)
+
+    res = simplify_polyline(xy_arr, 0.5)
+    assert np.array_equal(res, [[0, 0], [2, -0.1], [3, 5], [6, 8.1]])
+
+    # Closed polyline, where the segment between first and last point is degenerate
+    closed_xy_arr = np.array([[0, 0], [1, 0], [2, 0.1], [2, 2], [0, 2], [0, 0]])
+    res = simplify_polyline(closed_xy_arr, 0.5)
+    assert np.array_equal(res, [[0, 0], [2, 0.1], [2, 2], [0, 2], [0, 0]])
+
+
+def test_simplify_multiple_polylines_independently() -> None:
+    xy_list = [
+        np.array([[0, 0], [1, 0.1], [2, 0]]),
+        np.array([[10, 10]]),
+        np.array([[0, 0], [1, 3], [2, 0], [3, 0.1], [4, 0]]),
+    ]
+    start_indices = np.array([0, 3, 4])
+
+    keep = simplify_polylines(np.concatenate(xy_list), start_indices, 0.5)
+    assert keep.tolist() == [True, False, True, True, True, True, True, False, True]
+
+
+def test_fault_polygons_to_geojson_bytes() -> None:
+    dframe = pd.DataFrame(
+        {
+            "X_UTME": [0.0, 1, 1, 0, 0, 5, 6, 5],
+            "Y_UTMN": [0.0, 0, 1, 1, 0, 5, 5, 5],
+            "Z_TVDSS": [0.0] * 8,
+            "POLY_ID": [2, 2, 2, 2, 2, 1, 1, 1],
+        }
+    )
+    geojson_dict = json.loads(fault_polygons_to_geojson_bytes(xtgeo.Polygons(dframe)))
+
+    assert geojson_dict["type"] == "FeatureCollection"
+    features = geojson_dict["features"]
+    assert [feature["properties"]["name"] for feature in features] == ["id:1", "id:2"]
+    assert features[0]["geometry"] == {
+        "type": "Polygon",
+        "coordinates": [[[5.0, 5.0], [6.0, 5.0], [5.0, 5.0]]],
+    }
+    assert features[1]["geometry"]["coordinates"] == [
+        [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]]
+    ]
+
+    empty_dict = json.loads(fault_polygons_to_geojson_bytes(None))
+    assert empty_dict == {"type": "FeatureCollection", "features": []}
@@ -0,0 +1,62 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from webviz_subsurface._providers.provider_warmup import ProviderWarmUp
+
+
+def test_create_concurrently() -> None:
+    warm_up = ProviderWarmUp(max_workers=4)
+
+    thread_names: List[str] = []
+
+    def _create(value: int) -> int:
+        # Let the first one finish last
+        time.sleep(0.05 if value == 0 else 0.0)
+        thread_names.append(threading.current_thread().name)
+        return value * 10
+
+    created = warm_up.create_concurrently(
+        "test", {f"ens{i}": lambda i=i: _create(i) for i in range(4)}
+    )
+    assert list(created.items()) == [
+        ("ens0", 0),
+        ("ens1", 10),
+        ("ens2", 20),
+        ("ens3", 30),
+    ]
+    assert all(name.startswith("provider_warmup") for name in thread_names)
+
+    def _fail() -> int:
+        raise ValueError("Failed to create")
+
+    with pytest.raises(ValueError, match="Failed to create"):
+        warm_up.create_concurrently("test", {"ok": lambda: 1, "fail": _fail})
+
+
+def test_prefetch_jobs_start_after_plugin_init() -> None:
+    warm_up = ProviderWarmUp(max_workers=2)
+
+    prefetched: List[str] = []
+
+    def _fail() -> None:
+        raise RuntimeError("Prefetch failed")
+
+    warm_up.add_prefetch_job("a", lambda: prefetched.append("a"))
+    warm_up.add_prefetch_job("failing", _fail)
+    warm_up.wait_for_prefetch()
+    assert not prefetched
+
+    warm_up.cleanup_resources_after_plugin_init()
+    warm_up.add_prefetch_job("b", lambda: prefetched.append("b"))
+    warm_up.wait_for_prefetch(timeout=10)
+    assert sorted(prefetched) == ["a", "b"]
+
+    # Nothing should be run when prefetching is disabled
+    disabled_warm_up = ProviderWarmUp(prefetch=False)
+    disabled_warm_up.add_prefetch_job("c", lambda: prefetched.append("c"))
+    disabled_warm_up.cleanup_resources_after_plugin_init()
+    disabled_warm_up.wait_for_prefetch(timeout=10)
+    assert sorted(prefetched) == ["a", "b"]
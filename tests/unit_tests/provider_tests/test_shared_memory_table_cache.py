@@ -0,0 +1,155 @@
+import errno
+import os
+from pathlib import Path
+from typing import Any, List
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from webviz_subsurface._providers import shared_memory_table_cache
+from webviz_subsurface._providers.ensemble_summary_provider._provider_impl_arrow_lazy import (
+    ProviderImplArrowLazy,
+)
+from webviz_subsurface._providers.ensemble_summary_provider._table_utils import (
+    add_per_real_batch_index_to_table_schema_metadata,
+)
+from webviz_subsurface._providers.shared_memory_table_cache import (
+    SharedMemoryTableCache,
+    make_file_table_cache_key,
+)
+
+
+def test_table_is_only_created_once(tmp_path: Path) -> None:
+    created_tables: List[pa.Table] = []
+
+    def _table_factory() -> pa.Table:
+        table = pa.table({"REAL": [0, 0, 1], "A": [1.0, 2.0, 3.0]})
+        created_tables.append(table)
+        return table
+
+    # Separate cache objects on the same directory mimic separate worker processes
+    cache_a = SharedMemoryTableCache(tmp_path)
+    cache_b = SharedMemoryTableCache(tmp_path)
+
+    table_a = cache_a.get_or_create_table("key", _table_factory)
+    assert cache_a.get_or_create_table("key", _table_factory) is table_a
+    table_b = cache_b.get_or_create_table("key", _table_factory)
+
+    assert len(created_tables) == 1
+    assert table_a.equals(created_tables[0])
+    assert table_b.equals(created_tables[0])
+
+    usage_a = cache_a.memory_usage()
+    usage_b = cache_b.memory_usage()
+    assert usage_a.num_tables == 1
+    assert usage_a.created_table_bytes == usage_a.shared_table_bytes > 0
+    assert usage_b.created_table_bytes == 0
+    assert usage_b.shared_table_bytes == usage_a.shared_table_bytes
+
+
+def test_lazy_provider_with_shared_cache(tmp_path: Path) -> None:
+    per_real_tables = {
+        real: pa.table(
+            {
+                "DATE": pa.array(
+                    np.array(["2023-01-01", "2023-02-01"], dtype="datetime64[ms]")
+                ),
+                "A": [10.0 * real, 10.0 * real + 1],
+            }
+        )
+        for real in [0, 1, 2]
+    }
+    ProviderImplArrowLazy.write_backing_store_from_per_realization_tables(
+        tmp_path, "dummy_key", per_real_tables
+    )
+
+    cache = SharedMemoryTableCache(tmp_path / "shm")
+    provider = ProviderImplArrowLazy.from_backing_store(tmp_path, "dummy_key", cache)
+    ref_provider = ProviderImplArrowLazy.from_backing_store(tmp_path, "dummy_key")
+    assert provider is not None and ref_provider is not None
+    assert cache.memory_usage().num_tables == 1
+
+    assert provider.realizations() == ref_provider.realizations()
+    assert provider.vector_names() == ref_provider.vector_names()
+    vecdf = provider.get_vectors_df(["A"], None, realizations=[2, 0])
+    assert vecdf.equals(ref_provider.get_vectors_df(["A"], None, realizations=[2, 0]))
+    assert vecdf["A"].tolist() == [0.0, 1.0, 20.0, 21.0]
+
+    # Rewriting the backing store must give a new cache key
+    arrow_file_name = tmp_path / "dummy_key.arrow"
+    old_key = make_file_table_cache_key(arrow_file_name)
+    del per_real_tables[2]
+    ProviderImplArrowLazy.write_backing_store_from_per_realization_tables(
+        tmp_path, "dummy_key", per_real_tables
+    )
+    assert make_file_table_cache_key(arrow_file_name) != old_key
+
+
+def test_lazy_provider_with_shared_cache_and_unsorted_batches(tmp_path: Path) -> None:
+    # Backing stores written by older versions have one record batch per
+    # realization, but the batches are not sorted on realization
+    dates = np.array(["2023-01-01", "2023-02-01"] * 3, dtype="datetime64[ms]")
+    table = pa.table(
+        {
+            "DATE": pa.array(dates),
+            "REAL": pa.array([2, 2, 0, 0, 1, 1], type=pa.int64()),
+            "A": [20.0, 21.0, 0.0, 1.0, 10.0, 11.0],
+        }
+    )
+    table = add_per_real_batch_index_to_table_schema_metadata(
+        table, {2: (0, 1), 0: (1, 1), 1: (2, 1)}
+    )
+    with pa.OSFile(str(tmp_path / "dummy_key.arrow"), "wb") as sink:
+        with pa.RecordBatchFileWriter(sink, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=2):
+                writer.write_batch(batch)
+
+    cache = SharedMemoryTableCache(tmp_path / "shm")
+    provider = ProviderImplArrowLazy.from_backing_store(tmp_path, "dummy_key", cache)
+    ref_provider = ProviderImplArrowLazy.from_backing_store(tmp_path, "dummy_key")
+    assert provider is not None and ref_provider is not None
+    assert cache.memory_usage().num_tables == 1
+
+    vecdf = provider.get_vectors_df(["A"], None)
+    assert vecdf.equals(ref_provider.get_vectors_df(["A"], None))
+    assert vecdf["REAL"].tolist() == [0, 0, 1, 1, 2, 2]
+
+
+def test_write_failure_falls_back_to_non_shared_access(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _raise_no_space(*_args: Any) -> None:
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(shared_memory_table_cache, "_write_table_file", _raise_no_space)
+
+    cache = SharedMemoryTableCache(tmp_path)
+    table = cache.get_or_create_table("key", lambda: pa.table({"REAL": [0]}))
+    assert table is None
+    assert cache.memory_usage().num_tables == 0
+
+
+def test_least_recently_used_tables_are_removed(tmp_path: Path) -> None:
+    def _table_factory() -> pa.Table:
+        return pa.table({"A": np.zeros(1000)})
+
+    table_bytes = _table_factory().nbytes
+
+    cache_a = SharedMemoryTableCache(tmp_path, max_total_bytes=100 * table_bytes)
+    cache_a.get_or_create_table("old", _table_factory)
+    cache_a.get_or_create_table("recent", _table_factory)
+    old_file, recent_file = [
+        tmp_path / f"{shared_memory_table_cache._make_hash_string(key)}.arrow"
+        for key in ["old", "recent"]
+    ]
+    os.utime(old_file, ns=(0, 0))
+
+    # Room for two tables, so the least recently used table must go. Tables that
+    # are already mapped keep their content after the file is removed.
+    file_size = old_file.stat().st_size
+    cache_b = SharedMemoryTableCache(tmp_path, max_total_bytes=2 * file_size)
+    assert cache_b.get_or_create_table("new", _table_factory) is not None
+    assert not old_file.exists()
+    assert recent_file.exists()
+    assert cache_a.get_or_create_table("old", _table_factory).equals(_table_factory())
@@ -0,0 +1,69 @@
+from pathlib import Path
+
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._providers.ensemble_surface_provider._stat_surf_cache import (
+    StatSurfCache,
+)
+from webviz_subsurface._providers.ensemble_surface_provider.ensemble_surface_provider import (
+    StatisticalSurfaceAddress,
+    SurfaceStatistic,
+)
+
+
+def _make_address(
+    statistic: SurfaceStatistic, reals: list
+) -> StatisticalSurfaceAddress:
+    return StatisticalSurfaceAddress(
+        attribute="ds_extract_geogrid",
+        name="topvolantis",
+        datestr=None,
+        statistic=statistic,
+        realizations=reals,
+    )
+
+
+def _make_surface(value: float) -> xtgeo.RegularSurface:
+    return xtgeo.RegularSurface(ncol=10, nrow=10, xinc=1, yinc=1, values=value)
+
+
+def test_fetch_from_memory_tier(tmp_path: Path) -> None:
+    cache = StatSurfCache(tmp_path)
+    cache.store(_make_address(SurfaceStatistic.MEAN, [2, 0, 1]), _make_surface(1.0))
+
+    # Ordering and duplicates of realizations should not matter
+    surf = cache.fetch(_make_address(SurfaceStatistic.MEAN, [0, 1, 2, 2]))
+    assert surf is not None
+    assert np.all(surf.values == 1.0)
+    assert cache.counters.mem_hits == 1
+    assert cache.counters.file_hits == 0
+
+    # Returned surfaces are copies
+    surf.values = 99.0
+    surf = cache.fetch(_make_address(SurfaceStatistic.MEAN, [0, 1, 2]))
+    assert surf is not None
+    assert np.all(surf.values == 1.0)
+
+    assert cache.fetch(_make_address(SurfaceStatistic.P10, [0, 1, 2])) is None
+    assert cache.counters.mem_misses == 1
+    assert cache.counters.file_misses == 1
+
+
+def test_memory_tier_is_bounded_by_bytes(tmp_path: Path) -> None:
+    surf_bytes = 10 * 10 * 8 + 10 * 10
+    cache = StatSurfCache(tmp_path, max_mem_bytes=2 * surf_bytes)
+
+    cache.store(_make_address(SurfaceStatistic.MEAN, [0]), _make_surface(1.0))
+    cache.store(_make_address(SurfaceStatistic.P10, [0]), _make_surface(2.0))
+    assert cache.fetch(_make_address(SurfaceStatistic.MEAN, [0])) is not None
+
+    # P10 is now the least recently used and should be evicted
+    cache.store(_make_address(SurfaceStatistic.P90, [0]), _make_surface(3.0))
+    assert cache.counters.mem_evictions == 1
+
+    # ...but it is still available from the file tier
+    surf = cache.fetch(_make_address(SurfaceStatistic.P10, [0]))
+    assert surf is not None
+    assert np.all(surf.values == 2.0)
+    assert cache.counters.file_hits == 1
@@ -0,0 +1,60 @@
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._providers.ensemble_surface_provider._surface_pyramid import (
+    build_surface_pyramid,
+    downsample_surface,
+    iterate_image_tiles,
+)
+
+
+def test_downsample_surface() -> None:
+    values = np.ma.MaskedArray(
+        data=np.arange(15, dtype=np.float64).reshape((5, 3)),
+        mask=np.zeros((5, 3), dtype=bool),
+    )
+    values.mask[0, 0] = True
+    values.mask[4, 2] = True
+    surface = xtgeo.RegularSurface(
+        ncol=5, nrow=3, xinc=10, yinc=20, xori=100, yori=200, values=values
+    )
+
+    downsampled = downsample_surface(surface)
+    assert (downsampled.ncol, downsampled.nrow) == (3, 2)
+    assert (downsampled.xinc, downsampled.yinc) == (20, 40)
+    assert (downsampled.xori, downsampled.yori) == (105, 210)
+
+    # Undefined values are ignored when averaging
+    expected = np.ma.MaskedArray(
+        data=[[(1 + 3 + 4) / 3, (2 + 5) / 2], [8.0, 9.5], [(12 + 13) / 2, 0]],
+        mask=[[False, False], [False, False], [False, True]],
+    )
+    assert np.array_equal(np.ma.getmaskarray(downsampled.values), expected.mask)
+    assert np.allclose(downsampled.values.compressed(), expected.compressed())
+
+
+def test_build_surface_pyramid() -> None:
+    surface = xtgeo.RegularSurface(
+        ncol=1000, nrow=300, xinc=1, yinc=1, rotation=30, values=1.0
+    )
+    levels = build_surface_pyramid(surface, max_top_level_size=256)
+
+    assert [(level.ncol, level.nrow) for level in levels] == [
+        (250, 75),
+        (500, 150),
+        (1000, 300),
+    ]
+    assert levels[-1] is surface
+    assert all(level.rotation == 30 for level in levels)
+    assert all(np.allclose(level.values, 1.0) for level in levels)
+
+
+def test_iterate_image_tiles() -> None:
+    image_arr = np.zeros((5, 7, 4), dtype=np.uint8)
+    tiles = {(tx, ty): arr.shape for tx, ty, arr in iterate_image_tiles(image_arr, 4)}
+    assert tiles == {
+        (0, 0): (4, 4, 4),
+        (1, 0): (4, 3, 4),
+        (0, 1): (1, 4, 4),
+        (1, 1): (1, 3, 4),
+    }
@@ -0,0 +1,183 @@
+# pylint: disable=protected-access
+import os
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import xtgeo
+from dash import Dash, html
+
+from webviz_subsurface._providers import (
+    QualifiedSurfaceAddress,
+    SimulatedSurfaceAddress,
+    SurfaceServer,
+)
+from webviz_subsurface._providers.ensemble_surface_provider._provider_impl_file import (
+    ProviderImplFile,
+)
+from webviz_subsurface._providers.ensemble_surface_provider._surface_to_image import (
+    raw_rgba_bytes_to_rgba_array,
+    surface_to_rgba_array,
+)
+from webviz_subsurface._providers.ensemble_surface_provider.surface_server import (
+    SURFACE_TILE_SIZE,
+    _qualified_address_to_str,
+)
+
+
+def _create_surface() -> xtgeo.RegularSurface:
+    values = np.ma.MaskedArray(
+        data=np.arange(12, dtype=np.float64).reshape((4, 3)),
+        mask=np.zeros((4, 3), dtype=bool),
+    )
+    values.mask[1, 2] = True
+    return xtgeo.RegularSurface(
+        ncol=4, nrow=3, xinc=10, yinc=20, xori=100, yori=200, values=values
+    )
+
+
+def test_serve_png_and_raw_rgba(tmp_path: Path) -> None:
+    app = Dash(__name__)
+    app.layout = html.Div()
+    server = SurfaceServer(app, shared_cache_dir=tmp_path / "cache")
+    address = QualifiedSurfaceAddress(
+        "provider", SimulatedSurfaceAddress("depth", "top", None, 0)
+    )
+    surface = _create_surface()
+    server.publish_surface(address, surface)
+
+    client = app.server.test_client()
+    url = SurfaceServer.encode_partial_url(address)
+
+    png_response = client.get(url)
+    assert png_response.status_code == 200
+    assert png_response.mimetype == "image/png"
+
+    raw_response = client.get(url + "?format=rgba")
+    assert raw_response.status_code == 200
+    assert np.array_equal(
+        raw_rgba_bytes_to_rgba_array(raw_response.data),
+        surface_to_rgba_array(surface),
+    )
+
+
+def test_serve_surface_pyramid_tiles(tmp_path: Path) -> None:
+    app = Dash(__name__)
+    app.layout = html.Div()
+    server = SurfaceServer(app, shared_cache_dir=tmp_path / "cache")
+    address = QualifiedSurfaceAddress(
+        "provider", SimulatedSurfaceAddress("depth", "top", None, 0)
+    )
+    ncol = 2 * SURFACE_TILE_SIZE + 1
+    values = np.ma.masked_invalid(
+        np.tile(np.arange(ncol, dtype=np.float64)[:, np.newaxis], (1, 3))
+    )
+    values[0, :] = np.nan
+    surface = xtgeo.RegularSurface(ncol=ncol, nrow=3, xinc=1, yinc=1, values=values)
+    server.publish_surface_pyramid(address, surface)
+
+    pyramid_meta = server.get_surface_pyramid_metadata(address)
+    assert pyramid_meta is not None
+    assert [level.width for level in pyramid_meta.levels] == [257, 513, ncol]
+    assert [level.num_tiles_x for level in pyramid_meta.levels] == [1, 2, 3]
+    # The value range is that of each level, undefined values are ignored
+    assert [level.surface_meta.val_min for level in pyramid_meta.levels] == [
+        1.75,
+        1.0,
+        1.0,
+    ]
+
+    client = app.server.test_client()
+    tile_url = SurfaceServer.encode_partial_tile_url(address)
+    response = client.get(tile_url.format(z=2, x=2, y=0))
+    assert response.status_code == 200
+    assert response.mimetype == "image/png"
+    assert client.get(tile_url.format(z=2, x=3, y=0)).status_code == 404
+
+
+def test_evicted_images_are_republished(tmp_path: Path) -> None:
+    app = Dash(__name__)
+    app.layout = html.Div()
+    server = SurfaceServer(app, shared_cache_dir=tmp_path / "cache")
+    address = QualifiedSurfaceAddress(
+        "provider", SimulatedSurfaceAddress("depth", "top", None, 0)
+    )
+    server.publish_surface(address, _create_surface())
+    assert server.get_surface_metadata(address) is not None
+
+    # Pruning of the cache may remove the images and leave the metadata
+    base_cache_key = _qualified_address_to_str(address)
+    server._image_cache.delete("IMG:" + base_cache_key)
+    assert server.get_surface_metadata(address) is None
+
+    factory_calls: List[int] = []
+
+    def _surface_factory() -> xtgeo.RegularSurface:
+        factory_calls.append(1)
+        return _create_surface()
+
+    assert server.get_or_publish_surface(address, _surface_factory) is not None
+    assert len(factory_calls) == 1
+    client = app.server.test_client()
+    assert client.get(SurfaceServer.encode_partial_url(address)).status_code == 200
+
+
+def test_oldest_surfaces_are_removed_from_full_cache(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    app = Dash(__name__)
+    app.layout = html.Div()
+    server = SurfaceServer(app, shared_cache_dir=cache_dir)
+    old_address = QualifiedSurfaceAddress(
+        "provider", SimulatedSurfaceAddress("depth", "top", None, 0)
+    )
+    server.publish_surface(old_address, _create_surface())
+    surface_bytes = 0
+    for cache_file in cache_dir.iterdir():
+        surface_bytes += cache_file.stat().st_size
+        os.utime(cache_file, (1000, 1000))
+
+    # Another worker process sharing the cache directory, with room for one surface
+    other_app = Dash(__name__)
+    other_app.layout = html.Div()
+    other_server = SurfaceServer(
+        other_app, shared_cache_dir=cache_dir, max_cache_bytes=int(1.5 * surface_bytes)
+    )
+    new_address = QualifiedSurfaceAddress(
+        "provider", SimulatedSurfaceAddress("depth", "top", None, 1)
+    )
+    other_server.publish_surface(new_address, _create_surface())
+
+    assert sum(f.stat().st_size for f in cache_dir.iterdir()) <= 1.5 * surface_bytes
+    assert server.get_surface_metadata(old_address) is None
+    assert server.get_surface_metadata(new_address) is not None
+
+
+def test_get_or_publish_keeps_locks_outside_cache_dir(tmp_path: Path) -> None:
+    app = Dash(__name__)
+    app.layout = html.Div()
+    cache_dir = tmp_path / "cache"
+    server = SurfaceServer(app, shared_cache_dir=cache_dir)
+    address = QualifiedSurfaceAddress(
+        "provider", SimulatedSurfaceAddress("depth", "top", None, 0)
+    )
+
+    surf_meta = server.get_or_publish_surface(address, _create_surface)
+    assert surf_meta is not None
+    assert not list(cache_dir.glob("**/*.lock"))
+    assert list(tmp_path.glob("cache_locks/*.lock"))
+
+
+def test_provider_id_changes_when_backing_store_is_rewritten(tmp_path: Path) -> None:
+    ProviderImplFile.write_backing_store(
+        tmp_path, "ens", sim_surfaces=[], obs_surfaces=[], avoid_copying_surfaces=True
+    )
+    provider = ProviderImplFile.from_backing_store(tmp_path, "ens")
+    assert provider is not None
+    assert provider.provider_id().startswith("ens")
+
+    inventory_file = tmp_path / "ens" / "surface_inventory.parquet"
+    mtime_ns = inventory_file.stat().st_mtime_ns
+    os.utime(inventory_file, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+    reimported_provider = ProviderImplFile.from_backing_store(tmp_path, "ens")
+    assert reimported_provider is not None
+    assert reimported_provider.provider_id() != provider.provider_id()
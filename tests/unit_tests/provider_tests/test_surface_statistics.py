@@ -0,0 +1,80 @@
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+import xtgeo
+
+from webviz_subsurface._providers.ensemble_surface_provider._surface_statistics import (
+    calc_statistical_surfaces_from_files,
+)
+from webviz_subsurface._providers.ensemble_surface_provider.ensemble_surface_provider import (
+    SurfaceStatistic,
+)
+
+
+def _write_random_surfaces(tmp_path: Path, num_surfaces: int) -> List[str]:
+    rng = np.random.default_rng(seed=1234)
+    surf_fns: List[str] = []
+    for idx in range(num_surfaces):
+        values = rng.normal(1000, 50, size=(20, 30)).astype(np.float32)
+        # Let one of the surfaces have an undefined node
+        mask = np.zeros(values.shape, dtype=bool)
+        if idx == 2:
+            mask[5, 7] = True
+        surf = xtgeo.RegularSurface(
+            ncol=20,
+            nrow=30,
+            xinc=25,
+            yinc=25,
+            values=np.ma.masked_array(values, mask=mask),
+        )
+        surf_fn = str(tmp_path / f"surf_{idx}.gri")
+        surf.to_file(surf_fn, fformat="irap_binary")
+        surf_fns.append(surf_fn)
+
+    return surf_fns
+
+
+@pytest.mark.parametrize(
+    "statistic, func, args",
+    [
+        (SurfaceStatistic.MEAN, np.mean, []),
+        (SurfaceStatistic.STDDEV, np.std, []),
+        (SurfaceStatistic.MINIMUM, np.min, []),
+        (SurfaceStatistic.MAXIMUM, np.max, []),
+        (SurfaceStatistic.P10, np.percentile, [10]),
+        (SurfaceStatistic.P90, np.percentile, [90]),
+    ],
+)
+def test_single_pass_statistics_match_xtgeo(
+    tmp_path: Path, statistic: SurfaceStatistic, func: object, args: list
+) -> None:
+    surf_fns = _write_random_surfaces(tmp_path, num_surfaces=5)
+
+    stat_surfaces = calc_statistical_surfaces_from_files(
+        surf_fns, list(SurfaceStatistic)
+    )
+    assert set(stat_surfaces.keys()) == set(SurfaceStatistic)
+
+    expected = xtgeo.Surfaces(surf_fns).apply(func, *args, axis=0)
+    actual = stat_surfaces[statistic]
+
+    assert actual.compare_topology(expected)
+    assert np.array_equal(np.ma.getmaskarray(actual.values), expected.values.mask)
+    assert actual.values.mask[5, 7]
+    np.testing.assert_allclose(
+        actual.values.compressed(), expected.values.compressed(), rtol=1e-5
+    )
+
+
+def test_statistics_on_surfaces_with_different_topology(tmp_path: Path) -> None:
+    surf_fns = _write_random_surfaces(tmp_path, num_surfaces=2)
+    other_surf = xtgeo.RegularSurface(ncol=10, nrow=10, xinc=25, yinc=25, values=1.0)
+    other_surf_fn = str(tmp_path / "other.gri")
+    other_surf.to_file(other_surf_fn, fformat="irap_binary")
+
+    with pytest.raises(ValueError):
+        calc_statistical_surfaces_from_files(
+            surf_fns + [other_surf_fn], [SurfaceStatistic.MEAN]
+        )
@@ -0,0 +1,72 @@
+import io
+
+import numpy as np
+import xtgeo
+from PIL import Image
+
+from webviz_subsurface._providers.ensemble_surface_provider._surface_to_image import (
+    raw_rgba_bytes_to_rgba_array,
+    surface_to_png_bytes_optimized,
+    surface_to_raw_rgba_bytes,
+    surface_to_rgba_array,
+)
+
+
+def _make_surface() -> xtgeo.RegularSurface:
+    values = np.ma.MaskedArray(
+        data=np.arange(12, dtype=np.float64).reshape((4, 3)) * 10 + 100,
+        mask=np.zeros((4, 3), dtype=bool),
+    )
+    values.mask[1, 2] = True
+    return xtgeo.RegularSurface(ncol=4, nrow=3, xinc=1, yinc=1, values=values)
+
+
+def test_surface_to_rgba_array() -> None:
+    surface = _make_surface()
+    rgba_arr = surface_to_rgba_array(surface)
+
+    assert rgba_arr.shape == (3, 4, 4)
+    assert rgba_arr.dtype == np.uint8
+
+    # Decode the packed values and compare with the scaled surface values
+    decoded = (
+        rgba_arr[:, :, 0].astype(np.int64) * 256 * 256
+        + rgba_arr[:, :, 1].astype(np.int64) * 256
+        + rgba_arr[:, :, 2]
+    )
+    values = np.flip(surface.values.transpose(), axis=0)
+    expected = (values - 100) * (256 * 256 * 256 - 1) / 110
+
+    valid = ~np.ma.getmaskarray(values)
+    assert np.all(np.abs(decoded[valid] - expected[valid]) <= 1)
+    assert decoded.max() >= 256 * 256 * 256 - 2
+    assert decoded.min() == 0
+
+    assert np.array_equal(rgba_arr[:, :, 3] == 255, valid)
+    assert rgba_arr[0, 1, 3] == 0
+    assert np.all(rgba_arr[0, 1, 0:3] == 0)
+
+
+def test_surface_to_rgba_array_constant_and_undefined() -> None:
+    surface = xtgeo.RegularSurface(ncol=3, nrow=2, xinc=1, yinc=1, values=5.0)
+    rgba_arr = surface_to_rgba_array(surface)
+    assert np.all(rgba_arr[:, :, 0:3] == 0)
+    assert np.all(rgba_arr[:, :, 3] == 255)
+
+    surface.values = np.ma.masked_all((3, 2))
+    rgba_arr = surface_to_rgba_array(surface)
+    assert np.all(rgba_arr == 0)
+
+
+def test_png_and_raw_rgba_formats_are_identical() -> None:
+    surface = _make_surface()
+    rgba_arr = surface_to_rgba_array(surface)
+
+    png_bytes = surface_to_png_bytes_optimized(surface)
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        assert np.array_equal(np.asarray(image), rgba_arr)
+
+    raw_bytes = surface_to_raw_rgba_bytes(surface)
+    assert raw_bytes[0:4] == b"RGBA"
+    assert len(raw_bytes) == 12 + rgba_arr.size
+    assert np.array_equal(raw_rgba_bytes_to_rgba_array(raw_bytes), rgba_arr)
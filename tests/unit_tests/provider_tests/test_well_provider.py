@@ -0,0 +1,175 @@
+from pathlib import Path
+from typing import Dict, List
+
+import geojson
+import numpy as np
+import pandas as pd
+import xtgeo
+from dash import Dash, html
+from pyarrow import feather
+
+from webviz_subsurface._providers.well_provider._provider_impl_file import (
+    TRAJECTORIES_FILE_NAME,
+    WELL_INDEX_FILE_NAME,
+    ProviderImplFile,
+    _write_columnar_store,
+)
+from webviz_subsurface._providers.well_provider.well_provider import (
+    WellBoundingBox,
+    WellHead,
+    WellPath,
+    WellProvider,
+)
+from webviz_subsurface._providers.well_provider.well_server import WellServer
+
+
+def _write_well_files(well_dir: Path) -> List[str]:
+    well_dir.mkdir(parents=True)
+
+    file_names = []
+    for well_num, num_points in enumerate([5, 8, 6]):
+        md_arr = np.linspace(0, 100, num_points)
+        df = pd.DataFrame(
+            {
+                "X_UTME": 1000.0 * well_num + np.linspace(0, 10, num_points),
+                "Y_UTMN": 2000.0 + np.linspace(-5, 5, num_points),
+                "Z_TVDSS": md_arr * 0.9,
+                "MD": md_arr,
+            }
+        )
+        well = xtgeo.Well(
+            rkb=0,
+            xpos=df["X_UTME"][0],
+            ypos=df["Y_UTMN"][0],
+            wname=f"W{well_num}",
+            df=df,
+            mdlogname="MD",
+            wlogtypes={"MD": "CONT"},
+            wlogrecords={"MD": "UNK lin"},
+        )
+        file_name = str(well_dir / f"W{well_num}.rmswell")
+        well.to_file(wfile=file_name, fformat="rmswell")
+        file_names.append(file_name)
+
+    return file_names
+
+
+def test_columnar_store_vs_well_files(tmp_path: Path) -> None:
+    file_names = _write_well_files(tmp_path / "wells")
+    ProviderImplFile.write_backing_store(tmp_path, "key", file_names, "MD")
+
+    provider = ProviderImplFile.from_backing_store(tmp_path, "key")
+    assert provider is not None
+    assert provider.well_names() == ["W0", "W1", "W2"]
+
+    for well_name in provider.well_names():
+        well_path = provider.get_well_path(well_name)
+        well_df = provider.get_well_xtgeo_obj(well_name).dataframe
+        np.testing.assert_array_equal(well_path.x_arr, well_df["X_UTME"])
+        np.testing.assert_array_equal(well_path.y_arr, well_df["Y_UTMN"])
+        np.testing.assert_array_equal(well_path.z_arr, well_df["Z_TVDSS"])
+        np.testing.assert_array_equal(well_path.md_arr, well_df["MD"])
+
+        bbox = provider.get_well_bounding_box(well_name)
+        assert bbox.min_x == well_df["X_UTME"].min()
+        assert bbox.max_x == well_df["X_UTME"].max()
+        assert bbox.min_y == well_df["Y_UTMN"].min()
+        assert bbox.max_y == well_df["Y_UTMN"].max()
+        assert bbox.min_z == well_df["Z_TVDSS"].min()
+        assert bbox.max_z == well_df["Z_TVDSS"].max()
+
+    heads = provider.get_well_heads(["W2", "W0"])
+    assert [head.well_name for head in heads] == ["W2", "W0"]
+    assert (heads[0].x, heads[0].y, heads[0].z) == (2000.0, 1995.0, 0.0)
+    assert (heads[1].x, heads[1].y, heads[1].z) == (0.0, 1995.0, 0.0)
+
+    # Backing stores without the columnar files should give identical results
+    (tmp_path / "key" / TRAJECTORIES_FILE_NAME).unlink()
+    (tmp_path / "key" / WELL_INDEX_FILE_NAME).unlink()
+    legacy_provider = ProviderImplFile.from_backing_store(tmp_path, "key")
+    assert legacy_provider is not None
+    assert legacy_provider.get_well_heads(["W2", "W0"]) == heads
+    assert legacy_provider.get_well_bounding_box("W1") == (
+        provider.get_well_bounding_box("W1")
+    )
+
+
+def test_wells_without_trajectory_points_are_skipped(tmp_path: Path) -> None:
+    provider_dir = tmp_path / "key"
+    provider_dir.mkdir()
+    well_paths = {
+        "W0": WellPath(
+            x_arr=np.array([10.0, 11.0]),
+            y_arr=np.array([20.0, 21.0]),
+            z_arr=np.array([0.0, 50.0]),
+            md_arr=np.array([0.0, 50.0]),
+        ),
+        "EMPTY": WellPath(
+            x_arr=np.empty(0), y_arr=np.empty(0), z_arr=np.empty(0), md_arr=np.empty(0)
+        ),
+    }
+    _write_columnar_store(provider_dir, well_paths)
+    provider = ProviderImplFile(
+        "key",
+        provider_dir,
+        {well_name: {} for well_name in well_paths},
+        feather.read_table(str(provider_dir / TRAJECTORIES_FILE_NAME)),
+        feather.read_table(str(provider_dir / WELL_INDEX_FILE_NAME)),
+    )
+
+    heads = provider.get_well_heads(["EMPTY", "W0"])
+    assert [head.well_name for head in heads] == ["W0"]
+
+    app = Dash(__name__)
+    app.layout = html.Div()
+    server = WellServer(app)
+    server.add_provider(provider)
+    response = app.server.test_client().get(
+        server.encode_partial_url("key", ["EMPTY", "W0"])
+    )
+    assert response.status_code == 200
+    features = geojson.loads(response.data)["features"]
+    assert [feature["id"] for feature in features] == ["W0"]
+
+
+class _MinimalWellProvider(WellProvider):
+    def __init__(self, well_paths: Dict[str, WellPath]) -> None:
+        self._well_paths = well_paths
+
+    def provider_id(self) -> str:
+        return "minimal"
+
+    def well_names(self) -> List[str]:
+        return list(self._well_paths)
+
+    def get_well_path(self, well_name: str) -> WellPath:
+        return self._well_paths[well_name]
+
+    def get_well_xtgeo_obj(self, well_name: str) -> xtgeo.Well:
+        raise NotImplementedError
+
+
+def test_default_well_heads_and_bounding_box() -> None:
+    provider = _MinimalWellProvider(
+        {
+            "W0": WellPath(
+                x_arr=np.array([10.0, 12.0, 11.0]),
+                y_arr=np.array([20.0, 19.0, 21.0]),
+                z_arr=np.array([0.0, 50.0, 100.0]),
+                md_arr=np.array([0.0, 50.0, 100.0]),
+            ),
+            "EMPTY": WellPath(
+                x_arr=np.empty(0),
+                y_arr=np.empty(0),
+                z_arr=np.empty(0),
+                md_arr=np.empty(0),
+            ),
+        }
+    )
+
+    assert provider.get_well_heads(["EMPTY", "W0"]) == [
+        WellHead(well_name="W0", x=10.0, y=20.0, z=0.0)
+    ]
+    assert provider.get_well_bounding_box("W0") == WellBoundingBox(
+        min_x=10.0, min_y=19.0, min_z=0.0, max_x=12.0, max_y=21.0, max_z=100.0
+    )
@@ -0,0 +1,88 @@
+import os
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from webviz_subsurface import smry2arrow_batch
+from webviz_subsurface.smry2arrow_batch import (
+    _ConversionJob,
+    _get_parser,
+    _is_output_up_to_date,
+    _run_conversion_job,
+)
+
+
+def _touch(path: Path, mtime_s: float, content: str = "data") -> None:
+    path.write_text(content)
+    os.utime(path, (mtime_s, mtime_s))
+
+
+def _create_smry_and_arrow_files(
+    tmp_path: Path, arrow_mtime_s: float
+) -> _ConversionJob:
+    _touch(tmp_path / "CASE.UNSMRY", 1000)
+    _touch(tmp_path / "CASE.SMSPEC", 1000)
+    _touch(tmp_path / "CASE.arrow", arrow_mtime_s)
+    return _ConversionJob(str(tmp_path / "CASE.UNSMRY"), str(tmp_path / "CASE.arrow"))
+
+
+def test_column_keys_option_does_not_swallow_enspath() -> None:
+    args = _get_parser().parse_args(
+        ["--column-keys", "FOPT", "--column-keys", "WOPR:*", "ens/realization-*"]
+    )
+    assert args.column_keys == ["FOPT", "WOPR:*"]
+    assert args.enspath == Path("ens/realization-*")
+
+    args = _get_parser().parse_args(["ens/realization-*"])
+    assert args.column_keys is None
+
+
+def test_is_output_up_to_date(tmp_path: Path) -> None:
+    job = _create_smry_and_arrow_files(tmp_path, arrow_mtime_s=2000)
+    assert _is_output_up_to_date(job.smry_file, job.arrow_file)
+
+    # Newer SMSPEC file
+    _touch(tmp_path / "CASE.SMSPEC", 3000)
+    assert not _is_output_up_to_date(job.smry_file, job.arrow_file)
+
+
+def test_is_output_up_to_date_missing_or_empty_output(tmp_path: Path) -> None:
+    job = _create_smry_and_arrow_files(tmp_path, arrow_mtime_s=2000)
+    _touch(tmp_path / "CASE.arrow", 2000, content="")
+    assert not _is_output_up_to_date(job.smry_file, job.arrow_file)
+
+    os.remove(job.arrow_file)
+    assert not _is_output_up_to_date(job.smry_file, job.arrow_file)
+
+
+def test_run_conversion_job_skips_up_to_date_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    converted_files: List[str] = []
+    monkeypatch.setattr(
+        smry2arrow_batch,
+        "_convert_single_smry_file",
+        lambda smry_file, _arrow_file, _keys: converted_files.append(smry_file),
+    )
+
+    job = _create_smry_and_arrow_files(tmp_path, arrow_mtime_s=2000)
+    assert _run_conversion_job(job, column_keys=None, force=False).status == "skipped"
+    assert not converted_files
+
+    assert _run_conversion_job(job, column_keys=None, force=True).status == "converted"
+    assert converted_files == [job.smry_file]
+
+
+def test_run_conversion_job_converts_outdated_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _fail_conversion(*_args: Any) -> None:
+        raise ValueError("Invalid summary file")
+
+    monkeypatch.setattr(smry2arrow_batch, "_convert_single_smry_file", _fail_conversion)
+
+    job = _create_smry_and_arrow_files(tmp_path, arrow_mtime_s=500)
+    result = _run_conversion_job(job, column_keys=None, force=False)
+    assert result.status == "failed"
+    assert result.error is not None and "Invalid summary file" in result.error
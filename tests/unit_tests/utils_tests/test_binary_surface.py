@@ -0,0 +1,69 @@
+import mmap
+
+import numpy as np
+import pytest
+import xtgeo
+
+from webviz_subsurface._utils.binary_surface import (
+    surface_dict_from_bytes,
+    surface_dict_to_bytes,
+    surface_from_bytes,
+    surface_to_bytes,
+)
+
+
+def _create_surface(masked: bool) -> xtgeo.RegularSurface:
+    values = np.arange(15, dtype=np.float64).reshape(3, 5) * 1.5 + 1000
+    return xtgeo.RegularSurface(
+        ncol=3,
+        nrow=5,
+        xinc=25.0,
+        yinc=50.0,
+        xori=456000.5,
+        yori=5930000.25,
+        rotation=30.0,
+        yflip=-1,
+        values=np.ma.masked_where(values < 1004, values) if masked else values,
+    )
+
+
+@pytest.mark.parametrize("masked", [False, True])
+def test_surface_round_trip(masked: bool) -> None:
+    surface = _create_surface(masked)
+    encoded = surface_to_bytes(surface)
+
+    # 64 bytes header, float32 values and 2 bytes of packed mask if masked
+    assert len(encoded) == 64 + 15 * 4 + (2 if masked else 0)
+
+    decoded = surface_from_bytes(encoded)
+    assert decoded.compare_topology(surface, strict=True)
+    assert decoded.yflip == -1
+    assert np.array_equal(
+        np.ma.getmaskarray(decoded.values), np.ma.getmaskarray(surface.values)
+    )
+    assert np.ma.allclose(decoded.values, surface.values, rtol=1e-7)
+
+
+def test_surface_dict_round_trip_from_mmap(tmp_path) -> None:
+    surfaces = {"mean": _create_surface(False), "p10": _create_surface(True)}
+    file_name = tmp_path / "surfaces.bin"
+    file_name.write_bytes(surface_dict_to_bytes(surfaces))
+
+    with open(file_name, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped_file:
+        decoded = surface_dict_from_bytes(mapped_file)
+
+    assert list(decoded) == ["mean", "p10"]
+    for name, surface in surfaces.items():
+        assert np.ma.allclose(decoded[name].values, surface.values)
+        assert (
+            decoded[name].values.mask.sum() == np.ma.getmaskarray(surface.values).sum()
+        )
+
+
+def test_invalid_buffer() -> None:
+    with pytest.raises(ValueError):
+        surface_from_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        surface_dict_from_bytes(surface_to_bytes(_create_surface(False)))
@@ -0,0 +1,72 @@
+# pylint: disable=protected-access
+import multiprocessing
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from webviz_subsurface._utils import file_lock
+from webviz_subsurface._utils.file_lock import FileLock
+
+
+def _append_to_log_while_locked(lock_file: Path, log_file: Path, tag: str) -> None:
+    with FileLock(lock_file):
+        with open(log_file, "a") as file:
+            file.write(f"{tag}-start\n")
+            file.flush()
+            time.sleep(0.2)
+            file.write(f"{tag}-end\n")
+
+
+def test_file_lock_is_exclusive_between_processes(tmp_path: Path) -> None:
+    lock_file = tmp_path / "locks" / "test.lock"
+    log_file = tmp_path / "log.txt"
+
+    ctx = multiprocessing.get_context("fork")
+    procs = [
+        ctx.Process(
+            target=_append_to_log_while_locked, args=(lock_file, log_file, f"p{i}")
+        )
+        for i in range(3)
+    ]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+
+    # The critical sections must not be interleaved
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 6
+    for idx in range(0, 6, 2):
+        assert lines[idx].endswith("-start")
+        assert lines[idx + 1] == lines[idx].replace("-start", "-end")
+
+
+def test_thread_lock_fallback(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(file_lock, "_HAS_FCNTL", False)
+    lock_file = tmp_path / "test.lock"
+    log: List[str] = []
+
+    def _append_to_log_while_locked(tag: str) -> None:
+        with FileLock(lock_file):
+            log.append(f"{tag}-start")
+            time.sleep(0.05)
+            log.append(f"{tag}-end")
+
+    threads = [
+        threading.Thread(target=_append_to_log_while_locked, args=(f"t{i}",))
+        for i in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(log) == 6
+    for idx in range(0, 6, 2):
+        assert log[idx + 1] == log[idx].replace("-start", "-end")
+
+    # Thread locks are not kept for lock files that are no longer in use
+    assert str(lock_file) not in file_lock._THREAD_LOCKS
@@ -0,0 +1,122 @@
+import os
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._datainput.surface import load_surface
+from webviz_subsurface._utils.fingerprint_memoize import (
+    fingerprint_memoize,
+    make_fingerprint,
+)
+
+
+def test_make_fingerprint() -> None:
+    assert make_fingerprint((1, "a", None)) == make_fingerprint((1, "a", None))
+    assert make_fingerprint({"b": 1, "a": [2.0]}) == make_fingerprint(
+        {"a": [2.0], "b": 1}
+    )
+    assert make_fingerprint(np.arange(4)) == make_fingerprint(np.arange(4))
+    assert make_fingerprint(np.arange(4)) != make_fingerprint(np.arange(1, 5))
+
+    # Objects that have not been registered are only equal to themselves
+    surface = xtgeo.RegularSurface(ncol=2, nrow=2, xinc=1, yinc=1)
+    assert make_fingerprint(surface) == make_fingerprint(surface)
+    assert make_fingerprint(surface) != make_fingerprint(surface.copy())
+
+
+def test_memoize_on_loaded_object(tmp_path: Path) -> None:
+    file_name = tmp_path / "surface.gri"
+    xtgeo.RegularSurface(ncol=2, nrow=3, xinc=1, yinc=1, values=1.0).to_file(file_name)
+
+    loaded: List[Path] = []
+
+    @fingerprint_memoize(register_result=True)
+    def load(path: Path) -> xtgeo.RegularSurface:
+        loaded.append(path)
+        return xtgeo.surface_from_file(path)
+
+    @fingerprint_memoize()
+    def get_sum(surface: xtgeo.RegularSurface, factor: float = 1.0) -> float:
+        return float(surface.values.sum() * factor)
+
+    assert get_sum(load(file_name)) == 6.0
+    assert get_sum(load(file_name), factor=1.0) == 6.0
+    assert len(loaded) == 1
+    assert load.cache.counters.hits == 1
+    assert get_sum.cache.counters.hits == 1
+    assert get_sum.cache.counters.misses == 1
+
+    # The surface loaded anew from the same file has the same fingerprint
+    load.cache.clear()
+    assert get_sum(load(file_name)) == 6.0
+    assert len(loaded) == 2
+    assert get_sum.cache.counters.hits == 2
+
+    # Modifying the file invalidates the cached results
+    xtgeo.RegularSurface(ncol=2, nrow=3, xinc=1, yinc=1, values=2.0).to_file(file_name)
+    stat = file_name.stat()
+    os.utime(file_name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert get_sum(load(file_name)) == 12.0
+    assert len(loaded) == 3
+
+
+def test_memoize_is_bounded_by_bytes() -> None:
+    @fingerprint_memoize(max_bytes=2000)
+    def create(value: int) -> np.ndarray:
+        return np.full(100, value, dtype=np.float64)
+
+    for value in range(3):
+        create(value)
+    assert create.cache.counters.evictions == 1
+    assert create.cache.total_bytes == 1600
+
+    create(2)
+    assert create.cache.counters.hits == 1
+    create(0)
+    assert create.cache.counters.misses == 4
+
+    # The most recent result is kept even when it exceeds the budget by itself
+    @fingerprint_memoize(max_bytes=100)
+    def create_large(value: int) -> np.ndarray:
+        return np.full(100, value, dtype=np.float64)
+
+    create_large(1)
+    create_large(1)
+    assert create_large.cache.counters.hits == 1
+
+
+def test_memoize_is_bounded_by_entries() -> None:
+    @fingerprint_memoize(max_entries=2)
+    def create(value: int) -> np.ndarray:
+        return np.full(10, value, dtype=np.float64)
+
+    for value in range(3):
+        create(value)
+    assert create.cache.counters.evictions == 1
+
+    create(2)
+    create(1)
+    assert create.cache.counters.hits == 2
+    create(0)
+    assert create.cache.counters.misses == 4
+
+
+def test_modifying_loaded_surface_does_not_affect_cache(tmp_path: Path) -> None:
+    file_name = tmp_path / "surface.gri"
+    xtgeo.RegularSurface(ncol=2, nrow=3, xinc=1, yinc=1, values=1.0).to_file(file_name)
+
+    surface = load_surface(str(file_name))
+    surface.values = surface.values * 5.0
+    surface.fill(np.nan)
+
+    reloaded_surface = load_surface(str(file_name))
+    assert reloaded_surface is not surface
+    assert reloaded_surface.values.sum() == 6.0
+    assert load_surface.cache.counters.hits >= 1
+
+    # Unmodified copies share the fingerprint of the file
+    assert make_fingerprint(reloaded_surface) == make_fingerprint(
+        load_surface(str(file_name))
+    )
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from webviz_subsurface._utils.map_level_of_detail import (
+    bin_map_points,
+    cell_size_for_max_cells,
+    is_map_extent_change,
+    map_extent_from_relayout,
+    map_points_level_of_detail,
+)
+
+
+def _create_points(num_points: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "east": rng.uniform(456000, 466000, num_points),
+            "north": rng.uniform(5930000, 5935000, num_points),
+            "obs": rng.normal(0, 1, num_points),
+            "region": rng.integers(1, 5, num_points),
+        }
+    )
+
+
+def test_bin_map_points() -> None:
+    df = pd.DataFrame(
+        {
+            "east": [0.0, 5.0, 9.0, 15.0, 25.0],
+            "north": [0.0, 2.0, 9.0, 1.0, 25.0],
+            "obs": [1.0, 2.0, np.nan, 4.0, 5.0],
+            "region": [1, 2, 3, 4, 5],
+        }
+    )
+    binned = bin_map_points(df, 10.0, value_columns=["obs"], first_columns=["region"])
+
+    assert binned["east"].tolist() == [5.0, 15.0, 25.0]
+    assert binned["north"].tolist() == [5.0, 5.0, 25.0]
+    assert binned["count"].tolist() == [3, 1, 1]
+    assert binned["obs"].tolist() == [1.5, 4.0, 5.0]
+    assert binned["obs_max"].tolist() == [2.0, 4.0, 5.0]
+    assert binned["region"].tolist() == [1, 4, 5]
+
+
+@pytest.mark.parametrize(
+    "width, height", [(10000.0, 5000.0), (100000.0, 1.0), (0.0, 0.0)]
+)
+def test_cell_size_for_max_cells(width: float, height: float) -> None:
+    cell_size = cell_size_for_max_cells(width, height, 1000)
+    num_cells = (width // cell_size + 1) * (height // cell_size + 1)
+    assert num_cells <= 1000
+
+
+def test_level_of_detail_is_bounded() -> None:
+    df = _create_points(200000)
+    df_map, cell_size = map_points_level_of_detail(
+        df, value_columns=["obs"], first_columns=["region"], max_points=5000
+    )
+    assert cell_size is not None
+    assert len(df_map) <= 5000
+    assert df_map["count"].sum() == len(df)
+    assert np.isclose(
+        (df_map["obs"] * df_map["count"]).sum() / len(df), df["obs"].mean()
+    )
+
+    # Larger cell size than needed is kept
+    df_map, cell_size = map_points_level_of_detail(
+        df, value_columns=["obs"], max_points=5000, cell_size=1000.0
+    )
+    assert cell_size == 1000.0
+    assert len(df_map) == 50
+
+
+def test_level_of_detail_raw_points_when_zoomed() -> None:
+    df = _create_points(200000)
+    extent = ((460000.0, 460100.0), (5932000.0, 5932100.0))
+    df_map, cell_size = map_points_level_of_detail(
+        df, value_columns=["obs"], max_points=5000, extent=extent
+    )
+    assert cell_size is None
+    assert 0 < len(df_map) <= 5000
+    assert df_map["east"].between(*extent[0]).all()
+    assert df_map["north"].between(*extent[1]).all()
+    assert list(df_map.columns) == list(df.columns)
+
+
+def test_map_extent_from_relayout() -> None:
+    assert map_extent_from_relayout(None) == (None, None)
+    assert map_extent_from_relayout({"xaxis.autorange": True}) == (None, None)
+    assert map_extent_from_relayout(
+        {
+            "xaxis2.range[0]": 10,
+            "xaxis2.range[1]": 0,
+            "yaxis2.range[0]": 5,
+            "yaxis2.range[1]": 8,
+        }
+    ) == ((0.0, 10.0), (5.0, 8.0))
+    assert map_extent_from_relayout({"xaxis.range": [1, 2]}) == ((1.0, 2.0), None)
+
+    assert is_map_extent_change({"xaxis.autorange": True})
+    assert is_map_extent_change({"yaxis3.range[0]": 1})
+    assert not is_map_extent_change({"autosize": True})
+    assert not is_map_extent_change(None)
@@ -0,0 +1,32 @@
+import warnings
+
+import numpy as np
+
+from webviz_subsurface._utils.nan_statistics import calc_nan_statistics
+
+
+def test_calc_nan_statistics_matches_numpy() -> None:
+    rng = np.random.default_rng(seed=42)
+    values = rng.normal(size=(3, 20, 15))
+    values[rng.random(values.shape) < 0.3] = np.nan
+    values[0, 0, :] = np.nan
+    values[1, 1, 1:] = np.nan
+    values[1, 1, 0] = 5.0
+
+    stats = calc_nan_statistics(values, percentiles=[10, 50, 90])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        assert np.allclose(stats.mean, np.nanmean(values, axis=-1), equal_nan=True)
+        assert np.allclose(stats.min, np.nanmin(values, axis=-1), equal_nan=True)
+        assert np.allclose(stats.max, np.nanmax(values, axis=-1), equal_nan=True)
+        for perc in [10, 50, 90]:
+            assert np.allclose(
+                stats.percentiles[perc],
+                np.nanpercentile(values, perc, axis=-1),
+                equal_nan=True,
+            )
+
+    assert np.isnan(stats.mean[0, 0])
+    assert np.isnan(stats.percentiles[50][0, 0])
+    assert stats.percentiles[90][1, 1] == 5.0
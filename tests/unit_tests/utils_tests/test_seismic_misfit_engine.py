@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from webviz_subsurface._utils.seismic_misfit_engine import (
+    SeismicMisfitEngine,
+    load_sim_data_matrix,
+)
+
+
+def _create_df(num_points: int = 50, num_reals: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed=0)
+    obs = rng.normal(size=num_points)
+    df = pd.DataFrame(
+        {"obs": obs, "obs_error": rng.uniform(0.1, 0.5, size=num_points)},
+        index=np.arange(10, 10 + num_points),
+    )
+    sim = obs[:, np.newaxis] + rng.normal(size=(num_points, num_reals))
+    for real in range(num_reals):
+        df[f"real-{real}"] = sim[:, real].astype(np.float32)
+    return df
+
+
+@pytest.mark.parametrize("weight_by_obs_error", [False, True])
+@pytest.mark.parametrize("exponent", [1.0, 2.0])
+def test_misfit_per_realization(weight_by_obs_error: bool, exponent: float) -> None:
+    df = _create_df()
+    engine = SeismicMisfitEngine.from_dataframe(df)
+    assert engine.real_names == [f"real-{real}" for real in range(7)]
+
+    sim = df[engine.real_names]
+    diff = sim.sub(df["obs"], axis=0).abs()
+    if weight_by_obs_error:
+        diff = diff.div(df["obs_error"], axis=0)
+    expected = (diff**exponent).sum()
+
+    misfit = engine.misfit_per_realization(weight_by_obs_error, exponent)
+    assert np.allclose(misfit, expected, rtol=1e-5)
+
+    misfit = engine.misfit_per_realization(weight_by_obs_error, exponent, True)
+    assert np.allclose(misfit, (expected / len(df)) ** (1 / exponent), rtol=1e-5)
+
+
+def test_point_statistics() -> None:
+    df = _create_df()
+    engine = SeismicMisfitEngine.from_dataframe(df)
+    stat = engine.point_statistics(weight_by_obs_error=True)
+
+    sim = df[engine.real_names].astype(np.float64)
+    diff = sim.sub(df["obs"], axis=0).abs().div(df["obs_error"], axis=0)
+    expected = {
+        "sim_mean": sim.mean(axis=1),
+        "sim_std": sim.std(axis=1),
+        "sim_p90": sim.quantile(q=0.1, axis=1),
+        "sim_p10": sim.quantile(q=0.9, axis=1),
+        "sim_min": sim.min(axis=1),
+        "sim_max": sim.max(axis=1),
+        "diff_mean": diff.mean(axis=1),
+        "diff_std": diff.std(axis=1),
+    }
+    assert list(stat.columns) == list(expected)
+    for column, values in expected.items():
+        assert np.allclose(stat[column], values, rtol=1e-5, atol=1e-6), column
+
+    # Standard deviation is undefined for a single realization
+    single_real_stat = SeismicMisfitEngine.from_dataframe(
+        df[["obs", "obs_error", "real-0"]]
+    ).point_statistics()
+    assert single_real_stat["sim_std"].isna().all()
+    assert np.allclose(single_real_stat["sim_mean"], df["real-0"])
+
+
+def test_load_sim_data_matrix(tmp_path: Path) -> None:
+    sim_files = []
+    for real in range(3):
+        sim_file = tmp_path / f"sim-{real}.txt"
+        np.savetxt(sim_file, np.arange(5) + 10 * real)
+        sim_files.append(sim_file)
+
+    snapshot_dir = tmp_path / "snapshots"
+    matrix = load_sim_data_matrix(sim_files, 5, 2.0, snapshot_dir)
+    assert matrix.dtype == np.float32
+    assert matrix.tolist() == [
+        [2 * (i + 10 * real) for real in range(3)] for i in range(5)
+    ]
+    assert len(list(snapshot_dir.glob("*.npy"))) == 1
+
+    # Loaded from snapshot
+    assert np.array_equal(load_sim_data_matrix(sim_files, 5, 2.0, snapshot_dir), matrix)
+
+    # The snapshot is not used when the multiplier changes
+    assert np.array_equal(
+        load_sim_data_matrix(sim_files, 5, 1.0, snapshot_dir), matrix / 2
+    )
+    assert len(list(snapshot_dir.glob("*.npy"))) == 2
+
+    with pytest.raises(RuntimeError, match="different to the obs data"):
+        load_sim_data_matrix(sim_files, 4)
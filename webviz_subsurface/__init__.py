@@ -1,6 +1,6 @@
 import glob
 import pathlib
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 import jsonschema
 import webviz_config
@@ -10,10 +10,9 @@ from pkg_resources import DistributionNotFound, get_distribution
 from webviz_subsurface._utils.user_defined_vector_definitions import (
     USER_DEFINED_VECTOR_DEFINITIONS_JSON_SCHEMA,
 )
-from webviz_subsurface._utils.vector_calculator import (
-    PREDEFINED_EXPRESSIONS_JSON_SCHEMA,
-    ConfigExpressionData,
-)
+
+if TYPE_CHECKING:
+    from webviz_subsurface._utils.vector_calculator import ConfigExpressionData
 
 try:
     __version__ = get_distribution(__name__).version
@@ -60,6 +59,13 @@ def subscribe_predefined_expressions(
     if predefined_expressions is None:
         return output
 
+    # Imported here since the vector calculator pulls in all the providers, which
+    # should not be paid for when importing the package
+    # pylint: disable=import-outside-toplevel
+    from webviz_subsurface._utils.vector_calculator import (
+        PREDEFINED_EXPRESSIONS_JSON_SCHEMA,
+    )
+
     for key, path in predefined_expressions.items():
 
         if not pathlib.Path(path).is_absolute():
@@ -67,7 +73,7 @@ def subscribe_predefined_expressions(
 
         if not portable:
             predefined_expressions_data: Dict[
-                str, ConfigExpressionData
+                str, "ConfigExpressionData"
             ] = yaml.safe_load(output[key].read_text())
 
             try:
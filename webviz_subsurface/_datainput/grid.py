@@ -1,15 +1,16 @@
 from typing import Optional
 
 import xtgeo
-from webviz_config.common_cache import CACHE
 
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+
+@fingerprint_memoize(register_result=True)
 def load_grid(gridpath: str) -> xtgeo.Grid:
     return xtgeo.grid_from_file(gridpath)
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize(register_result=True)
 def load_grid_parameter(
     grid: Optional[xtgeo.Grid], gridparameterpath: str
 ) -> xtgeo.GridProperty:
@@ -1,26 +1,32 @@
 import numpy as np
 import xtgeo
-from webviz_config.common_cache import CACHE
 
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+# Slices are small compared to the cube they are taken from, and are keyed on the
+# fingerprint of the file the cube was loaded from, so slice browsing does not
+# require the cube to be pickled or hashed
+SLICE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+@fingerprint_memoize(register_result=True)
 def load_cube_data(cube_path: str) -> xtgeo.Cube:
     return xtgeo.cube_from_file(cube_path)
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize(max_bytes=SLICE_CACHE_MAX_BYTES)
 def get_xline(cube: xtgeo.Cube, xline: int) -> np.ndarray:
     idx = np.where(cube.xlines == xline)
     return cube.values[:, idx, :][:, 0, 0].T
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize(max_bytes=SLICE_CACHE_MAX_BYTES)
 def get_iline(cube: xtgeo.Cube, iline: int) -> np.ndarray:
     idx = np.where(cube.ilines == iline)
     return cube.values[idx, :, :][0, 0, :].T
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize(max_bytes=SLICE_CACHE_MAX_BYTES)
 def get_zslice(cube: xtgeo.Cube, zslice: float) -> np.ndarray:
     idx = np.where(cube.zslices == zslice)
     return cube.values[:, :, idx][:, :, 0, 0].T
@@ -0,0 +1,276 @@
+import logging
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+import segyio
+import xtgeo
+
+from webviz_subsurface._utils.fingerprint_memoize import (
+    FingerprintMemoizeCache,
+    fingerprint_memoize,
+)
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+LOGGER = logging.getLogger(__name__)
+
+# Memory budget for the recently used slices, per cube
+DEFAULT_MAX_SLICE_CACHE_BYTES = 256 * 1024 * 1024
+
+# Max number of slice engines kept by get_seismic_slice_engine(). Each engine holds
+# a memory mapped file, a prefetch thread and its own slice cache, which are not
+# accounted for by the memory budget of the memoization
+MAX_SHARED_SLICE_ENGINES = 4
+
+# Number of lines on each side of a requested line to prefetch in the background
+DEFAULT_NUM_PREFETCH_LINES = 2
+
+# Max number of inlines to read when estimating the value range of the cube
+_MAX_VALUE_RANGE_SAMPLE_LINES = 32
+
+# Absolute tolerance when looking up z-slices by value, inlines and crosslines
+# are integers and must match exactly
+_ZSLICE_ATOL = 1e-3
+
+_ILINE = "iline"
+_XLINE = "xline"
+_ZSLICE = "zslice"
+
+
+class SeismicSliceEngine:
+    """Serves inlines, crosslines and z-slices from a SEG-Y cube without loading the
+    full cube into memory.
+
+    The SEG-Y file is memory mapped using segyio, so that only the traces (or for
+    z-slices, the samples) needed for a slice are read from disk. The returned
+    slices have the same orientation as when slicing the values of an xtgeo.Cube
+    and transposing, and are kept in a size bounded LRU cache. After a line has been
+    requested, the neighbouring lines are prefetched in a background thread, so
+    that stepping through the cube is fast.
+
+    SEG-Y files that segyio cannot interpret as a regular cube are loaded into
+    memory using xtgeo instead.
+
+    The file and the prefetch thread are released by close(), or at the latest when
+    the engine is garbage collected, e.g. after being evicted from the cache of
+    get_seismic_slice_engine().
+    """
+
+    def __init__(
+        self,
+        cube_path: Path,
+        max_cache_bytes: int = DEFAULT_MAX_SLICE_CACHE_BYTES,
+        num_prefetch_lines: int = DEFAULT_NUM_PREFETCH_LINES,
+    ) -> None:
+        timer = PerfTimer()
+        self._num_prefetch_lines = num_prefetch_lines
+        self._read_lock = threading.Lock()
+        self._cache = FingerprintMemoizeCache(
+            f"SeismicSliceEngine({Path(cube_path).name})", max_cache_bytes
+        )
+        self._prefetch_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="seismic_prefetch"
+        )
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_futures: List[Future] = []
+        self._value_range: Optional[Tuple[float, float]] = None
+
+        self._segyfile: Optional[segyio.SegyFile] = None
+        self._values: Optional[np.ndarray] = None
+        try:
+            self._segyfile = segyio.open(cube_path, "r")
+            self._segyfile.mmap()
+            self.ilines = np.asarray(self._segyfile.ilines)
+            self.xlines = np.asarray(self._segyfile.xlines)
+            self.zslices = np.asarray(self._segyfile.samples)
+            self._is_xline_sorted = (
+                self._segyfile.sorting == segyio.TraceSortingFormat.CROSSLINE_SORTING
+            )
+        except (RuntimeError, ValueError) as exc:
+            LOGGER.warning(
+                f"Could not memory map {cube_path} as a regular cube ({exc}), "
+                "loading the full cube into memory instead"
+            )
+            if self._segyfile is not None:
+                self._segyfile.close()
+                self._segyfile = None
+            cube = xtgeo.cube_from_file(cube_path)
+            self._values = cube.values
+            self.ilines = np.asarray(cube.ilines)
+            self.xlines = np.asarray(cube.xlines)
+            self.zslices = np.asarray(cube.zslices)
+
+        # Must not reference self, or the engine would never be garbage collected
+        self._finalizer = weakref.finalize(
+            self,
+            _release_resources,
+            self._segyfile,
+            self._read_lock,
+            self._prefetch_executor,
+        )
+
+        LOGGER.debug(
+            f"Opened {cube_path} with {len(self.ilines)} inlines, "
+            f"{len(self.xlines)} crosslines and {len(self.zslices)} samples "
+            f"in {timer.elapsed_ms()}ms (memory mapped: {self._values is None})"
+        )
+
+    @property
+    def cache(self) -> FingerprintMemoizeCache:
+        return self._cache
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def close(self) -> None:
+        """Close the SEG-Y file and stop prefetching. Slices that are already cached
+        can still be retrieved, reading new slices from the file raises ValueError."""
+        self._finalizer()
+
+    def get_iline(self, iline: int) -> np.ndarray:
+        """Returns inline as array with shape (num zslices, num xlines)"""
+        return self._get_slice(_ILINE, _index_of(self.ilines, iline))
+
+    def get_xline(self, xline: int) -> np.ndarray:
+        """Returns crossline as array with shape (num zslices, num ilines)"""
+        return self._get_slice(_XLINE, _index_of(self.xlines, xline))
+
+    def get_zslice(self, zslice: float) -> np.ndarray:
+        """Returns z-slice as array with shape (num xlines, num ilines)"""
+        return self._get_slice(
+            _ZSLICE, _index_of(self.zslices, zslice, atol=_ZSLICE_ATOL)
+        )
+
+    def value_range(self) -> Tuple[float, float]:
+        """Min and max value of the cube. For memory mapped cubes the range is
+        estimated from a limited number of evenly spaced inlines, to avoid reading
+        the full cube."""
+        if self._value_range is None:
+            if self._values is not None:
+                self._value_range = (
+                    float(np.nanmin(self._values)),
+                    float(np.nanmax(self._values)),
+                )
+            else:
+                num_ilines = len(self.ilines)
+                line_indices = np.unique(
+                    np.linspace(
+                        0,
+                        num_ilines - 1,
+                        min(num_ilines, _MAX_VALUE_RANGE_SAMPLE_LINES),
+                    ).astype(int)
+                )
+                lines = [self._read_slice(_ILINE, idx) for idx in line_indices]
+                self._value_range = (
+                    float(min(np.nanmin(line) for line in lines)),
+                    float(max(np.nanmax(line) for line in lines)),
+                )
+        return self._value_range
+
+    def wait_for_prefetch(self) -> None:
+        with self._prefetch_lock:
+            futures = list(self._prefetch_futures)
+        wait(futures)
+
+    def _get_slice(self, kind: str, index: int) -> np.ndarray:
+        found, arr = self._cache.get((kind, index))
+        if not found:
+            arr = self._read_and_cache_slice(kind, index)
+        if kind != _ZSLICE and not self.closed:
+            self._prefetch_neighbours(kind, index)
+        return arr
+
+    def _read_and_cache_slice(self, kind: str, index: int) -> np.ndarray:
+        arr = self._read_slice(kind, index)
+        # The slices are shared by all callers, so protect them from modification
+        arr.flags.writeable = False
+        self._cache.put((kind, index), arr)
+        return arr
+
+    def _read_slice(self, kind: str, index: int) -> np.ndarray:
+        if self._values is not None:
+            if kind == _ILINE:
+                return self._values[index, :, :].T.copy()
+            if kind == _XLINE:
+                return self._values[:, index, :].T.copy()
+            return self._values[:, :, index].T.copy()
+
+        assert self._segyfile is not None
+        # segyio file handles are not thread safe
+        with self._read_lock:
+            if self.closed:
+                raise ValueError(
+                    "Cannot read slice, the seismic slice engine is closed"
+                )
+            if kind == _ILINE:
+                return self._segyfile.iline[self.ilines[index]].T
+            if kind == _XLINE:
+                return self._segyfile.xline[self.xlines[index]].T
+            # Depth slices come out as (slow, fast) lines, where the slow lines are
+            # the inlines for inline sorted files
+            depth_slice = self._segyfile.depth_slice[index]
+            return depth_slice if self._is_xline_sorted else depth_slice.T
+
+    def _prefetch_neighbours(self, kind: str, index: int) -> None:
+        num_lines = len(self.ilines) if kind == _ILINE else len(self.xlines)
+        neighbours = [
+            index + offset * direction
+            for offset in range(1, self._num_prefetch_lines + 1)
+            for direction in (1, -1)
+        ]
+
+        with self._prefetch_lock:
+            # Prefetching for the previously requested lines is no longer of interest
+            for future in self._prefetch_futures:
+                future.cancel()
+            try:
+                self._prefetch_futures = [
+                    self._prefetch_executor.submit(
+                        self._prefetch_slice, kind, neighbour
+                    )
+                    for neighbour in neighbours
+                    if 0 <= neighbour < num_lines
+                ]
+            except RuntimeError:
+                # The engine was closed by another thread
+                self._prefetch_futures = []
+
+    def _prefetch_slice(self, kind: str, index: int) -> None:
+        if not self._cache.contains((kind, index)) and not self.closed:
+            self._read_and_cache_slice(kind, index)
+
+
+def _release_resources(
+    segyfile: Optional[segyio.SegyFile],
+    read_lock: threading.Lock,
+    prefetch_executor: ThreadPoolExecutor,
+) -> None:
+    prefetch_executor.shutdown(wait=False)
+    if segyfile is not None:
+        # Wait for any ongoing read to finish
+        with read_lock:
+            segyfile.close()
+
+
+def _index_of(axis_values: np.ndarray, value: float, atol: float = 0) -> int:
+    if atol > 0:
+        matches = np.isclose(axis_values, value, rtol=0, atol=atol)
+    else:
+        matches = axis_values == value
+    indices = np.flatnonzero(matches)
+    if len(indices) == 0:
+        raise ValueError(f"{value} is not in the range of the cube")
+    return int(indices[0])
+
+
+@fingerprint_memoize(register_result=True, max_entries=MAX_SHARED_SLICE_ENGINES)
+def get_seismic_slice_engine(cube_path: Path) -> SeismicSliceEngine:
+    """Returns slice engine for the cube, shared by all callers as long as the file
+    is unchanged. At most MAX_SHARED_SLICE_ENGINES engines are kept, counting those
+    for earlier versions of rewritten files, and evicted engines release their file
+    and prefetch thread once they are no longer in use."""
+    return SeismicSliceEngine(cube_path)
@@ -1,13 +1,15 @@
 import numpy as np
 import xtgeo
-from webviz_config.common_cache import CACHE
 
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+
+# Callers modify the loaded surface, e.g. by slicing a cube onto it
+@fingerprint_memoize(register_result=True, copy_result=True)
 def load_surface(surface_path: str) -> xtgeo.RegularSurface:
     return xtgeo.surface_from_file(surface_path)
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def get_surface_fence(fence: np.ndarray, surface: xtgeo.RegularSurface) -> np.ndarray:
     return surface.get_fence(fence)
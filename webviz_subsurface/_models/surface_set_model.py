@@ -9,6 +9,8 @@ import xtgeo
 from webviz_config.common_cache import CACHE
 from webviz_config.webviz_store import webvizstore
 
+from webviz_subsurface._utils.binary_surface import surface_from_bytes, surface_to_bytes
+
 
 class SurfaceSetModel:
     """Class to load and calculate statistical surfaces from an FMU Ensemble"""
@@ -139,7 +141,7 @@ class SurfaceSetModel:
                 sorted(list(df["path"])), calculation
             )
 
-        return xtgeo.surface_from_file(surface_stream, fformat="irap_binary")
+        return surface_from_bytes(surface_stream.getbuffer())
 
     def webviz_store_statistical_calculation(
         self,
@@ -232,9 +234,7 @@ def save_statistical_surface_no_store(
         surface = xtgeo.RegularSurface(
             ncol=1, nrow=1, xinc=1, yinc=1
         )  # 1's as input is required
-    stream = io.BytesIO()
-    surface.to_file(stream, fformat="irap_binary")
-    return stream
+    return io.BytesIO(surface_to_bytes(surface))
 
 
 @webvizstore
@@ -256,9 +256,7 @@ def save_statistical_surface(fns: List[str], calculation: str) -> io.BytesIO:
         surface = xtgeo.RegularSurface(
             ncol=1, nrow=1, xinc=1, yinc=1
         )  # 1's as input is required
-    stream = io.BytesIO()
-    surface.to_file(stream, fformat="irap_binary")
-    return stream
+    return io.BytesIO(surface_to_bytes(surface))
 
 
 # pylint: disable=too-many-return-statements
@@ -5,6 +5,7 @@ from .ensemble_fault_polygons_provider import (
     FaultPolygonsServer,
     SimulatedFaultPolygonsAddress,
 )
+from .ensemble_summary_provider._vector_statistics import VectorStatistic
 from .ensemble_summary_provider.ensemble_summary_provider import (
     EnsembleSummaryProvider,
     Frequency,
@@ -28,4 +29,9 @@ from .ensemble_surface_provider import (
 )
 from .ensemble_table_provider import EnsembleTableProvider, EnsembleTableProviderSet
 from .ensemble_table_provider_factory import EnsembleTableProviderFactory
+from .provider_warmup import (
+    ProviderWarmUp,
+    prefetch_first_statistical_surface,
+    prefetch_first_vector_statistics,
+)
 from .well_provider import WellProvider, WellProviderFactory, WellServer
@@ -0,0 +1,127 @@
+import json
+from typing import Dict, List, Optional
+
+import numpy as np
+import xtgeo
+
+# Same coordinate precision as used by geojson.dumps()
+_COORDINATE_DECIMALS = 6
+
+
+def simplify_polylines(
+    xy_arr: np.ndarray, start_indices: np.ndarray, tolerance: float
+) -> np.ndarray:
+    """Simplify multiple polylines using the Douglas-Peucker algorithm.
+    The polylines are given as one (N, 2) array of coordinates, where each polyline
+    starts at the indices in start_indices. Returns a boolean mask of the points to
+    keep. Points that deviate less than tolerance from the simplified line are
+    removed, while the first and last point of each polyline are always kept.
+    Works for closed polylines (where the first and last point are equal) as well.
+
+    Instead of recursing into each segment, all segments of all the polylines are
+    split in the same pass, so the number of numpy calls is proportional to the
+    recursion depth rather than to the number of points.
+    """
+
+    num_points = len(xy_arr)
+    keep = np.zeros(num_points, dtype=bool)
+    if num_points == 0:
+        return keep
+
+    keep[start_indices] = True
+    keep[np.append(start_indices[1:] - 1, num_points - 1)] = True
+    if tolerance <= 0:
+        keep[:] = True
+        return keep
+
+    point_indices = np.arange(num_points)
+    while True:
+        # Each point that is not kept lies within the segment between the
+        # closest kept points before and after it
+        kept_indices = np.flatnonzero(keep)
+        seg_idx = np.searchsorted(kept_indices, point_indices, side="right") - 1
+        seg_start = kept_indices[seg_idx]
+        seg_end = kept_indices[np.minimum(seg_idx + 1, len(kept_indices) - 1)]
+
+        distances = _distances_to_segments(xy_arr, xy_arr[seg_start], xy_arr[seg_end])
+        distances[keep] = 0
+
+        # Split each segment at its point with the largest distance, if that
+        # distance exceeds the tolerance
+        seg_max_distances = np.maximum.reduceat(distances, kept_indices)
+        is_split_candidate = (distances > tolerance) & (
+            distances == seg_max_distances[seg_idx]
+        )
+        candidate_indices = np.flatnonzero(is_split_candidate)
+        if len(candidate_indices) == 0:
+            return keep
+
+        # Pick the first point in case of ties within a segment
+        _, first_in_seg = np.unique(seg_idx[candidate_indices], return_index=True)
+        keep[candidate_indices[first_in_seg]] = True
+
+
+def simplify_polyline(xy_arr: np.ndarray, tolerance: float) -> np.ndarray:
+    """Simplify a single polyline given as (N, 2) array of coordinates, see
+    simplify_polylines()"""
+    return xy_arr[simplify_polylines(xy_arr, np.array([0]), tolerance)]
+
+
+def _distances_to_segments(
+    points: np.ndarray, seg_starts: np.ndarray, seg_ends: np.ndarray
+) -> np.ndarray:
+    seg_vecs = seg_ends - seg_starts
+    seg_len_sqr = np.einsum("ij,ij->i", seg_vecs, seg_vecs)
+    rel_points = points - seg_starts
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t_arr = np.einsum("ij,ij->i", rel_points, seg_vecs) / seg_len_sqr
+    # Degenerate segments (e.g. when closing a polygon) give distance to the point
+    t_arr = np.where(seg_len_sqr > 0, np.clip(t_arr, 0, 1), 0)
+
+    diff = rel_points - t_arr[:, np.newaxis] * seg_vecs
+    return np.hypot(diff[:, 0], diff[:, 1])
+
+
+def fault_polygons_to_geojson_bytes(
+    polygons: Optional[xtgeo.Polygons], simplify_tolerance: Optional[float] = None
+) -> bytes:
+    """Encode fault polygons as a GeoJSON FeatureCollection with one Polygon feature
+    per POLY_ID, optionally simplifying each polygon with the given tolerance.
+    Returns an empty FeatureCollection if polygons is None.
+    """
+    # pylint: disable=too-many-locals
+
+    feature_arr: List[Dict] = []
+
+    if polygons is not None:
+        dframe = polygons.dataframe
+        poly_ids = dframe["POLY_ID"].to_numpy()
+        xy_arr = np.round(
+            dframe[["X_UTME", "Y_UTMN"]].to_numpy(dtype=np.float64),
+            _COORDINATE_DECIMALS,
+        )
+
+        # Same ordering as when doing groupby on POLY_ID
+        sort_order = np.argsort(poly_ids, kind="stable")
+        sorted_ids = poly_ids[sort_order]
+        sorted_xy = xy_arr[sort_order]
+        unique_ids, start_indices = np.unique(sorted_ids, return_index=True)
+
+        if simplify_tolerance:
+            keep = simplify_polylines(sorted_xy, start_indices, simplify_tolerance)
+            kept_counts = np.add.reduceat(keep.astype(np.int64), start_indices)
+            sorted_xy = sorted_xy[keep]
+            start_indices = np.cumsum(kept_counts) - kept_counts
+
+        for poly_id, poly_xy in zip(unique_ids, np.split(sorted_xy, start_indices[1:])):
+            feature_arr.append(
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Polygon", "coordinates": [poly_xy.tolist()]},
+                    "properties": {"name": f"id:{poly_id}", "color": [0, 0, 0, 255]},
+                }
+            )
+
+    featurecoll = {"type": "FeatureCollection", "features": feature_arr}
+    return json.dumps(featurecoll).encode()
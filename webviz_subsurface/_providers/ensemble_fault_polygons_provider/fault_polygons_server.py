@@ -1,3 +1,5 @@
+import gzip
+import hashlib
 import json
 import logging
 from dataclasses import asdict, dataclass
@@ -5,10 +7,12 @@ from typing import Dict, Optional
 from urllib.parse import quote
 
 import flask
-import geojson
-import xtgeo
+import flask_caching
 from dash import Dash
 
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+from ._fault_polygons_encoding import fault_polygons_to_geojson_bytes
 from .ensemble_fault_polygons_provider import (
     EnsembleFaultPolygonsProvider,
     FaultPolygonsAddress,
@@ -18,6 +22,14 @@ LOGGER = logging.getLogger(__name__)
 
 _ROOT_URL_PATH = "/FaultPolygonsServer"
 
+# Max number of encoded fault polygon sets to keep in the in-memory cache
+_ENCODING_CACHE_MAX_ENTRIES = 500
+
+# When a zoom level is specified, polygons are simplified so that the error is
+# at most this number of pixels. With deck.gl's OrthographicView one world unit
+# is 2^zoom pixels.
+_SIMPLIFY_TOLERANCE_PIXELS = 0.5
+
 _FAULT_POLYGONS_SERVER_INSTANCE: Optional["FaultPolygonsServer"] = None
 
 
@@ -27,9 +39,26 @@ class QualifiedAddress:
     address: FaultPolygonsAddress
 
 
+@dataclass(frozen=True)
+class _EncodedFaultPolygons:
+    gzipped_geojson_bytes: bytes
+    etag: str
+
+
 class FaultPolygonsServer:
     def __init__(self, app: Dash) -> None:
 
+        # Cache of the gzipped GeoJSON responses, since the fault polygons are
+        # requested on every redraw of the map
+        self._encoding_cache = flask_caching.Cache(
+            config={
+                "CACHE_TYPE": "SimpleCache",
+                "CACHE_THRESHOLD": _ENCODING_CACHE_MAX_ENTRIES,
+                "CACHE_DEFAULT_TIMEOUT": 0,
+            }
+        )
+        self._encoding_cache.init_app(app.server)
+
         self._setup_url_rule(app)
         self._id_to_provider_dict: Dict[str, EnsembleFaultPolygonsProvider] = {}
 
@@ -66,7 +95,10 @@ class FaultPolygonsServer:
         self,
         provider_id: str,
         fault_polygons_address: FaultPolygonsAddress,
+        zoom: Optional[int] = None,
     ) -> str:
+        """If zoom is specified, the polygons will be simplified to a level of
+        detail suitable for displaying them at that zoom level"""
         if not provider_id in self._id_to_provider_dict:
             raise ValueError("Could not find provider")
 
@@ -74,6 +106,8 @@ class FaultPolygonsServer:
             f"{_ROOT_URL_PATH}/{quote(provider_id)}"
             f"/{quote(json.dumps(asdict(fault_polygons_address)))}"
         )
+        if zoom is not None:
+            url_path += f"?zoom={zoom}"
 
         return url_path
 
@@ -88,42 +122,55 @@ class FaultPolygonsServer:
                 f"full_fault_polygons_address={fault_polygons_address} "
             )
 
-            fault_polygons_geojson = None
-            # try:
+            timer = PerfTimer()
 
-            address = FaultPolygonsAddress(**json.loads(fault_polygons_address))
-            provider = self._id_to_provider_dict[provider_id]
-            fault_polygons = provider.get_fault_polygons(address)
-            if fault_polygons is not None:
-                fault_polygons_geojson = _create_fault_polygons_geojson(
-                    polygons=fault_polygons
+            zoom = flask.request.args.get("zoom", type=int)
+            cache_key = f"{provider_id}:{fault_polygons_address}:{zoom}"
+            encoded = self._encoding_cache.get(cache_key)
+            if encoded is None:
+                encoded = self._create_encoded_fault_polygons(
+                    provider_id, fault_polygons_address, zoom
                 )
+                self._encoding_cache.set(cache_key, encoded)
+                LOGGER.debug(f"Encoded fault polygons in: {timer.elapsed_s():.2f}s")
 
-            # except Exception as e:
-            #     LOGGER.error("Error decoding fault polygons address")
-            #     print(e)
-            #     # flask.abort(404)
-            featurecoll = (
-                fault_polygons_geojson
-                if fault_polygons_geojson is not None
-                else {
-                    "type": "FeatureCollection",
-                    "features": [],
-                }
-            )
+            if flask.request.accept_encodings["gzip"]:
+                response = flask.Response(
+                    encoded.gzipped_geojson_bytes, mimetype="application/geo+json"
+                )
+                response.headers["Content-Encoding"] = "gzip"
+                response.set_etag(encoded.etag + "-gz")
+            else:
+                response = flask.Response(
+                    gzip.decompress(encoded.gzipped_geojson_bytes),
+                    mimetype="application/geo+json",
+                )
+                response.set_etag(encoded.etag)
 
-            return flask.Response(
-                geojson.dumps(featurecoll), mimetype="application/geo+json"
-            )
+            # Let browsers keep the response, but always revalidate it using the ETag
+            response.vary.add("Accept-Encoding")
+            response.cache_control.no_cache = True
+            response.make_conditional(flask.request)
 
+            LOGGER.debug(f"Request handled in: {timer.elapsed_s():.2f}s")
+            return response
+
+    def _create_encoded_fault_polygons(
+        self, provider_id: str, fault_polygons_address: str, zoom: Optional[int]
+    ) -> _EncodedFaultPolygons:
+        address = FaultPolygonsAddress(**json.loads(fault_polygons_address))
+        provider = self._id_to_provider_dict[provider_id]
+        fault_polygons = provider.get_fault_polygons(address)
+
+        simplify_tolerance = (
+            _SIMPLIFY_TOLERANCE_PIXELS / 2**zoom if zoom is not None else None
+        )
+        geojson_bytes = fault_polygons_to_geojson_bytes(
+            fault_polygons, simplify_tolerance
+        )
 
-def _create_fault_polygons_geojson(polygons: xtgeo.Polygons) -> Dict:
-    feature_arr = []
-    for name, polygon in polygons.dataframe.groupby("POLY_ID"):
-        coords = [list(zip(polygon.X_UTME, polygon.Y_UTMN))]
-        feature = geojson.Feature(
-            geometry=geojson.Polygon(coords),
-            properties={"name": f"id:{name}", "color": [0, 0, 0, 255]},
+        return _EncodedFaultPolygons(
+            gzipped_geojson_bytes=gzip.compress(geojson_bytes),
+            # There is no security risk here, the hash is only used as an ETag
+            etag=hashlib.md5(geojson_bytes).hexdigest(),  # nosec
         )
-        feature_arr.append(feature)
-    return geojson.FeatureCollection(features=feature_arr)
@@ -2,9 +2,9 @@ import glob
 import logging
 import os
 import re
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 import pyarrow as pa
 
@@ -19,7 +19,10 @@ class FileEntry:
     filename: str
 
 
-def _discover_arrow_unsmry_files(globpattern: str) -> List[FileEntry]:
+def discover_per_realization_files(globpattern: str) -> List[FileEntry]:
+    """Find files matching the glob pattern and determine the realization number of
+    each file from the `realization-<N>` component of its path.
+    Returns file entries sorted on realization number."""
 
     realidxregexp = re.compile(r"realization-(\d+)")
 
@@ -53,47 +56,98 @@ def _discover_arrow_unsmry_files(globpattern: str) -> List[FileEntry]:
 
 def _load_table_from_arrow_file(entry: FileEntry) -> pa.Table:
     LOGGER.debug(f"loading table real={entry.real}: {entry.filename}")
-    source = pa.memory_map(entry.filename, "r")
-    reader = pa.ipc.RecordBatchFileReader(source)
-    return reader.read_all()
+    # Read the file fully instead of memory mapping it, so that the actual IO is done
+    # by the worker threads (PyArrow releases the GIL while reading)
+    with pa.OSFile(entry.filename, "r") as source:
+        reader = pa.ipc.RecordBatchFileReader(source)
+        return reader.read_all()
 
 
-def load_per_realization_arrow_unsmry_files(
-    ens_path: str, rel_file_pattern: str
-) -> Dict[int, pa.Table]:
-    """Load summary data stored in per-realization arrow files.
-    Returns dictionary containing a PyArrow table for each realization, indexed by
-    realization number.
+def _default_num_import_workers() -> int:
+    # Same default as ThreadPoolExecutor, IO bound work
+    return min(32, (os.cpu_count() or 1) + 4)
 
-    `rel_file_pattern` denotes a file pattern relative to the realization's runpath,
-    typical value is: "share/results/unsmry/*.arrow"
-    """
 
-    LOGGER.debug(f"load_per_realization_arrow_unsmry_files() starting - {ens_path}")
-    LOGGER.debug(f"looking for .arrow files using relative pattern: {rel_file_pattern}")
-    timer = PerfTimer()
+def discover_per_realization_arrow_unsmry_files(
+    ens_path: str, rel_file_pattern: str
+) -> List[FileEntry]:
+    """Find the per-realization arrow files matching `rel_file_pattern` within each
+    realization of the ensemble. Returns file entries sorted on realization number.
+    """
 
-    per_real_tables: Dict[int, pa.Table] = {}
     globpattern = os.path.join(ens_path, rel_file_pattern)
-    files_to_process = _discover_arrow_unsmry_files(globpattern)
-    if len(files_to_process) == 0:
+    files = discover_per_realization_files(globpattern)
+    if len(files) == 0:
         LOGGER.warning(f"No arrow files were discovered in: {ens_path}")
         LOGGER.warning(f"Glob pattern used: {globpattern}")
-        return per_real_tables
 
-    with ProcessPoolExecutor() as executor:
-        futures = executor.map(_load_table_from_arrow_file, files_to_process)
-    for i, table in enumerate(futures):
-        real = files_to_process[i].real
-        per_real_tables[real] = table
+    return files
+
+
+def read_arrow_unsmry_file_schemas(file_entries: List[FileEntry]) -> List[pa.Schema]:
+    """Read only the schemas of the specified arrow files, no actual data is read"""
+
+    schemas: List[pa.Schema] = []
+    for entry in file_entries:
+        source = pa.memory_map(entry.filename, "r")
+        schemas.append(pa.ipc.RecordBatchFileReader(source).schema)
+
+    return schemas
+
+
+def iterate_arrow_unsmry_files(
+    file_entries: List[FileEntry], max_workers: Optional[int] = None
+) -> Iterator[Tuple[int, pa.Table]]:
+    """Load the specified per-realization arrow files concurrently using a thread pool.
+    Yields (realization number, table) pairs in the order the loading finishes.
+
+    To cap memory usage only a limited number of files are loaded ahead of the
+    consumer, so that finished realizations can be written/streamed onwards instead
+    of having all tables in memory at once.
+    """
 
-    # for entry in files_to_process:
-    #     table = _load_table_from_arrow_file(entry)
-    #     per_real_tables[entry.real] = table
+    num_workers = max_workers if max_workers else _default_num_import_workers()
+    max_in_flight = 2 * num_workers
 
     LOGGER.debug(
-        f"load_per_realization_arrow_unsmry_files() "
-        f"finished in: {timer.elapsed_s():.2f}s"
+        f"iterate_arrow_unsmry_files() starting - #files={len(file_entries)}, "
+        f"num_workers={num_workers}"
+    )
+    timer = PerfTimer()
+
+    remaining_entries = iter(file_entries)
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        pending: Dict[Future, FileEntry] = {}
+
+        def submit_next() -> None:
+            entry = next(remaining_entries, None)
+            if entry is not None:
+                pending[executor.submit(_load_table_from_arrow_file, entry)] = entry
+
+        for _ in range(max_in_flight):
+            submit_next()
+
+        while pending:
+            done, _not_done = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                entry = pending.pop(future)
+                submit_next()
+                yield (entry.real, future.result())
+
+    LOGGER.debug(f"iterate_arrow_unsmry_files() finished in: {timer.elapsed_s():.2f}s")
+
+
+def load_arrow_unsmry_files(
+    file_entries: List[FileEntry], max_workers: Optional[int] = None
+) -> Dict[int, pa.Table]:
+    """Load the specified per-realization arrow files.
+    Returns dictionary containing a PyArrow table for each realization, indexed by
+    realization number.
+    """
+
+    per_real_tables: Dict[int, pa.Table] = dict(
+        iterate_arrow_unsmry_files(file_entries, max_workers)
     )
 
-    return per_real_tables
+    # Keep the same ordering as the file entries, i.e. sorted on realization
+    return {entry.real: per_real_tables[entry.real] for entry in file_entries}
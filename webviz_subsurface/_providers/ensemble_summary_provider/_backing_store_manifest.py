@@ -0,0 +1,121 @@
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SourceFileFingerprint:
+    """Lightweight fingerprint of a source file that was used to build a backing store.
+    `real` is the realization number the file belongs to, or None for files that
+    contain data for the whole ensemble."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    real: Optional[int] = None
+
+
+@dataclass
+class ManifestDiff:
+    """Realizations that must be re-imported (added or modified source files) and
+    realizations whose source files have disappeared. `requires_full_rebuild` is set
+    whenever the changes cannot be attributed to individual realizations."""
+
+    changed_reals: List[int]
+    removed_reals: List[int]
+    requires_full_rebuild: bool
+
+    def is_up_to_date(self) -> bool:
+        return (
+            not self.changed_reals
+            and not self.removed_reals
+            and not self.requires_full_rebuild
+        )
+
+
+def create_source_file_fingerprint(
+    file_name: str, real: Optional[int] = None
+) -> SourceFileFingerprint:
+    stat_result = os.stat(file_name)
+    return SourceFileFingerprint(
+        path=os.path.abspath(file_name),
+        size=stat_result.st_size,
+        mtime_ns=stat_result.st_mtime_ns,
+        real=real,
+    )
+
+
+def write_backing_store_manifest(
+    storage_dir: Path, storage_key: str, fingerprints: Iterable[SourceFileFingerprint]
+) -> None:
+    manifest_file_name = _manifest_file_name(storage_dir, storage_key)
+    LOGGER.debug(f"Writing backing store manifest to: {manifest_file_name}")
+
+    sorted_fingerprints = sorted(
+        fingerprints, key=lambda fp: (-1 if fp.real is None else fp.real, fp.path)
+    )
+    with open(manifest_file_name, "w") as file:
+        json.dump([asdict(fp) for fp in sorted_fingerprints], file, indent=1)
+
+
+def read_backing_store_manifest(
+    storage_dir: Path, storage_key: str
+) -> Optional[List[SourceFileFingerprint]]:
+    manifest_file_name = _manifest_file_name(storage_dir, storage_key)
+    if not manifest_file_name.is_file():
+        return None
+
+    try:
+        with open(manifest_file_name, "r") as file:
+            return [SourceFileFingerprint(**entry) for entry in json.load(file)]
+    except (ValueError, TypeError) as exc:
+        LOGGER.warning(f"Ignoring invalid manifest {manifest_file_name}: {exc}")
+        return None
+
+
+def diff_manifests(
+    stored: Optional[List[SourceFileFingerprint]],
+    current: List[SourceFileFingerprint],
+) -> ManifestDiff:
+    """Compare the stored manifest against the current state of the source files"""
+
+    if stored is None:
+        return ManifestDiff(
+            changed_reals=[], removed_reals=[], requires_full_rebuild=True
+        )
+
+    stored_set = set(stored)
+    current_set = set(current)
+
+    requires_full_rebuild = False
+    changed_reals: Set[int] = set()
+    for fingerprint in current_set - stored_set:
+        if fingerprint.real is None:
+            requires_full_rebuild = True
+        else:
+            changed_reals.add(fingerprint.real)
+
+    current_reals = {fp.real for fp in current_set}
+    removed_reals: Set[int] = set()
+    for fingerprint in stored_set - current_set:
+        if fingerprint.real is None:
+            requires_full_rebuild = True
+        elif fingerprint.real not in current_reals:
+            removed_reals.add(fingerprint.real)
+        else:
+            changed_reals.add(fingerprint.real)
+
+    return ManifestDiff(
+        changed_reals=sorted(changed_reals),
+        removed_reals=sorted(removed_reals),
+        requires_full_rebuild=requires_full_rebuild,
+    )
+
+
+def _manifest_file_name(storage_dir: Path, storage_key: str) -> Path:
+    return storage_dir / (storage_key + ".manifest.json")
@@ -1,27 +1,62 @@
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import pandas as pd
-from fmu.ensemble import ScratchEnsemble
 
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
+from ._arrow_unsmry_import import discover_per_realization_files
+
 LOGGER = logging.getLogger(__name__)
 
 
-def load_per_real_csv_file_using_fmu(
-    ens_path: str, csv_file_rel_path: str
+def load_per_real_csv_files(
+    ens_path: str, csv_file_rel_path: str, max_workers: Optional[int] = None
 ) -> pd.DataFrame:
-
-    LOGGER.debug(f"load_per_real_csv_file_using_fmu() starting - {csv_file_rel_path}")
+    """Load per-realization CSV files and return them as one dataframe with a REAL
+    column identifying each realization's data. The files are parsed concurrently
+    using a process pool since the CSV parsing is mostly bound by the GIL.
+
+    This replaces ScratchEnsemble.load_csv() from fmu-ensemble, and gives the same
+    data for the same input, with these differences:
+    * The rows are sorted on REAL, fmu-ensemble uses the order of discovery.
+    * `csv_file_rel_path` is used as a glob pattern within each realization, and
+      must match at most one file per realization.
+    * The realization number is taken from the `realization-<N>` component of the
+      file's path. This is the default in fmu-ensemble as well, but custom
+      realization index regexps are not supported.
+    * Realizations without the file are skipped silently, fmu-ensemble also skips
+      them but logs a warning for each.
+    """
+
+    LOGGER.debug(f"load_per_real_csv_files() starting - {csv_file_rel_path}")
     timer = PerfTimer()
 
-    scratch_ensemble = ScratchEnsemble("tempEnsName", ens_path, autodiscovery=True)
-    df = scratch_ensemble.load_csv(csv_file_rel_path)
+    file_entries = discover_per_realization_files(
+        os.path.join(ens_path, csv_file_rel_path)
+    )
+    if not file_entries:
+        raise ValueError(
+            f"No CSV files found for ens_path={ens_path}, "
+            f"csv_file_rel_path={csv_file_rel_path}"
+        )
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        per_real_dfs = list(
+            executor.map(pd.read_csv, [entry.filename for entry in file_entries])
+        )
+
+    for entry, real_df in zip(file_entries, per_real_dfs):
+        real_df.insert(0, "REAL", entry.real)
+
+    df = pd.concat(per_real_dfs, ignore_index=True)
 
     LOGGER.debug(
-        f"load_per_real_csv_file_using_fmu() finished in: {timer.elapsed_s():.2f}s"
+        f"load_per_real_csv_files() finished in: {timer.elapsed_s():.2f}s "
+        f"(#files={len(file_entries)})"
     )
 
     return df
@@ -1,8 +1,9 @@
 import datetime
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
@@ -11,6 +12,10 @@ import pyarrow.compute as pc
 
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
+from ..shared_memory_table_cache import (
+    SharedMemoryTableCache,
+    make_file_table_cache_key,
+)
 from ._field_metadata import create_vector_metadata_from_field_meta
 from ._resampling import (
     generate_normalized_sample_dates,
@@ -18,11 +23,17 @@ from ._resampling import (
     sample_segmented_multi_real_table_at_date,
 )
 from ._table_utils import (
+    add_per_real_batch_index_to_table_schema_metadata,
     add_per_vector_min_max_to_table_schema_metadata,
     find_intersected_dates_between_realizations,
     find_min_max_for_numeric_table_columns,
+    get_per_real_batch_index_from_schema_metadata,
     get_per_vector_min_max_from_schema_metadata,
 )
+from ._vector_statistics import (
+    compute_vectors_statistics_table,
+    statistics_table_to_df,
+)
 from .ensemble_summary_provider import (
     EnsembleSummaryProvider,
     Frequency,
@@ -35,14 +46,6 @@ from .ensemble_summary_provider import (
 LOGGER = logging.getLogger(__name__)
 
 
-def _sort_table_on_real_then_date(table: pa.Table) -> pa.Table:
-    indices = pc.sort_indices(
-        table, sort_keys=[("REAL", "ascending"), ("DATE", "ascending")]
-    )
-    sorted_table = table.take(indices)
-    return sorted_table
-
-
 def _is_date_column_monotonically_increasing(table: pa.Table) -> bool:
     dates_np = table.column("DATE").to_numpy()
     if not np.all(np.diff(dates_np) > np.timedelta64(0)):
@@ -62,12 +65,108 @@ def _find_first_non_increasing_date_pair(
     return (dates_np[offending_indices[0]], dates_np[offending_indices[0] + 1])
 
 
+def _validate_per_real_table(real_num: int, table: pa.Table) -> None:
+    if "REAL" in table.schema.names:
+        raise ValueError(f"Input tables should not have REAL column (real={real_num})")
+
+    if table.schema.field("DATE").type != pa.timestamp("ms"):
+        raise ValueError(
+            f"DATE column must have timestamp[ms] data type (real={real_num})"
+        )
+
+    if not _is_date_column_monotonically_increasing(table):
+        offending_pair = _find_first_non_increasing_date_pair(table)
+        raise ValueError(
+            f"DATE column must be monotonically increasing\n"
+            f"Error detected in realization: {real_num}\n"
+            f"First offending timestamps: {offending_pair}"
+        )
+
+
+def _conform_table_to_schema(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Reorder columns to match the schema, adding null columns for missing fields"""
+    columns = []
+    for field in schema:
+        if field.name in table.column_names:
+            columns.append(table.column(field.name))
+        else:
+            columns.append(pa.nulls(table.num_rows, field.type))
+
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _merge_min_max_into(
+    accumulated_min_max: Dict[str, dict], table_min_max: Dict[str, dict]
+) -> None:
+    for vec_name, table_entry in table_min_max.items():
+        accumulated_entry = accumulated_min_max.setdefault(
+            vec_name, {"min": None, "max": None}
+        )
+        for key, func in [("min", min), ("max", max)]:
+            values = [
+                val
+                for val in [accumulated_entry[key], table_entry[key]]
+                if val is not None
+            ]
+            accumulated_entry[key] = func(values) if values else None
+
+
+def _filter_table_on_realizations(
+    table: pa.Table, realizations: Optional[Sequence[int]]
+) -> pa.Table:
+    if not realizations:
+        return table
+
+    mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
+    return table.filter(mask)
+
+
+def _sort_table_on_real_then_date(table: pa.Table) -> pa.Table:
+    indices = pc.sort_indices(
+        table, sort_keys=[("REAL", "ascending"), ("DATE", "ascending")]
+    )
+    return table.take(indices)
+
+
+def _copy_batches_sorted_on_real(
+    reader: pa.ipc.RecordBatchFileReader,
+    per_real_batch_index: Dict[int, Tuple[int, int]],
+    schema_table: pa.Table,
+    arrow_file_name: Path,
+) -> None:
+    """Copy the record batches of reader to a new arrow file, ordered on realization
+    number, without decoding the data. The batch index for the new file is added to
+    the schema metadata of schema_table, which is used as schema for the file."""
+
+    sorted_reals = sorted(per_real_batch_index)
+    sorted_batch_index: Dict[int, Tuple[int, int]] = {}
+    num_sorted_batches = 0
+    for real_num in sorted_reals:
+        batch_count = per_real_batch_index[real_num][1]
+        sorted_batch_index[real_num] = (num_sorted_batches, batch_count)
+        num_sorted_batches += batch_count
+
+    schema_table = add_per_real_batch_index_to_table_schema_metadata(
+        schema_table, sorted_batch_index
+    )
+    with pa.OSFile(str(arrow_file_name), "wb") as sink:
+        with pa.RecordBatchFileWriter(sink, schema_table.schema) as writer:
+            for real_num in sorted_reals:
+                first_batch_idx, batch_count = per_real_batch_index[real_num]
+                for batch_idx in range(first_batch_idx, first_batch_idx + batch_count):
+                    writer.write_batch(reader.get_batch(batch_idx))
+
+
 class ProviderImplArrowLazy(EnsembleSummaryProvider):
     """This class implements an EnsembleSummaryProvider with lazy (on-demand)
     resampling/interpolation.
     """
 
-    def __init__(self, arrow_file_name: Path) -> None:
+    def __init__(
+        self,
+        arrow_file_name: Path,
+        shared_table_cache: Optional[SharedMemoryTableCache] = None,
+    ) -> None:
         self._arrow_file_name = str(arrow_file_name)
 
         LOGGER.debug(f"init with arrow file: {self._arrow_file_name}")
@@ -88,18 +187,43 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         ]
         et_find_vec_names_ms = timer.lap_ms()
 
-        unique_realizations_on_file = reader.read_all().column("REAL").unique()
-        self._realizations: List[int] = unique_realizations_on_file.to_pylist()
+        # Backing stores written by this class contain an index that maps each
+        # realization to its range of record batches. If the index is missing we fall
+        # back to reading the full REAL column and filtering on realizations.
+        self._per_real_batch_index = get_per_real_batch_index_from_schema_metadata(
+            reader.schema
+        )
+        if self._per_real_batch_index is not None:
+            self._realizations: List[int] = [
+                real
+                for real, (_first_batch_idx, batch_count) in sorted(
+                    self._per_real_batch_index.items()
+                )
+                if batch_count > 0
+            ]
+        else:
+            unique_realizations_on_file = (
+                reader.read_all().column("REAL").unique().to_pylist()
+            )
+            self._realizations = unique_realizations_on_file
         et_find_real_ms = timer.lap_ms()
 
         # We'll try and keep the file open for the life-span of the provider.
         # Done to try and stop blobfuse from throwing the file out of its cache.
+        self._cached_source = source
         self._cached_reader = reader
 
-        # For testing, uncomment code below and we will be more aggressive
-        # and keep the "raw" table in memory
-        self._cached_full_table = None
-        # self._cached_full_table = reader.read_all()
+        # Optionally keep the "raw" table in memory, shared with other processes.
+        # When reading from file using the batch index, rows are returned sorted on
+        # realization, and the record batches of older backing stores are not in that
+        # order. Sort the shared table so that it gives the same result.
+        # If the table could not be placed in shared memory we read from file.
+        self._cached_full_table: Optional[pa.Table] = None
+        if shared_table_cache is not None:
+            self._cached_full_table = shared_table_cache.get_or_create_table(
+                make_file_table_cache_key(Path(self._arrow_file_name)),
+                self._read_full_table_for_cache,
+            )
 
         LOGGER.debug(
             f"init took: {timer.elapsed_s():.2f}s, "
@@ -114,18 +238,43 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         if not self._vector_names:
             raise ValueError("Init from backing store failed NO vector_names")
 
+    def _read_full_table_for_cache(self) -> pa.Table:
+        table = self._cached_reader.read_all()
+        if self._per_real_batch_index is None:
+            return table
+        return _sort_table_on_real_then_date(table)
+
     @staticmethod
     def write_backing_store_from_per_realization_tables(
         storage_dir: Path, storage_key: str, per_real_tables: Dict[int, pa.Table]
     ) -> None:
+        unified_schema = pa.unify_schemas(
+            [table.schema for table in per_real_tables.values()]
+        )
+        ProviderImplArrowLazy.write_backing_store_from_per_realization_table_stream(
+            storage_dir, storage_key, unified_schema, sorted(per_real_tables.items())
+        )
+
+    @staticmethod
+    def write_backing_store_from_per_realization_table_stream(
+        storage_dir: Path,
+        storage_key: str,
+        unified_schema: pa.Schema,
+        per_real_tables: Iterable[Tuple[int, pa.Table]],
+    ) -> None:
+        """Write backing store from a stream of (realization number, table) pairs.
+        The realizations may arrive in any order, but are stored sorted on realization
+        number. Each table is written to file as soon as it arrives so that only a
+        single realization needs to be held in memory at any one time.
+        `unified_schema` must contain the union of the columns in all the tables,
+        columns missing from a table will be null-filled.
+        """
         # pylint: disable=too-many-locals
         @dataclass
         class Elapsed:
-            concat_tables_s: float = -1
-            build_add_real_col_s: float = -1
-            sorting_s: float = -1
-            find_and_store_min_max_s: float = -1
-            write_s: float = -1
+            stream_write_s: float = 0
+            find_min_max_s: float = 0
+            finalize_s: float = -1
 
         elapsed = Elapsed()
 
@@ -133,85 +282,140 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         LOGGER.debug(f"Writing backing store to arrow file: {arrow_file_name}")
         timer = PerfTimer()
 
-        unique_column_names = set()
-        for real_num, table in per_real_tables.items():
-            unique_column_names.update(table.schema.names)
-
-            if "REAL" in table.schema.names:
-                raise ValueError(
-                    f"Input tables should not have REAL column (real={real_num})"
-                )
-
-            if table.schema.field("DATE").type != pa.timestamp("ms"):
-                raise ValueError(
-                    f"DATE column must have timestamp[ms] data type (real={real_num})"
-                )
-
-            if not _is_date_column_monotonically_increasing(table):
-                offending_pair = _find_first_non_increasing_date_pair(table)
-                raise ValueError(
-                    f"DATE column must be monotonically increasing\n"
-                    f"Error detected in realization: {real_num}\n"
-                    f"First offending timestamps: {offending_pair}"
-                )
-
-        LOGGER.debug(
-            f"Concatenating {len(per_real_tables)} tables with "
-            f"{len(unique_column_names)} unique column names"
+        if "REAL" in unified_schema.names:
+            raise ValueError("Input tables should not have REAL column")
+
+        stream_schema = unified_schema.insert(0, pa.field("REAL", pa.int32()))
+        stream_arrow_file_name = storage_dir / (storage_key + ".arrow.stream_tmp")
+
+        # Write one or more record batches per realization, and never let a batch span
+        # multiple realizations. Together with the index stored in the schema metadata
+        # this allows reading only the batches for the requested realizations.
+        per_real_batch_index: Dict[int, Tuple[int, int]] = {}
+        per_vector_min_max: Dict[str, dict] = {}
+        num_batches_written = 0
+        with pa.OSFile(str(stream_arrow_file_name), "wb") as sink:
+            with pa.RecordBatchFileWriter(sink, stream_schema) as writer:
+                for real_num, table in per_real_tables:
+                    if real_num in per_real_batch_index:
+                        raise ValueError(f"Duplicate tables for realization {real_num}")
+
+                    _validate_per_real_table(real_num, table)
+                    table = _conform_table_to_schema(table, unified_schema)
+                    real_arr = np.full(table.num_rows, real_num, np.int32)
+                    table = table.add_column(0, "REAL", pa.array(real_arr))
+                    elapsed.stream_write_s += timer.lap_s()
+
+                    _merge_min_max_into(
+                        per_vector_min_max,
+                        find_min_max_for_numeric_table_columns(table),
+                    )
+                    elapsed.find_min_max_s += timer.lap_s()
+
+                    batches = [b for b in table.to_batches() if b.num_rows > 0]
+                    per_real_batch_index[real_num] = (num_batches_written, len(batches))
+                    for batch in batches:
+                        writer.write_batch(batch)
+                    num_batches_written += len(batches)
+                    elapsed.stream_write_s += timer.lap_s()
+
+        LOGGER.debug(f"Streamed {len(per_real_batch_index)} realizations to file")
+
+        # The per vector min/max values and the batch index are only known after all
+        # the data has been seen, so we must do a final pass where the record batches
+        # are copied over to a file that has this info in the schema's metadata.
+        # The realizations arrive in the order they finished importing, so the copy is
+        # also where the batches are put in sorted order on REAL, which is the order
+        # the rest of the provider (and the shared memory cache) expects.
+        # Note that this does not involve any decoding of the data.
+        # Write to a temporary file and move it into place afterwards, so that any
+        # existing memory mapping of the backing store stays valid while writing.
+        final_schema_table = pa.Table.from_batches([], schema=stream_schema)
+        final_schema_table = add_per_vector_min_max_to_table_schema_metadata(
+            final_schema_table, per_vector_min_max
         )
 
-        full_table = pa.concat_tables(per_real_tables.values(), promote=True)
-        elapsed.concat_tables_s = timer.lap_s()
-
-        real_arr = np.empty(full_table.num_rows, np.int32)
-        table_start_idx = 0
-        for real_num, real_table in per_real_tables.items():
-            real_arr[table_start_idx : table_start_idx + real_table.num_rows] = real_num
-            table_start_idx += real_table.num_rows
-
-        full_table = full_table.add_column(0, "REAL", pa.array(real_arr))
-        elapsed.build_add_real_col_s = timer.lap_s()
-
-        # Must sort table on real since interpolations work per realization
-        # and we utilize slicing for speed
-        full_table = _sort_table_on_real_then_date(full_table)
-        elapsed.sorting_s = timer.lap_s()
-
-        # Find per column min/max values and store them as metadata on table's schema
-        per_vector_min_max = find_min_max_for_numeric_table_columns(full_table)
-        full_table = add_per_vector_min_max_to_table_schema_metadata(
-            full_table, per_vector_min_max
+        tmp_arrow_file_name = storage_dir / (storage_key + ".arrow.tmp")
+        stream_source = pa.memory_map(str(stream_arrow_file_name), "r")
+        _copy_batches_sorted_on_real(
+            pa.ipc.RecordBatchFileReader(stream_source),
+            per_real_batch_index,
+            final_schema_table,
+            tmp_arrow_file_name,
         )
-        elapsed.find_and_store_min_max_s = timer.lap_s()
-
-        # feather.write_feather(full_table, dest=arrow_file_name)
-        with pa.OSFile(str(arrow_file_name), "wb") as sink:
-            with pa.RecordBatchFileWriter(sink, full_table.schema) as writer:
-                writer.write_table(full_table)
-        elapsed.write_s = timer.lap_s()
+        stream_source.close()
+        os.remove(stream_arrow_file_name)
+        os.replace(tmp_arrow_file_name, arrow_file_name)
+        elapsed.finalize_s = timer.lap_s()
 
         LOGGER.debug(
             f"Wrote backing store to arrow file in: {timer.elapsed_s():.2f}s ("
-            f"concat_tables={elapsed.concat_tables_s:.2f}s, "
-            f"build_add_real_col={elapsed.build_add_real_col_s:.2f}s, "
-            f"sorting={elapsed.sorting_s:.2f}s, "
-            f"find_and_store_min_max={elapsed.find_and_store_min_max_s:.2f}s, "
-            f"write={elapsed.write_s:.2f}s)"
+            f"stream_write={elapsed.stream_write_s:.2f}s, "
+            f"find_min_max={elapsed.find_min_max_s:.2f}s, "
+            f"finalize={elapsed.finalize_s:.2f}s)"
         )
 
     @staticmethod
     def from_backing_store(
-        storage_dir: Path, storage_key: str
+        storage_dir: Path,
+        storage_key: str,
+        shared_table_cache: Optional[SharedMemoryTableCache] = None,
     ) -> Optional["ProviderImplArrowLazy"]:
 
         arrow_file_name = storage_dir / (storage_key + ".arrow")
         if arrow_file_name.is_file():
-            return ProviderImplArrowLazy(arrow_file_name)
+            return ProviderImplArrowLazy(arrow_file_name, shared_table_cache)
 
         return None
 
+    @staticmethod
+    def read_per_realization_tables_from_backing_store(
+        storage_dir: Path, storage_key: str, realizations: Sequence[int]
+    ) -> Optional[Dict[int, pa.Table]]:
+        """Read back the per-realization tables for the specified realizations from an
+        existing backing store, on the same form as the input to
+        write_backing_store_from_per_realization_tables(). Columns that only contain
+        nulls for a realization are dropped since they stem from the merge with other
+        realizations. Returns None if the backing store does not exist or lacks the
+        per-realization batch index."""
+
+        arrow_file_name = storage_dir / (storage_key + ".arrow")
+        if not arrow_file_name.is_file():
+            return None
+
+        source = pa.memory_map(str(arrow_file_name), "r")
+        reader = pa.ipc.RecordBatchFileReader(source)
+        per_real_batch_index = get_per_real_batch_index_from_schema_metadata(
+            reader.schema
+        )
+        if per_real_batch_index is None:
+            return None
+
+        # Drop the schema level metadata (min/max and batch index), it will be
+        # recreated when writing
+        schema = reader.schema.remove_metadata()
+
+        per_real_tables: Dict[int, pa.Table] = {}
+        for real in realizations:
+            if real not in per_real_batch_index:
+                continue
+            first_batch_idx, batch_count = per_real_batch_index[real]
+            batches = [
+                reader.get_batch(batch_idx)
+                for batch_idx in range(first_batch_idx, first_batch_idx + batch_count)
+            ]
+            table = pa.Table.from_batches(batches, schema=schema).drop(["REAL"])
+            all_null_columns = [
+                colname
+                for colname in table.column_names
+                if 0 < table.num_rows == table.column(colname).null_count
+            ]
+            per_real_tables[real] = table.drop(all_null_columns)
+
+        return per_real_tables
+
     def _get_or_read_schema(self) -> pa.Schema:
-        if self._cached_full_table:
+        if self._cached_full_table is not None:
             return self._cached_full_table.schema
         if self._cached_reader:
             return self._cached_reader.schema
@@ -219,15 +423,46 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         source = pa.memory_map(self._arrow_file_name, "r")
         return pa.ipc.RecordBatchFileReader(source).schema
 
-    def _get_or_read_table(self, columns: List[str]) -> pa.Table:
-        if self._cached_full_table:
-            return self._cached_full_table.select(columns)
-        if self._cached_reader:
-            return self._cached_reader.read_all().select(columns)
+    def _get_or_read_table(
+        self, columns: List[str], realizations: Optional[Sequence[int]] = None
+    ) -> pa.Table:
+        """Get table with the specified columns, optionally filtered on realizations.
+        Whenever possible only the record batches and column buffers that are actually
+        needed will be read from file"""
 
-        source = pa.memory_map(self._arrow_file_name, "r")
-        reader = pa.ipc.RecordBatchFileReader(source)
-        return reader.read_all().select(columns)
+        if self._cached_full_table is not None:
+            table = self._cached_full_table.select(columns)
+            return _filter_table_on_realizations(table, realizations)
+
+        source = self._cached_source
+        if not source:
+            source = pa.memory_map(self._arrow_file_name, "r")
+
+        # Only read the requested fields. Note that the fields in the returned
+        # table will be ordered as on file, hence the select() further down
+        schema = self._get_or_read_schema()
+        field_indices = [schema.get_field_index(colname) for colname in columns]
+        field_indices = sorted(idx for idx in field_indices if idx >= 0)
+        read_options = pa.ipc.IpcReadOptions(included_fields=field_indices)
+        reader = pa.ipc.RecordBatchFileReader(source, options=read_options)
+
+        if self._per_real_batch_index is None:
+            table = reader.read_all().select(columns)
+            return _filter_table_on_realizations(table, realizations)
+
+        if realizations:
+            reals_to_get = sorted(set(realizations) & self._per_real_batch_index.keys())
+        else:
+            reals_to_get = sorted(self._per_real_batch_index)
+
+        batches = []
+        for real in reals_to_get:
+            first_batch_idx, batch_count = self._per_real_batch_index[real]
+            for batch_idx in range(first_batch_idx, first_batch_idx + batch_count):
+                batches.append(reader.get_batch(batch_idx))
+
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+        return table.select(columns)
 
     def vector_names(self) -> List[str]:
         return self._vector_names
@@ -289,14 +524,9 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
         timer = PerfTimer()
 
-        table = self._get_or_read_table(["DATE", "REAL"])
+        table = self._get_or_read_table(["DATE", "REAL"], realizations)
         et_read_ms = timer.lap_ms()
 
-        if realizations:
-            mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
-            table = table.filter(mask)
-        et_filter_ms = timer.lap_ms()
-
         if resampling_frequency is not None:
             unique_dates_np = table.column("DATE").unique().to_numpy()
             min_raw_date = np.min(unique_dates_np)
@@ -312,7 +542,6 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         LOGGER.debug(
             f"dates({resampling_frequency}) took: {timer.elapsed_ms()}ms ("
             f"read={et_read_ms}ms, "
-            f"filter={et_filter_ms}ms, "
             f"find_unique={et_find_unique_ms}ms)"
         )
 
@@ -332,14 +561,9 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
         columns_to_get = ["DATE", "REAL"]
         columns_to_get.extend(vector_names)
-        table = self._get_or_read_table(columns_to_get)
+        table = self._get_or_read_table(columns_to_get, realizations)
         et_read_ms = timer.lap_ms()
 
-        if realizations:
-            mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
-            table = table.filter(mask)
-        et_filter_ms = timer.lap_ms()
-
         if resampling_frequency is not None:
             table = resample_segmented_multi_real_table(table, resampling_frequency)
         et_resample_ms = timer.lap_ms()
@@ -350,7 +574,6 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         LOGGER.debug(
             f"get_vectors_df({resampling_frequency}) took: {timer.elapsed_ms()}ms ("
             f"read={et_read_ms}ms, "
-            f"filter={et_filter_ms}ms, "
             f"resample={et_resample_ms}ms, "
             f"to_pandas={et_to_pandas_ms}ms), "
             f"#vecs={len(vector_names)}, "
@@ -360,6 +583,47 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
         return df
 
+    def get_vectors_statistics_df(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+
+        if not vector_names:
+            raise ValueError("List of requested vector names is empty")
+
+        timer = PerfTimer()
+
+        columns_to_get = ["DATE", "REAL"]
+        columns_to_get.extend(vector_names)
+        table = self._get_or_read_table(columns_to_get, realizations)
+        et_read_ms = timer.lap_ms()
+
+        if resampling_frequency is not None:
+            table = resample_segmented_multi_real_table(table, resampling_frequency)
+        et_resample_ms = timer.lap_ms()
+
+        stat_table = compute_vectors_statistics_table(table, vector_names)
+        et_calc_stats_ms = timer.lap_ms()
+
+        df = statistics_table_to_df(stat_table, vector_names)
+        et_to_pandas_ms = timer.lap_ms()
+
+        LOGGER.debug(
+            f"get_vectors_statistics_df({resampling_frequency}) took: "
+            f"{timer.elapsed_ms()}ms ("
+            f"read={et_read_ms}ms, "
+            f"resample={et_resample_ms}ms, "
+            f"calc_stats={et_calc_stats_ms}ms, "
+            f"to_pandas={et_to_pandas_ms}ms), "
+            f"#vecs={len(vector_names)}, "
+            f"#real={len(realizations) if realizations else 'all'}, "
+            f"df.shape={df.shape}, file={Path(self._arrow_file_name).name}"
+        )
+
+        return df
+
     def get_vectors_for_date_df(
         self,
         date: datetime.datetime,
@@ -374,14 +638,9 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
         columns_to_get = ["DATE", "REAL"]
         columns_to_get.extend(vector_names)
-        table = self._get_or_read_table(columns_to_get)
+        table = self._get_or_read_table(columns_to_get, realizations)
         et_read_ms = timer.lap_ms()
 
-        if realizations:
-            real_mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
-            table = table.filter(real_mask)
-        et_filter_ms = timer.lap_ms()
-
         np_lookup_date = np.datetime64(date, "ms")
         table = sample_segmented_multi_real_table_at_date(table, np_lookup_date)
 
@@ -394,7 +653,6 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         LOGGER.debug(
             f"get_vectors_for_date_df() took: {timer.elapsed_ms()}ms ("
             f"read={et_read_ms}ms, "
-            f"filter={et_filter_ms}ms, "
             f"resample={et_resample_ms}ms, "
             f"to_pandas={et_to_pandas_ms}ms), "
             f"#vecs={len(vector_names)}, "
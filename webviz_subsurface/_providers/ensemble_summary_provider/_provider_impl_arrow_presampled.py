@@ -20,6 +20,12 @@ from ._table_utils import (
     find_min_max_for_numeric_table_columns,
     get_per_vector_min_max_from_schema_metadata,
 )
+from ._vector_statistics import (
+    VectorStatistic,
+    compute_vectors_statistics_table,
+    make_statistic_column_name,
+    statistics_table_to_df,
+)
 from .ensemble_summary_provider import (
     EnsembleSummaryProvider,
     Frequency,
@@ -57,6 +63,33 @@ def _set_date_column_type_to_timestamp_ms(schema: pa.Schema) -> pa.Schema:
     return pa.schema(field_list)
 
 
+def _statistics_file_name(arrow_file_name: Path) -> Path:
+    # Companion file with precomputed statistics for all realizations
+    return arrow_file_name.with_suffix(".stats.arrow")
+
+
+def _write_statistics_file(arrow_file_name: Path, table: pa.Table) -> None:
+    vector_names = [
+        field.name
+        for field in table.schema
+        if field.name not in ["DATE", "REAL", "ENSEMBLE"]
+        and (pa.types.is_floating(field.type) or pa.types.is_integer(field.type))
+    ]
+    stat_table = compute_vectors_statistics_table(table, vector_names)
+    feather.write_feather(
+        stat_table,
+        dest=_statistics_file_name(arrow_file_name),
+        compression="uncompressed",
+    )
+
+
+def _remove_statistics_file(arrow_file_name: Path) -> None:
+    # Make sure we never pair a new backing store with stale statistics
+    stats_file_name = _statistics_file_name(arrow_file_name)
+    if stats_file_name.exists():
+        stats_file_name.unlink()
+
+
 def _sort_table_on_date_then_real(table: pa.Table) -> pa.Table:
     indices = pc.sort_indices(
         table, sort_keys=[("DATE", "ascending"), ("REAL", "ascending")]
@@ -97,6 +130,18 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
         # Done to try and stop blobfuse from throwing the file out of its cache.
         self._cached_reader = reader
 
+        # Precomputed statistics are optional, backing stores written by older
+        # versions will not have them
+        self._cached_stats_source: Optional[pa.MemoryMappedFile] = None
+        self._stats_schema: Optional[pa.Schema] = None
+        stats_file_name = _statistics_file_name(Path(self._arrow_file_name))
+        if stats_file_name.is_file():
+            self._cached_stats_source = pa.memory_map(str(stats_file_name), "r")
+            self._stats_schema = pa.ipc.RecordBatchFileReader(
+                self._cached_stats_source
+            ).schema
+        et_open_stats_ms = timer.lap_ms()
+
         # For testing, uncomment code below and we will be more aggressive
         # and keep the "raw" table in memory
         self._cached_full_table = None
@@ -105,7 +150,8 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
         LOGGER.debug(
             f"init took: {timer.elapsed_s():.2f}s, "
             f"(open={et_open_ms}ms, create_reader={et_create_reader_ms}ms, "
-            f"find_vec_names={et_find_vec_names_ms}ms, find_real={et_find_real_ms}ms), "
+            f"find_vec_names={et_find_vec_names_ms}ms, find_real={et_find_real_ms}ms, "
+            f"open_stats={et_open_stats_ms}ms), "
             f"#vector_names={len(self._vector_names)}, "
             f"#realization={len(self._realizations)}"
         )
@@ -126,6 +172,7 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
             find_and_store_min_max_s: float = -1
             sorting_s: float = -1
             write_s: float = -1
+            write_stats_s: float = -1
 
         elapsed = Elapsed()
 
@@ -135,6 +182,8 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
         )
         timer = PerfTimer()
 
+        _remove_statistics_file(arrow_file_name)
+
         # Force data type in the incoming DataFrame's DATE column to datetime.datetime objects
         # This is the first step in coercing pyarrow to always store DATEs as timestamps
         ensemble_df = make_date_column_datetime_object(ensemble_df)
@@ -176,13 +225,17 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
         feather.write_feather(table, dest=arrow_file_name, compression="uncompressed")
         elapsed.write_s = timer.lap_s()
 
+        _write_statistics_file(arrow_file_name, table)
+        elapsed.write_stats_s = timer.lap_s()
+
         LOGGER.debug(
             f"Wrote backing store to arrow file in: {timer.elapsed_s():.2f}s ("
             f"convert_date={elapsed.convert_date_s:.2f}s, "
             f"table_from_pandas={elapsed.table_from_pandas_s:.2f}s, "
             f"find_and_store_min_max={elapsed.find_and_store_min_max_s:.2f}s, "
             f"sorting={elapsed.sorting_s:.2f}s, "
-            f"write={elapsed.write_s:.2f}s)"
+            f"write={elapsed.write_s:.2f}s, "
+            f"write_stats={elapsed.write_stats_s:.2f}s)"
         )
 
     @staticmethod
@@ -196,6 +249,7 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
             sorting_s: float = -1
             find_and_store_min_max_s: float = -1
             write_s: float = -1
+            write_stats_s: float = -1
 
         elapsed = Elapsed()
 
@@ -205,6 +259,8 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
         )
         timer = PerfTimer()
 
+        _remove_statistics_file(arrow_file_name)
+
         unique_column_names = set()
         for table in per_real_tables.values():
             unique_column_names.update(table.schema.names)
@@ -242,13 +298,17 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
         )
         elapsed.write_s = timer.lap_s()
 
+        _write_statistics_file(arrow_file_name, full_table)
+        elapsed.write_stats_s = timer.lap_s()
+
         LOGGER.debug(
             f"Wrote backing store to arrow file in: {timer.elapsed_s():.2f}s ("
             f"concat_tables={elapsed.concat_tables_s:.2f}s, "
             f"build_add_real_col={elapsed.build_add_real_col_s:.2f}s, "
             f"sorting={elapsed.sorting_s:.2f}s, "
             f"find_and_store_min_max={elapsed.find_and_store_min_max_s:.2f}s, "
-            f"write={elapsed.write_s:.2f}s)"
+            f"write={elapsed.write_s:.2f}s, "
+            f"write_stats={elapsed.write_stats_s:.2f}s)"
         )
 
     @staticmethod
@@ -281,6 +341,26 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
         reader = pa.ipc.RecordBatchFileReader(source)
         return reader.read_all().select(columns)
 
+    def _read_statistics_table(self, columns: List[str]) -> pa.Table:
+        """Read the specified columns from the precomputed statistics file. The file
+        has one column per vector and statistic, so make sure to only deserialize
+        the fields that are actually requested"""
+
+        if self._cached_stats_source is None or self._stats_schema is None:
+            raise ValueError("No precomputed statistics available")
+
+        # Note that the fields in the returned table will be ordered as on file,
+        # hence the select() further down
+        field_indices = [
+            self._stats_schema.get_field_index(colname) for colname in columns
+        ]
+        field_indices = sorted(idx for idx in field_indices if idx >= 0)
+        read_options = pa.ipc.IpcReadOptions(included_fields=field_indices)
+        reader = pa.ipc.RecordBatchFileReader(
+            self._cached_stats_source, options=read_options
+        )
+        return reader.read_all().select(columns)
+
     def vector_names(self) -> List[str]:
         return self._vector_names
 
@@ -418,6 +498,61 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
 
         return df
 
+    def get_vectors_statistics_df(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+
+        if resampling_frequency is not None:
+            raise ValueError("Resampling is not supported by this provider")
+
+        timer = PerfTimer()
+
+        # Use the precomputed statistics unless a realization filter is active
+        use_precomputed = self._cached_stats_source is not None and (
+            not realizations or set(realizations).issuperset(self._realizations)
+        )
+
+        if use_precomputed:
+            columns_to_get = ["DATE"]
+            for vector_name in vector_names:
+                columns_to_get.extend(
+                    make_statistic_column_name(vector_name, statistic)
+                    for statistic in VectorStatistic
+                )
+            stat_table = self._read_statistics_table(columns_to_get)
+            et_read_ms = timer.lap_ms()
+            et_calc_stats_ms = 0
+        else:
+            columns_to_get = ["DATE", "REAL"]
+            columns_to_get.extend(vector_names)
+            table = self._get_or_read_table(columns_to_get)
+            if realizations:
+                mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
+                table = table.filter(mask)
+            et_read_ms = timer.lap_ms()
+
+            stat_table = compute_vectors_statistics_table(table, vector_names)
+            et_calc_stats_ms = timer.lap_ms()
+
+        df = statistics_table_to_df(stat_table, vector_names)
+        et_to_pandas_ms = timer.lap_ms()
+
+        LOGGER.debug(
+            f"get_vectors_statistics_df() took: {timer.elapsed_ms()}ms ("
+            f"read={et_read_ms}ms, "
+            f"calc_stats={et_calc_stats_ms}ms, "
+            f"to_pandas={et_to_pandas_ms}ms), "
+            f"precomputed={use_precomputed}, "
+            f"#vecs={len(vector_names)}, "
+            f"#real={len(realizations) if realizations else 'all'}, "
+            f"df.shape={df.shape}, file={Path(self._arrow_file_name).name}"
+        )
+
+        return df
+
     def get_vectors_for_date_df(
         self,
         date: datetime.datetime,
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict
+from typing import Any, Dict, List
 
 import numpy as np
 import pyarrow as pa
@@ -145,31 +145,137 @@ def resample_single_real_table(table: pa.Table, freq: Frequency) -> pa.Table:
 
 
 @dataclass
-class RealInterpolationInfo:
-    raw_dates_np: np.ndarray
-    raw_dates_np_as_uint: np.ndarray
+class SegmentedResamplingIndices:
+    """Row indices and weights for resampling all the value columns of a table that
+    is segmented on REAL, computed once and shared between all the columns.
+
+    All arrays have one entry per output row. For non-rate columns the output value
+    is the linear blend between the rows given by interp_lo_rows and interp_hi_rows
+    using the weights in interp_t. For rate columns the output is the value in
+    backfill_rows multiplied by backfill_mask, which is 0 outside the raw date range.
+    """
+
     sample_dates_np: np.ndarray
-    sample_dates_np_as_uint: np.ndarray
+    sample_reals_np: np.ndarray
+    interp_lo_rows: np.ndarray
+    interp_hi_rows: np.ndarray
+    interp_t: np.ndarray
+    backfill_rows: np.ndarray
+    backfill_mask: np.ndarray
+
+
+# Upper limit for the size of the stacked (columns, rows) matrix that is gathered
+# from in one go when resampling
+_MAX_STACKED_COLUMNS_BYTES = 64 * 1024 * 1024
+
 
+def compute_segmented_resampling_indices(
+    table: pa.Table, freq: Frequency
+) -> SegmentedResamplingIndices:
+    """Compute the row indices and interpolation weights needed to resample table.
+    The table must contain both a REAL and a DATE column, be segmented on REAL and
+    sorted on DATE within each REAL segment.
+    """
+    # pylint: disable=too-many-locals
+
+    unique_reals, first_occurrence_idx, real_counts = np.unique(
+        table.column("REAL").to_numpy(), return_index=True, return_counts=True
+    )
+    all_raw_dates_np = table.column("DATE").to_numpy()
 
-def _extract_real_interpolation_info(
-    table: pa.Table, start_row_idx: int, row_count: int, freq: Frequency
-) -> RealInterpolationInfo:
+    sample_dates_list = []
+    sample_reals_list = []
+    interp_lo_list = []
+    interp_hi_list = []
+    interp_t_list = []
+    backfill_rows_list = []
+    backfill_mask_list = []
 
-    real_dates = table["DATE"].slice(start_row_idx, row_count).to_numpy()
+    for i, real in enumerate(unique_reals):
+        start_row_idx = first_occurrence_idx[i]
+        row_count = real_counts[i]
 
-    min_raw_date = np.min(real_dates)
-    max_raw_date = np.max(real_dates)
-    sample_dates = generate_normalized_sample_dates(min_raw_date, max_raw_date, freq)
+        raw_dates = all_raw_dates_np[start_row_idx : start_row_idx + row_count]
+        sample_dates = generate_normalized_sample_dates(
+            np.min(raw_dates), np.max(raw_dates), freq
+        )
 
-    return RealInterpolationInfo(
-        raw_dates_np=real_dates,
-        raw_dates_np_as_uint=real_dates.astype(np.uint64),
-        sample_dates_np=sample_dates,
-        sample_dates_np_as_uint=sample_dates.astype(np.uint64),
+        raw_x = raw_dates.astype(np.uint64).astype(np.float64)
+        x = sample_dates.astype(np.uint64).astype(np.float64)
+        last_idx = row_count - 1
+
+        # Linear interpolation, equivalent to np.interp(), which clamps to the first
+        # and last values outside the raw date range. On exact matches and outside
+        # the range we use the same row for both lo and hi, with a weight of 0
+        lo_idx = np.maximum(np.searchsorted(raw_x, x, side="right") - 1, 0)
+        hi_idx = np.where(raw_x[lo_idx] >= x, lo_idx, np.minimum(lo_idx + 1, last_idx))
+        span = raw_x[hi_idx] - raw_x[lo_idx]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            interp_t = np.where(span > 0, (x - raw_x[lo_idx]) / span, 0.0)
+
+        # Back-filling, equivalent to interpolate_backfill() with yleft=yright=0
+        bf_idx = np.searchsorted(raw_x, x, side="left")
+        bf_mask = (bf_idx <= last_idx) & (x >= raw_x[0])
+
+        sample_dates_list.append(sample_dates)
+        sample_reals_list.append(np.full(len(sample_dates), real))
+        interp_lo_list.append(start_row_idx + lo_idx)
+        interp_hi_list.append(start_row_idx + hi_idx)
+        interp_t_list.append(interp_t)
+        backfill_rows_list.append(start_row_idx + np.minimum(bf_idx, last_idx))
+        backfill_mask_list.append(bf_mask.astype(np.float64))
+
+    def _concat(arr_list: List[np.ndarray], dtype: Any) -> np.ndarray:
+        if not arr_list:
+            return np.empty(0, dtype=dtype)
+        return np.concatenate(arr_list)
+
+    return SegmentedResamplingIndices(
+        sample_dates_np=_concat(sample_dates_list, "datetime64[ms]"),
+        sample_reals_np=_concat(sample_reals_list, unique_reals.dtype),
+        interp_lo_rows=_concat(interp_lo_list, np.int64),
+        interp_hi_rows=_concat(interp_hi_list, np.int64),
+        interp_t=_concat(interp_t_list, np.float64),
+        backfill_rows=_concat(backfill_rows_list, np.int64),
+        backfill_mask=_concat(backfill_mask_list, np.float64),
     )
 
 
+def _resample_column_group(
+    table: pa.Table,
+    column_names: List[str],
+    is_rate: bool,
+    indices: SegmentedResamplingIndices,
+) -> Dict[str, np.ndarray]:
+    """Resample a group of columns that are either all rates or all non-rates by
+    stacking them into a matrix and gathering the sample rows for all the columns
+    in one go"""
+
+    ret_dict: Dict[str, np.ndarray] = {}
+
+    bytes_per_column = max(1, 8 * table.num_rows)
+    chunk_size = max(1, _MAX_STACKED_COLUMNS_BYTES // bytes_per_column)
+
+    for chunk_start in range(0, len(column_names), chunk_size):
+        chunk_names = column_names[chunk_start : chunk_start + chunk_size]
+        # Stack as (columns, rows) so that each resampled column ends up contiguous
+        stacked = np.vstack(
+            [table.column(name).to_numpy() for name in chunk_names]
+        ).astype(np.float64, copy=False)
+
+        if is_rate:
+            resampled = stacked[:, indices.backfill_rows] * indices.backfill_mask
+        else:
+            v0_mat = stacked[:, indices.interp_lo_rows]
+            v1_mat = stacked[:, indices.interp_hi_rows]
+            resampled = v0_mat + indices.interp_t * (v1_mat - v0_mat)
+
+        for col_idx, name in enumerate(chunk_names):
+            ret_dict[name] = resampled[col_idx]
+
+    return ret_dict
+
+
 def resample_segmented_multi_real_table(table: pa.Table, freq: Frequency) -> pa.Table:
     """Resample table containing multiple realizations.
     The table must contain both a REAL and a DATE column.
@@ -179,88 +285,45 @@ def resample_segmented_multi_real_table(table: pa.Table, freq: Frequency) -> pa.
     The segmentation is needed since interpolations must be done per realization
     and we utilize slicing on rows for speed.
     """
-    # pylint: disable=too-many-locals
-
-    real_arr_np = table.column("REAL").to_numpy()
-    unique_reals, first_occurrence_idx, real_counts = np.unique(
-        real_arr_np, return_index=True, return_counts=True
-    )
-
-    output_columns_dict: Dict[str, pa.ChunkedArray] = {}
 
-    real_interpolation_info_dict: Dict[int, RealInterpolationInfo] = {}
+    # The sample positions only depend on the dates of each realization, so we
+    # compute the indices and weights once and apply them to all the columns
+    indices = compute_segmented_resampling_indices(table, freq)
 
+    rate_columns: List[str] = []
+    non_rate_columns: List[str] = []
     for colname in table.schema.names:
         if colname in ["DATE", "REAL"]:
             continue
+        if is_rate_from_field_meta(table.field(colname)):
+            rate_columns.append(colname)
+        else:
+            non_rate_columns.append(colname)
 
-        is_rate = is_rate_from_field_meta(table.field(colname))
-        raw_whole_numpy_arr = table.column(colname).to_numpy()
-
-        vec_arr_list = []
-        for i, real in enumerate(unique_reals):
-            start_row_idx = first_occurrence_idx[i]
-            row_count = real_counts[i]
-
-            rii = real_interpolation_info_dict.get(real)
-            if not rii:
-                rii = _extract_real_interpolation_info(
-                    table, start_row_idx, row_count, freq
-                )
-                real_interpolation_info_dict[real] = rii
-
-            raw_numpy_arr = raw_whole_numpy_arr[
-                start_row_idx : start_row_idx + row_count
-            ]
-
-            if is_rate:
-                inter = interpolate_backfill(
-                    rii.sample_dates_np_as_uint,
-                    rii.raw_dates_np_as_uint,
-                    raw_numpy_arr,
-                    0,
-                    0,
-                )
-            else:
-                inter = np.interp(
-                    rii.sample_dates_np_as_uint,
-                    rii.raw_dates_np_as_uint,
-                    raw_numpy_arr,
-                )
-
-            arr_length = len(rii.sample_dates_np_as_uint)
-            assert arr_length == len(inter)
-
-            vec_arr_list.append(inter)
-
-        output_columns_dict[colname] = pa.chunked_array(vec_arr_list)
-
-    date_arr_list = []
-    real_arr_list = []
-    for real in unique_reals:
-        rii = real_interpolation_info_dict[real]
-        arr_length = len(rii.sample_dates_np)
-        date_arr_list.append(rii.sample_dates_np)
-        real_arr_list.append(np.full(arr_length, real))
+    resampled_dict: Dict[str, np.ndarray] = {}
+    resampled_dict.update(_resample_column_group(table, rate_columns, True, indices))
+    resampled_dict.update(
+        _resample_column_group(table, non_rate_columns, False, indices)
+    )
 
-    output_columns_dict["DATE"] = pa.chunked_array(date_arr_list)
-    output_columns_dict["REAL"] = pa.chunked_array(real_arr_list)
+    output_columns_dict: Dict[str, np.ndarray] = {}
+    for colname in table.schema.names:
+        if colname == "DATE":
+            output_columns_dict[colname] = indices.sample_dates_np
+        elif colname == "REAL":
+            output_columns_dict[colname] = indices.sample_reals_np
+        else:
+            # Cast to the output type up front, pyarrow's checked cast from float64
+            # is a lot slower than the numpy cast
+            output_columns_dict[colname] = resampled_dict[colname].astype(
+                table.field(colname).type.to_pandas_dtype(), copy=False
+            )
 
     ret_table = pa.table(output_columns_dict, schema=table.schema)
 
     return ret_table
 
 
-def _compute_interpolation_weight(
-    d: np.datetime64, d0: np.datetime64, d1: np.datetime64
-) -> float:
-    # pylint: disable=invalid-name
-    d_as_uint = d.astype(np.uint64)
-    d0_as_uint = d0.astype(np.uint64)
-    d1_as_uint = d1.astype(np.uint64)
-    return float(d_as_uint - d0_as_uint) / float(d1_as_uint - d0_as_uint)
-
-
 def sample_segmented_multi_real_table_at_date(
     table: pa.Table, np_datetime: np.datetime64
 ) -> pa.Table:
@@ -270,102 +333,112 @@ def sample_segmented_multi_real_table_at_date(
     realization are contiguous) and within each REAL segment, it must be
     sorted on DATE.
     """
-    # pylint: disable=too-many-locals
+    return sample_segmented_multi_real_table_at_dates(table, np.array([np_datetime]))
 
-    unique_reals_arr_np, first_occurrence_idx, real_counts = np.unique(
-        table.column("REAL").to_numpy(), return_index=True, return_counts=True
-    )
 
-    all_dates_arr_np = table.column("DATE").to_numpy()
+def sample_segmented_multi_real_table_at_dates(
+    table: pa.Table, np_datetimes: np.ndarray
+) -> pa.Table:
+    """Sample table containing multiple realizations at each of the specified dates.
+    The table must contain both a REAL and a DATE column.
+    The table must be segmented on REAL (so that all rows from a single
+    realization are contiguous) and within each REAL segment, it must be
+    sorted on DATE.
+
+    The returned table has one row per date and realization, ordered by the
+    dates in np_datetimes and then by ascending REAL. Rates are back-filled and
+    set to 0 outside each realization's date range, while all other vectors are
+    linearly interpolated and clamped to the first/last value outside the range.
+    """
+    # pylint: disable=too-many-locals
+
+    query_dates = np.asarray(np_datetimes).astype("datetime64[ms]", copy=False)
+    query_dates_int = query_dates.astype(np.int64)
 
-    # Will receive row indices into the full input table for the two values we should
-    # interpolate/blend between.
-    # To keep things simple we always add two indices for each realization even if
-    # we know that no interpolation will be needed (e.g. exact matches)
-    row_indices = []
+    if table.num_rows == 0:
+        return table.slice(0, 0)
 
-    # Will receive the blending weights for doing interpolation
-    interpolate_t_arr = np.zeros(len(unique_reals_arr_np))
+    # Since the table is segmented on REAL we can find the segments by looking for
+    # changes in REAL, which is much cheaper than np.unique() on the whole column
+    real_arr_np = table.column("REAL").to_numpy()
+    segment_start_rows = np.flatnonzero(
+        np.concatenate(([True], real_arr_np[1:] != real_arr_np[:-1]))
+    )
+    segment_row_counts = np.diff(np.append(segment_start_rows, len(real_arr_np)))
+    num_reals = len(segment_start_rows)
+
+    # Segments are ordered by their position in the table, which need not be the
+    # same as the sorted order of the REAL numbers that we want in the output
+    segment_pos_of_real = np.argsort(real_arr_np[segment_start_rows], kind="stable")
+    unique_reals_arr_np = real_arr_np[segment_start_rows][segment_pos_of_real]
+    first_occurrence_idx = segment_start_rows[segment_pos_of_real]
+    real_counts = segment_row_counts[segment_pos_of_real]
+
+    raw_dates_int = (
+        table.column("DATE").to_numpy().astype("datetime64[ms]", copy=False)
+    ).view(np.int64)
+
+    # Do one search for all realizations and dates by encoding the dates with a
+    # per segment offset, so that the encoded dates of the whole table are sorted.
+    # Query dates are clamped to just outside the range of the table's dates,
+    # which keeps the encoded values within their segment.
+    span_start = raw_dates_int.min() - 1
+    span = raw_dates_int.max() - span_start + 2
+    row_segment_pos = np.repeat(np.arange(num_reals), segment_row_counts)
+
+    encoded_raw_dates = row_segment_pos * span + (raw_dates_int - span_start)
+    clamped_query_dates = np.clip(query_dates_int, span_start, span_start + span - 1)
+    encoded_query_dates = segment_pos_of_real[np.newaxis, :] * span + (
+        clamped_query_dates[:, np.newaxis] - span_start
+    )
 
-    # Array with mask for selecting values when doing backfill. A value of 1 will select
-    # v1, while a value of 0 will yield a 0 value
-    backfill_mask_arr = np.ones(len(unique_reals_arr_np))
+    # All the following arrays have shape (num dates, num reals)
+    last_insertion_idx = np.searchsorted(
+        encoded_raw_dates, encoded_query_dates, side="right"
+    )
+    first_row = first_occurrence_idx[np.newaxis, :]
+    last_row = first_row + real_counts[np.newaxis, :] - 1
+    query = query_dates_int[:, np.newaxis]
+
+    # Row indices into the full input table for the two values we should
+    # interpolate/blend between. When no interpolation is needed (outside the range
+    # or exact matches) both indices refer to the same row
+    lo_rows = np.clip(last_insertion_idx - 1, first_row, last_row)
+    outside_range = (query < raw_dates_int[first_row]) | (
+        query > raw_dates_int[last_row]
+    )
+    no_blend = outside_range | (raw_dates_int[lo_rows] == query)
+    hi_rows = np.where(no_blend, lo_rows, lo_rows + 1)
 
-    for i, _real in enumerate(unique_reals_arr_np):
-        # Starting row of this realization and number of rows belonging to realization
-        start_row_idx = first_occurrence_idx[i]
-        row_count = real_counts[i]
+    # Blending weights for doing interpolation
+    lo_dates = raw_dates_int[lo_rows].astype(np.float64)
+    hi_dates = raw_dates_int[hi_rows].astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        interpolate_t_arr = np.where(
+            no_blend, 0.0, (query - lo_dates) / (hi_dates - lo_dates)
+        ).ravel()
 
-        # Get slice of the dates for just this realization
-        dates_arr_np = all_dates_arr_np[start_row_idx : start_row_idx + row_count]
-        assert len(dates_arr_np) > 0
-
-        # OUTSIDE RANGE (query date is before our first date)
-        if np_datetime < dates_arr_np[0]:
-            row_indices.append(start_row_idx)
-            row_indices.append(start_row_idx)
-            # Extrapolate or just fill with 0 for rates
-            # interpolate_t_arr[i] = 0
-            backfill_mask_arr[i] = 0
-
-        # OUTSIDE RANGE (query date is beyond our last date)
-        elif np_datetime > dates_arr_np[-1]:
-            row_indices.append(start_row_idx + row_count - 1)
-            row_indices.append(start_row_idx + row_count - 1)
-            # Extrapolate or just fill with 0 for rates. For interpolation, t should
-            # really 1, but since the rows are duplicated it does not matter
-            # interpolate_t_arr[i] = 0
-            backfill_mask_arr[i] = 0
-
-        # EXACT MATCH on the LAST DATE
-        elif np_datetime == dates_arr_np[-1]:
-            row_indices.append(start_row_idx + row_count - 1)
-            row_indices.append(start_row_idx + row_count - 1)
-            # interpolate_t_arr[i] = 0
-            # backfill_mask_arr[i] = 1
+    # Mask for selecting values when doing backfill. A value of 1 will select v1,
+    # while a value of 0 will yield a 0 value
+    backfill_mask_arr = np.where(outside_range, 0.0, 1.0).ravel()
 
-        else:
-            # Search for query date amongst the realization's dates.
-            # last_insertion_index is the last legal insertion index of the queried value
-            last_insertion_index: int = np.searchsorted(
-                dates_arr_np, np_datetime, side="right"
-            ).item()
-
-            assert 0 < last_insertion_index < len(dates_arr_np)
-            assert dates_arr_np[last_insertion_index - 1] <= np_datetime
-            assert dates_arr_np[last_insertion_index] > np_datetime
-
-            if dates_arr_np[last_insertion_index - 1] == np_datetime:
-                # Exact match
-                row_indices.append(start_row_idx + last_insertion_index - 1)
-                row_indices.append(start_row_idx + last_insertion_index - 1)
-                # interpolate_t_arr[i] = 0
-                # backfill_mask_arr[i] = 1
-            else:
-                row_indices.append(start_row_idx + last_insertion_index - 1)
-                row_indices.append(start_row_idx + last_insertion_index)
-                interpolate_t_arr[i] = _compute_interpolation_weight(
-                    np_datetime,
-                    dates_arr_np[last_insertion_index - 1],
-                    dates_arr_np[last_insertion_index],
-                )
-                # backfill_mask_arr[i] = 1
+    # Gather the two rows for all columns with a single take
+    num_samples = lo_rows.size
+    records_table = table.take(np.concatenate((lo_rows.ravel(), hi_rows.ravel())))
 
     column_arrays = []
-
     for colname in table.schema.names:
         if colname == "REAL":
-            column_arrays.append(unique_reals_arr_np)
+            column_arrays.append(np.tile(unique_reals_arr_np, len(query_dates)))
         elif colname == "DATE":
-            column_arrays.append(np.full(len(unique_reals_arr_np), np_datetime))
+            column_arrays.append(np.repeat(query_dates, num_reals))
         else:
-            records_np = table.column(colname).take(row_indices).to_numpy()
+            records_np = records_table.column(colname).to_numpy()
+            v0_arr = records_np[:num_samples]
+            v1_arr = records_np[num_samples:]
             if is_rate_from_field_meta(table.field(colname)):
-                v1_arr = records_np[1::2]
                 interpolated_vec_values = v1_arr * backfill_mask_arr
             else:
-                v0_arr = records_np[0::2]
-                v1_arr = records_np[1::2]
                 delta_arr = v1_arr - v0_arr
                 interpolated_vec_values = v0_arr + (delta_arr * interpolate_t_arr)
 
@@ -1,5 +1,5 @@
 import json
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pyarrow as pa
@@ -7,6 +7,7 @@ import pyarrow.compute as pc
 
 _MAIN_WEBVIZ_METADATA_KEY = b"webviz"
 _PER_VECTOR_MIN_MAX_KEY = "per_vector_min_max"
+_PER_REAL_BATCH_INDEX_KEY = "per_real_batch_index"
 
 
 def find_min_max_for_numeric_table_columns(
@@ -31,13 +32,9 @@ def add_per_vector_min_max_to_table_schema_metadata(
 ) -> pa.Table:
     """Store dict with per-vector min/max values schema's metadata"""
 
-    webviz_meta = {_PER_VECTOR_MIN_MAX_KEY: per_vector_min_max}
-    new_combined_meta = {}
-    if table.schema.metadata is not None:
-        new_combined_meta.update(table.schema.metadata)
-    new_combined_meta.update({_MAIN_WEBVIZ_METADATA_KEY: json.dumps(webviz_meta)})
-    table = table.replace_schema_metadata(new_combined_meta)
-    return table
+    return _add_entry_to_webviz_schema_metadata(
+        table, _PER_VECTOR_MIN_MAX_KEY, per_vector_min_max
+    )
 
 
 def get_per_vector_min_max_from_schema_metadata(schema: pa.Schema) -> Dict[str, dict]:
@@ -47,6 +44,58 @@ def get_per_vector_min_max_from_schema_metadata(schema: pa.Schema) -> Dict[str,
     return webviz_meta[_PER_VECTOR_MIN_MAX_KEY]
 
 
+def add_per_real_batch_index_to_table_schema_metadata(
+    table: pa.Table, per_real_batch_index: Dict[int, Tuple[int, int]]
+) -> pa.Table:
+    """Store dict with per-realization record batch ranges in the schema's metadata.
+    The ranges are given as (first_batch_idx, batch_count) indexed by realization number"""
+
+    json_compatible_index = {
+        str(real): [first_batch_idx, batch_count]
+        for real, (first_batch_idx, batch_count) in per_real_batch_index.items()
+    }
+    return _add_entry_to_webviz_schema_metadata(
+        table, _PER_REAL_BATCH_INDEX_KEY, json_compatible_index
+    )
+
+
+def get_per_real_batch_index_from_schema_metadata(
+    schema: pa.Schema,
+) -> Optional[Dict[int, Tuple[int, int]]]:
+    """Extract dict containing per-realization record batch ranges from the schema-level
+    metadata. Returns None if no index is present, e.g. for files written by older versions"""
+
+    if schema.metadata is None or _MAIN_WEBVIZ_METADATA_KEY not in schema.metadata:
+        return None
+
+    webviz_meta = json.loads(schema.metadata[_MAIN_WEBVIZ_METADATA_KEY])
+    json_index = webviz_meta.get(_PER_REAL_BATCH_INDEX_KEY)
+    if json_index is None:
+        return None
+
+    return {
+        int(real_str): (int(batch_range[0]), int(batch_range[1]))
+        for real_str, batch_range in json_index.items()
+    }
+
+
+def _add_entry_to_webviz_schema_metadata(
+    table: pa.Table, key: str, value: dict
+) -> pa.Table:
+    webviz_meta = {}
+    new_combined_meta = {}
+    if table.schema.metadata is not None:
+        new_combined_meta.update(table.schema.metadata)
+        existing_webviz_meta = table.schema.metadata.get(_MAIN_WEBVIZ_METADATA_KEY)
+        if existing_webviz_meta is not None:
+            webviz_meta.update(json.loads(existing_webviz_meta))
+
+    webviz_meta[key] = value
+    new_combined_meta.update({_MAIN_WEBVIZ_METADATA_KEY: json.dumps(webviz_meta)})
+    table = table.replace_schema_metadata(new_combined_meta)
+    return table
+
+
 def find_intersected_dates_between_realizations(table: pa.Table) -> np.ndarray:
     """Find the intersection of dates present in all the realizations
     The input table must contain both REAL and DATE columns, but this function makes
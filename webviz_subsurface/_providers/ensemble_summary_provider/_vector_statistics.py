@@ -0,0 +1,158 @@
+import logging
+from enum import Enum
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from webviz_subsurface._utils.nan_statistics import NanStatistics, calc_nan_statistics
+
+LOGGER = logging.getLogger(__name__)
+
+
+class VectorStatistic(Enum):
+    """Per date statistics across realizations.
+    Note that P10 and P90 follow the oil industry convention, i.e. P10 is the 90th
+    percentile and P90 is the 10th percentile."""
+
+    MEAN = "MEAN"
+    MIN = "MIN"
+    MAX = "MAX"
+    P10 = "P10"
+    P90 = "P90"
+    P50 = "P50"
+
+
+# Note that P10 and P90 are inverted according to oil industry convention
+_STATISTIC_PERCENTILES: Dict[VectorStatistic, float] = {
+    VectorStatistic.P10: 90,
+    VectorStatistic.P90: 10,
+    VectorStatistic.P50: 50,
+}
+
+# Upper limit for the size of the dense (vectors, dates, realizations) array
+# that the statistics are computed from
+_MAX_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def make_statistic_column_name(vector_name: str, statistic: VectorStatistic) -> str:
+    return f"{vector_name}::{statistic.value}"
+
+
+def compute_vectors_statistics_table(
+    table: pa.Table, vector_names: Sequence[str]
+) -> pa.Table:
+    """Compute per date statistics across realizations for the specified vectors.
+    The input table must contain DATE and REAL columns in addition to the vectors.
+
+    The returned table contains a DATE column with the unique dates in ascending
+    order, and one column per vector and statistic, named according to
+    make_statistic_column_name()
+    """
+
+    date_np = table["DATE"].to_numpy()
+    unique_dates, date_codes = np.unique(date_np, return_inverse=True)
+    unique_reals, real_codes = np.unique(table["REAL"].to_numpy(), return_inverse=True)
+
+    per_vector_stats = _calc_per_date_statistics(
+        date_codes=date_codes,
+        num_dates=len(unique_dates),
+        real_codes=real_codes,
+        num_reals=len(unique_reals),
+        vector_names=vector_names,
+        get_vector_values=lambda name: table[name].to_numpy(),
+    )
+
+    field_list = [pa.field("DATE", table.schema.field("DATE").type)]
+    columndata_list = [pa.array(unique_dates, type=field_list[0].type)]
+    for vector_name, vector_stats in per_vector_stats.items():
+        for statistic, values in vector_stats.items():
+            column_name = make_statistic_column_name(vector_name, statistic)
+            field_list.append(pa.field(column_name, pa.float64()))
+            columndata_list.append(pa.array(values))
+
+    return pa.table(columndata_list, schema=pa.schema(field_list))
+
+
+def compute_vectors_statistics_df(
+    vectors_df: pd.DataFrame, vector_names: Sequence[str]
+) -> pd.DataFrame:
+    """Compute per date statistics across realizations for the specified vectors from
+    a DataFrame with DATE and REAL columns, as returned by get_vectors_df().
+    Returns a DataFrame on the format returned by statistics_table_to_df()
+    """
+    table = pa.Table.from_pandas(
+        vectors_df[["DATE", "REAL", *vector_names]], preserve_index=False
+    )
+    return statistics_table_to_df(
+        compute_vectors_statistics_table(table, vector_names), vector_names
+    )
+
+
+def statistics_table_to_df(
+    statistics_table: pa.Table, vector_names: Sequence[str]
+) -> pd.DataFrame:
+    """Convert table with statistics, as returned by compute_vectors_statistics_table(),
+    to a DataFrame with a two level column index:
+    [("DATE", ""), (vector1, "MEAN"), (vector1, "MIN"), ..., (vectorN, "P50")]
+    """
+
+    columns: Dict[tuple, np.ndarray] = {
+        ("DATE", ""): statistics_table["DATE"].to_pandas(timestamp_as_object=True)
+    }
+    for vector_name in vector_names:
+        for statistic in VectorStatistic:
+            column_name = make_statistic_column_name(vector_name, statistic)
+            columns[(vector_name, statistic.value)] = statistics_table[
+                column_name
+            ].to_numpy()
+
+    return pd.DataFrame(columns)
+
+
+def _calc_per_date_statistics(
+    date_codes: np.ndarray,
+    num_dates: int,
+    real_codes: np.ndarray,
+    num_reals: int,
+    vector_names: Sequence[str],
+    get_vector_values: Callable[[str], np.ndarray],
+) -> Dict[str, Dict[VectorStatistic, np.ndarray]]:
+
+    bytes_per_vector = max(1, 8 * num_dates * num_reals)
+    chunk_size = max(1, _MAX_CHUNK_BYTES // bytes_per_vector)
+
+    per_vector_stats: Dict[str, Dict[VectorStatistic, np.ndarray]] = {}
+    for chunk_start in range(0, len(vector_names), chunk_size):
+        chunk_names: List[str] = list(
+            vector_names[chunk_start : chunk_start + chunk_size]
+        )
+
+        # Scatter the values into a dense array where missing entries are NaN
+        dense_values = np.full((len(chunk_names), num_dates, num_reals), np.nan)
+        for idx, vector_name in enumerate(chunk_names):
+            dense_values[idx, date_codes, real_codes] = get_vector_values(vector_name)
+
+        nan_stats = calc_nan_statistics(
+            dense_values, list(_STATISTIC_PERCENTILES.values())
+        )
+
+        for idx, vector_name in enumerate(chunk_names):
+            per_vector_stats[vector_name] = _extract_vector_statistics(nan_stats, idx)
+
+    return per_vector_stats
+
+
+def _extract_vector_statistics(
+    nan_stats: NanStatistics, idx: int
+) -> Dict[VectorStatistic, np.ndarray]:
+    vector_stats = {
+        VectorStatistic.MEAN: nan_stats.mean[idx],
+        VectorStatistic.MIN: nan_stats.min[idx],
+        VectorStatistic.MAX: nan_stats.max[idx],
+    }
+    for statistic, perc in _STATISTIC_PERCENTILES.items():
+        vector_stats[statistic] = nan_stats.percentiles[perc][idx]
+
+    return {statistic: vector_stats[statistic] for statistic in VectorStatistic}
@@ -0,0 +1,144 @@
+import logging
+import time
+from typing import Dict, List
+
+import numpy as np
+import pyarrow as pa
+
+from webviz_subsurface._providers.ensemble_summary_provider._field_metadata import (
+    is_rate_from_field_meta,
+)
+from webviz_subsurface._providers.ensemble_summary_provider._resampling import (
+    generate_normalized_sample_dates,
+    interpolate_backfill,
+    resample_segmented_multi_real_table,
+)
+from webviz_subsurface._providers.ensemble_summary_provider.ensemble_summary_provider import (
+    Frequency,
+)
+
+
+def _create_table(
+    num_reals: int, start_date: np.datetime64, end_date: np.datetime64, num_columns: int
+) -> pa.Table:
+
+    date_list: List[np.ndarray] = []
+    real_list: List[np.ndarray] = []
+    for real in range(0, num_reals):
+        # Let every realization have a slightly different date range
+        dates_for_this_real = np.arange(start_date, end_date + 1 + real)
+        dates_for_this_real = dates_for_this_real.astype("datetime64[ms]")
+        date_list.append(dates_for_this_real)
+        real_list.append(np.full(len(dates_for_this_real), real))
+
+    date_arr_np = np.concatenate(date_list)
+    real_arr_np = np.concatenate(real_list)
+    num_rows = len(real_arr_np)
+
+    field_list = [pa.field("DATE", pa.timestamp("ms")), pa.field("REAL", pa.int64())]
+    columndata_list = [pa.array(date_arr_np), pa.array(real_arr_np)]
+
+    for colnum in range(0, num_columns):
+        if (colnum % 2) == 0:
+            metadata = {b"is_rate": b"False"}
+        else:
+            metadata = {b"is_rate": b"True"}
+
+        field_list.append(pa.field(f"c_{colnum}", pa.float32(), metadata=metadata))
+        columndata_list.append(
+            pa.array(np.linspace(colnum, colnum + num_rows, num_rows), pa.float32())
+        )
+
+    return pa.table(columndata_list, schema=pa.schema(field_list))
+
+
+def _resample_per_column_and_real(table: pa.Table, freq: Frequency) -> pa.Table:
+    """Reference implementation doing one np.interp() or interpolate_backfill() call
+    per column and realization"""
+
+    real_arr_np = table.column("REAL").to_numpy()
+    _unique_reals, first_occurrence_idx, real_counts = np.unique(
+        real_arr_np, return_index=True, return_counts=True
+    )
+    all_dates_np = table.column("DATE").to_numpy()
+
+    output_columns_dict: Dict[str, pa.ChunkedArray] = {}
+    for colname in table.schema.names:
+        if colname in ["DATE", "REAL"]:
+            continue
+
+        is_rate = is_rate_from_field_meta(table.field(colname))
+        whole_arr = table.column(colname).to_numpy()
+
+        vec_arr_list = []
+        for start, count in zip(first_occurrence_idx, real_counts):
+            stop = start + count
+            vec_arr_list.append(
+                _resample_single_real(
+                    all_dates_np[start:stop], whole_arr[start:stop], freq, is_rate
+                )
+            )
+
+        output_columns_dict[colname] = pa.chunked_array(vec_arr_list)
+
+    return pa.table(output_columns_dict)
+
+
+def _resample_single_real(
+    raw_dates: np.ndarray, raw_values: np.ndarray, freq: Frequency, is_rate: bool
+) -> np.ndarray:
+    sample_dates = generate_normalized_sample_dates(
+        np.min(raw_dates), np.max(raw_dates), freq
+    )
+    raw_x = raw_dates.astype(np.uint64)
+    x = sample_dates.astype(np.uint64)
+    if is_rate:
+        return interpolate_backfill(x, raw_x, raw_values, 0, 0)
+    return np.interp(x, raw_x, raw_values)
+
+
+def _time_ms(func, *args) -> int:  # type: ignore
+    start_tim = time.perf_counter()
+    func(*args)
+    return int(1000 * (time.perf_counter() - start_tim))
+
+
+def main() -> None:
+    print()
+    print("## Running resample table performance tests")
+    print("## =================================================")
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s %(levelname)-3s [%(name)s]: %(message)s",
+    )
+
+    # Summary data is typically reported at irregular report steps, roughly monthly.
+    # Also include a setup with daily raw data where the cost of the actual
+    # interpolation is more dominant than the per call overhead
+    for raw_start, raw_end in [
+        (np.datetime64("2000-01", "M"), np.datetime64("2019-12", "M")),
+        (np.datetime64("2000-01-01", "D"), np.datetime64("2019-12-31", "D")),
+    ]:
+        table = _create_table(
+            num_reals=200, start_date=raw_start, end_date=raw_end, num_columns=50
+        )
+        print()
+        print(f"## raw data with unit={raw_start.dtype}")
+        print("## table shape (rows,columns):", table.shape)
+
+        for freq in [Frequency.DAILY, Frequency.MONTHLY, Frequency.YEARLY]:
+            ref_ms = _time_ms(_resample_per_column_and_real, table, freq)
+            batched_ms = _time_ms(resample_segmented_multi_real_table, table, freq)
+
+            print(
+                f"## {freq.value:10}  per column and real: {ref_ms}ms  "
+                f"batched: {batched_ms}ms  speedup: {ref_ms / max(batched_ms, 1):.1f}x"
+            )
+
+
+# Running:
+#   python -m webviz_subsurface._providers.ensemble_summary_provider.dev_resample_table_perf_testing
+# -------------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
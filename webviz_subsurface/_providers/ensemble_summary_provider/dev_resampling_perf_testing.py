@@ -6,6 +6,7 @@ import pyarrow as pa
 
 from webviz_subsurface._providers.ensemble_summary_provider._resampling import (
     sample_segmented_multi_real_table_at_date,
+    sample_segmented_multi_real_table_at_dates,
 )
 
 
@@ -105,6 +106,18 @@ def main() -> None:
 
     print(f"## sample at date took: {elapsed_time_ms}ms")
 
+    # Yearly date sweep, as used for animations, sampled in one call
+    sweep_dates = np.arange(
+        np.datetime64("2000-01", "M"), np.datetime64("2100-01", "M"), 12
+    ).astype("datetime64[ms]")
+
+    start_tim = time.perf_counter()
+    res = sample_segmented_multi_real_table_at_dates(table, sweep_dates)
+    elapsed_time_ms = int(1000 * (time.perf_counter() - start_tim))
+
+    print("## res shape:", res.shape)
+    print(f"## sample at {len(sweep_dates)} dates took: {elapsed_time_ms}ms")
+
 
 # Running:
 #   python -m webviz_subsurface._providers.ensemble_summary_provider.dev_resampling_perf_testing
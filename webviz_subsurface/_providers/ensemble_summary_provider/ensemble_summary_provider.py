@@ -6,6 +6,8 @@ from typing import List, Optional, Sequence
 
 import pandas as pd
 
+from ._vector_statistics import compute_vectors_statistics_df
+
 
 class Frequency(Enum):
     DAILY = "daily"
@@ -99,6 +101,33 @@ class EnsembleSummaryProvider(abc.ABC):
         to columns for all the requested vectors.
         """
 
+    def get_vectors_statistics_df(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        """Returns a Pandas DataFrame with per date statistics across the realizations
+        for the vectors specified in `vector_names`. The `resampling_frequency`
+        parameter has the same meaning as for `get_vectors_df()`.
+
+        Providers may precompute the statistics for all realizations when building
+        their backing store, in which case a request without a realization filter
+        will be served directly from the precomputed statistics.
+
+        The returned DataFrame has a two level column index, with one column per
+        vector and statistic in addition to the 'DATE' column:
+        [("DATE", ""), (vector1, "MEAN"), (vector1, "MIN"), ..., (vectorN, "P50")]
+        where the second level labels are the values of `VectorStatistic`.
+
+        This default implementation computes the statistics from the data returned
+        by `get_vectors_df()`.
+        """
+        vectors_df = self.get_vectors_df(
+            vector_names, resampling_frequency, realizations
+        )
+        return compute_vectors_statistics_df(vectors_df, vector_names)
+
     @abc.abstractmethod
     def get_vectors_for_date_df(
         self,
@@ -1,20 +1,37 @@
+import contextlib
+import glob
 import hashlib
+import itertools
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import ContextManager, Dict, List, Optional
 
+import pyarrow as pa
 from webviz_config.webviz_factory import WebvizFactory
 from webviz_config.webviz_factory_registry import WEBVIZ_FACTORY_REGISTRY
 from webviz_config.webviz_instance_info import WebvizRunMode
 
+from webviz_subsurface._utils.file_lock import FileLock
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
-from ._arrow_unsmry_import import load_per_realization_arrow_unsmry_files
-from ._csv_import import (
-    load_ensemble_summary_csv_file,
-    load_per_real_csv_file_using_fmu,
+from ..shared_memory_table_cache import SharedMemoryTableCache
+from ._arrow_unsmry_import import (
+    FileEntry,
+    discover_per_realization_arrow_unsmry_files,
+    iterate_arrow_unsmry_files,
+    load_arrow_unsmry_files,
+    read_arrow_unsmry_file_schemas,
 )
+from ._backing_store_manifest import (
+    ManifestDiff,
+    SourceFileFingerprint,
+    create_source_file_fingerprint,
+    diff_manifests,
+    read_backing_store_manifest,
+    write_backing_store_manifest,
+)
+from ._csv_import import load_ensemble_summary_csv_file, load_per_real_csv_files
 from ._provider_impl_arrow_lazy import ProviderImplArrowLazy
 from ._provider_impl_arrow_presampled import ProviderImplArrowPresampled
 from ._resampling import Frequency, resample_single_real_table
@@ -24,13 +41,28 @@ LOGGER = logging.getLogger(__name__)
 
 
 class EnsembleSummaryProviderFactory(WebvizFactory):
-    def __init__(self, root_storage_folder: Path, allow_storage_writes: bool) -> None:
+    def __init__(
+        self,
+        root_storage_folder: Path,
+        allow_storage_writes: bool,
+        max_import_workers: Optional[int] = None,
+        use_shared_memory_cache: bool = False,
+    ) -> None:
         self._storage_dir = Path(root_storage_folder) / __name__
         self._allow_storage_writes = allow_storage_writes
+        self._max_import_workers = max_import_workers
+        self._shared_table_cache: Optional[SharedMemoryTableCache] = (
+            SharedMemoryTableCache.instance() if use_shared_memory_cache else None
+        )
 
         LOGGER.info(
             f"EnsembleSummaryProviderFactory init: storage_dir={self._storage_dir}"
         )
+        LOGGER.info(
+            f"EnsembleSummaryProviderFactory init: "
+            f"max_import_workers={self._max_import_workers}, "
+            f"use_shared_memory_cache={use_shared_memory_cache}"
+        )
 
         if self._allow_storage_writes:
             os.makedirs(self._storage_dir, exist_ok=True)
@@ -44,8 +76,27 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
             app_instance_info = WEBVIZ_FACTORY_REGISTRY.app_instance_info
             storage_folder = app_instance_info.storage_folder
             allow_writes = app_instance_info.run_mode != WebvizRunMode.PORTABLE
+            max_import_workers = None
+            use_shared_memory_cache = False
 
-            factory = EnsembleSummaryProviderFactory(storage_folder, allow_writes)
+            my_settings = WEBVIZ_FACTORY_REGISTRY.all_factory_settings.get(
+                "EnsembleSummaryProviderFactory"
+            )
+            if my_settings:
+                LOGGER.info(
+                    f"Parsing settings for EnsembleSummaryProviderFactory: {my_settings}"
+                )
+                if "max_import_workers" in my_settings:
+                    max_import_workers = int(my_settings["max_import_workers"])
+                if "shared_memory_cache" in my_settings:
+                    use_shared_memory_cache = bool(my_settings["shared_memory_cache"])
+
+            factory = EnsembleSummaryProviderFactory(
+                storage_folder,
+                allow_writes,
+                max_import_workers,
+                use_shared_memory_cache,
+            )
 
             # Store the factory object in the global factory registry
             WEBVIZ_FACTORY_REGISTRY.set_factory(EnsembleSummaryProviderFactory, factory)
@@ -74,52 +125,61 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
             storage_key += f"_filtered_on_{ensemble_filter}"
         storage_key += f"__{_make_hash_string(str(csv_file))}"
 
-        provider = ProviderImplArrowPresampled.from_backing_store(
-            self._storage_dir, storage_key
-        )
-        if provider:
-            LOGGER.info(
-                f"Loaded summary provider (CSV) from backing store in "
-                f"{timer.elapsed_s():.2f}s (csv_file={csv_file})"
-            )
-            return provider
+        with self._lock_storage_key(storage_key):
+            fingerprints = None
+            if self._allow_storage_writes:
+                fingerprints = [create_source_file_fingerprint(str(csv_file))]
 
-        # We can only import data from CSV if storage writes are allowed
-        if not self._allow_storage_writes:
-            raise ValueError(f"Failed to load summary provider (CSV) for {csv_file}")
+            if self._is_backing_store_up_to_date(storage_key, fingerprints):
+                provider = ProviderImplArrowPresampled.from_backing_store(
+                    self._storage_dir, storage_key
+                )
+                if provider:
+                    LOGGER.info(
+                        f"Loaded summary provider (CSV) from backing store in "
+                        f"{timer.elapsed_s():.2f}s (csv_file={csv_file})"
+                    )
+                    return provider
+
+            # We can only import data from CSV if storage writes are allowed
+            if fingerprints is None:
+                raise ValueError(
+                    f"Failed to load summary provider (CSV) for {csv_file}"
+                )
 
-        LOGGER.info(f"Importing/saving CSV summary data for: {csv_file}")
+            LOGGER.info(f"Importing/saving CSV summary data for: {csv_file}")
 
-        timer.lap_s()
-        ensemble_df = load_ensemble_summary_csv_file(csv_file, ensemble_filter)
-        et_import_csv_s = timer.lap_s()
+            timer.lap_s()
+            ensemble_df = load_ensemble_summary_csv_file(csv_file, ensemble_filter)
+            et_import_csv_s = timer.lap_s()
 
-        if len(ensemble_df) == 0:
-            raise ValueError("Import resulted in empty DataFrame")
-        if "DATE" not in ensemble_df.columns:
-            raise ValueError("No DATE column present in input data")
-        if "REAL" not in ensemble_df.columns:
-            raise ValueError("No REAL column present in input data")
+            if len(ensemble_df) == 0:
+                raise ValueError("Import resulted in empty DataFrame")
+            if "DATE" not in ensemble_df.columns:
+                raise ValueError("No DATE column present in input data")
+            if "REAL" not in ensemble_df.columns:
+                raise ValueError("No REAL column present in input data")
 
-        ProviderImplArrowPresampled.write_backing_store_from_ensemble_dataframe(
-            self._storage_dir, storage_key, ensemble_df
-        )
-        et_write_s = timer.lap_s()
+            ProviderImplArrowPresampled.write_backing_store_from_ensemble_dataframe(
+                self._storage_dir, storage_key, ensemble_df
+            )
+            write_backing_store_manifest(self._storage_dir, storage_key, fingerprints)
+            et_write_s = timer.lap_s()
 
-        provider = ProviderImplArrowPresampled.from_backing_store(
-            self._storage_dir, storage_key
-        )
-        if not provider:
-            raise ValueError(f"Failed to load/create provider for {csv_file}")
+            provider = ProviderImplArrowPresampled.from_backing_store(
+                self._storage_dir, storage_key
+            )
+            if not provider:
+                raise ValueError(f"Failed to load/create provider for {csv_file}")
 
-        LOGGER.info(
-            f"Saved summary provider (CSV) to backing store in {timer.elapsed_s():.2f}s ("
-            f"import_csv={et_import_csv_s:.2f}s, "
-            f"write={et_write_s:.2f}s, "
-            f"csv_file={csv_file})"
-        )
+            LOGGER.info(
+                f"Saved summary provider (CSV) to backing store in {timer.elapsed_s():.2f}s ("
+                f"import_csv={et_import_csv_s:.2f}s, "
+                f"write={et_write_s:.2f}s, "
+                f"csv_file={csv_file})"
+            )
 
-        return provider
+            return provider
 
     def create_from_per_realization_csv_file(
         self, ens_path: str, csv_file_rel_path: str
@@ -133,52 +193,69 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         timer = PerfTimer()
 
         storage_key = f"per_real_csv__{_make_hash_string(ens_path + csv_file_rel_path)}"
-        provider = ProviderImplArrowPresampled.from_backing_store(
-            self._storage_dir, storage_key
-        )
 
-        if provider:
-            LOGGER.info(
-                f"Loaded summary provider (per real CSV) from backing store in "
-                f"{timer.elapsed_s():.2f}s ("
-                f"ens_path={ens_path}, csv_file_rel_path={csv_file_rel_path})"
-            )
-            return provider
+        with self._lock_storage_key(storage_key):
+            # No incremental updates for CSV data, any change to the per realization
+            # CSV files will trigger a full re-import.
+            fingerprints = None
+            if self._allow_storage_writes:
+                fingerprints = [
+                    create_source_file_fingerprint(file_name)
+                    for file_name in glob.glob(
+                        os.path.join(ens_path, csv_file_rel_path)
+                    )
+                ]
+
+            if self._is_backing_store_up_to_date(storage_key, fingerprints):
+                provider = ProviderImplArrowPresampled.from_backing_store(
+                    self._storage_dir, storage_key
+                )
+                if provider:
+                    LOGGER.info(
+                        f"Loaded summary provider (per real CSV) from backing store in "
+                        f"{timer.elapsed_s():.2f}s ("
+                        f"ens_path={ens_path}, csv_file_rel_path={csv_file_rel_path})"
+                    )
+                    return provider
+
+            # We can only import data from CSV if storage writes are allowed
+            if fingerprints is None:
+                raise ValueError(
+                    f"Failed to load summary provider (per real CSV) for {ens_path}"
+                )
 
-        # We can only import data from CSV if storage writes are allowed
-        if not self._allow_storage_writes:
-            raise ValueError(
-                f"Failed to load summary provider (per real CSV) for {ens_path}"
-            )
+            LOGGER.info(f"Importing/saving per real CSV summary data for: {ens_path}")
 
-        LOGGER.info(f"Importing/saving per real CSV summary data for: {ens_path}")
+            timer.lap_s()
 
-        timer.lap_s()
+            ensemble_df = load_per_real_csv_files(
+                ens_path, csv_file_rel_path, self._max_import_workers
+            )
+            et_import_csv_s = timer.lap_s()
 
-        ensemble_df = load_per_real_csv_file_using_fmu(ens_path, csv_file_rel_path)
-        et_import_csv_s = timer.lap_s()
+            ProviderImplArrowPresampled.write_backing_store_from_ensemble_dataframe(
+                self._storage_dir, storage_key, ensemble_df
+            )
+            write_backing_store_manifest(self._storage_dir, storage_key, fingerprints)
+            et_write_s = timer.lap_s()
 
-        ProviderImplArrowPresampled.write_backing_store_from_ensemble_dataframe(
-            self._storage_dir, storage_key, ensemble_df
-        )
-        et_write_s = timer.lap_s()
+            provider = ProviderImplArrowPresampled.from_backing_store(
+                self._storage_dir, storage_key
+            )
 
-        provider = ProviderImplArrowPresampled.from_backing_store(
-            self._storage_dir, storage_key
-        )
+            if not provider:
+                raise ValueError(
+                    f"Failed to load/create provider (per real CSV) for {ens_path}"
+                )
 
-        if not provider:
-            raise ValueError(
-                f"Failed to load/create provider (per real CSV) for {ens_path}"
+            LOGGER.info(
+                f"Saved summary provider (per real CSV) to backing store in "
+                f"{timer.elapsed_s():.2f}s ("
+                f"import_csv={et_import_csv_s:.2f}s, write={et_write_s:.2f}s, "
+                f"ens_path={ens_path}, csv_file_rel_path={csv_file_rel_path})"
             )
 
-        LOGGER.info(
-            f"Saved summary provider (per real CSV) to backing store in {timer.elapsed_s():.2f}s ("
-            f"import_csv={et_import_csv_s:.2f}s, write={et_write_s:.2f}s, "
-            f"ens_path={ens_path}, csv_file_rel_path={csv_file_rel_path})"
-        )
-
-        return provider
+            return provider
 
     def create_from_arrow_unsmry_lazy(
         self, ens_path: str, rel_file_pattern: str
@@ -198,53 +275,110 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         storage_key = (
             f"arrow_unsmry_lazy__{_make_hash_string(ens_path + rel_file_pattern)}"
         )
-        provider = ProviderImplArrowLazy.from_backing_store(
-            self._storage_dir, storage_key
-        )
-        if provider:
-            LOGGER.info(
-                f"Loaded lazy summary provider from backing store in {timer.elapsed_s():.2f}s ("
-                f"ens_path={ens_path})"
-            )
-            return provider
 
-        # We can only import data from data source if storage writes are allowed
-        if not self._allow_storage_writes:
-            raise ValueError(f"Failed to load lazy summary provider for {ens_path}")
-
-        LOGGER.info(f"Importing/saving arrow summary data for: {ens_path}")
+        with self._lock_storage_key(storage_key):
+            # We can only import data from data source if storage writes are allowed
+            if not self._allow_storage_writes:
+                provider = ProviderImplArrowLazy.from_backing_store(
+                    self._storage_dir, storage_key, self._shared_table_cache
+                )
+                if not provider:
+                    raise ValueError(
+                        f"Failed to load lazy summary provider for {ens_path}"
+                    )
+                LOGGER.info(
+                    f"Loaded lazy summary provider from backing store in {timer.elapsed_s():.2f}s ("
+                    f"ens_path={ens_path})"
+                )
+                return provider
 
-        timer.lap_s()
-        per_real_tables = load_per_realization_arrow_unsmry_files(
-            ens_path, rel_file_pattern
-        )
-        if not per_real_tables:
-            raise ValueError(
-                f"Could not find any .arrow unsmry files for ens_path={ens_path}"
+            file_entries = discover_per_realization_arrow_unsmry_files(
+                ens_path, rel_file_pattern
+            )
+            if not file_entries:
+                raise ValueError(
+                    f"Could not find any .arrow unsmry files for ens_path={ens_path}"
+                )
+            fingerprints = [
+                create_source_file_fingerprint(entry.filename, entry.real)
+                for entry in file_entries
+            ]
+            manifest_diff = diff_manifests(
+                read_backing_store_manifest(self._storage_dir, storage_key),
+                fingerprints,
             )
-        et_import_smry_s = timer.lap_s()
 
-        try:
-            ProviderImplArrowLazy.write_backing_store_from_per_realization_tables(
-                self._storage_dir, storage_key, per_real_tables
+            if manifest_diff.is_up_to_date():
+                provider = ProviderImplArrowLazy.from_backing_store(
+                    self._storage_dir, storage_key, self._shared_table_cache
+                )
+                if provider:
+                    LOGGER.info(
+                        f"Loaded lazy summary provider from backing store in "
+                        f"{timer.elapsed_s():.2f}s (ens_path={ens_path})"
+                    )
+                    return provider
+
+            # Try and reuse the data for unchanged realizations from the existing backing
+            # store, so that only the realizations that have changed need to be imported
+            reused_per_real_tables = self._read_unchanged_per_real_tables(
+                storage_key, file_entries, manifest_diff
+            )
+            if reused_per_real_tables is not None:
+                LOGGER.info(
+                    f"Updating arrow summary data for: {ens_path} "
+                    f"(changed_reals={manifest_diff.changed_reals}, "
+                    f"removed_reals={manifest_diff.removed_reals})"
+                )
+                entries_to_import = [
+                    entry
+                    for entry in file_entries
+                    if entry.real in manifest_diff.changed_reals
+                ]
+            else:
+                LOGGER.info(f"Importing/saving arrow summary data for: {ens_path}")
+                reused_per_real_tables = {}
+                entries_to_import = file_entries
+
+            # Realizations are imported concurrently and streamed into the backing store
+            # as they finish, so we never hold all the imported tables in memory at once
+            timer.lap_s()
+            unified_schema = pa.unify_schemas(
+                [table.schema for table in reused_per_real_tables.values()]
+                + read_arrow_unsmry_file_schemas(entries_to_import)
+            )
+            per_real_table_stream = itertools.chain(
+                reused_per_real_tables.items(),
+                iterate_arrow_unsmry_files(entries_to_import, self._max_import_workers),
             )
-        except ValueError as exc:
-            raise ValueError(f"Failed to write backing store for: {ens_path}") from exc
+            try:
+                ProviderImplArrowLazy.write_backing_store_from_per_realization_table_stream(
+                    self._storage_dir,
+                    storage_key,
+                    unified_schema,
+                    per_real_table_stream,
+                )
+            except ValueError as exc:
+                raise ValueError(
+                    f"Failed to write backing store for: {ens_path}"
+                ) from exc
+            write_backing_store_manifest(self._storage_dir, storage_key, fingerprints)
 
-        et_write_s = timer.lap_s()
+            et_write_s = timer.lap_s()
 
-        provider = ProviderImplArrowLazy.from_backing_store(
-            self._storage_dir, storage_key
-        )
-        if not provider:
-            raise ValueError(f"Failed to load/create lazy provider for {ens_path}")
+            provider = ProviderImplArrowLazy.from_backing_store(
+                self._storage_dir, storage_key, self._shared_table_cache
+            )
+            if not provider:
+                raise ValueError(f"Failed to load/create lazy provider for {ens_path}")
 
-        LOGGER.info(
-            f"Saved lazy summary provider to backing store in {timer.elapsed_s():.2f}s ("
-            f"import_smry={et_import_smry_s:.2f}s, write={et_write_s:.2f}s, ens_path={ens_path})"
-        )
+            LOGGER.info(
+                f"Saved lazy summary provider to backing store in {timer.elapsed_s():.2f}s ("
+                f"import_and_write={et_write_s:.2f}s, "
+                f"#imported_reals={len(entries_to_import)}, ens_path={ens_path})"
+            )
 
-        return provider
+            return provider
 
     def create_from_arrow_unsmry_presampled(
         self,
@@ -271,62 +405,146 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         freq_str = sampling_frequency.value if sampling_frequency else "raw"
         hash_str = _make_hash_string(ens_path + rel_file_pattern)
         storage_key = f"arrow_unsmry_presampled_{freq_str}__{hash_str}"
-        provider = ProviderImplArrowPresampled.from_backing_store(
-            self._storage_dir, storage_key
-        )
-        if provider:
+
+        with self._lock_storage_key(storage_key):
+            # The presampled backing store is always rebuilt in full when the source
+            # files have changed
+            file_entries = None
+            fingerprints = None
+            if self._allow_storage_writes:
+                file_entries = discover_per_realization_arrow_unsmry_files(
+                    ens_path, rel_file_pattern
+                )
+                fingerprints = [
+                    create_source_file_fingerprint(entry.filename, entry.real)
+                    for entry in file_entries
+                ]
+
+            if self._is_backing_store_up_to_date(storage_key, fingerprints):
+                provider = ProviderImplArrowPresampled.from_backing_store(
+                    self._storage_dir, storage_key
+                )
+                if provider:
+                    LOGGER.info(
+                        f"Loaded presampled summary provider from backing store in "
+                        f"{timer.elapsed_s():.2f}s ("
+                        f"sampling_frequency={sampling_frequency}, ens_path={ens_path})"
+                    )
+                    return provider
+
+            # We can only import data from data source if storage writes are allowed
+            if file_entries is None or fingerprints is None:
+                raise ValueError(
+                    f"Failed to load presampled summary provider for {ens_path}"
+                )
+
+            LOGGER.info(f"Importing/saving arrow summary data for: {ens_path}")
+
+            timer.lap_s()
+            per_real_tables = load_arrow_unsmry_files(
+                file_entries, self._max_import_workers
+            )
+            if not per_real_tables:
+                raise ValueError(
+                    f"Could not find any .arrow unsmry files for ens_path={ens_path}"
+                )
+            et_import_smry_s = timer.lap_s()
+
+            if sampling_frequency is not None:
+                per_real_tables = _resample_per_real_tables(
+                    per_real_tables, sampling_frequency
+                )
+            et_resample_s = timer.lap_s()
+
+            ProviderImplArrowPresampled.write_backing_store_from_per_realization_tables(
+                self._storage_dir, storage_key, per_real_tables
+            )
+            write_backing_store_manifest(self._storage_dir, storage_key, fingerprints)
+            et_write_s = timer.lap_s()
+
+            provider = ProviderImplArrowPresampled.from_backing_store(
+                self._storage_dir, storage_key
+            )
+            if not provider:
+                raise ValueError(f"Failed to load/create provider for {ens_path}")
+
             LOGGER.info(
-                f"Loaded presampled summary provider from backing store in "
-                f"{timer.elapsed_s():.2f}s ("
-                f"sampling_frequency={sampling_frequency}, ens_path={ens_path})"
+                f"Saved presampled summary provider to backing store in {timer.elapsed_s():.2f}s ("
+                f"import_smry={et_import_smry_s:.2f}s, "
+                f"resample={et_resample_s:.2f}s, "
+                f"write={et_write_s:.2f}s, "
+                f"ens_path={ens_path})"
             )
+
             return provider
 
-        # We can only import data from data source if storage writes are allowed
+    def _lock_storage_key(self, storage_key: str) -> ContextManager:
+        """Returns a lock that serializes the import and writing of the backing store
+        for `storage_key`, both between threads and processes. Needed since providers
+        are created concurrently, and multiple ensembles may refer to the same data.
+        Once the lock is acquired, the backing store written by the holder of the
+        lock will be found to be up to date."""
+
         if not self._allow_storage_writes:
-            raise ValueError(
-                f"Failed to load presampled summary provider for {ens_path}"
-            )
+            return contextlib.ExitStack()
 
-        LOGGER.info(f"Importing/saving arrow summary data for: {ens_path}")
+        return FileLock(self._storage_dir / (storage_key + ".lock"))
 
-        timer.lap_s()
-        per_real_tables = load_per_realization_arrow_unsmry_files(
-            ens_path, rel_file_pattern
-        )
-        if not per_real_tables:
-            raise ValueError(
-                f"Could not find any .arrow unsmry files for ens_path={ens_path}"
+    def _read_unchanged_per_real_tables(
+        self,
+        storage_key: str,
+        file_entries: List[FileEntry],
+        manifest_diff: ManifestDiff,
+    ) -> Optional[Dict[int, pa.Table]]:
+        """Read the tables of the realizations that are unchanged according to
+        `manifest_diff` from the existing lazy backing store.
+        Returns None if the backing store must be rebuilt from scratch."""
+
+        if manifest_diff.requires_full_rebuild:
+            return None
+
+        unchanged_reals = [
+            entry.real
+            for entry in file_entries
+            if entry.real not in manifest_diff.changed_reals
+        ]
+        per_real_tables = (
+            ProviderImplArrowLazy.read_per_realization_tables_from_backing_store(
+                self._storage_dir, storage_key, unchanged_reals
             )
-        et_import_smry_s = timer.lap_s()
+        )
+        if per_real_tables is None or len(per_real_tables) != len(unchanged_reals):
+            return None
 
-        if sampling_frequency is not None:
-            for real_num, table in per_real_tables.items():
-                per_real_tables[real_num] = resample_single_real_table(
-                    table, sampling_frequency
-                )
-        et_resample_s = timer.lap_s()
+        return per_real_tables
 
-        ProviderImplArrowPresampled.write_backing_store_from_per_realization_tables(
-            self._storage_dir, storage_key, per_real_tables
-        )
-        et_write_s = timer.lap_s()
+    def _is_backing_store_up_to_date(
+        self, storage_key: str, fingerprints: Optional[List[SourceFileFingerprint]]
+    ) -> bool:
+        """Check the backing store's manifest against the current source files.
+        When `fingerprints` is None the source files are assumed to be unavailable
+        (e.g. in portable apps) and whatever is in the backing store will be used."""
 
-        provider = ProviderImplArrowPresampled.from_backing_store(
-            self._storage_dir, storage_key
-        )
-        if not provider:
-            raise ValueError(f"Failed to load/create provider for {ens_path}")
+        if fingerprints is None:
+            return True
 
-        LOGGER.info(
-            f"Saved presampled summary provider to backing store in {timer.elapsed_s():.2f}s ("
-            f"import_smry={et_import_smry_s:.2f}s, "
-            f"resample={et_resample_s:.2f}s, "
-            f"write={et_write_s:.2f}s, "
-            f"ens_path={ens_path})"
+        manifest_diff: ManifestDiff = diff_manifests(
+            read_backing_store_manifest(self._storage_dir, storage_key), fingerprints
         )
+        if not manifest_diff.is_up_to_date():
+            LOGGER.info(f"Backing store is outdated for storage_key={storage_key}")
+            return False
+
+        return True
+
 
-        return provider
+def _resample_per_real_tables(
+    per_real_tables: Dict[int, pa.Table], sampling_frequency: Frequency
+) -> Dict[int, pa.Table]:
+    return {
+        real_num: resample_single_real_table(table, sampling_frequency)
+        for real_num, table in per_real_tables.items()
+    }
 
 
 def _make_hash_string(string_to_hash: str) -> str:
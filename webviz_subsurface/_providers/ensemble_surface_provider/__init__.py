@@ -9,6 +9,8 @@ from .ensemble_surface_provider_factory import EnsembleSurfaceProviderFactory
 from .surface_server import (
     QualifiedDiffSurfaceAddress,
     QualifiedSurfaceAddress,
+    SurfaceLevelMeta,
     SurfaceMeta,
+    SurfacePyramidMeta,
     SurfaceServer,
 )
@@ -1,11 +1,10 @@
+import dataclasses
 import logging
 import shutil
-import warnings
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set
 
-import numpy as np
 import pandas as pd
 import xtgeo
 
@@ -13,6 +12,7 @@ from webviz_subsurface._utils.perf_timer import PerfTimer
 
 from ._stat_surf_cache import StatSurfCache
 from ._surface_discovery import SurfaceFileInfo
+from ._surface_statistics import calc_statistical_surfaces_from_files
 from .ensemble_surface_provider import (
     EnsembleSurfaceProvider,
     ObservedSurfaceAddress,
@@ -178,7 +178,12 @@ class ProviderImplFile(EnsembleSurfaceProvider):
 
         try:
             surface_inventory_df = pd.read_parquet(path=parquet_file_name)
-            return ProviderImplFile(storage_key, provider_dir, surface_inventory_df)
+            # Data for a storage key may be reimported, and consumers such as the
+            # SurfaceServer cache published surfaces per provider id. Include the
+            # time the inventory was written so that the id changes with the data.
+            mtime_ns = parquet_file_name.stat().st_mtime_ns
+            provider_id = f"{storage_key}__{mtime_ns}"
+            return ProviderImplFile(provider_id, provider_dir, surface_inventory_df)
         except FileNotFoundError:
             return None
 
@@ -224,7 +229,6 @@ class ProviderImplFile(EnsembleSurfaceProvider):
     ) -> Optional[xtgeo.RegularSurface]:
         if isinstance(address, StatisticalSurfaceAddress):
             return self._get_or_create_statistical_surface(address)
-            # return self._create_statistical_surface(address)
         if isinstance(address, SimulatedSurfaceAddress):
             return self._get_simulated_surface(address)
         if isinstance(address, ObservedSurfaceAddress):
@@ -241,28 +245,45 @@ class ProviderImplFile(EnsembleSurfaceProvider):
         surf = self._stat_surf_cache.fetch(address)
         if surf:
             LOGGER.debug(
-                f"Fetched statistical surface from cache in: {timer.elapsed_s():.2f}s"
+                f"Fetched statistical surface from cache in: {timer.elapsed_s():.2f}s "
+                f"({self._stat_surf_cache.counters})"
             )
             return surf
 
-        surf = self._create_statistical_surface(address)
+        # Since loading the realization surfaces usually dominates, we compute and
+        # cache all the statistics in one go. Toggling between statistics for the
+        # same surface is then served from the cache.
+        stat_surfaces = self._create_statistical_surfaces(
+            address, statistics=list(SurfaceStatistic)
+        )
         et_create_s = timer.lap_s()
 
-        self._stat_surf_cache.store(address, surf)
+        for statistic, stat_surf in stat_surfaces.items():
+            self._stat_surf_cache.store(
+                dataclasses.replace(address, statistic=statistic), stat_surf
+            )
         et_write_cache_s = timer.lap_s()
 
+        surf = stat_surfaces.get(address.statistic)
+
         LOGGER.debug(
-            f"Created and wrote statistical surface to cache in: {timer.elapsed_s():.2f}s ("
+            f"Created and wrote statistical surfaces to cache in: {timer.elapsed_s():.2f}s ("
             f"create={et_create_s:.2f}s, store={et_write_cache_s:.2f}s), "
-            f"[stat={address.statistic}, "
+            f"[stat={address.statistic}, #stats={len(stat_surfaces)}, "
             f"attr={address.attribute}, name={address.name}, date={address.datestr}]"
         )
 
         return surf
 
-    def _create_statistical_surface(
-        self, address: StatisticalSurfaceAddress
-    ) -> Optional[xtgeo.RegularSurface]:
+    def _create_statistical_surfaces(
+        self,
+        address: StatisticalSurfaceAddress,
+        statistics: List[SurfaceStatistic],
+    ) -> Dict[SurfaceStatistic, xtgeo.RegularSurface]:
+        """Create the specified statistical surfaces for the attribute, name, date and
+        realizations given by the address. The realization surfaces are only read once.
+        Note that the statistic field of the address is ignored."""
+
         surf_fns: List[str] = self._locate_simulated_surfaces(
             attribute=address.attribute,
             name=address.name,
@@ -272,51 +293,19 @@ class ProviderImplFile(EnsembleSurfaceProvider):
 
         if len(surf_fns) == 0:
             LOGGER.warning(f"No input surfaces found for statistical surface {address}")
-            return None
+            return {}
 
         timer = PerfTimer()
 
-        surfaces = xtgeo.Surfaces(surf_fns)
-        et_load_s = timer.lap_s()
-
-        surf_count = len(surfaces.surfaces)
-        if surf_count == 0:
-            LOGGER.warning(
-                f"Could not load input surfaces for statistical surface {address}"
-            )
-            return None
-
-        # print("########################################################")
-        # first_surf = surfaces.surfaces[0]
-        # for surf in surfaces.surfaces:
-        #     print(
-        #         surf.dimensions,
-        #         surf.xinc,
-        #         surf.yinc,
-        #         surf.xori,
-        #         surf.yori,
-        #         surf.rotation,
-        #         surf.filesrc,
-        #     )
-        # print("########################################################")
-
-        # Suppress numpy warnings when surfaces have undefined z-values
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", "All-NaN slice encountered")
-            warnings.filterwarnings("ignore", "Mean of empty slice")
-            warnings.filterwarnings("ignore", "Degrees of freedom <= 0 for slice")
-
-            stat_surface = _calc_statistic_across_surfaces(address.statistic, surfaces)
-        et_calc_s = timer.lap_s()
+        stat_surfaces = calc_statistical_surfaces_from_files(surf_fns, statistics)
 
         LOGGER.debug(
-            f"Created statistical surface in: {timer.elapsed_s():.2f}s ("
-            f"load={et_load_s:.2f}s, calc={et_calc_s:.2f}s), "
-            f"[#surfaces={surf_count}, stat={address.statistic}, "
+            f"Created statistical surfaces in: {timer.elapsed_s():.2f}s "
+            f"[#surfaces={len(surf_fns)}, #stats={len(statistics)}, "
             f"attr={address.attribute}, name={address.name}, date={address.datestr}]"
         )
 
-        return stat_surface
+        return stat_surfaces
 
     def _get_simulated_surface(
         self, address: SimulatedSurfaceAddress
@@ -495,26 +484,3 @@ def _compose_rel_obs_surf_pathstr(
     else:
         fname = f"{name}--{attribute}{extension}"
     return str(Path(REL_OBS_DIR) / fname)
-
-
-def _calc_statistic_across_surfaces(
-    statistic: SurfaceStatistic, surfaces: xtgeo.Surfaces
-) -> xtgeo.RegularSurface:
-    """Calculates a statistical surface from a list of Xtgeo surface instances"""
-
-    stat_surf: xtgeo.RegularSurface
-
-    if statistic == SurfaceStatistic.MEAN:
-        stat_surf = surfaces.apply(np.mean, axis=0)
-    elif statistic == SurfaceStatistic.STDDEV:
-        stat_surf = surfaces.apply(np.std, axis=0)
-    elif statistic == SurfaceStatistic.MINIMUM:
-        stat_surf = surfaces.apply(np.min, axis=0)
-    elif statistic == SurfaceStatistic.MAXIMUM:
-        stat_surf = surfaces.apply(np.max, axis=0)
-    elif statistic == SurfaceStatistic.P10:
-        stat_surf = surfaces.apply(np.percentile, 10, axis=0)
-    elif statistic == SurfaceStatistic.P90:
-        stat_surf = surfaces.apply(np.percentile, 90, axis=0)
-
-    return stat_surf
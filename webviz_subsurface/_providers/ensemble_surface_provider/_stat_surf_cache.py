@@ -2,10 +2,12 @@ import datetime
 import hashlib
 import logging
 import os
-import pickle  # nosec
+import threading
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import xtgeo
 
@@ -23,10 +25,77 @@ FILE_EXTENSION = ".gri"
 # FILE_FORMAT_READ = FILE_FORMAT_WRITE
 # FILE_EXTENSION = ".xtgregsurf"
 
+# Default memory budget for decoded surfaces kept in memory (per process)
+DEFAULT_MAX_MEM_CACHE_BYTES = 512 * 1024 * 1024
+
+# Canonical address key: (statistic, name, attribute, datestr, sorted unique reals)
+_AddressKey = Tuple[str, str, str, str, Tuple[int, ...]]
+
+
+@dataclass
+class StatSurfCacheCounters:
+    mem_hits: int = 0
+    mem_misses: int = 0
+    mem_evictions: int = 0
+    file_hits: int = 0
+    file_misses: int = 0
+
+
+class _SurfaceLruCache:
+    """In-memory LRU cache of decoded surfaces, bounded by total size in bytes"""
+
+    def __init__(self, max_bytes: int, counters: StatSurfCacheCounters) -> None:
+        self._max_bytes = max_bytes
+        self._counters = counters
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[_AddressKey, Tuple[xtgeo.RegularSurface, int]]" = (
+            OrderedDict()
+        )
+        self._total_bytes = 0
+
+    def get(self, key: _AddressKey) -> Optional[xtgeo.RegularSurface]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters.mem_misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._counters.mem_hits += 1
+            surf = entry[0]
+
+        # Hand out copies so that callers cannot modify the cached surface
+        return surf.copy()
+
+    def put(self, key: _AddressKey, surface: xtgeo.RegularSurface) -> None:
+        surf_bytes = _surface_size_in_bytes(surface)
+        if surf_bytes > self._max_bytes:
+            return
+
+        surf_copy = surface.copy()
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._total_bytes -= old_entry[1]
+
+            self._entries[key] = (surf_copy, surf_bytes)
+            self._total_bytes += surf_bytes
+
+            while self._total_bytes > self._max_bytes:
+                _evicted_key, (_evicted_surf, evicted_bytes) = self._entries.popitem(
+                    last=False
+                )
+                self._total_bytes -= evicted_bytes
+                self._counters.mem_evictions += 1
+
 
 class StatSurfCache:
-    def __init__(self, cache_dir: Path) -> None:
+    def __init__(
+        self, cache_dir: Path, max_mem_bytes: int = DEFAULT_MAX_MEM_CACHE_BYTES
+    ) -> None:
         self.cache_dir = cache_dir
+        self.counters = StatSurfCacheCounters()
+        self._mem_cache = _SurfaceLruCache(max_mem_bytes, self.counters)
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         placeholder_file = self.cache_dir / "placeholder.txt"
@@ -38,22 +107,34 @@ class StatSurfCache:
         self, address: StatisticalSurfaceAddress
     ) -> Optional[xtgeo.RegularSurface]:
 
+        address_key = _make_address_key(address)
+        surf = self._mem_cache.get(address_key)
+        if surf is not None:
+            return surf
+
         full_surf_path = self.cache_dir / _compose_stat_surf_file_name(
-            address, FILE_EXTENSION
+            address_key, FILE_EXTENSION
         )
 
         try:
             surf = xtgeo.surface_from_file(full_surf_path, fformat=FILE_FORMAT_READ)
-            return surf
         # pylint: disable=bare-except
         except:
+            self.counters.file_misses += 1
             return None
 
+        self.counters.file_hits += 1
+        self._mem_cache.put(address_key, surf)
+        return surf
+
     def store(
         self, address: StatisticalSurfaceAddress, surface: xtgeo.RegularSurface
     ) -> None:
 
-        surf_fn = _compose_stat_surf_file_name(address, FILE_EXTENSION)
+        address_key = _make_address_key(address)
+        self._mem_cache.put(address_key, surface)
+
+        surf_fn = _compose_stat_surf_file_name(address_key, FILE_EXTENSION)
         full_surf_path = self.cache_dir / surf_fn
 
         # Try and go via a temporary file which we don't rename until writing is finished.
@@ -72,22 +153,35 @@ class StatSurfCache:
         # surface.to_file(full_surf_path, fformat=FILE_FORMAT_WRITE)
 
 
-def _compose_stat_surf_file_name(
-    address: StatisticalSurfaceAddress, extension: str
-) -> str:
+def _make_address_key(address: StatisticalSurfaceAddress) -> _AddressKey:
+    # The statistics do not depend on the ordering of the realizations nor on
+    # duplicates, so use the sorted unique realizations in the key
+    return (
+        str(address.statistic),
+        address.name,
+        address.attribute,
+        str(address.datestr),
+        tuple(sorted(set(address.realizations))),
+    )
+
 
-    # Should probably sort the realization list
-    # Also, what about duplicates
-    # And further, handling of missing realizations...
+def _compose_stat_surf_file_name(address_key: _AddressKey, extension: str) -> str:
+    statistic, name, attribute, datestr, realizations = address_key
 
-    pickled = pickle.dumps(address.realizations, pickle.HIGHEST_PROTOCOL)
-    real_hash = hashlib.md5(pickled).hexdigest()  # nosec
+    reals_str = ",".join(str(real) for real in realizations)
+    real_hash = hashlib.md5(reals_str.encode()).hexdigest()  # nosec
     return "--".join(
         [
-            f"{address.statistic}",
-            f"{address.name}",
-            f"{address.attribute}",
-            f"{address.datestr}",
+            f"{statistic}",
+            f"{name}",
+            f"{attribute}",
+            f"{datestr}",
             f"{real_hash}{extension}",
         ]
     )
+
+
+def _surface_size_in_bytes(surface: xtgeo.RegularSurface) -> int:
+    # Size of the values plus a boolean mask
+    values = surface.values
+    return values.nbytes + values.size
@@ -0,0 +1,87 @@
+import math
+from typing import Iterator, List, Tuple
+
+import numpy as np
+import xtgeo
+
+
+def downsample_surface(surface: xtgeo.RegularSurface) -> xtgeo.RegularSurface:
+    """Return a surface with half the resolution in each direction, where each node
+    is the average of the defined values in the corresponding 2x2 block of nodes.
+    Nodes whose block contains no defined values will be undefined.
+    """
+    # pylint: disable=too-many-locals
+
+    data = np.ma.filled(surface.values.astype(np.float64), fill_value=np.nan)
+    ncol, nrow = data.shape
+    new_ncol = (ncol + 1) // 2
+    new_nrow = (nrow + 1) // 2
+
+    # Pad to even dimensions with NaN so that we can view the data as 2x2 blocks
+    padded = np.full((2 * new_ncol, 2 * new_nrow), np.nan)
+    padded[:ncol, :nrow] = data
+    blocks = padded.reshape((new_ncol, 2, new_nrow, 2))
+
+    defined = ~np.isnan(blocks)
+    counts = defined.sum(axis=(1, 3))
+    sums = np.where(defined, blocks, 0).sum(axis=(1, 3))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        averages = sums / counts
+
+    # The new nodes are located in the center of the blocks, so the origin is
+    # shifted by half an increment along the (rotated) axes
+    dx = 0.5 * surface.xinc
+    dy = 0.5 * surface.yinc * surface.yflip
+    angle = math.radians(surface.rotation)
+    xori = surface.xori + dx * math.cos(angle) - dy * math.sin(angle)
+    yori = surface.yori + dx * math.sin(angle) + dy * math.cos(angle)
+
+    return xtgeo.RegularSurface(
+        ncol=new_ncol,
+        nrow=new_nrow,
+        xinc=2 * surface.xinc,
+        yinc=2 * surface.yinc,
+        xori=xori,
+        yori=yori,
+        rotation=surface.rotation,
+        yflip=surface.yflip,
+        values=np.ma.masked_invalid(averages),
+    )
+
+
+def build_surface_pyramid(
+    surface: xtgeo.RegularSurface, max_top_level_size: int
+) -> List[xtgeo.RegularSurface]:
+    """Build a multi-resolution pyramid by repeatedly halving the resolution until
+    the surface fits within max_top_level_size nodes in both directions.
+    The returned list is ordered from the coarsest level to the full resolution
+    level, so that the list index corresponds to the zoom level.
+    """
+
+    levels = [surface]
+    while max(levels[-1].ncol, levels[-1].nrow) > max_top_level_size:
+        levels.append(downsample_surface(levels[-1]))
+
+    levels.reverse()
+    return levels
+
+
+def iterate_image_tiles(
+    image_arr: np.ndarray, tile_size: int
+) -> Iterator[Tuple[int, int, np.ndarray]]:
+    """Split an image array into tiles of at most tile_size x tile_size pixels and
+    yield (tile_x, tile_y, tile_arr), where tile (0, 0) is the upper left tile.
+    Tiles along the right and bottom edges may be smaller than tile_size.
+    """
+
+    height, width = image_arr.shape[0:2]
+    for tile_y in range(math.ceil(height / tile_size)):
+        for tile_x in range(math.ceil(width / tile_size)):
+            yield (
+                tile_x,
+                tile_y,
+                image_arr[
+                    tile_y * tile_size : (tile_y + 1) * tile_size,
+                    tile_x * tile_size : (tile_x + 1) * tile_size,
+                ],
+            )
@@ -0,0 +1,114 @@
+import logging
+import warnings
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+from .ensemble_surface_provider import SurfaceStatistic
+
+LOGGER = logging.getLogger(__name__)
+
+
+def load_surface_stack(
+    surf_fns: Sequence[str],
+) -> Tuple[xtgeo.RegularSurface, np.ndarray]:
+    """Load the specified surfaces into one contiguous float32 array with shape
+    (num_surfaces, ncol, nrow), where undefined values are set to NaN.
+    Returns the stack together with the first surface, which can be used as a
+    template for the surfaces computed from the stack.
+
+    Raises ValueError if the surfaces differ in topology.
+    """
+
+    template = xtgeo.surface_from_file(surf_fns[0])
+    stack = np.empty((len(surf_fns), template.ncol, template.nrow), dtype=np.float32)
+    stack[0] = np.ma.filled(template.values, fill_value=np.nan)
+
+    for idx, surf_fn in enumerate(surf_fns[1:], start=1):
+        surf = xtgeo.surface_from_file(surf_fn)
+        if not template.compare_topology(surf, strict=False):
+            raise ValueError("Cannot do statistics, surfaces differ in topology")
+        stack[idx] = np.ma.filled(surf.values, fill_value=np.nan)
+
+    return (template, stack)
+
+
+def calc_statistics_from_surface_stack(
+    template: xtgeo.RegularSurface,
+    stack: np.ndarray,
+    statistics: Sequence[SurfaceStatistic],
+) -> Dict[SurfaceStatistic, xtgeo.RegularSurface]:
+    """Compute the requested statistics across the first axis of the surface stack.
+    A node will be undefined in the resulting surfaces if it is undefined in any of
+    the input surfaces.
+    """
+
+    stat_values: Dict[SurfaceStatistic, np.ndarray] = {}
+
+    # Suppress numpy warnings when surfaces have undefined z-values
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", r"All-NaN (slice|axis) encountered")
+        warnings.filterwarnings("ignore", "Mean of empty slice")
+        warnings.filterwarnings("ignore", "Degrees of freedom <= 0 for slice")
+
+        # Accumulate in float64 to avoid loss of precision for large stacks
+        if SurfaceStatistic.MEAN in statistics or SurfaceStatistic.STDDEV in statistics:
+            mean = np.mean(stack, axis=0, dtype=np.float64)
+            stat_values[SurfaceStatistic.MEAN] = mean
+            if SurfaceStatistic.STDDEV in statistics:
+                # Accumulate one layer at a time to avoid a float64 copy of the stack
+                sum_sq_dev = np.zeros_like(mean)
+                for layer in stack:
+                    sum_sq_dev += np.square(layer - mean)
+                stat_values[SurfaceStatistic.STDDEV] = np.sqrt(sum_sq_dev / len(stack))
+
+        if SurfaceStatistic.MINIMUM in statistics:
+            stat_values[SurfaceStatistic.MINIMUM] = np.min(stack, axis=0)
+        if SurfaceStatistic.MAXIMUM in statistics:
+            stat_values[SurfaceStatistic.MAXIMUM] = np.max(stack, axis=0)
+
+        # Compute all the requested percentiles in a single partitioning pass
+        percentile_stats: List[Tuple[SurfaceStatistic, float]] = [
+            (stat, perc)
+            for stat, perc in [(SurfaceStatistic.P10, 10), (SurfaceStatistic.P90, 90)]
+            if stat in statistics
+        ]
+        if percentile_stats:
+            percentile_values = np.percentile(
+                stack, [perc for _stat, perc in percentile_stats], axis=0
+            )
+            for idx, (stat, _perc) in enumerate(percentile_stats):
+                stat_values[stat] = percentile_values[idx]
+
+    stat_surfaces: Dict[SurfaceStatistic, xtgeo.RegularSurface] = {}
+    for stat in statistics:
+        surf = template.copy()
+        surf.values = np.asarray(stat_values[stat], dtype=np.float64)
+        stat_surfaces[stat] = surf
+
+    return stat_surfaces
+
+
+def calc_statistical_surfaces_from_files(
+    surf_fns: Sequence[str], statistics: Sequence[SurfaceStatistic]
+) -> Dict[SurfaceStatistic, xtgeo.RegularSurface]:
+    """Load the realization surfaces once and compute all the requested statistics"""
+
+    timer = PerfTimer()
+
+    template, stack = load_surface_stack(surf_fns)
+    et_load_s = timer.lap_s()
+
+    stat_surfaces = calc_statistics_from_surface_stack(template, stack, statistics)
+    et_calc_s = timer.lap_s()
+
+    LOGGER.debug(
+        f"Calculated {len(statistics)} statistical surfaces in: "
+        f"{timer.elapsed_s():.2f}s (load={et_load_s:.2f}s, calc={et_calc_s:.2f}s), "
+        f"[#surfaces={len(surf_fns)}, stack_shape={stack.shape}]"
+    )
+
+    return stat_surfaces
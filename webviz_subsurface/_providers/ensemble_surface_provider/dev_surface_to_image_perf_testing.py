@@ -0,0 +1,86 @@
+import logging
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._providers.ensemble_surface_provider._surface_to_image import (
+    surface_to_png_bytes,
+    surface_to_png_bytes_optimized,
+    surface_to_raw_rgba_bytes,
+    surface_to_rgba_array,
+)
+
+
+def _create_surface(
+    ncol: int, nrow: int, undef_fraction: float
+) -> xtgeo.RegularSurface:
+    rng = np.random.default_rng(seed=1234)
+    values = np.ma.MaskedArray(
+        data=rng.normal(loc=1700, scale=50, size=(ncol, nrow)),
+        mask=rng.random((ncol, nrow)) < undef_fraction,
+    )
+    return xtgeo.RegularSurface(
+        ncol=ncol, nrow=nrow, xinc=25, yinc=25, rotation=30, values=values
+    )
+
+
+def _time_func_ms(
+    func: Callable[[xtgeo.RegularSurface], object],
+    surface: xtgeo.RegularSurface,
+    num_runs: int,
+) -> float:
+    # Some of the encoders modify the surface, so always pass a copy
+    elapsed_ms_list: List[float] = []
+    for _i in range(num_runs):
+        surf_copy = surface.copy()
+        start_tim = time.perf_counter()
+        func(surf_copy)
+        elapsed_ms_list.append(1000 * (time.perf_counter() - start_tim))
+
+    return min(elapsed_ms_list)
+
+
+def main() -> None:
+    print()
+    print("## Running surface to image performance tests")
+    print("## =================================================")
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s %(levelname)-3s [%(name)s]: %(message)s",
+    )
+
+    grid_sizes: List[Tuple[int, int]] = [
+        (250, 250),
+        (1000, 1000),
+        (2000, 3000),
+        (4000, 4000),
+    ]
+    encoders = {
+        "png_bytes": surface_to_png_bytes,
+        "png_bytes_optimized": surface_to_png_bytes_optimized,
+        "raw_rgba_bytes": surface_to_raw_rgba_bytes,
+        "rgba_array": surface_to_rgba_array,
+    }
+    num_runs = 3
+
+    print(f"## best of {num_runs} runs, all times in ms")
+    header = f"{'ncol x nrow':>14}" + "".join(f"{name:>22}" for name in encoders)
+    print(header)
+
+    for ncol, nrow in grid_sizes:
+        surface = _create_surface(ncol, nrow, undef_fraction=0.2)
+        line = f"{f'{ncol} x {nrow}':>14}"
+        for func in encoders.values():
+            line += f"{_time_func_ms(func, surface, num_runs):22.1f}"
+        print(line)
+
+
+# Running:
+#   python -m \
+#     webviz_subsurface._providers.ensemble_surface_provider.dev_surface_to_image_perf_testing
+# -------------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,31 @@ import io
 import json
 import logging
 import math
+import shutil
+import time
 from dataclasses import asdict, dataclass
-from typing import List, Optional, Tuple, Union
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 from urllib.parse import quote
 from uuid import uuid4
 
 import flask
 import flask_caching
+import numpy as np
 import xtgeo
 from dash import Dash
+from webviz_config.webviz_factory_registry import WEBVIZ_FACTORY_REGISTRY
 from webviz_config.webviz_instance_info import WEBVIZ_INSTANCE_INFO
 
+from webviz_subsurface._utils.file_lock import FileLock
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
-from ._surface_to_image import surface_to_png_bytes_optimized
+from ._surface_pyramid import build_surface_pyramid, iterate_image_tiles
+from ._surface_to_image import (
+    rgba_array_to_png_bytes,
+    rgba_array_to_raw_rgba_bytes,
+    surface_to_rgba_array,
+)
 from .ensemble_surface_provider import (
     ObservedSurfaceAddress,
     SimulatedSurfaceAddress,
@@ -27,6 +38,23 @@ from .ensemble_surface_provider import (
 LOGGER = logging.getLogger(__name__)
 
 _ROOT_URL_PATH = "/SurfaceServer"
+_TILES_ROOT_URL_PATH = "/SurfaceServer/tiles"
+
+# Size in pixels of the tiles in a surface pyramid. The coarsest pyramid level
+# always fits within a single tile, which bounds the size of the initial display.
+SURFACE_TILE_SIZE = 512
+
+# Clients can ask for uncompressed images instead of PNG, either by adding
+# ?format=rgba to the URL or by listing this mimetype in the Accept header.
+# See _surface_to_image.rgba_array_to_raw_rgba_bytes() for the format.
+RAW_RGBA_MIMETYPE = "application/x-webviz-rgba"
+
+# Default upper limit for the total size of the image cache, as a fraction of the
+# size of the file system holding the cache directory
+DEFAULT_MAX_CACHE_FILE_SYSTEM_FRACTION = 0.1
+
+# Suffix of the temporary files written by the file system cache
+_CACHE_TMP_FILE_SUFFIX = ".__wz_cache"
 
 _SURFACE_SERVER_INSTANCE: Optional["SurfaceServer"] = None
 
@@ -57,21 +85,73 @@ class SurfaceMeta:
     deckgl_rot_deg: float  # Around upper left corner
 
 
+@dataclass(frozen=True)
+class SurfaceLevelMeta:
+    # Image dimensions in pixels for this level, tiles along the right and bottom
+    # edges of the image may be smaller than the tile size
+    width: int
+    height: int
+    num_tiles_x: int
+    num_tiles_y: int
+    # Note that the value range is specific to the level, and must be used when
+    # decoding the tile images of the level
+    surface_meta: SurfaceMeta
+
+
+@dataclass(frozen=True)
+class SurfacePyramidMeta:
+    tile_size: int
+    # Ordered from coarsest to full resolution, so index is equal to the zoom level
+    levels: List[SurfaceLevelMeta]
+
+
 class SurfaceServer:
-    def __init__(self, app: Dash) -> None:
-        cache_dir = (
-            WEBVIZ_INSTANCE_INFO.storage_folder / f"SurfaceServer_filecache_{uuid4()}"
-        )
+    def __init__(
+        self,
+        app: Dash,
+        shared_cache_dir: Optional[Path] = None,
+        max_cache_bytes: Optional[int] = None,
+    ) -> None:
+        """If shared_cache_dir is specified, the image cache will be placed there
+        and shared with all other SurfaceServer instances using the same directory,
+        typically other worker processes serving the same app. Otherwise a private
+        cache directory is created for this instance.
+
+        The cache directory outlives the server, so to bound its size the oldest
+        cache entries are removed whenever publishing a surface makes the cache
+        exceed max_cache_bytes."""
+        if shared_cache_dir is not None:
+            cache_dir = shared_cache_dir
+        else:
+            cache_dir = (
+                WEBVIZ_INSTANCE_INFO.storage_folder
+                / f"SurfaceServer_filecache_{uuid4()}"
+            )
         LOGGER.debug(f"Setting up file cache in: {cache_dir}")
+        # Keep the lock files outside of the cache directory, since the file system
+        # cache considers all files in its directory to be cache entries
+        self._lock_dir = Path(f"{cache_dir}_locks")
+        self._cache_dir = Path(cache_dir)
         self._image_cache = flask_caching.Cache(
             config={
                 "CACHE_TYPE": "FileSystemCache",
                 "CACHE_DIR": cache_dir,
                 "CACHE_DEFAULT_TIMEOUT": 0,
+                # Pruning on the number of entries is replaced by the size based
+                # cleanup in _remove_oldest_cache_files(), which removes the oldest
+                # entries rather than arbitrary ones
+                "CACHE_THRESHOLD": 0,
             }
         )
         self._image_cache.init_app(app.server)
 
+        if max_cache_bytes is None:
+            max_cache_bytes = int(
+                shutil.disk_usage(self._cache_dir).total
+                * DEFAULT_MAX_CACHE_FILE_SYSTEM_FRACTION
+            )
+        self._max_cache_bytes = max_cache_bytes
+
         self._setup_url_rule(app)
 
     @staticmethod
@@ -80,7 +160,22 @@ class SurfaceServer:
         global _SURFACE_SERVER_INSTANCE
         if not _SURFACE_SERVER_INSTANCE:
             LOGGER.debug("Initializing SurfaceServer instance")
-            _SURFACE_SERVER_INSTANCE = SurfaceServer(app)
+
+            shared_cache_dir: Optional[Path] = None
+            my_settings = WEBVIZ_FACTORY_REGISTRY.all_factory_settings.get(
+                "SurfaceServer"
+            )
+            if my_settings:
+                LOGGER.info(f"Parsing settings for SurfaceServer: {my_settings}")
+                if my_settings.get("shared_cache_dir"):
+                    shared_cache_dir = Path(my_settings["shared_cache_dir"])
+                elif my_settings.get("shared_cache"):
+                    shared_cache_dir = (
+                        WEBVIZ_INSTANCE_INFO.storage_folder
+                        / "SurfaceServer_shared_filecache"
+                    )
+
+            _SURFACE_SERVER_INSTANCE = SurfaceServer(app, shared_cache_dir)
 
         return _SURFACE_SERVER_INSTANCE
 
@@ -90,18 +185,9 @@ class SurfaceServer:
         surface: xtgeo.RegularSurface,
     ) -> None:
         timer = PerfTimer()
+        publish_start_s = time.time()
 
-        if isinstance(qualified_address, QualifiedSurfaceAddress):
-            base_cache_key = _address_to_str(
-                qualified_address.provider_id, qualified_address.address
-            )
-        else:
-            base_cache_key = _diff_address_to_str(
-                qualified_address.provider_id_a,
-                qualified_address.address_a,
-                qualified_address.provider_id_b,
-                qualified_address.address_b,
-            )
+        base_cache_key = _qualified_address_to_str(qualified_address)
 
         LOGGER.debug(
             f"Publishing surface (dim={surface.dimensions}, #cells={surface.ncol*surface.nrow}), "
@@ -109,25 +195,140 @@ class SurfaceServer:
         )
 
         self._create_and_store_image_in_cache(base_cache_key, surface)
+        self._remove_oldest_cache_files(keep_newer_than_s=publish_start_s)
 
         LOGGER.debug(f"Surface published in: {timer.elapsed_s():.2f}s")
 
-    def get_surface_metadata(
+    def get_or_publish_surface(
         self,
         qualified_address: Union[QualifiedSurfaceAddress, QualifiedDiffSurfaceAddress],
+        surface_factory: Callable[[], Optional[xtgeo.RegularSurface]],
     ) -> Optional[SurfaceMeta]:
+        """Get metadata for a published surface, calling surface_factory and
+        publishing the resulting surface if it has not yet been published.
+        Concurrent calls for the same address, also from other processes sharing
+        the cache directory, are coalesced so that only one of them calls the
+        factory while the others wait for the result.
+        Returns None if the factory does not produce a surface."""
+
+        surf_meta = self.get_surface_metadata(qualified_address)
+        if surf_meta:
+            return surf_meta
+
+        timer = PerfTimer()
+        base_cache_key = _qualified_address_to_str(qualified_address)
+        with FileLock(self._lock_dir / (_make_hash_string(base_cache_key) + ".lock")):
+            et_wait_s = timer.lap_s()
+
+            # Someone else may have published the surface while we were waiting
+            surf_meta = self.get_surface_metadata(qualified_address)
+            if surf_meta:
+                LOGGER.debug(
+                    f"Surface was published by someone else while waiting for lock "
+                    f"(wait={et_wait_s:.2f}s), [base_cache_key={base_cache_key}]"
+                )
+                return surf_meta
+
+            surface = surface_factory()
+            if surface is None:
+                return None
 
-        if isinstance(qualified_address, QualifiedSurfaceAddress):
-            base_cache_key = _address_to_str(
-                qualified_address.provider_id, qualified_address.address
+            self.publish_surface(qualified_address, surface)
+            return self.get_surface_metadata(qualified_address)
+
+    def publish_surface_pyramid(
+        self,
+        qualified_address: Union[QualifiedSurfaceAddress, QualifiedDiffSurfaceAddress],
+        surface: xtgeo.RegularSurface,
+    ) -> None:
+        """Publish the surface as a tiled multi-resolution pyramid, suitable for
+        large surfaces where shipping the full resolution image is too costly.
+        Tiles are served through the URL given by encode_partial_tile_url()"""
+        # pylint: disable=too-many-locals
+        timer = PerfTimer()
+        publish_start_s = time.time()
+
+        base_cache_key = _qualified_address_to_str(qualified_address)
+        LOGGER.debug(
+            f"Publishing surface pyramid (dim={surface.dimensions}, "
+            f"#cells={surface.ncol*surface.nrow}), [base_cache_key={base_cache_key}]"
+        )
+
+        level_surfaces = build_surface_pyramid(surface, SURFACE_TILE_SIZE)
+        et_build_pyramid_s = timer.lap_s()
+
+        level_metas: List[SurfaceLevelMeta] = []
+        num_tiles = 0
+        for level, level_surface in enumerate(level_surfaces):
+            rgba_arr = surface_to_rgba_array(level_surface)
+            for tile_x, tile_y, tile_arr in iterate_image_tiles(
+                rgba_arr, SURFACE_TILE_SIZE
+            ):
+                tile_cache_key = _tile_cache_key(base_cache_key, level, tile_x, tile_y)
+                png_bytes = rgba_array_to_png_bytes(np.ascontiguousarray(tile_arr))
+                self._image_cache.set(tile_cache_key, png_bytes)
+                num_tiles += 1
+
+            height, width = rgba_arr.shape[0:2]
+            level_metas.append(
+                SurfaceLevelMeta(
+                    width=width,
+                    height=height,
+                    num_tiles_x=math.ceil(width / SURFACE_TILE_SIZE),
+                    num_tiles_y=math.ceil(height / SURFACE_TILE_SIZE),
+                    surface_meta=_create_surface_meta(level_surface),
+                )
             )
-        else:
-            base_cache_key = _diff_address_to_str(
-                qualified_address.provider_id_a,
-                qualified_address.address_a,
-                qualified_address.provider_id_b,
-                qualified_address.address_b,
+        et_tiles_s = timer.lap_s()
+
+        pyramid_meta = SurfacePyramidMeta(
+            tile_size=SURFACE_TILE_SIZE, levels=level_metas
+        )
+        # The metadata is written last, see get_surface_pyramid_metadata()
+        self._image_cache.set("PYRAMID_META:" + base_cache_key, pyramid_meta)
+        self._remove_oldest_cache_files(keep_newer_than_s=publish_start_s)
+
+        LOGGER.debug(
+            f"Surface pyramid published in: {timer.elapsed_s():.2f}s ("
+            f"build_pyramid={et_build_pyramid_s:.2f}s, tiles={et_tiles_s:.2f}s), "
+            f"[#levels={len(level_metas)}, #tiles={num_tiles}]"
+        )
+
+    def get_surface_pyramid_metadata(
+        self,
+        qualified_address: Union[QualifiedSurfaceAddress, QualifiedDiffSurfaceAddress],
+    ) -> Optional[SurfacePyramidMeta]:
+
+        base_cache_key = _qualified_address_to_str(qualified_address)
+        meta = self._image_cache.get("PYRAMID_META:" + base_cache_key)
+        if not meta:
+            return None
+
+        if not isinstance(meta, SurfacePyramidMeta):
+            LOGGER.error("Error loading SurfacePyramidMeta from cache")
+            return None
+
+        tile_cache_keys = (
+            _tile_cache_key(base_cache_key, level, tile_x, tile_y)
+            for level, level_meta in enumerate(meta.levels)
+            for tile_x in range(level_meta.num_tiles_x)
+            for tile_y in range(level_meta.num_tiles_y)
+        )
+        if not self._has_all_entries(tile_cache_keys):
+            LOGGER.debug(
+                f"Tiles of surface pyramid have been evicted from cache, "
+                f"it must be republished [base_cache_key={base_cache_key}]"
             )
+            return None
+
+        return meta
+
+    def get_surface_metadata(
+        self,
+        qualified_address: Union[QualifiedSurfaceAddress, QualifiedDiffSurfaceAddress],
+    ) -> Optional[SurfaceMeta]:
+
+        base_cache_key = _qualified_address_to_str(qualified_address)
 
         meta_cache_key = "META:" + base_cache_key
         meta: Optional[SurfaceMeta] = self._image_cache.get(meta_cache_key)
@@ -138,28 +339,85 @@ class SurfaceServer:
             LOGGER.error("Error loading SurfaceMeta from cache")
             return None
 
+        if not self._has_all_entries(
+            ["IMG:" + base_cache_key, "RAW:" + base_cache_key]
+        ):
+            LOGGER.debug(
+                f"Images of surface have been evicted from cache, "
+                f"it must be republished [base_cache_key={base_cache_key}]"
+            )
+            return None
+
         return meta
 
+    def _remove_oldest_cache_files(self, keep_newer_than_s: float) -> None:
+        """Remove cache entries, oldest first, until the cache is within the size
+        limit. Entries written after keep_newer_than_s, i.e. those of the surface
+        that was just published, are kept. Surfaces whose entries are removed are
+        republished when requested again, see get_surface_metadata()"""
+
+        # Serialize cleanup between processes sharing the cache directory
+        with FileLock(self._lock_dir / "cleanup.lock"):
+            candidates = []
+            total_bytes = 0
+            for file_name in self._cache_dir.iterdir():
+                if file_name.name.endswith(_CACHE_TMP_FILE_SUFFIX):
+                    continue
+                try:
+                    stat = file_name.stat()
+                except FileNotFoundError:
+                    # Removed by another process
+                    continue
+                total_bytes += stat.st_size
+                # File systems may truncate modification times to whole seconds
+                if stat.st_mtime < math.floor(keep_newer_than_s):
+                    candidates.append((stat.st_mtime_ns, stat.st_size, file_name))
+
+            num_removed = 0
+            for _mtime_ns, size, file_name in sorted(candidates):
+                if total_bytes <= self._max_cache_bytes:
+                    break
+                try:
+                    file_name.unlink()
+                except FileNotFoundError:
+                    # Removed by another process
+                    pass
+                total_bytes -= size
+                num_removed += 1
+
+        if num_removed > 0:
+            LOGGER.debug(
+                f"Removed {num_removed} old entries from image cache, "
+                f"cache_size={total_bytes / (1024 * 1024):.1f}MB"
+            )
+
+    def _has_all_entries(self, cache_keys: Iterable[str]) -> bool:
+        # The file system cache prunes entries independently of each other, so the
+        # metadata of a surface may outlive its images. The metadata is always
+        # written last, so checking the images after the metadata is sufficient.
+        return all(self._image_cache.cache.has(key) for key in cache_keys)
+
     @staticmethod
     def encode_partial_url(
         qualified_address: Union[QualifiedSurfaceAddress, QualifiedDiffSurfaceAddress],
     ) -> str:
 
-        if isinstance(qualified_address, QualifiedSurfaceAddress):
-            address_str = _address_to_str(
-                qualified_address.provider_id, qualified_address.address
-            )
-        else:
-            address_str = _diff_address_to_str(
-                qualified_address.provider_id_a,
-                qualified_address.address_a,
-                qualified_address.provider_id_b,
-                qualified_address.address_b,
-            )
+        address_str = _qualified_address_to_str(qualified_address)
 
         url_path: str = f"{_ROOT_URL_PATH}/{quote(address_str)}"
         return url_path
 
+    @staticmethod
+    def encode_partial_tile_url(
+        qualified_address: Union[QualifiedSurfaceAddress, QualifiedDiffSurfaceAddress],
+    ) -> str:
+        """Returns URL template for the tiles of a published surface pyramid, with
+        {z}, {x} and {y} as placeholders for the level and tile indices"""
+
+        address_str = _qualified_address_to_str(qualified_address)
+        url_path: str = f"{_TILES_ROOT_URL_PATH}/{quote(address_str)}"
+        return url_path + "/{z}/{x}/{y}"
+
     def _setup_url_rule(self, app: Dash) -> None:
         @app.server.route(_ROOT_URL_PATH + "/<full_surf_address_str>")
         def _handle_surface_request(full_surf_address_str: str) -> flask.Response:
@@ -180,11 +438,49 @@ class SurfaceServer:
                 )
                 flask.abort(404)
 
+            if _request_wants_raw_rgba(flask.request):
+                raw_bytes = self._image_cache.get("RAW:" + full_surf_address_str)
+                if not raw_bytes:
+                    LOGGER.error(
+                        f"Error getting raw image for address: {full_surf_address_str}"
+                    )
+                    flask.abort(404)
+                response = flask.send_file(
+                    io.BytesIO(raw_bytes), mimetype=RAW_RGBA_MIMETYPE
+                )
+            else:
+                response = flask.send_file(
+                    io.BytesIO(cached_img_bytes), mimetype="image/png"
+                )
+
+            response.vary.add("Accept")
+            LOGGER.debug(
+                f"Request handled from image cache in: {timer.elapsed_s():.2f}s"
+            )
+            return response
+
+        @app.server.route(
+            _TILES_ROOT_URL_PATH
+            + "/<full_surf_address_str>/<int:level>/<int:tile_x>/<int:tile_y>"
+        )
+        def _handle_tile_request(
+            full_surf_address_str: str, level: int, tile_x: int, tile_y: int
+        ) -> flask.Response:
+            timer = PerfTimer()
+
+            tile_cache_key = _tile_cache_key(
+                full_surf_address_str, level, tile_x, tile_y
+            )
+            cached_img_bytes = self._image_cache.get(tile_cache_key)
+            if not cached_img_bytes:
+                LOGGER.error(f"Error getting tile image: {tile_cache_key}")
+                flask.abort(404)
+
             response = flask.send_file(
                 io.BytesIO(cached_img_bytes), mimetype="image/png"
             )
             LOGGER.debug(
-                f"Request handled from image cache in: {timer.elapsed_s():.2f}s"
+                f"Tile request handled from image cache in: {timer.elapsed_s():.2f}s"
             )
             return response
 
@@ -196,34 +492,31 @@ class SurfaceServer:
 
         timer = PerfTimer()
 
-        LOGGER.debug("Converting surface to PNG image...")
-        png_bytes: bytes = surface_to_png_bytes_optimized(surface)
+        LOGGER.debug("Converting surface to PNG and raw RGBA images...")
+        # Both image formats are made from the same RGBA array, so that serving the
+        # raw format never requires decoding the PNG image
+        rgba_arr = surface_to_rgba_array(surface)
+        png_bytes = rgba_array_to_png_bytes(rgba_arr)
+        raw_bytes = rgba_array_to_raw_rgba_bytes(rgba_arr)
         LOGGER.debug(f"Got PNG image, size={(len(png_bytes) / (1024 * 1024)):.2f}MB")
         et_to_image_s = timer.lap_s()
 
         img_cache_key = "IMG:" + base_cache_key
+        raw_cache_key = "RAW:" + base_cache_key
         meta_cache_key = "META:" + base_cache_key
 
-        self._image_cache.add(img_cache_key, png_bytes)
+        # Overwrite any entries left from a partially evicted surface
+        self._image_cache.set(img_cache_key, png_bytes)
+        self._image_cache.set(raw_cache_key, raw_bytes)
 
         # For debugging rotations
         # unrot_surf = surface.copy()
         # unrot_surf.unrotate()
         # unrot_surf.quickplot("/home/sigurdp/gitRoot/hk-webviz-subsurface/quickplot.png")
 
-        deckgl_bounds, deckgl_rot = _calc_map_component_bounds_and_rot(surface)
-
-        meta = SurfaceMeta(
-            x_min=surface.xmin,
-            x_max=surface.xmax,
-            y_min=surface.ymin,
-            y_max=surface.ymax,
-            val_min=surface.values.min(),
-            val_max=surface.values.max(),
-            deckgl_bounds=deckgl_bounds,
-            deckgl_rot_deg=deckgl_rot,
-        )
-        self._image_cache.add(meta_cache_key, meta)
+        meta = _create_surface_meta(surface)
+        # The metadata is written last, see get_surface_metadata()
+        self._image_cache.set(meta_cache_key, meta)
         et_write_cache_s = timer.lap_s()
 
         LOGGER.debug(
@@ -233,6 +526,51 @@ class SurfaceServer:
         )
 
 
+def _create_surface_meta(surface: xtgeo.RegularSurface) -> SurfaceMeta:
+    deckgl_bounds, deckgl_rot = _calc_map_component_bounds_and_rot(surface)
+
+    return SurfaceMeta(
+        x_min=surface.xmin,
+        x_max=surface.xmax,
+        y_min=surface.ymin,
+        y_max=surface.ymax,
+        val_min=surface.values.min(),
+        val_max=surface.values.max(),
+        deckgl_bounds=deckgl_bounds,
+        deckgl_rot_deg=deckgl_rot,
+    )
+
+
+def _make_hash_string(string_to_hash: str) -> str:
+    return hashlib.md5(string_to_hash.encode()).hexdigest()  # nosec
+
+
+def _tile_cache_key(base_cache_key: str, level: int, tile_x: int, tile_y: int) -> str:
+    return f"TILE:{level}/{tile_x}/{tile_y}:{base_cache_key}"
+
+
+def _request_wants_raw_rgba(request: flask.Request) -> bool:
+    if request.args.get("format") == "rgba":
+        return True
+
+    accept = request.accept_mimetypes
+    return accept[RAW_RGBA_MIMETYPE] > accept["image/png"]
+
+
+def _qualified_address_to_str(
+    qualified_address: Union[QualifiedSurfaceAddress, QualifiedDiffSurfaceAddress],
+) -> str:
+    if isinstance(qualified_address, QualifiedSurfaceAddress):
+        return _address_to_str(qualified_address.provider_id, qualified_address.address)
+
+    return _diff_address_to_str(
+        qualified_address.provider_id_a,
+        qualified_address.address_a,
+        qualified_address.provider_id_b,
+        qualified_address.address_b,
+    )
+
+
 def _address_to_str(
     provider_id: str,
     address: SurfaceAddress,
@@ -1,8 +1,11 @@
 import abc
-from typing import Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence
 
 import pandas as pd
 
+# Filter values can be given either as a single value or as a list of values
+SelectorFilters = Dict[str, Any]
+
 
 class EnsembleTableProvider(abc.ABC):
     @abc.abstractmethod
@@ -19,6 +22,50 @@ class EnsembleTableProvider(abc.ABC):
     ) -> pd.DataFrame:
         ...
 
+    def get_filtered_column_data(
+        self,
+        column_names: Sequence[str],
+        realizations: Optional[Sequence[int]] = None,
+        selector_filters: Optional[SelectorFilters] = None,
+        groupby_sum: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Get column data for the rows where the selector columns (e.g. ZONE, REGION,
+        FACIES, SOURCE, SENSNAME) match the values in selector_filters. Each filter
+        value can be a single value or a list of accepted values.
+
+        If groupby_sum is specified, the returned data will contain the groupby columns
+        together with the sum of each of the columns in column_names per group, sorted
+        on the groupby columns. Otherwise the returned data has the same layout as
+        returned by get_column_data().
+
+        This default implementation does the filtering in pandas, implementations
+        should override it to reduce the data before converting it to pandas.
+        """
+        filter_dict = selector_filter_value_lists(selector_filters)
+        groupby_columns = list(groupby_sum) if groupby_sum else []
+        columns_to_get = [
+            col
+            for col in dict.fromkeys(
+                [*column_names, *filter_dict.keys(), *groupby_columns]
+            )
+            if col != "REAL"
+        ]
+
+        df = self.get_column_data(columns_to_get, realizations)
+        for column_name, values in filter_dict.items():
+            df = df.loc[df[column_name].isin(values)]
+
+        if groupby_columns:
+            sum_columns = [col for col in column_names if col not in groupby_columns]
+            return (
+                df.groupby(groupby_columns, as_index=False)[sum_columns]
+                .sum()
+                .reset_index(drop=True)
+            )
+
+        output_columns = list(dict.fromkeys(["REAL", *column_names]))
+        return df[output_columns].reset_index(drop=True)
+
 
 class EnsembleTableProviderSet:
     def __init__(self, provider_dict: Dict[str, EnsembleTableProvider]) -> None:
@@ -29,3 +76,17 @@ class EnsembleTableProviderSet:
 
     def ensemble_provider(self, ensemble_name: str) -> EnsembleTableProvider:
         return self._provider_dict[ensemble_name]
+
+
+def selector_filter_value_lists(
+    selector_filters: Optional[SelectorFilters],
+) -> Dict[str, List[Any]]:
+    """Returns the selector filters with all the filter values as lists"""
+    if not selector_filters:
+        return {}
+    return {
+        column_name: list(values)
+        if isinstance(values, (list, tuple, set))
+        else [values]
+        for column_name, values in selector_filters.items()
+    }
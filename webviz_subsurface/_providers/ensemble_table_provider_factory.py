@@ -19,10 +19,13 @@ from .ensemble_table_provider_impl_arrow import EnsembleTableProviderImplArrow
 from .ensemble_table_provider_impl_inmem_parquet import (
     EnsembleTableProviderImplInMemParquet,
 )
+from .shared_memory_table_cache import SharedMemoryTableCache
 
 
 class BackingType(Enum):
     ARROW = "arrow"
+    # Arrow with dictionary encoded string columns and float32 where possible
+    ARROW_COMPACT = "arrow_compact"
     INMEM_PARQUET = "inmem_parquet"
 
 
@@ -34,18 +37,28 @@ def _make_hash_string(string_to_hash: str) -> str:
     return hashlib.md5(string_to_hash.encode()).hexdigest()  # nosec
 
 
+def _compact_storage_key(storage_key: str) -> str:
+    # Compact arrow files get their own key so they never get mixed up with
+    # existing plain arrow files in the same storage folder
+    return storage_key + "__compact"
+
+
 class EnsembleTableProviderFactory(WebvizFactory):
     def __init__(
         self,
         root_storage_folder: Path,
         backing_type: BackingType,
         allow_storage_writes: bool,
+        use_shared_memory_cache: bool = False,
     ) -> None:
 
         self._storage_dir = Path(root_storage_folder) / __name__
         self._backing_type: BackingType = backing_type
         self._allow_storage_writes = allow_storage_writes
         self._scratch_ensemble_cache: Dict[str, bytes] = {}
+        self._shared_table_cache: Optional[SharedMemoryTableCache] = (
+            SharedMemoryTableCache.instance() if use_shared_memory_cache else None
+        )
 
         LOGGER.info(
             f"EnsembleTableProviderFactory init: backing_type={repr(self._backing_type)}"
@@ -53,6 +66,10 @@ class EnsembleTableProviderFactory(WebvizFactory):
         LOGGER.info(
             f"EnsembleTableProviderFactory init: storage_dir={self._storage_dir}"
         )
+        LOGGER.info(
+            f"EnsembleTableProviderFactory init: "
+            f"use_shared_memory_cache={use_shared_memory_cache}"
+        )
 
         if self._allow_storage_writes:
             # For now, just make sure the storage folder exists
@@ -67,6 +84,7 @@ class EnsembleTableProviderFactory(WebvizFactory):
             storage_folder = app_instance_info.storage_folder
             backing_type = BackingType.ARROW
             allow_writes = app_instance_info.run_mode != WebvizRunMode.PORTABLE
+            use_shared_memory_cache = False
 
             my_settings = WEBVIZ_FACTORY_REGISTRY.all_factory_settings.get(
                 "EnsembleTableProviderFactory"
@@ -77,9 +95,11 @@ class EnsembleTableProviderFactory(WebvizFactory):
                 )
                 if "backing_type" in my_settings:
                     backing_type = BackingType(my_settings["backing_type"])
+                if "shared_memory_cache" in my_settings:
+                    use_shared_memory_cache = bool(my_settings["shared_memory_cache"])
 
             factory = EnsembleTableProviderFactory(
-                storage_folder, backing_type, allow_writes
+                storage_folder, backing_type, allow_writes, use_shared_memory_cache
             )
             WEBVIZ_FACTORY_REGISTRY.set_factory(EnsembleTableProviderFactory, factory)
 
@@ -282,7 +302,13 @@ class EnsembleTableProviderFactory(WebvizFactory):
     ) -> Optional[EnsembleTableProvider]:
         if self._backing_type == BackingType.ARROW:
             return EnsembleTableProviderImplArrow.from_backing_store(
-                self._storage_dir, storage_key
+                self._storage_dir, storage_key, self._shared_table_cache
+            )
+        if self._backing_type == BackingType.ARROW_COMPACT:
+            return EnsembleTableProviderImplArrow.from_backing_store(
+                self._storage_dir,
+                _compact_storage_key(storage_key),
+                self._shared_table_cache,
             )
         if self._backing_type == BackingType.INMEM_PARQUET:
             return EnsembleTableProviderImplInMemParquet.from_backing_store(
@@ -298,6 +324,13 @@ class EnsembleTableProviderFactory(WebvizFactory):
             EnsembleTableProviderImplArrow.write_backing_store_from_ensemble_dataframe(
                 self._storage_dir, storage_key, ensemble_df
             )
+        elif self._backing_type == BackingType.ARROW_COMPACT:
+            EnsembleTableProviderImplArrow.write_backing_store_from_ensemble_dataframe(
+                self._storage_dir,
+                _compact_storage_key(storage_key),
+                ensemble_df,
+                compact=True,
+            )
         elif self._backing_type == BackingType.INMEM_PARQUET:
             EnsembleTableProviderImplInMemParquet.write_backing_store_from_ensemble_dataframe(
                 self._storage_dir, storage_key, ensemble_df
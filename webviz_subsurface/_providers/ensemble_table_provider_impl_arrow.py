@@ -2,12 +2,18 @@ import logging
 from pathlib import Path
 from typing import List, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.compute as pc
 
 from .._utils.perf_timer import PerfTimer
-from .ensemble_table_provider import EnsembleTableProvider
+from .ensemble_table_provider import (
+    EnsembleTableProvider,
+    SelectorFilters,
+    selector_filter_value_lists,
+)
+from .shared_memory_table_cache import SharedMemoryTableCache, make_file_table_cache_key
 
 # Since PyArrow's actual compute functions are not seen by pylint
 # pylint: disable=no-member
@@ -15,9 +21,22 @@ from .ensemble_table_provider import EnsembleTableProvider
 
 LOGGER = logging.getLogger(__name__)
 
+# String columns with fewer unique values than this fraction of the number of rows
+# are dictionary encoded in compact backing stores
+_MAX_DICTIONARY_UNIQUE_FRACTION = 0.5
+
+# Max relative difference for float64 columns to be stored as float32 in compact
+# backing stores. Float32 has about 7 significant digits, so in practice only
+# columns with values outside of the float32 range are kept as float64.
+_FLOAT32_DOWNCAST_RTOL = 1e-6
+
 
 class EnsembleTableProviderImplArrow(EnsembleTableProvider):
-    def __init__(self, arrow_file_name: Path) -> None:
+    def __init__(
+        self,
+        arrow_file_name: Path,
+        shared_table_cache: Optional[SharedMemoryTableCache] = None,
+    ) -> None:
         self._arrow_file_name = str(arrow_file_name)
 
         LOGGER.debug(f"init with arrow file: {self._arrow_file_name}")
@@ -45,18 +64,37 @@ class EnsembleTableProviderImplArrow(EnsembleTableProvider):
         self._realizations: List[int] = unique_realizations_on_file.to_pylist()
         et_find_real_ms = timer.lap_ms()
 
+        # Optionally keep the full table in memory, shared with other processes
+        self._cached_full_table: Optional[pa.Table] = None
+        if shared_table_cache is not None:
+            self._cached_full_table = shared_table_cache.get_or_create_table(
+                make_file_table_cache_key(Path(self._arrow_file_name)),
+                self._cached_reader.read_all,
+            )
+        et_shared_cache_ms = timer.lap_ms()
+
         LOGGER.debug(
             f"init took: {timer.elapsed_s():.2f}s, "
             f"(open={et_open_ms}ms, create_reader={et_create_reader_ms}ms, "
-            f"find_col_names={et_find_col_names_ms}ms, find_real={et_find_real_ms}ms), "
+            f"find_col_names={et_find_col_names_ms}ms, find_real={et_find_real_ms}ms, "
+            f"shared_cache={et_shared_cache_ms}ms), "
             f"#column_names={len(self._column_names)}, "
             f"#realization={len(self._realizations)}"
         )
 
     @staticmethod
     def write_backing_store_from_ensemble_dataframe(
-        storage_dir: Path, storage_key: str, ensemble_df: pd.DataFrame
+        storage_dir: Path,
+        storage_key: str,
+        ensemble_df: pd.DataFrame,
+        compact: bool = False,
     ) -> None:
+        """Write the ensemble data to arrow backing store.
+        If compact is True, low cardinality string columns (e.g. ZONE, REGION,
+        SENSNAME) are dictionary encoded, so they will be returned as pandas
+        Categorical, and float64 columns are stored as float32 when that can be done
+        without loss of precision beyond _FLOAT32_DOWNCAST_RTOL.
+        """
 
         table = pa.Table.from_pandas(ensemble_df, preserve_index=False)
 
@@ -67,6 +105,9 @@ class EnsembleTableProviderImplArrow(EnsembleTableProvider):
                 raise KeyError("Input data contains more than one unique ensemble name")
             table = table.drop(["ENSEMBLE"])
 
+        if compact:
+            table = _compact_table(table)
+
         # Write to arrow format
         arrow_file_name: Path = storage_dir / (storage_key + ".arrow")
         with pa.OSFile(str(arrow_file_name), "wb") as sink:
@@ -75,12 +116,14 @@ class EnsembleTableProviderImplArrow(EnsembleTableProvider):
 
     @staticmethod
     def from_backing_store(
-        storage_dir: Path, storage_key: str
+        storage_dir: Path,
+        storage_key: str,
+        shared_table_cache: Optional[SharedMemoryTableCache] = None,
     ) -> Optional["EnsembleTableProviderImplArrow"]:
 
         arrow_file_name = storage_dir / (storage_key + ".arrow")
         if arrow_file_name.is_file():
-            return EnsembleTableProviderImplArrow(arrow_file_name)
+            return EnsembleTableProviderImplArrow(arrow_file_name, shared_table_cache)
 
         return None
 
@@ -109,7 +152,10 @@ class EnsembleTableProviderImplArrow(EnsembleTableProvider):
             ["REAL", *column_names] if "REAL" not in column_names else column_names
         )
 
-        table = self._cached_reader.read_all().select(columns_to_get)
+        if self._cached_full_table is not None:
+            table = self._cached_full_table.select(columns_to_get)
+        else:
+            table = self._cached_reader.read_all().select(columns_to_get)
         et_read_ms = timer.lap_ms()
 
         if realizations:
@@ -129,3 +175,153 @@ class EnsembleTableProviderImplArrow(EnsembleTableProvider):
         )
 
         return df
+
+    def get_filtered_column_data(
+        self,
+        column_names: Sequence[str],
+        realizations: Optional[Sequence[int]] = None,
+        selector_filters: Optional[SelectorFilters] = None,
+        groupby_sum: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        # pylint: disable=too-many-locals
+
+        # Filtering and aggregation is done in arrow, so that only the reduced
+        # result is converted to pandas
+
+        timer = PerfTimer()
+
+        filter_dict = selector_filter_value_lists(selector_filters)
+        groupby_columns = list(groupby_sum) if groupby_sum else []
+        columns_to_get = list(
+            dict.fromkeys(
+                ["REAL", *column_names, *filter_dict.keys(), *groupby_columns]
+            )
+        )
+
+        if self._cached_full_table is not None:
+            table = self._cached_full_table.select(columns_to_get)
+        else:
+            table = self._cached_reader.read_all().select(columns_to_get)
+        et_read_ms = timer.lap_ms()
+
+        mask = None
+        if realizations:
+            mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
+        for column_name, values in filter_dict.items():
+            column_mask = _is_in_mask(table[column_name], values)
+            mask = column_mask if mask is None else pc.and_(mask, column_mask)
+        if mask is not None:
+            table = table.filter(mask)
+        et_filter_ms = timer.lap_ms()
+
+        if groupby_columns:
+            # Table.group_by() requires pyarrow 7, which is not available for all
+            # supported Python versions. The table has already been reduced by the
+            # filters, so only the needed columns are converted and summed in pandas.
+            sum_columns = [col for col in column_names if col not in groupby_columns]
+            table = table.select([*groupby_columns, *sum_columns])
+
+            # Decode dictionary encoded groupby columns, so that the groups are
+            # sorted on their values rather than on the order of the categories
+            for col in groupby_columns:
+                if pa.types.is_dictionary(table.schema.field(col).type):
+                    table = table.set_column(
+                        table.schema.get_field_index(col),
+                        col,
+                        _dictionary_decode(table[col]),
+                    )
+            df = table.to_pandas(ignore_metadata=True)
+            et_to_pandas_ms = timer.lap_ms()
+
+            df = (
+                df.groupby(groupby_columns, as_index=False)[sum_columns]
+                .sum()
+                .reset_index(drop=True)
+            )
+            et_aggregate_ms = timer.lap_ms()
+        else:
+            table = table.select(list(dict.fromkeys(["REAL", *column_names])))
+            df = table.to_pandas(ignore_metadata=True)
+            et_to_pandas_ms = timer.lap_ms()
+            et_aggregate_ms = 0
+
+        LOGGER.debug(
+            f"get_filtered_column_data() took: {timer.elapsed_ms()}ms "
+            f"(read={et_read_ms}ms, filter={et_filter_ms}ms, "
+            f"aggregate={et_aggregate_ms}ms, to_pandas={et_to_pandas_ms}ms), "
+            f"#cols={len(column_names)}, "
+            f"#real={len(realizations) if realizations else 'all'}, "
+            f"#filters={len(filter_dict)}, groupby={groupby_columns}, "
+            f"df.shape={df.shape}, file={Path(self._arrow_file_name).name}"
+        )
+
+        return df
+
+
+def _compact_table(table: pa.Table) -> pa.Table:
+    timer = PerfTimer()
+
+    fields = []
+    columns = []
+    for field, column in zip(table.schema, table.columns):
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            num_unique = len(pc.unique(column))
+            if num_unique <= _MAX_DICTIONARY_UNIQUE_FRACTION * len(column):
+                column = column.dictionary_encode()
+        elif field.type == pa.float64() and _is_float32_downcast_within_tolerance(
+            column
+        ):
+            column = pc.cast(column, pa.float32(), safe=False)
+
+        fields.append(pa.field(field.name, column.type, field.nullable))
+        columns.append(column)
+
+    compacted_table = pa.table(columns, schema=pa.schema(fields))
+
+    LOGGER.debug(
+        f"Compacted table in {timer.elapsed_ms()}ms, "
+        f"size={table.nbytes / (1024 * 1024):.1f}MB -> "
+        f"{compacted_table.nbytes / (1024 * 1024):.1f}MB"
+    )
+
+    return compacted_table
+
+
+def _is_float32_downcast_within_tolerance(column: pa.ChunkedArray) -> bool:
+    np_f64 = column.to_numpy()
+    with np.errstate(over="ignore"):
+        np_f32 = np_f64.astype(np.float32)
+    return np.allclose(
+        np_f32, np_f64, rtol=_FLOAT32_DOWNCAST_RTOL, atol=0, equal_nan=True
+    )
+
+
+def _is_in_mask(column: pa.ChunkedArray, values: List) -> pa.ChunkedArray:
+    value_set = pa.array(values, type=_value_type(column))
+    if not pa.types.is_dictionary(column.type):
+        return pc.is_in(column, value_set=value_set)
+
+    # For dictionary encoded columns, only look up the (few) dictionary values and
+    # then map the result to all rows through the indices
+    return pa.chunked_array(
+        [
+            pc.take(pc.is_in(chunk.dictionary, value_set=value_set), chunk.indices)
+            for chunk in column.chunks
+        ],
+        type=pa.bool_(),
+    )
+
+
+def _dictionary_decode(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    return pa.chunked_array(
+        [chunk.dictionary_decode() for chunk in column.chunks],
+        type=column.type.value_type,
+    )
+
+
+def _value_type(column: pa.ChunkedArray) -> pa.DataType:
+    """Returns the type of the values in the column, which for dictionary encoded
+    columns is the type of the dictionary values"""
+    if pa.types.is_dictionary(column.type):
+        return column.type.value_type
+    return column.type
@@ -0,0 +1,216 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from webviz_config.webviz_factory import WebvizFactory
+from webviz_config.webviz_factory_registry import WEBVIZ_FACTORY_REGISTRY
+from webviz_config.webviz_instance_info import WebvizRunMode
+
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+from .ensemble_summary_provider.ensemble_summary_provider import (
+    EnsembleSummaryProvider,
+    Frequency,
+)
+from .ensemble_surface_provider.ensemble_surface_provider import (
+    EnsembleSurfaceProvider,
+    StatisticalSurfaceAddress,
+    SurfaceStatistic,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ProviderWarmUp(WebvizFactory):
+    """Speeds up server start and the first user interactions.
+
+    Provider creation for the ensembles of a plugin can be run concurrently using
+    create_concurrently(), and plugins can register prefetch jobs that pre-touch
+    the data that is most likely to be needed first. The prefetch jobs are started
+    in background threads once all plugins have been initialized, so they do not
+    delay the start of the server.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, prefetch: bool = True):
+        self._max_workers = max_workers
+        self._prefetch_enabled = prefetch
+
+        self._lock = threading.Lock()
+        self._pending_prefetch_jobs: List[Tuple[str, Callable[[], Any]]] = []
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch_futures: List[Future] = []
+        self._prefetch_timer = PerfTimer()
+        self._num_prefetch_jobs_done = 0
+
+        LOGGER.info(
+            f"ProviderWarmUp init: max_workers={self._max_workers}, "
+            f"prefetch={self._prefetch_enabled}"
+        )
+
+    @staticmethod
+    def instance() -> "ProviderWarmUp":
+        """Static method to access the singleton instance of the factory."""
+
+        factory = WEBVIZ_FACTORY_REGISTRY.get_factory(ProviderWarmUp)
+        if not factory:
+            app_instance_info = WEBVIZ_FACTORY_REGISTRY.app_instance_info
+            max_workers = None
+            # Pre-touching data is of no use when just copying data for a portable app
+            prefetch = app_instance_info.run_mode != WebvizRunMode.BUILDING_PORTABLE
+
+            my_settings = WEBVIZ_FACTORY_REGISTRY.all_factory_settings.get(
+                "ProviderWarmUp"
+            )
+            if my_settings:
+                LOGGER.info(f"Parsing settings for ProviderWarmUp: {my_settings}")
+                if "max_workers" in my_settings:
+                    max_workers = int(my_settings["max_workers"])
+                if "prefetch" in my_settings:
+                    prefetch = prefetch and bool(my_settings["prefetch"])
+
+            factory = ProviderWarmUp(max_workers, prefetch)
+
+            # Store the factory object in the global factory registry
+            WEBVIZ_FACTORY_REGISTRY.set_factory(ProviderWarmUp, factory)
+
+        return factory
+
+    def create_concurrently(
+        self, description: str, create_funcs: Dict[str, Callable[[], T]]
+    ) -> Dict[str, T]:
+        """Call the create functions concurrently in a thread pool and return the
+        created objects with the same keys and ordering as create_funcs.
+        Progress is logged as each object is created. If any of the create functions
+        raises an exception, it will be re-raised here.
+        """
+        timer = PerfTimer()
+        num_to_create = len(create_funcs)
+
+        created: Dict[str, T] = {}
+        if num_to_create <= 1 or self._max_workers == 1:
+            for key, create_func in create_funcs.items():
+                created[key] = create_func()
+                self._log_create_progress(description, key, len(created), timer)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="provider_warmup"
+            ) as executor:
+                future_to_key = {
+                    executor.submit(create_func): key
+                    for key, create_func in create_funcs.items()
+                }
+                for future in as_completed(future_to_key):
+                    key = future_to_key[future]
+                    created[key] = future.result()
+                    self._log_create_progress(description, key, len(created), timer)
+
+        LOGGER.info(
+            f"{description}: created {num_to_create} in {timer.elapsed_s():.2f}s"
+        )
+
+        return {key: created[key] for key in create_funcs}
+
+    def add_prefetch_job(self, description: str, job: Callable[[], Any]) -> None:
+        """Register job that pre-touches data, to be run in the background after all
+        plugins have been initialized. Exceptions from the job are logged, but will
+        otherwise be ignored."""
+        if not self._prefetch_enabled:
+            return
+
+        with self._lock:
+            if self._prefetch_executor is None:
+                self._pending_prefetch_jobs.append((description, job))
+            else:
+                self._submit_prefetch_job(description, job)
+
+    def wait_for_prefetch(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            futures = list(self._prefetch_futures)
+        wait(futures, timeout=timeout)
+
+    def cleanup_resources_after_plugin_init(self) -> None:
+        # All plugins have been initialized, so start pre-touching data
+        with self._lock:
+            if self._prefetch_executor is not None or not self._prefetch_enabled:
+                return
+
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="provider_prefetch"
+            )
+            self._prefetch_timer.lap_ms()
+            LOGGER.info(
+                f"Starting {len(self._pending_prefetch_jobs)} prefetch jobs in background"
+            )
+            for description, job in self._pending_prefetch_jobs:
+                self._submit_prefetch_job(description, job)
+            self._pending_prefetch_jobs.clear()
+
+    def _submit_prefetch_job(self, description: str, job: Callable[[], Any]) -> None:
+        # Must be called with the lock held
+        assert self._prefetch_executor is not None
+        self._prefetch_futures.append(
+            self._prefetch_executor.submit(self._run_prefetch_job, description, job)
+        )
+
+    def _run_prefetch_job(self, description: str, job: Callable[[], Any]) -> None:
+        timer = PerfTimer()
+        try:
+            job()
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.warning(f"Prefetch of {description} failed: {exc}")
+            return
+
+        with self._lock:
+            self._num_prefetch_jobs_done += 1
+            num_done = self._num_prefetch_jobs_done
+            num_submitted = len(self._prefetch_futures)
+
+        LOGGER.debug(
+            f"Prefetched {description} in {timer.elapsed_ms()}ms "
+            f"({num_done}/{num_submitted} done, "
+            f"total elapsed {self._prefetch_timer.elapsed_s():.2f}s)"
+        )
+
+    @staticmethod
+    def _log_create_progress(
+        description: str, key: str, num_created: int, timer: PerfTimer
+    ) -> None:
+        LOGGER.debug(
+            f"{description}: created {key} after {timer.elapsed_s():.2f}s "
+            f"({num_created} done)"
+        )
+
+
+def prefetch_first_vector_statistics(provider: EnsembleSummaryProvider) -> None:
+    """Pre-touch the data for the first vector by computing its statistics"""
+    vector_names = provider.vector_names()
+    if not vector_names:
+        return
+
+    frequency = Frequency.MONTHLY if provider.supports_resampling() else None
+    provider.get_vectors_statistics_df(vector_names[:1], frequency)
+
+
+def prefetch_first_statistical_surface(provider: EnsembleSurfaceProvider) -> None:
+    """Pre-touch the data for the first surface by computing its mean surface"""
+    attributes = provider.attributes()
+    if not attributes:
+        return
+
+    surface_names = provider.surface_names_for_attribute(attributes[0])
+    surface_dates = provider.surface_dates_for_attribute(attributes[0])
+    if not surface_names:
+        return
+
+    provider.get_surface(
+        StatisticalSurfaceAddress(
+            attribute=attributes[0],
+            name=surface_names[0],
+            datestr=surface_dates[0] if surface_dates else None,
+            statistic=SurfaceStatistic.MEAN,
+            realizations=provider.realizations(),
+        )
+    )
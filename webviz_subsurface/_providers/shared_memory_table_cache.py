@@ -0,0 +1,257 @@
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set
+
+import pyarrow as pa
+
+from webviz_subsurface._utils.file_lock import FileLock
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+LOGGER = logging.getLogger(__name__)
+
+# On Linux, /dev/shm is a tmpfs mount backed by shared memory
+DEFAULT_SHARED_MEMORY_ROOT = Path("/dev/shm")
+
+# Default upper limit for the total size of the cached tables, as a fraction of the
+# size of the file system holding the cache directory
+DEFAULT_MAX_FILE_SYSTEM_FRACTION = 0.5
+
+_SHARED_MEMORY_TABLE_CACHE_INSTANCE: Optional["SharedMemoryTableCache"] = None
+
+
+@dataclass(frozen=True)
+class SharedMemoryUsage:
+    num_tables: int
+    # Total size of the shared tables mapped by this process
+    shared_table_bytes: int
+    # Size of the shared tables that were created by this process
+    created_table_bytes: int
+    # Resident memory of this process, split into private and shared memory.
+    # None if not available on this platform
+    process_private_bytes: Optional[int]
+    process_shared_bytes: Optional[int]
+
+
+class SharedMemoryTableCache:
+    """Cache of fully decoded arrow tables that are shared between processes.
+
+    Each table is written once, as an uncompressed arrow IPC file, to a directory
+    that should reside on a shared memory file system (typically /dev/shm). All
+    processes using the same cache directory, e.g. the worker processes of a
+    gunicorn server, then memory map the same file, so there is only one copy of
+    the data in RAM and column access is zero-copy.
+
+    The table files outlive the processes, so that restarted workers can reuse
+    them. To bound the memory used, the least recently used table files are
+    removed when creating a new table would exceed max_total_bytes. Removing a
+    file does not affect processes that already have it mapped.
+    """
+
+    def __init__(self, cache_dir: Path, max_total_bytes: Optional[int] = None) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        if max_total_bytes is None:
+            max_total_bytes = int(
+                shutil.disk_usage(self._cache_dir).total
+                * DEFAULT_MAX_FILE_SYSTEM_FRACTION
+            )
+        self._max_total_bytes = max_total_bytes
+
+        self._lock = threading.Lock()
+        self._tables: Dict[str, pa.Table] = {}
+        self._mapped_file_names: Set[Path] = set()
+        self._shared_table_bytes = 0
+        self._created_table_bytes = 0
+
+        LOGGER.info(
+            f"SharedMemoryTableCache init: cache_dir={self._cache_dir}, "
+            f"max_total_size={self._max_total_bytes / (1024 * 1024):.1f}MB"
+        )
+
+    @staticmethod
+    def instance() -> "SharedMemoryTableCache":
+        # pylint: disable=global-statement
+        global _SHARED_MEMORY_TABLE_CACHE_INSTANCE
+        if not _SHARED_MEMORY_TABLE_CACHE_INSTANCE:
+            root_dir = DEFAULT_SHARED_MEMORY_ROOT
+            if not root_dir.is_dir():
+                LOGGER.warning(
+                    f"{root_dir} not found, the table cache will not be placed in "
+                    "shared memory"
+                )
+                root_dir = Path(os.environ.get("TMPDIR", "/tmp"))
+
+            _SHARED_MEMORY_TABLE_CACHE_INSTANCE = SharedMemoryTableCache(
+                root_dir / "webviz_shared_table_cache"
+            )
+
+        return _SHARED_MEMORY_TABLE_CACHE_INSTANCE
+
+    def get_or_create_table(
+        self, key: str, table_factory: Callable[[], pa.Table]
+    ) -> Optional[pa.Table]:
+        """Get the shared table for the specified key, calling table_factory to create
+        it if no process has created it yet.
+
+        The key must identify the table content, so when caching tables read from
+        file the key should include something like the file's size and modification
+        time.
+
+        Returns None if the table could not be placed in the cache, e.g. if the
+        shared memory file system is full. Callers should then fall back to reading
+        the data the same way as without a cache.
+        """
+
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                return table
+
+            timer = PerfTimer()
+
+            file_name = self._cache_dir / f"{_make_hash_string(key)}.arrow"
+
+            try:
+                created = self._create_table_file_if_missing(file_name, table_factory)
+                et_create_ms = timer.lap_ms()
+
+                table = pa.ipc.open_file(pa.memory_map(str(file_name), "r")).read_all()
+                table_bytes = file_name.stat().st_size
+            except OSError as exc:
+                LOGGER.warning(
+                    f"Could not place table in shared memory cache, falling back to "
+                    f"non-shared access (key={key}): {exc}"
+                )
+                return None
+            et_map_ms = timer.lap_ms()
+
+            self._tables[key] = table
+            self._mapped_file_names.add(file_name)
+            self._shared_table_bytes += table_bytes
+            if created:
+                self._created_table_bytes += table_bytes
+
+        usage = self.memory_usage()
+        LOGGER.debug(
+            f"{'Created' if created else 'Mapped existing'} shared table in "
+            f"{timer.elapsed_ms()}ms (create={et_create_ms}ms, map={et_map_ms}ms), "
+            f"table_size={table_bytes / (1024 * 1024):.1f}MB, "
+            f"{_format_memory_usage(usage)}"
+        )
+
+        return table
+
+    def _create_table_file_if_missing(
+        self, file_name: Path, table_factory: Callable[[], pa.Table]
+    ) -> bool:
+        """Returns True if the file was created by this call"""
+
+        # Serialize creation between processes so the table is only created once
+        with FileLock(file_name.with_suffix(".lock")):
+            if file_name.is_file():
+                # Mark as recently used, see _remove_least_recently_used_files()
+                os.utime(file_name)
+                return False
+
+            table = table_factory()
+            self._remove_least_recently_used_files(table.nbytes)
+            _write_table_file(file_name, table)
+            return True
+
+    def _remove_least_recently_used_files(self, bytes_to_add: int) -> None:
+        """Remove table files, least recently used first, until bytes_to_add fits
+        within the size limit. Files mapped by this process are kept"""
+
+        candidates = []
+        total_bytes = 0
+        for file_name in self._cache_dir.glob("*.arrow"):
+            try:
+                stat = file_name.stat()
+            except FileNotFoundError:
+                # Removed by another process
+                continue
+            total_bytes += stat.st_size
+            if file_name not in self._mapped_file_names:
+                candidates.append((stat.st_mtime_ns, stat.st_size, file_name))
+
+        for _mtime_ns, size, file_name in sorted(candidates):
+            if total_bytes + bytes_to_add <= self._max_total_bytes:
+                break
+            LOGGER.debug(f"Removing least recently used shared table: {file_name}")
+            try:
+                file_name.unlink()
+            except FileNotFoundError:
+                # Removed by another process
+                pass
+            total_bytes -= size
+
+    def memory_usage(self) -> SharedMemoryUsage:
+        process_memory = _read_process_memory_bytes()
+        return SharedMemoryUsage(
+            num_tables=len(self._tables),
+            shared_table_bytes=self._shared_table_bytes,
+            created_table_bytes=self._created_table_bytes,
+            process_private_bytes=process_memory.get("RssAnon"),
+            process_shared_bytes=process_memory.get("RssShmem"),
+        )
+
+
+def make_file_table_cache_key(file_name: Path) -> str:
+    """Make cache key for a table read from the specified file, that changes
+    whenever the file is rewritten"""
+    stat = os.stat(file_name)
+    return f"{Path(file_name).resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _write_table_file(file_name: Path, table: pa.Table) -> None:
+    # Write to a temporary file and rename, so other processes never see a
+    # partially written file
+    tmp_file_name = file_name.with_name(f"{file_name.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with pa.OSFile(str(tmp_file_name), "wb") as sink:
+            with pa.RecordBatchFileWriter(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_file_name, file_name)
+    finally:
+        if tmp_file_name.exists():
+            tmp_file_name.unlink()
+
+
+def _read_process_memory_bytes() -> Dict[str, int]:
+    """Returns the RSS entries (RssAnon, RssFile, RssShmem) from /proc/self/status
+    in bytes, or an empty dict if not available"""
+    ret_dict: Dict[str, int] = {}
+    try:
+        with open("/proc/self/status", "r") as file:
+            for line in file:
+                if line.startswith("Rss"):
+                    name, value = line.split(":", 1)
+                    ret_dict[name] = int(value.split()[0]) * 1024
+    except (OSError, ValueError):
+        return {}
+    return ret_dict
+
+
+def _format_memory_usage(usage: SharedMemoryUsage) -> str:
+    def _to_mb(num_bytes: Optional[int]) -> str:
+        return f"{num_bytes / (1024 * 1024):.1f}MB" if num_bytes is not None else "n/a"
+
+    return (
+        f"#shared_tables={usage.num_tables}, "
+        f"shared_tables={_to_mb(usage.shared_table_bytes)} "
+        f"(created_here={_to_mb(usage.created_table_bytes)}), "
+        f"process_private={_to_mb(usage.process_private_bytes)}, "
+        f"process_shared={_to_mb(usage.process_shared_bytes)}"
+    )
+
+
+def _make_hash_string(string_to_hash: str) -> str:
+    # There is no security risk here and chances of collision should be very slim
+    return hashlib.md5(string_to_hash.encode()).hexdigest()  # nosec
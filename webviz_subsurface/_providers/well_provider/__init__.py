@@ -1,3 +1,3 @@
-from .well_provider import WellProvider
+from .well_provider import WellBoundingBox, WellHead, WellPath, WellProvider
 from .well_provider_factory import WellProviderFactory
 from .well_server import WellServer
@@ -3,11 +3,20 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
+import pyarrow as pa
 import xtgeo
+from pyarrow import feather
 
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
-from .well_provider import WellPath, WellProvider
+from .well_provider import (
+    WellBoundingBox,
+    WellHead,
+    WellPath,
+    WellProvider,
+    bounding_box_from_well_path,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -15,15 +24,52 @@ LOGGER = logging.getLogger(__name__)
 INV_KEY_REL_PATH = "rel_path"
 INV_KEY_MD_LOGNAME = "md_logname"
 
+# All well trajectories concatenated into X, Y, Z and MD columns
+TRAJECTORIES_FILE_NAME = "trajectories.arrow"
+
+# One row per well with the well's offset and number of rows in the trajectories
+# file, along with its well head position and bounding box
+WELL_INDEX_FILE_NAME = "well_index.arrow"
+
 
 class ProviderImplFile(WellProvider):
     def __init__(
-        self, provider_id: str, provider_dir: Path, inventory: Dict[str, dict]
+        self,
+        provider_id: str,
+        provider_dir: Path,
+        inventory: Dict[str, dict],
+        trajectories_table: Optional[pa.Table],
+        well_index_table: Optional[pa.Table],
     ) -> None:
         self._provider_id = provider_id
         self._provider_dir = provider_dir
         self._inventory = inventory
 
+        # The columnar store is optional, backing stores written by older versions
+        # will not have it, in which case we fall back to reading the well files
+        self._traj_x_arr: Optional[np.ndarray] = None
+        self._traj_y_arr: Optional[np.ndarray] = None
+        self._traj_z_arr: Optional[np.ndarray] = None
+        self._traj_md_arr: Optional[np.ndarray] = None
+        self._well_index: Optional[Dict[str, np.ndarray]] = None
+        self._well_name_to_index_row: Dict[str, int] = {}
+
+        if trajectories_table is not None and well_index_table is not None:
+            # Zero-copy views into the memory mapped files
+            self._traj_x_arr = trajectories_table["X"].to_numpy()
+            self._traj_y_arr = trajectories_table["Y"].to_numpy()
+            self._traj_z_arr = trajectories_table["Z"].to_numpy()
+            self._traj_md_arr = trajectories_table["MD"].to_numpy()
+            self._well_index = {
+                colname: well_index_table[colname].to_numpy()
+                for colname in well_index_table.schema.names
+                if colname != "WELL_NAME"
+            }
+            self._well_name_to_index_row = {
+                name: row
+                for row, name in enumerate(well_index_table["WELL_NAME"].to_pylist())
+            }
+
     @staticmethod
     def write_backing_store(
         storage_dir: Path,
@@ -31,6 +77,7 @@ class ProviderImplFile(WellProvider):
         well_file_names: List[str],
         md_logname: Optional[str],
     ) -> None:
+        # pylint: disable=too-many-locals
 
         timer = PerfTimer()
 
@@ -41,6 +88,7 @@ class ProviderImplFile(WellProvider):
         provider_dir.mkdir(parents=True, exist_ok=True)
 
         inventory_dict: Dict[str, dict] = {}
+        well_paths: Dict[str, WellPath] = {}
 
         LOGGER.debug(f"Writing {len(well_file_names)} wells into backing store...")
 
@@ -70,16 +118,21 @@ class ProviderImplFile(WellProvider):
                 INV_KEY_REL_PATH: rel_path,
                 INV_KEY_MD_LOGNAME: well.mdlogname,
             }
+            well_paths[well_name] = _well_path_from_xtgeo_well(well)
 
         et_copy_s = timer.lap_s()
 
+        _write_columnar_store(provider_dir, well_paths)
+        et_write_columnar_s = timer.lap_s()
+
+        # Write the inventory last, since its presence signals a complete store
         json_fn = provider_dir / "inventory.json"
         with open(json_fn, "w") as file:
             json.dump(inventory_dict, file)
 
         LOGGER.debug(
             f"Wrote well backing store in: {timer.elapsed_s():.2f}s ("
-            f"copy={et_copy_s:.2f}s)"
+            f"copy={et_copy_s:.2f}s, write_columnar={et_write_columnar_s:.2f}s)"
         )
 
     @staticmethod
@@ -97,7 +150,22 @@ class ProviderImplFile(WellProvider):
         except FileNotFoundError:
             return None
 
-        return ProviderImplFile(storage_key, provider_dir, inventory)
+        trajectories_table: Optional[pa.Table] = None
+        well_index_table: Optional[pa.Table] = None
+        traj_fn = provider_dir / TRAJECTORIES_FILE_NAME
+        index_fn = provider_dir / WELL_INDEX_FILE_NAME
+        if traj_fn.is_file() and index_fn.is_file():
+            trajectories_table = feather.read_table(str(traj_fn), memory_map=True)
+            well_index_table = feather.read_table(str(index_fn), memory_map=True)
+        else:
+            LOGGER.debug(
+                f"No columnar well store found in {provider_dir}, "
+                "falling back to reading well files"
+            )
+
+        return ProviderImplFile(
+            storage_key, provider_dir, inventory, trajectories_table, well_index_table
+        )
 
     def provider_id(self) -> str:
         return self._provider_id
@@ -106,16 +174,63 @@ class ProviderImplFile(WellProvider):
         return sorted(list(self._inventory.keys()))
 
     def get_well_path(self, well_name: str) -> WellPath:
-        well = self.get_well_xtgeo_obj(well_name)
-        df = well.dataframe
-        md_logname = well.mdlogname
+        if self._well_index is None:
+            return _well_path_from_xtgeo_well(self.get_well_xtgeo_obj(well_name))
+
+        row = self._get_well_index_row(well_name)
+        start = self._well_index["OFFSET"][row]
+        stop = start + self._well_index["COUNT"][row]
+
+        return WellPath(
+            x_arr=self._traj_x_arr[start:stop],
+            y_arr=self._traj_y_arr[start:stop],
+            z_arr=self._traj_z_arr[start:stop],
+            md_arr=self._traj_md_arr[start:stop],
+        )
 
-        x_arr = df["X_UTME"].to_numpy()
-        y_arr = df["Y_UTMN"].to_numpy()
-        z_arr = df["Z_TVDSS"].to_numpy()
-        md_arr = df[md_logname].to_numpy()
+    def get_well_heads(self, well_names: List[str]) -> List[WellHead]:
+        if self._well_index is None:
+            return super().get_well_heads(well_names)
 
-        return WellPath(x_arr=x_arr, y_arr=y_arr, z_arr=z_arr, md_arr=md_arr)
+        rows = np.array(
+            [self._get_well_index_row(well_name) for well_name in well_names],
+            dtype=np.int64,
+        )
+        # Wells without any trajectory points have NaN well heads in the index
+        has_points = self._well_index["COUNT"][rows] > 0
+        rows = rows[has_points]
+        well_names = [name for name, keep in zip(well_names, has_points) if keep]
+
+        head_x_list = self._well_index["HEAD_X"][rows].tolist()
+        head_y_list = self._well_index["HEAD_Y"][rows].tolist()
+        head_z_list = self._well_index["HEAD_Z"][rows].tolist()
+
+        return [
+            WellHead(well_name=well_name, x=x, y=y, z=z)
+            for well_name, x, y, z in zip(
+                well_names, head_x_list, head_y_list, head_z_list
+            )
+        ]
+
+    def get_well_bounding_box(self, well_name: str) -> WellBoundingBox:
+        if self._well_index is None:
+            return super().get_well_bounding_box(well_name)
+
+        row = self._get_well_index_row(well_name)
+        return WellBoundingBox(
+            min_x=float(self._well_index["MIN_X"][row]),
+            min_y=float(self._well_index["MIN_Y"][row]),
+            min_z=float(self._well_index["MIN_Z"][row]),
+            max_x=float(self._well_index["MAX_X"][row]),
+            max_y=float(self._well_index["MAX_Y"][row]),
+            max_z=float(self._well_index["MAX_Z"][row]),
+        )
+
+    def _get_well_index_row(self, well_name: str) -> int:
+        row = self._well_name_to_index_row.get(well_name)
+        if row is None:
+            raise ValueError(f"Requested well name {well_name} not found")
+        return row
 
     def get_well_xtgeo_obj(self, well_name: str) -> xtgeo.Well:
         well_entry = self._inventory.get(well_name)
@@ -131,3 +246,82 @@ class ProviderImplFile(WellProvider):
         )
 
         return well
+
+
+def _well_path_from_xtgeo_well(well: xtgeo.Well) -> WellPath:
+    df = well.dataframe
+    md_logname = well.mdlogname
+
+    x_arr = df["X_UTME"].to_numpy()
+    y_arr = df["Y_UTMN"].to_numpy()
+    z_arr = df["Z_TVDSS"].to_numpy()
+    md_arr = df[md_logname].to_numpy()
+
+    return WellPath(x_arr=x_arr, y_arr=y_arr, z_arr=z_arr, md_arr=md_arr)
+
+
+def _write_columnar_store(provider_dir: Path, well_paths: Dict[str, WellPath]) -> None:
+    """Write all well paths into one trajectories file along with an index file
+    containing per well offsets, well heads and bounding boxes"""
+
+    well_names = list(well_paths.keys())
+    paths = list(well_paths.values())
+
+    counts = np.array([len(path.x_arr) for path in paths], dtype=np.int64)
+    offsets = (np.cumsum(counts) - counts).astype(np.int64)
+
+    # Wells without any trajectory points get NaN well heads and bounding boxes
+    nan_bb = WellBoundingBox(*([np.nan] * 6))
+    bounding_boxes = [
+        bounding_box_from_well_path(path) if len(path.x_arr) > 0 else nan_bb
+        for path in paths
+    ]
+    heads = [
+        (path.x_arr[0], path.y_arr[0], path.z_arr[0])
+        if len(path.x_arr) > 0
+        else (np.nan, np.nan, np.nan)
+        for path in paths
+    ]
+
+    def _concat(arr_list: List[np.ndarray]) -> np.ndarray:
+        if not arr_list:
+            return np.empty(0, dtype=np.float64)
+        return np.concatenate(arr_list).astype(np.float64)
+
+    trajectories_table = pa.table(
+        {
+            "X": _concat([path.x_arr for path in paths]),
+            "Y": _concat([path.y_arr for path in paths]),
+            "Z": _concat([path.z_arr for path in paths]),
+            "MD": _concat([path.md_arr for path in paths]),
+        }
+    )
+
+    well_index_table = pa.table(
+        {
+            "WELL_NAME": pa.array(well_names, type=pa.string()),
+            "OFFSET": pa.array(offsets, type=pa.int64()),
+            "COUNT": pa.array(counts, type=pa.int64()),
+            "HEAD_X": pa.array([head[0] for head in heads], type=pa.float64()),
+            "HEAD_Y": pa.array([head[1] for head in heads], type=pa.float64()),
+            "HEAD_Z": pa.array([head[2] for head in heads], type=pa.float64()),
+            "MIN_X": pa.array([bb.min_x for bb in bounding_boxes], type=pa.float64()),
+            "MIN_Y": pa.array([bb.min_y for bb in bounding_boxes], type=pa.float64()),
+            "MIN_Z": pa.array([bb.min_z for bb in bounding_boxes], type=pa.float64()),
+            "MAX_X": pa.array([bb.max_x for bb in bounding_boxes], type=pa.float64()),
+            "MAX_Y": pa.array([bb.max_y for bb in bounding_boxes], type=pa.float64()),
+            "MAX_Z": pa.array([bb.max_z for bb in bounding_boxes], type=pa.float64()),
+        }
+    )
+
+    # Uncompressed so that the files can be memory mapped and read zero-copy
+    feather.write_feather(
+        trajectories_table,
+        dest=provider_dir / TRAJECTORIES_FILE_NAME,
+        compression="uncompressed",
+    )
+    feather.write_feather(
+        well_index_table,
+        dest=provider_dir / WELL_INDEX_FILE_NAME,
+        compression="uncompressed",
+    )
@@ -14,6 +14,35 @@ class WellPath:
     md_arr: np.ndarray
 
 
+@dataclass(frozen=True)
+class WellHead:
+    well_name: str
+    x: float
+    y: float
+    z: float
+
+
+@dataclass(frozen=True)
+class WellBoundingBox:
+    min_x: float
+    min_y: float
+    min_z: float
+    max_x: float
+    max_y: float
+    max_z: float
+
+
+def bounding_box_from_well_path(well_path: WellPath) -> WellBoundingBox:
+    return WellBoundingBox(
+        min_x=float(np.nanmin(well_path.x_arr)),
+        min_y=float(np.nanmin(well_path.y_arr)),
+        min_z=float(np.nanmin(well_path.z_arr)),
+        max_x=float(np.nanmax(well_path.x_arr)),
+        max_y=float(np.nanmax(well_path.y_arr)),
+        max_z=float(np.nanmax(well_path.z_arr)),
+    )
+
+
 # Class provides data for wells
 class WellProvider(abc.ABC):
     @abc.abstractmethod
@@ -28,6 +57,34 @@ class WellProvider(abc.ABC):
     def get_well_path(self, well_name: str) -> WellPath:
         """Returns the coordinates for the well path along with MD for the well."""
 
+    def get_well_heads(self, well_names: List[str]) -> List[WellHead]:
+        """Returns the position of the first point of the well path for each of the
+        specified wells, in the same order as the well names. Wells without any
+        trajectory points have no well head and are left out.
+
+        This default implementation fetches the full well path of each well, so
+        providers that can do better should override it."""
+        ret_list = []
+        for well_name in well_names:
+            well_path = self.get_well_path(well_name)
+            if len(well_path.x_arr) == 0:
+                continue
+            ret_list.append(
+                WellHead(
+                    well_name=well_name,
+                    x=float(well_path.x_arr[0]),
+                    y=float(well_path.y_arr[0]),
+                    z=float(well_path.z_arr[0]),
+                )
+            )
+        return ret_list
+
+    def get_well_bounding_box(self, well_name: str) -> WellBoundingBox:
+        """Returns the bounding box of the well path.
+
+        This default implementation computes the bounding box from the well path."""
+        return bounding_box_from_well_path(self.get_well_path(well_name))
+
     @abc.abstractmethod
     def get_well_xtgeo_obj(self, well_name: str) -> xtgeo.Well:
         ...
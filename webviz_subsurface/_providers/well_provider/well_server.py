@@ -90,19 +90,17 @@ class WellServer:
 
             validate_geometry = True
             feature_arr = []
-            for wname in well_names_arr:
-                well_path = provider.get_well_path(wname)
-
-                coords = list(zip(well_path.x_arr, well_path.y_arr, well_path.z_arr))
-                # coords = coords[0::20]
+            for well_head in provider.get_well_heads(well_names_arr):
                 point = geojson.Point(
-                    coordinates=[coords[0][0], coords[0][1]], validate=validate_geometry
+                    coordinates=[well_head.x, well_head.y], validate=validate_geometry
                 )
 
                 geocoll = geojson.GeometryCollection(geometries=[point])
 
                 feature = geojson.Feature(
-                    id=wname, geometry=geocoll, properties={"name": wname}
+                    id=well_head.well_name,
+                    geometry=geocoll,
+                    properties={"name": well_head.well_name},
                 )
                 feature_arr.append(feature)
 
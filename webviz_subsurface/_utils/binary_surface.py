@@ -0,0 +1,144 @@
+import struct
+from typing import Dict, Union
+
+import numpy as np
+import xtgeo
+
+# Compact binary encoding of regular surfaces, used instead of JSON when storing
+# surfaces in the webviz store and in the cache.
+#
+# A single surface is encoded as a fixed size header followed by the values as
+# little endian float32 in the same (ncol, nrow) C order as xtgeo uses, and then,
+# if any of the values are masked, a bitmap with the mask packed using np.packbits.
+# Masked values are also stored as NaN, so consumers that only need the values can
+# skip the bitmap. The header size is a multiple of 8 bytes, so that the values can
+# be viewed directly from a memory mapped file without copying.
+
+_SURFACE_MAGIC = b"WSRF"
+_SURFACE_DICT_MAGIC = b"WSRD"
+_VERSION = 1
+
+_FLAG_HAS_MASK = 1
+
+# magic, version, flags, ncol, nrow, xori, yori, xinc, yinc, rotation, yflip
+_SURFACE_HEADER = struct.Struct("<4sHHiidddddi4x")
+
+# magic, version, number of surfaces
+_SURFACE_DICT_HEADER = struct.Struct("<4sHxxi")
+# length of surface name, length of encoded surface
+_SURFACE_DICT_ENTRY = struct.Struct("<iq")
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def surface_to_bytes(surface: xtgeo.RegularSurface) -> bytes:
+    """Encode surface as header, float32 values and optionally a mask bitmap"""
+    values = np.ma.asarray(surface.values)
+    mask = np.ma.getmaskarray(values)
+    has_mask = bool(mask.any())
+
+    header = _SURFACE_HEADER.pack(
+        _SURFACE_MAGIC,
+        _VERSION,
+        _FLAG_HAS_MASK if has_mask else 0,
+        surface.ncol,
+        surface.nrow,
+        surface.xori,
+        surface.yori,
+        surface.xinc,
+        surface.yinc,
+        surface.rotation,
+        surface.yflip,
+    )
+    float_values = np.ma.filled(values.astype("<f4"), np.nan)
+
+    chunks = [header, np.ascontiguousarray(float_values).tobytes()]
+    if has_mask:
+        chunks.append(np.packbits(mask, axis=None).tobytes())
+    return b"".join(chunks)
+
+
+def surface_from_bytes(buffer: BytesLike) -> xtgeo.RegularSurface:
+    """Decode surface encoded with surface_to_bytes(). The buffer can be any object
+    supporting the buffer protocol, e.g. bytes, memoryview or mmap."""
+    # pylint: disable=too-many-locals
+    buffer = memoryview(buffer).cast("B")
+    (
+        magic,
+        version,
+        flags,
+        ncol,
+        nrow,
+        xori,
+        yori,
+        xinc,
+        yinc,
+        rotation,
+        yflip,
+    ) = _SURFACE_HEADER.unpack_from(buffer)
+    if magic != _SURFACE_MAGIC or version != _VERSION:
+        raise ValueError("Buffer does not contain a binary encoded surface")
+
+    num_values = ncol * nrow
+    offset = _SURFACE_HEADER.size
+    values = np.frombuffer(buffer, dtype="<f4", count=num_values, offset=offset)
+    if flags & _FLAG_HAS_MASK:
+        offset += 4 * num_values
+        packed_mask = np.frombuffer(
+            buffer, dtype=np.uint8, count=(num_values + 7) // 8, offset=offset
+        )
+        mask = np.unpackbits(packed_mask, count=num_values).view(bool)
+    else:
+        mask = np.isnan(values)
+
+    return xtgeo.RegularSurface(
+        ncol=ncol,
+        nrow=nrow,
+        xori=xori,
+        yori=yori,
+        xinc=xinc,
+        yinc=yinc,
+        rotation=rotation,
+        yflip=yflip,
+        values=np.ma.MaskedArray(values, mask=mask).reshape(ncol, nrow),
+    )
+
+
+def surface_dict_to_bytes(surfaces: Dict[str, xtgeo.RegularSurface]) -> bytes:
+    """Encode a dict of named surfaces into one buffer. Each encoded surface starts
+    at an offset that is a multiple of 8 bytes."""
+    chunks = [_SURFACE_DICT_HEADER.pack(_SURFACE_DICT_MAGIC, _VERSION, len(surfaces))]
+    offset = _SURFACE_DICT_HEADER.size
+    for name, surface in surfaces.items():
+        encoded_name = name.encode()
+        encoded_surface = surface_to_bytes(surface)
+        entry_size = _SURFACE_DICT_ENTRY.size + len(encoded_name)
+        padding = -(offset + entry_size) % 8
+        chunks.append(
+            _SURFACE_DICT_ENTRY.pack(len(encoded_name), len(encoded_surface))
+            + encoded_name
+            + bytes(padding)
+        )
+        chunks.append(encoded_surface)
+        offset += entry_size + padding + len(encoded_surface)
+    return b"".join(chunks)
+
+
+def surface_dict_from_bytes(buffer: BytesLike) -> Dict[str, xtgeo.RegularSurface]:
+    """Decode dict of named surfaces encoded with surface_dict_to_bytes()"""
+    buffer = memoryview(buffer).cast("B")
+    magic, version, num_surfaces = _SURFACE_DICT_HEADER.unpack_from(buffer)
+    if magic != _SURFACE_DICT_MAGIC or version != _VERSION:
+        raise ValueError("Buffer does not contain binary encoded surfaces")
+
+    surfaces: Dict[str, xtgeo.RegularSurface] = {}
+    offset = _SURFACE_DICT_HEADER.size
+    for _ in range(num_surfaces):
+        name_size, surface_size = _SURFACE_DICT_ENTRY.unpack_from(buffer, offset)
+        offset += _SURFACE_DICT_ENTRY.size
+        name = bytes(buffer[offset : offset + name_size]).decode()
+        offset += name_size
+        offset += -offset % 8
+        surfaces[name] = surface_from_bytes(buffer[offset : offset + surface_size])
+        offset += surface_size
+    return surfaces
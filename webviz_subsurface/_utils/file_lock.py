@@ -0,0 +1,91 @@
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Dict, Optional, Type
+
+try:
+    import fcntl
+
+    _HAS_FCNTL = True
+except ImportError:
+    _HAS_FCNTL = False
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _ThreadLock:
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # Number of threads holding or waiting for the lock. The entry is removed from
+    # _THREAD_LOCKS when this drops to zero, so that it does not grow with the
+    # number of distinct lock files used
+    num_users: int = 0
+
+
+_THREAD_LOCKS: Dict[str, _ThreadLock] = {}
+_THREAD_LOCKS_GUARD = threading.Lock()
+
+
+class FileLock:
+    """Exclusive lock that is shared between processes on the same machine through
+    a lock file, usable as a context manager. Blocks until the lock is acquired.
+
+    On platforms without fcntl, the lock only guards against other threads in the
+    current process.
+    """
+
+    def __init__(self, lock_file: Path) -> None:
+        self._lock_file = lock_file
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        # flock() locks are associated with the open file description, so they
+        # work between threads as well. The thread lock is only needed as a
+        # fallback when fcntl is unavailable.
+        if not _HAS_FCNTL:
+            with _THREAD_LOCKS_GUARD:
+                thread_lock = _THREAD_LOCKS.setdefault(
+                    str(self._lock_file), _ThreadLock()
+                )
+                thread_lock.num_users += 1
+            thread_lock.lock.acquire()
+            return
+
+        self._lock_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._lock_file, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        except OSError:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def release(self) -> None:
+        if not _HAS_FCNTL:
+            with _THREAD_LOCKS_GUARD:
+                thread_lock = _THREAD_LOCKS[str(self._lock_file)]
+                thread_lock.lock.release()
+                thread_lock.num_users -= 1
+                if thread_lock.num_users == 0:
+                    del _THREAD_LOCKS[str(self._lock_file)]
+            return
+
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.release()
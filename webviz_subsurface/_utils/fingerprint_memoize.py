@@ -0,0 +1,252 @@
+import functools
+import hashlib
+import inspect
+import itertools
+import logging
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar, cast
+
+import numpy as np
+
+from .perf_timer import PerfTimer
+
+LOGGER = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Default memory budget per memoized function
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Fingerprints of objects that cannot be fingerprinted from their content, keyed by
+# id(). Entries are removed when the object is garbage collected, so that ids that
+# are reused by new objects do not give stale fingerprints.
+_OBJECT_FINGERPRINTS: Dict[int, Hashable] = {}
+# Reentrant, since the finalizers may be run by the garbage collector while the lock
+# is held by the same thread
+_OBJECT_FINGERPRINTS_LOCK = threading.RLock()
+_OBJECT_COUNTER = itertools.count()
+
+
+def register_fingerprint(obj: Any, fingerprint: Hashable) -> None:
+    """Register the fingerprint to use for obj, e.g. the fingerprint of the file it
+    was loaded from. The object must not be modified after registration."""
+    with _OBJECT_FINGERPRINTS_LOCK:
+        if id(obj) not in _OBJECT_FINGERPRINTS:
+            weakref.finalize(obj, _forget_fingerprint, id(obj))
+        _OBJECT_FINGERPRINTS[id(obj)] = fingerprint
+
+
+def _forget_fingerprint(obj_id: int) -> None:
+    with _OBJECT_FINGERPRINTS_LOCK:
+        _OBJECT_FINGERPRINTS.pop(obj_id, None)
+
+
+def make_fingerprint(obj: Any) -> Hashable:
+    """Returns a lightweight, hashable fingerprint of obj.
+
+    Plain values are used as is, paths are fingerprinted by their resolved path,
+    size and modification time, and small numpy arrays by a hash of their content.
+    Other objects, e.g. xtgeo cubes, surfaces and grids, use the fingerprint they
+    have been registered with. Objects that have not been registered are assigned a
+    new unique fingerprint, so that they will only give cache hits when the very
+    same object is passed again.
+    """
+    # pylint: disable=too-many-return-statements
+    if obj is None or isinstance(obj, (str, bytes, int, float, bool)):
+        return obj
+    if isinstance(obj, Path):
+        return _make_path_fingerprint(obj)
+    if isinstance(obj, (tuple, list)):
+        return (type(obj).__name__, tuple(make_fingerprint(item) for item in obj))
+    if isinstance(obj, dict):
+        return (
+            "dict",
+            tuple(
+                sorted((str(key), make_fingerprint(val)) for key, val in obj.items())
+            ),
+        )
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray) and not isinstance(obj, np.ma.MaskedArray):
+        content_hash = hashlib.md5(np.ascontiguousarray(obj).tobytes())  # nosec
+        return ("ndarray", obj.dtype.str, obj.shape, content_hash.hexdigest())
+
+    with _OBJECT_FINGERPRINTS_LOCK:
+        fingerprint = _OBJECT_FINGERPRINTS.get(id(obj))
+    if fingerprint is None:
+        fingerprint = ("object", type(obj).__qualname__, next(_OBJECT_COUNTER))
+        register_fingerprint(obj, fingerprint)
+    return fingerprint
+
+
+def _make_path_fingerprint(path: Path) -> Hashable:
+    try:
+        resolved_path = path.resolve()
+        stat = resolved_path.stat()
+    except OSError:
+        # Let the memoized function report the missing file
+        return ("path", str(path))
+    return ("path", str(resolved_path), stat.st_size, stat.st_mtime_ns)
+
+
+def estimate_size_bytes(obj: Any) -> int:
+    """Rough estimate of the memory used by obj, counting numpy arrays held directly
+    by the object or as one of its attributes (e.g. the values of an xtgeo object)"""
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes + (obj.size if isinstance(obj, np.ma.MaskedArray) else 0)
+    if isinstance(obj, (tuple, list)):
+        return sys.getsizeof(obj) + sum(estimate_size_bytes(item) for item in obj)
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sum(
+            estimate_size_bytes(attr)
+            for attr in vars(obj).values()
+            if isinstance(attr, np.ndarray)
+        )
+    return size
+
+
+@dataclass
+class MemoizeCounters:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class FingerprintMemoizeCache:
+    """In-memory LRU cache of function results keyed on argument fingerprints and
+    bounded by the estimated size of the results in bytes, and optionally by the
+    number of results. The most recently used result is always kept, even if it is
+    larger than the budget by itself."""
+
+    def __init__(
+        self, name: str, max_bytes: int, max_entries: Optional[int] = None
+    ) -> None:
+        self.name = name
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.counters = MemoizeCounters()
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.counters.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.counters.hits += 1
+            return True, entry[0]
+
+    def contains(self, key: Hashable) -> bool:
+        """Check for key without affecting the LRU order or the counters"""
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key: Hashable, value: Any) -> None:
+        value_bytes = estimate_size_bytes(value)
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._total_bytes -= old_entry[1]
+
+            self._entries[key] = (value, value_bytes)
+            self._total_bytes += value_bytes
+
+            while self._is_over_budget() and len(self._entries) > 1:
+                _evicted_key, (_evicted_value, evicted_bytes) = self._entries.popitem(
+                    last=False
+                )
+                self._total_bytes -= evicted_bytes
+                self.counters.evictions += 1
+
+    def _is_over_budget(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self._total_bytes > self.max_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+def fingerprint_memoize(
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    register_result: bool = False,
+    copy_result: bool = False,
+    max_entries: Optional[int] = None,
+) -> Callable[[F], F]:
+    """Memoization decorator that, unlike CACHE.memoize, never pickles arguments or
+    results. Cache keys are built from make_fingerprint() of the arguments, and the
+    cached results are returned as is, so callers must not modify them.
+
+    Use register_result=True for functions that load objects from file, so that the
+    loaded object gets a fingerprint based on the file it was loaded from. Other
+    memoized functions taking the loaded object as argument will then get cache hits
+    for the same file, even if the object has been loaded anew.
+
+    Use copy_result=True for results that callers are expected to modify, e.g.
+    surfaces. Each call then returns a copy of the cached result, made with its
+    copy() method. If register_result is also set, the copy gets the same
+    fingerprint as the cached result, so it should only be passed on to other
+    memoized functions before it is modified.
+
+    Use max_entries to also bound the number of cached results, e.g. for results
+    that hold on to resources not counted by estimate_size_bytes().
+
+    The cache of the decorated function is available as its `cache` attribute.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+        cache = FingerprintMemoizeCache(func.__qualname__, max_bytes, max_entries)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound_args = signature.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+            key = tuple(make_fingerprint(arg) for arg in bound_args.arguments.values())
+
+            found, result = cache.get(key)
+            if found:
+                return _result_for_caller(result, key)
+
+            timer = PerfTimer()
+            result = func(*args, **kwargs)
+            if register_result:
+                register_fingerprint(result, (cache.name, key))
+            cache.put(key, result)
+
+            LOGGER.debug(
+                f"{cache.name} computed in {timer.elapsed_s():.2f}s "
+                f"(hits={cache.counters.hits}, misses={cache.counters.misses}, "
+                f"evictions={cache.counters.evictions}, "
+                f"cached={cache.total_bytes / (1024 * 1024):.1f}MB)"
+            )
+            return _result_for_caller(result, key)
+
+        def _result_for_caller(result: Any, key: Hashable) -> Any:
+            if not copy_result:
+                return result
+            result_copy = result.copy()
+            if register_result:
+                register_fingerprint(result_copy, (cache.name, key))
+            return result_copy
+
+        setattr(wrapper, "cache", cache)
+        return cast(F, wrapper)
+
+    return decorator
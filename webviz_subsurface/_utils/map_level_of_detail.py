@@ -0,0 +1,212 @@
+import logging
+import math
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .perf_timer import PerfTimer
+
+LOGGER = logging.getLogger(__name__)
+
+# Default max number of markers to send to the browser per map trace
+DEFAULT_MAX_MAP_POINTS = 20000
+
+# Name of the column with the number of points in each cell of binned dataframes
+COUNT_COLUMN = "count"
+
+# Suffix of the columns with the max value in each cell of binned dataframes
+MAX_SUFFIX = "_max"
+
+MapRange = Optional[Tuple[float, float]]
+
+_RELAYOUT_RANGE_KEY = re.compile(r"^([xy])axis\d*\.range(?:\[([01])\])?$")
+_RELAYOUT_AUTORANGE_KEY = re.compile(r"^[xy]axis\d*\.autorange$")
+
+
+def is_map_extent_change(relayout_data: Optional[Dict[str, Any]]) -> bool:
+    """Returns True if the relayoutData of a plotly map plot is from zooming,
+    panning or resetting the axes, as opposed to e.g. resizing the plot"""
+    return any(
+        _RELAYOUT_RANGE_KEY.match(key) or _RELAYOUT_AUTORANGE_KEY.match(key)
+        for key in relayout_data or {}
+    )
+
+
+def map_extent_from_relayout(
+    relayout_data: Optional[Dict[str, Any]]
+) -> Tuple[MapRange, MapRange]:
+    """Returns the (x range, y range) zoomed to in a plotly map plot, given the
+    relayoutData of the graph. A range is None if the axis is not zoomed.
+
+    Axes of all subplots are checked, so that this also works for subplots with
+    matching axes."""
+    if not relayout_data:
+        return None, None
+
+    ranges: Dict[str, List[Optional[float]]] = {"x": [None, None], "y": [None, None]}
+
+    for key, value in relayout_data.items():
+        match = _RELAYOUT_RANGE_KEY.match(key)
+        if match is None:
+            continue
+        axis, index = match.groups()
+        if index is None:
+            ranges[axis] = [float(value[0]), float(value[1])]
+        else:
+            ranges[axis][int(index)] = float(value)
+
+    return _to_map_range(ranges["x"]), _to_map_range(ranges["y"])
+
+
+def _to_map_range(axis_range: List[Optional[float]]) -> MapRange:
+    lower, upper = axis_range
+    if lower is None or upper is None:
+        return None
+    return min(lower, upper), max(lower, upper)
+
+
+def cell_size_for_max_cells(width: float, height: float, max_cells: int) -> float:
+    """Returns the smallest cell size for which a regular grid covering width x
+    height has at most max_cells cells"""
+    if max_cells < 2:
+        return max(width, height, 1.0) * 2
+    # Solve (width / size + 1) * (height / size + 1) = max_cells for size
+    sum_sides = width + height
+    size = (
+        sum_sides + math.sqrt(sum_sides**2 + 4 * (max_cells - 1) * width * height)
+    ) / (2 * (max_cells - 1))
+    return size if size > 0 else 1.0
+
+
+def bin_map_points(
+    df: pd.DataFrame,
+    cell_size: float,
+    value_columns: Sequence[str],
+    first_columns: Sequence[str] = (),
+    x_column: str = "east",
+    y_column: str = "north",
+) -> pd.DataFrame:
+    """Bin the points of df into the cells of a regular grid with the given cell
+    size. Returns a dataframe with one row per non-empty cell, with the x and y
+    columns set to the cell centre, and a column with the number of points in the
+    cell. For each of the value_columns there is a column with the mean of the
+    values in the cell, and one with the max value (with MAX_SUFFIX added to the
+    column name). NaN values are ignored. The first_columns, typically categorical
+    values such as the region, are given the value of the first point in the cell.
+    """
+    # pylint: disable=too-many-locals
+    x_values = df[x_column].to_numpy(dtype=np.float64)
+    y_values = df[y_column].to_numpy(dtype=np.float64)
+    valid = np.isfinite(x_values) & np.isfinite(y_values)
+    if not valid.all():
+        df = df[valid]
+        x_values = x_values[valid]
+        y_values = y_values[valid]
+    if len(df) == 0:
+        return pd.DataFrame(
+            columns=[x_column, y_column, COUNT_COLUMN]
+            + list(value_columns)
+            + [col + MAX_SUFFIX for col in value_columns]
+            + list(first_columns)
+        )
+
+    x_origin = x_values.min()
+    y_origin = y_values.min()
+    col_indices = ((x_values - x_origin) // cell_size).astype(np.int64)
+    row_indices = ((y_values - y_origin) // cell_size).astype(np.int64)
+    num_cols = int(col_indices.max()) + 1
+    cell_indices = row_indices * num_cols + col_indices
+
+    cells, first_indices, inverse, counts = np.unique(
+        cell_indices, return_index=True, return_inverse=True, return_counts=True
+    )
+    num_cells = len(cells)
+
+    binned: Dict[str, Any] = {
+        x_column: x_origin + (cells % num_cols + 0.5) * cell_size,
+        y_column: y_origin + (cells // num_cols + 0.5) * cell_size,
+        COUNT_COLUMN: counts,
+    }
+
+    # Points sorted by cell, for reducing each cell with reduceat
+    order = np.argsort(inverse, kind="stable")
+    cell_starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for col in value_columns:
+            values = df[col].to_numpy(dtype=np.float64)
+            finite = np.isfinite(values)
+            sums = np.bincount(
+                inverse, weights=np.where(finite, values, 0.0), minlength=num_cells
+            )
+            num_finite = np.bincount(inverse, weights=finite, minlength=num_cells)
+            binned[col] = sums / num_finite
+            # fmax ignores NaN unless all values in the cell are NaN
+            binned[col + MAX_SUFFIX] = np.fmax.reduceat(values[order], cell_starts)
+
+    for col in first_columns:
+        binned[col] = df[col].to_numpy()[first_indices]
+
+    return pd.DataFrame(binned)
+
+
+def map_points_level_of_detail(
+    df: pd.DataFrame,
+    value_columns: Sequence[str],
+    first_columns: Sequence[str] = (),
+    max_points: int = DEFAULT_MAX_MAP_POINTS,
+    cell_size: Optional[float] = None,
+    extent: Tuple[MapRange, MapRange] = (None, None),
+    x_column: str = "east",
+    y_column: str = "north",
+) -> Tuple[pd.DataFrame, Optional[float]]:
+    """Reduce the points of df to what is needed for a map plot of the given extent
+    (x range, y range), so that the number of plotted markers is bounded by
+    max_points regardless of the number of points in df.
+
+    Points outside the extent are dropped. If the remaining number of points is at
+    most max_points, the points are returned as is. Otherwise they are binned into a
+    regular grid, see bin_map_points(). The cell size is increased from the given
+    cell_size if needed to keep the number of cells at most max_points.
+
+    Returns the dataframe to plot along with the cell size used, which is None if
+    the points are not binned.
+    """
+    # pylint: disable=too-many-locals
+    timer = PerfTimer()
+    x_values = df[x_column].to_numpy(dtype=np.float64)
+    y_values = df[y_column].to_numpy(dtype=np.float64)
+
+    in_extent = np.ones(len(df), dtype=bool)
+    for values, axis_range in zip((x_values, y_values), extent):
+        if axis_range is not None:
+            in_extent &= (values >= axis_range[0]) & (values <= axis_range[1])
+    if not in_extent.all():
+        df = df[in_extent]
+        x_values = x_values[in_extent]
+        y_values = y_values[in_extent]
+
+    if len(df) <= max_points:
+        return df, None
+
+    min_cell_size = cell_size_for_max_cells(
+        np.nanmax(x_values) - np.nanmin(x_values),
+        np.nanmax(y_values) - np.nanmin(y_values),
+        max_points,
+    )
+    used_cell_size = max(cell_size or 0.0, min_cell_size)
+    df_binned = bin_map_points(
+        df,
+        used_cell_size,
+        value_columns=value_columns,
+        first_columns=first_columns,
+        x_column=x_column,
+        y_column=y_column,
+    )
+    LOGGER.debug(
+        f"Binned {len(df)} map points into {len(df_binned)} cells of size "
+        f"{used_cell_size:.1f} in {timer.elapsed_ms()}ms"
+    )
+    return df_binned, used_cell_size
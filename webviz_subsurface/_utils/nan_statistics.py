@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import Dict, Sequence
+
+import numpy as np
+
+
+@dataclass
+class NanStatistics:
+    """Statistics computed along the last axis, ignoring NaN values.
+    All arrays have the shape of the input array without its last axis, and are
+    NaN where all input values are NaN."""
+
+    mean: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    percentiles: Dict[float, np.ndarray]
+
+
+def calc_nan_statistics(
+    values: np.ndarray, percentiles: Sequence[float]
+) -> NanStatistics:
+    """Vectorized equivalent of calling np.nanmean, np.nanmin, np.nanmax and
+    np.nanpercentile (with linear interpolation) along the last axis of values.
+
+    np.nanpercentile falls back to a Python level loop over all 1d slices when
+    NaN values are present, which is prohibitively slow for large arrays. Instead,
+    we sort once along the last axis, which places the NaN values at the end, and
+    then pick and interpolate the percentiles based on the number of valid values.
+    """
+
+    sorted_values = np.sort(values, axis=-1)
+    valid_counts = np.count_nonzero(~np.isnan(sorted_values), axis=-1)
+    has_values = valid_counts > 0
+    last_valid_idx = np.maximum(valid_counts - 1, 0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nansum(sorted_values, axis=-1) / valid_counts
+
+    min_values = sorted_values[..., 0]
+    max_values = np.where(
+        has_values, _take_along_last_axis(sorted_values, last_valid_idx), np.nan
+    )
+
+    percentile_values: Dict[float, np.ndarray] = {
+        perc: np.where(
+            has_values,
+            _interpolate_percentile(sorted_values, last_valid_idx, perc),
+            np.nan,
+        )
+        for perc in percentiles
+    }
+
+    return NanStatistics(
+        mean=mean, min=min_values, max=max_values, percentiles=percentile_values
+    )
+
+
+def _interpolate_percentile(
+    sorted_values: np.ndarray, last_valid_idx: np.ndarray, perc: float
+) -> np.ndarray:
+    virtual_idx = last_valid_idx * (perc / 100.0)
+    lower_idx = np.floor(virtual_idx).astype(np.int64)
+    upper_idx = np.minimum(lower_idx + 1, last_valid_idx)
+    fraction = virtual_idx - lower_idx
+
+    lower_values = _take_along_last_axis(sorted_values, lower_idx)
+    upper_values = _take_along_last_axis(sorted_values, upper_idx)
+    return lower_values + fraction * (upper_values - lower_values)
+
+
+def _take_along_last_axis(arr: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    return np.take_along_axis(arr, indices[..., np.newaxis], axis=-1)[..., 0]
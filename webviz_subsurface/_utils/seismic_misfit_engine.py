@@ -0,0 +1,201 @@
+import hashlib
+import json
+import logging
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .perf_timer import PerfTimer
+
+LOGGER = logging.getLogger(__name__)
+
+# Number of threads used for reading the sim data files
+_MAX_READ_WORKERS = 8
+
+
+class SeismicMisfitEngine:
+    """Misfit calculations for seismic data, done with matrix operations on the sim
+    data of all realizations at once.
+
+    The sim data is held as a dense float32 matrix with one row per data point and
+    one column per realization, along with obs and obs_error vectors.
+    """
+
+    def __init__(
+        self,
+        sim: np.ndarray,
+        obs: np.ndarray,
+        obs_error: np.ndarray,
+        real_names: List[str],
+    ) -> None:
+        if sim.shape != (len(obs), len(real_names)):
+            raise ValueError(
+                f"Shape of sim data {sim.shape} does not match the number of data "
+                f"points ({len(obs)}) and realizations ({len(real_names)})"
+            )
+        self._sim = sim
+        self._obs = obs.astype(np.float32)
+        self._obs_error = obs_error.astype(np.float32)
+        self.real_names = real_names
+
+    @staticmethod
+    def from_dataframe(df: pd.DataFrame) -> "SeismicMisfitEngine":
+        """Create engine from dataframe with obs and obs_error columns, and sim data
+        in real-<number> columns"""
+        real_columns = [col for col in df.columns if col.startswith("real-")]
+        return SeismicMisfitEngine(
+            sim=df[real_columns].to_numpy(dtype=np.float32),
+            obs=df["obs"].to_numpy(),
+            obs_error=df["obs_error"].to_numpy(),
+            real_names=real_columns,
+        )
+
+    @property
+    def num_points(self) -> int:
+        return self._sim.shape[0]
+
+    @property
+    def num_reals(self) -> int:
+        return self._sim.shape[1]
+
+    def abs_diff(self, weight_by_obs_error: bool = False) -> np.ndarray:
+        """Returns |sim - obs| per data point and realization, optionally divided by
+        obs_error"""
+        diff = self._sim - self._obs[:, np.newaxis]
+        np.abs(diff, out=diff)
+        if weight_by_obs_error:
+            diff /= self._obs_error[:, np.newaxis]
+        return diff
+
+    def misfit_per_realization(
+        self,
+        weight_by_obs_error: bool = False,
+        exponent: float = 1.0,
+        normalize: bool = False,
+    ) -> np.ndarray:
+        """Returns sum of |sim - obs|^exponent over the data points, per realization.
+        If normalize is True, the sum is divided by the number of data points and
+        the exponent is reverted, i.e. (sum / num points)^(1 / exponent)."""
+        diff = self.abs_diff(weight_by_obs_error)
+        if exponent != 1.0:
+            np.power(diff, exponent, out=diff)
+        misfit = diff.sum(axis=0, dtype=np.float64)
+
+        if normalize:
+            misfit = (misfit / self.num_points) ** (1 / exponent)
+        return misfit
+
+    def point_statistics(self, weight_by_obs_error: bool = False) -> pd.DataFrame:
+        """Returns dataframe with statistics over the realizations per data point,
+        for both the sim values and the diff values (|sim - obs|).
+        Note that following the conventions of the plugin, sim_p10 is the 90th
+        percentile and sim_p90 the 10th percentile."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sim_p90, sim_p10 = np.quantile(self._sim, [0.1, 0.9], axis=1)
+            diff = self.abs_diff(weight_by_obs_error)
+            return pd.DataFrame(
+                {
+                    "sim_mean": _mean(self._sim),
+                    "sim_std": _std(self._sim),
+                    "sim_p90": sim_p90.astype(np.float64),
+                    "sim_p10": sim_p10.astype(np.float64),
+                    "sim_min": self._sim.min(axis=1).astype(np.float64),
+                    "sim_max": self._sim.max(axis=1).astype(np.float64),
+                    "diff_mean": _mean(diff),
+                    "diff_std": _std(diff),
+                }
+            )
+
+
+def _mean(values: np.ndarray) -> np.ndarray:
+    # Accumulate in float64 to avoid loss of precision for many realizations
+    return values.mean(axis=1, dtype=np.float64)
+
+
+def _std(values: np.ndarray) -> np.ndarray:
+    # Sample standard deviation (ddof=1), as calculated by pandas
+    deviation = values - _mean(values)[:, np.newaxis].astype(values.dtype)
+    np.square(deviation, out=deviation)
+    return np.sqrt(deviation.sum(axis=1, dtype=np.float64) / (values.shape[1] - 1))
+
+
+def load_sim_data_matrix(
+    sim_files: List[Path],
+    num_points: int,
+    sim_mult: float = 1.0,
+    snapshot_dir: Optional[Path] = None,
+) -> np.ndarray:
+    """Read sim data files, each with a single column of num_points values and no
+    header, into a float32 matrix with one column per file.
+
+    The files are read in parallel. If snapshot_dir is given, the matrix is stored
+    there as a .npy file and loaded from it as long as none of the files change.
+    """
+    timer = PerfTimer()
+    snapshot_path = None
+    if snapshot_dir is not None:
+        snapshot_path = snapshot_dir / (
+            _make_snapshot_hash(sim_files, num_points, sim_mult) + ".npy"
+        )
+        if snapshot_path.exists():
+            matrix = np.load(snapshot_path)
+            LOGGER.debug(
+                f"Loaded sim data {matrix.shape} from snapshot in {timer.elapsed_ms()}ms"
+            )
+            return matrix
+
+    # Fortran order, so that each column is contiguous and can be filled from its
+    # file independently. This is also the memory layout used by pandas, so
+    # dataframes can be made from the matrix without copying
+    matrix = np.empty((num_points, len(sim_files)), dtype=np.float32, order="F")
+
+    def _read_column(col_idx: int) -> None:
+        sim_file = sim_files[col_idx]
+        values = pd.read_csv(sim_file, header=None, usecols=[0]).iloc[:, 0]
+        if len(values) != num_points:
+            raise RuntimeError(
+                f"---\nThe length of {sim_file} is {len(values)} which is "
+                f"different to the obs data which has {num_points} data points. "
+                "These must be the same size.\n---"
+            )
+        matrix[:, col_idx] = values.to_numpy(dtype=np.float64) * sim_mult
+
+    with ThreadPoolExecutor(max_workers=_MAX_READ_WORKERS) as executor:
+        # Consume the results to propagate any exceptions
+        list(executor.map(_read_column, range(len(sim_files))))
+
+    LOGGER.debug(f"Read sim data {matrix.shape} in {timer.elapsed_ms()}ms")
+
+    if snapshot_path is not None:
+        _write_snapshot(snapshot_path, matrix)
+
+    return matrix
+
+
+def _make_snapshot_hash(sim_files: List[Path], num_points: int, sim_mult: float) -> str:
+    file_stats = []
+    for sim_file in sim_files:
+        stat = sim_file.stat()
+        file_stats.append([str(sim_file.resolve()), stat.st_size, stat.st_mtime_ns])
+    hash_input = json.dumps([file_stats, num_points, sim_mult])
+    return hashlib.md5(hash_input.encode()).hexdigest()  # nosec
+
+
+def _write_snapshot(snapshot_path: Path, matrix: np.ndarray) -> None:
+    # Write to a temporary file that is renamed when finished, so that concurrent
+    # readers never see a partially written snapshot
+    tmp_path = snapshot_path.with_name(f"{snapshot_path.stem}__{uuid.uuid4().hex}.tmp")
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as file:
+            np.save(file, matrix)
+        os.replace(tmp_path, snapshot_path)
+    except OSError as exc:
+        LOGGER.warning(f"Could not write sim data snapshot {snapshot_path}: {exc}")
+        if tmp_path.exists():
+            tmp_path.unlink()
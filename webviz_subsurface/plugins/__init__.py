@@ -20,48 +20,122 @@ pages:
 ```
 """
 
-from ._assisted_history_matching_analysis import AssistedHistoryMatchingAnalysis
-from ._bhp_qc import BhpQc
-from ._disk_usage import DiskUsage
-from ._group_tree import GroupTree
-from ._history_match import HistoryMatch
-from ._horizon_uncertainty_viewer import HorizonUncertaintyViewer
-from ._inplace_volumes import InplaceVolumes
-from ._inplace_volumes_onebyone import InplaceVolumesOneByOne
-from ._line_plotter_fmu.line_plotter_fmu import LinePlotterFMU
-from ._map_viewer_fmu import MapViewerFMU
-from ._morris_plot import MorrisPlot
-from ._parameter_analysis import ParameterAnalysis
-from ._parameter_correlation import ParameterCorrelation
-from ._parameter_distribution import ParameterDistribution
-from ._parameter_parallel_coordinates import ParameterParallelCoordinates
-from ._parameter_response_correlation import ParameterResponseCorrelation
-from ._prod_misfit import ProdMisfit
-from ._property_statistics import PropertyStatistics
-from ._pvt_plot import PvtPlot
-from ._relative_permeability import RelativePermeability
-from ._reservoir_simulation_timeseries import ReservoirSimulationTimeSeries
-from ._reservoir_simulation_timeseries_onebyone import (
-    ReservoirSimulationTimeSeriesOneByOne,
-)
-from ._reservoir_simulation_timeseries_regional import (
-    ReservoirSimulationTimeSeriesRegional,
-)
-from ._rft_plotter import RftPlotter
-from ._running_time_analysis_fmu import RunningTimeAnalysisFMU
-from ._segy_viewer import SegyViewer
-from ._seismic_misfit import SeismicMisfit
-from ._simulation_time_series import SimulationTimeSeries
-from ._structural_uncertainty import StructuralUncertainty
-from ._subsurface_map import SubsurfaceMap
-from ._surface_viewer_fmu import SurfaceViewerFMU
-from ._surface_with_grid_cross_section import SurfaceWithGridCrossSection
-from ._surface_with_seismic_cross_section import SurfaceWithSeismicCrossSection
-from ._swatinit_qc import SwatinitQC
-from ._tornado_plotter_fmu import TornadoPlotterFMU
-from ._volumetric_analysis import VolumetricAnalysis
-from ._well_analysis import WellAnalysis
-from ._well_completions import WellCompletions
-from ._well_cross_section import WellCrossSection
-from ._well_cross_section_fmu import WellCrossSectionFMU
-from ._well_log_viewer import WellLogViewer
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any, List
+
+# Maps the name of each plugin class to the module that defines it.
+# The plugin modules are imported on first access of the plugin class (PEP 562),
+# so that an app using only a few plugins does not pay for importing the
+# dependencies and layout code of all the others.
+_PLUGIN_MODULES = {
+    "AssistedHistoryMatchingAnalysis": "._assisted_history_matching_analysis",
+    "BhpQc": "._bhp_qc",
+    "DiskUsage": "._disk_usage",
+    "GroupTree": "._group_tree",
+    "HistoryMatch": "._history_match",
+    "HorizonUncertaintyViewer": "._horizon_uncertainty_viewer",
+    "InplaceVolumes": "._inplace_volumes",
+    "InplaceVolumesOneByOne": "._inplace_volumes_onebyone",
+    "LinePlotterFMU": "._line_plotter_fmu.line_plotter_fmu",
+    "MapViewerFMU": "._map_viewer_fmu",
+    "MorrisPlot": "._morris_plot",
+    "ParameterAnalysis": "._parameter_analysis",
+    "ParameterCorrelation": "._parameter_correlation",
+    "ParameterDistribution": "._parameter_distribution",
+    "ParameterParallelCoordinates": "._parameter_parallel_coordinates",
+    "ParameterResponseCorrelation": "._parameter_response_correlation",
+    "ProdMisfit": "._prod_misfit",
+    "PropertyStatistics": "._property_statistics",
+    "PvtPlot": "._pvt_plot",
+    "RelativePermeability": "._relative_permeability",
+    "ReservoirSimulationTimeSeries": "._reservoir_simulation_timeseries",
+    "ReservoirSimulationTimeSeriesOneByOne": "._reservoir_simulation_timeseries_onebyone",
+    "ReservoirSimulationTimeSeriesRegional": "._reservoir_simulation_timeseries_regional",
+    "RftPlotter": "._rft_plotter",
+    "RunningTimeAnalysisFMU": "._running_time_analysis_fmu",
+    "SegyViewer": "._segy_viewer",
+    "SeismicMisfit": "._seismic_misfit",
+    "SimulationTimeSeries": "._simulation_time_series",
+    "StructuralUncertainty": "._structural_uncertainty",
+    "SubsurfaceMap": "._subsurface_map",
+    "SurfaceViewerFMU": "._surface_viewer_fmu",
+    "SurfaceWithGridCrossSection": "._surface_with_grid_cross_section",
+    "SurfaceWithSeismicCrossSection": "._surface_with_seismic_cross_section",
+    "SwatinitQC": "._swatinit_qc",
+    "TornadoPlotterFMU": "._tornado_plotter_fmu",
+    "VolumetricAnalysis": "._volumetric_analysis",
+    "WellAnalysis": "._well_analysis",
+    "WellCompletions": "._well_completions",
+    "WellCrossSection": "._well_cross_section",
+    "WellCrossSectionFMU": "._well_cross_section_fmu",
+    "WellLogViewer": "._well_log_viewer",
+}
+
+__all__ = list(_PLUGIN_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _PLUGIN_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    plugin_class = getattr(importlib.import_module(module_name, __name__), name)
+
+    # Cache in module globals so __getattr__ is only called once per plugin
+    globals()[name] = plugin_class
+    return plugin_class
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_PLUGIN_MODULES])
+
+
+if TYPE_CHECKING or sys.version_info < (3, 7):
+    # For static type checkers and linters. Module level __getattr__ requires
+    # Python 3.7, so older versions import all plugins eagerly.
+    from ._assisted_history_matching_analysis import AssistedHistoryMatchingAnalysis
+    from ._bhp_qc import BhpQc
+    from ._disk_usage import DiskUsage
+    from ._group_tree import GroupTree
+    from ._history_match import HistoryMatch
+    from ._horizon_uncertainty_viewer import HorizonUncertaintyViewer
+    from ._inplace_volumes import InplaceVolumes
+    from ._inplace_volumes_onebyone import InplaceVolumesOneByOne
+    from ._line_plotter_fmu.line_plotter_fmu import LinePlotterFMU
+    from ._map_viewer_fmu import MapViewerFMU
+    from ._morris_plot import MorrisPlot
+    from ._parameter_analysis import ParameterAnalysis
+    from ._parameter_correlation import ParameterCorrelation
+    from ._parameter_distribution import ParameterDistribution
+    from ._parameter_parallel_coordinates import ParameterParallelCoordinates
+    from ._parameter_response_correlation import ParameterResponseCorrelation
+    from ._prod_misfit import ProdMisfit
+    from ._property_statistics import PropertyStatistics
+    from ._pvt_plot import PvtPlot
+    from ._relative_permeability import RelativePermeability
+    from ._reservoir_simulation_timeseries import ReservoirSimulationTimeSeries
+    from ._reservoir_simulation_timeseries_onebyone import (
+        ReservoirSimulationTimeSeriesOneByOne,
+    )
+    from ._reservoir_simulation_timeseries_regional import (
+        ReservoirSimulationTimeSeriesRegional,
+    )
+    from ._rft_plotter import RftPlotter
+    from ._running_time_analysis_fmu import RunningTimeAnalysisFMU
+    from ._segy_viewer import SegyViewer
+    from ._seismic_misfit import SeismicMisfit
+    from ._simulation_time_series import SimulationTimeSeries
+    from ._structural_uncertainty import StructuralUncertainty
+    from ._subsurface_map import SubsurfaceMap
+    from ._surface_viewer_fmu import SurfaceViewerFMU
+    from ._surface_with_grid_cross_section import SurfaceWithGridCrossSection
+    from ._surface_with_seismic_cross_section import SurfaceWithSeismicCrossSection
+    from ._swatinit_qc import SwatinitQC
+    from ._tornado_plotter_fmu import TornadoPlotterFMU
+    from ._volumetric_analysis import VolumetricAnalysis
+    from ._well_analysis import WellAnalysis
+    from ._well_completions import WellCompletions
+    from ._well_cross_section import WellCrossSection
+    from ._well_cross_section_fmu import WellCrossSectionFMU
+    from ._well_log_viewer import WellLogViewer
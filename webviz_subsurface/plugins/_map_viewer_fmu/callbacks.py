@@ -4,6 +4,7 @@ from copy import deepcopy
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
+import xtgeo
 from dash import ALL, MATCH, Input, Output, State, callback, callback_context, no_update
 from dash.exceptions import PreventUpdate
 from webviz_config.utils._dash_component_utils import calculate_slider_step
@@ -707,16 +708,12 @@ def plugin_callbacks(
     ) -> Tuple:
         provider_id: str = surface_provider.provider_id()
         qualified_address = QualifiedSurfaceAddress(provider_id, surface_address)
-        surf_meta = surface_server.get_surface_metadata(qualified_address)
+        surf_meta = surface_server.get_or_publish_surface(
+            qualified_address,
+            lambda: surface_provider.get_surface(address=surface_address),
+        )
         if not surf_meta:
-            # This means we need to compute the surface
-            surface = surface_provider.get_surface(address=surface_address)
-            if not surface:
-                raise ValueError(
-                    f"Could not get surface for address: {surface_address}"
-                )
-            surface_server.publish_surface(qualified_address, surface)
-            surf_meta = surface_server.get_surface_metadata(qualified_address)
+            raise ValueError(f"Could not get surface for address: {surface_address}")
         return surf_meta, surface_server.encode_partial_url(qualified_address)
 
     def publish_and_get_diff_surface_metadata(
@@ -732,14 +729,21 @@ def plugin_callbacks(
             provider_id, surface_address, subprovider_id, sub_surface_address
         )
 
-        surf_meta = surface_server.get_surface_metadata(qualified_address)
-        if not surf_meta:
+        def _create_diff_surface() -> Optional[xtgeo.RegularSurface]:
             surface_a = surface_provider.get_surface(address=surface_address)
             surface_b = sub_surface_provider.get_surface(address=sub_surface_address)
-            if surface_a is not None and surface_b is not None:
-                surface = surface_a - surface_b
-            surface_server.publish_surface(qualified_address, surface)
-            surf_meta = surface_server.get_surface_metadata(qualified_address)
+            if surface_a is None or surface_b is None:
+                return None
+            return surface_a - surface_b
+
+        surf_meta = surface_server.get_or_publish_surface(
+            qualified_address, _create_diff_surface
+        )
+        if not surf_meta:
+            raise ValueError(
+                f"Could not get diff surface for addresses: "
+                f"{surface_address}, {sub_surface_address}"
+            )
         return surf_meta, surface_server.encode_partial_url(qualified_address)
 
     def get_surface_id_from_data(data: dict) -> str:
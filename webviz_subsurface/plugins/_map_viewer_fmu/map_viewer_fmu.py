@@ -1,3 +1,4 @@
+import functools
 import json
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
@@ -8,6 +9,8 @@ from webviz_config import WebvizPluginABC, WebvizSettings
 from webviz_subsurface._providers import (
     EnsembleFaultPolygonsProviderFactory,
     EnsembleSurfaceProviderFactory,
+    ProviderWarmUp,
+    prefetch_first_statistical_surface,
 )
 from webviz_subsurface._providers.ensemble_fault_polygons_provider.fault_polygons_server import (
     FaultPolygonsServer,
@@ -100,14 +103,24 @@ color-tables.json for color_tables format.
             EnsembleFaultPolygonsProviderFactory.instance()
         )
 
-        self._ensemble_surface_providers = {
-            ens: surface_provider_factory.create_from_ensemble_surface_files(
-                webviz_settings.shared_settings["scratch_ensembles"][ens],
-                attribute_filter=attributes,
-                rel_surface_folder=rel_surface_folder,
+        warm_up = ProviderWarmUp.instance()
+        self._ensemble_surface_providers = warm_up.create_concurrently(
+            "Ensemble surface providers",
+            {
+                ens: functools.partial(
+                    surface_provider_factory.create_from_ensemble_surface_files,
+                    webviz_settings.shared_settings["scratch_ensembles"][ens],
+                    attribute_filter=attributes,
+                    rel_surface_folder=rel_surface_folder,
+                )
+                for ens in ensembles
+            },
+        )
+        for ens, provider in self._ensemble_surface_providers.items():
+            warm_up.add_prefetch_job(
+                f"first statistical surface of {ens}",
+                functools.partial(prefetch_first_statistical_surface, provider),
             )
-            for ens in ensembles
-        }
         self._surface_server = SurfaceServer.instance(app)
 
         self.well_pick_provider = None
@@ -11,7 +11,7 @@ from webviz_config import WebvizPluginABC, WebvizSettings
 from webviz_config.utils import calculate_slider_step
 from webviz_config.webviz_store import webvizstore
 
-from .._datainput.seismic import get_iline, get_xline, get_zslice, load_cube_data
+from .._datainput.seismic_slice_engine import get_seismic_slice_engine
 
 
 class SegyViewer(WebvizPluginABC):
@@ -76,16 +76,17 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
         self.set_callbacks(app)
 
     def update_state(self, cubepath: str, **kwargs: Any) -> Dict[str, Any]:
-        cube = load_cube_data(get_path(cubepath))
+        cube = get_seismic_slice_engine(get_path(cubepath))
+        min_value, max_value = cube.value_range()
         state = {
             "cubepath": cubepath,
             "iline": int(cube.ilines[int(len(cube.ilines) / 2)]),
             "xline": int(cube.xlines[int(len(cube.xlines) / 2)]),
             "zslice": float(cube.zslices[int(len(cube.zslices) / 2)]),
-            "min_value": float(f"{round(cube.values.min(), 2):2f}"),
-            "max_value": float(f"{round(cube.values.max(), 2):2f}"),
-            "color_min_value": float(f"{round(cube.values.min(), 2):2f}"),
-            "color_max_value": float(f"{round(cube.values.max(), 2):2f}"),
+            "min_value": float(f"{round(min_value, 2):2f}"),
+            "max_value": float(f"{round(max_value, 2):2f}"),
+            "color_min_value": float(f"{round(min_value, 2):2f}"),
+            "color_max_value": float(f"{round(max_value, 2):2f}"),
             "uirevision": str(uuid4()),
             "colorscale": self.initial_colors,
         }
@@ -324,7 +325,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
             if not state_data_str:
                 raise PreventUpdate
             state = json.loads(state_data_str)
-            cube = load_cube_data(get_path(state["cubepath"]))
+            cube = get_seismic_slice_engine(get_path(state["cubepath"]))
             shapes = [
                 {
                     "type": "line",
@@ -344,7 +345,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
                 },
             ]
 
-            zslice_arr = get_zslice(cube, state["zslice"])
+            zslice_arr = cube.get_zslice(state["zslice"])
 
             fig = make_heatmap(
                 zslice_arr,
@@ -376,7 +377,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
             if not state_data_str:
                 raise PreventUpdate
             state = json.loads(state_data_str)
-            cube = load_cube_data(get_path(state["cubepath"]))
+            cube = get_seismic_slice_engine(get_path(state["cubepath"]))
             shapes = [
                 {
                     "type": "line",
@@ -395,7 +396,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
                     "line": {"width": 1, "dash": "dot"},
                 },
             ]
-            iline_arr = get_iline(cube, state["iline"])
+            iline_arr = cube.get_iline(state["iline"])
 
             fig = make_heatmap(
                 iline_arr,
@@ -422,7 +423,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
             if not state_data_str:
                 raise PreventUpdate
             state = json.loads(state_data_str)
-            cube = load_cube_data(get_path(state["cubepath"]))
+            cube = get_seismic_slice_engine(get_path(state["cubepath"]))
             shapes = [
                 {
                     "type": "line",
@@ -441,7 +442,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
                     "line": {"width": 1, "dash": "dot"},
                 },
             ]
-            xline_arr = get_xline(cube, state["xline"])
+            xline_arr = cube.get_xline(state["xline"])
             fig = make_heatmap(
                 xline_arr,
                 self.plotly_theme,
@@ -12,12 +12,32 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import webviz_core_components as wcc
-from dash import Dash, Input, Output, dcc, html
+from dash import Dash, Input, Output, callback_context, dcc, html, no_update
 from dash.exceptions import PreventUpdate
 from plotly.subplots import make_subplots
 from webviz_config import WebvizPluginABC, WebvizSettings
+from webviz_config.webviz_instance_info import WEBVIZ_INSTANCE_INFO, WebvizRunMode
 from webviz_config.webviz_store import webvizstore
 
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
+from webviz_subsurface._utils.map_level_of_detail import (
+    COUNT_COLUMN,
+    DEFAULT_MAX_MAP_POINTS,
+    MAX_SUFFIX,
+    MapRange,
+    is_map_extent_change,
+    map_extent_from_relayout,
+    map_points_level_of_detail,
+)
+from webviz_subsurface._utils.seismic_misfit_engine import (
+    SeismicMisfitEngine,
+    load_sim_data_matrix,
+)
+
+# The selected data and statistics of the map plots are kept in memory, so that
+# zooming and panning the maps only requires the map points to be re-binned
+MAP_PLOT_DATA_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
 # Seismic color scales
 SEISMIC_SYMMETRIC = [
     [0, "yellow"],
@@ -108,6 +128,16 @@ class SeismicMisfit(WebvizPluginABC):
     Realizations outside range will be excluded.
     If `realrange` is omitted, no realization filter will be applied (i.e. include all).
 
+    * **`map_max_points`:** Max number of data points to show in the map view plots.
+    If the zoomed extent of a map contains more data points, the data points are
+    binned into the cells of a regular grid, and the mean value per cell is shown.
+    Default is 20000.
+
+    * **`map_cell_size`:** Cell size (in the units of the coordinates) to use when
+    binning data points in the map view plots. The cell size is increased if needed
+    to keep the number of cells below `map_max_points`. If omitted, the smallest
+    such cell size is used.
+
     ---
 
     a) The required input data consists of 2 different file types.<br>
@@ -170,10 +200,14 @@ class SeismicMisfit(WebvizPluginABC):
         sim_mult: float = 1.0,
         polygon: str = None,
         realrange: List[List[int]] = None,
+        map_max_points: int = DEFAULT_MAX_MAP_POINTS,
+        map_cell_size: Optional[float] = None,
     ):
         super().__init__()
 
         self.attributes = attributes
+        self.map_max_points = map_max_points
+        self.map_cell_size = map_cell_size
 
         self.ensemble_set = {
             ens: webviz_settings.shared_settings["scratch_ensembles"][ens]
@@ -282,8 +316,12 @@ class SeismicMisfit(WebvizPluginABC):
             if col.startswith("real")
         ]
 
+        # the map plots never show more than map_max_points markers per ensemble
         self.map_intial_marker_size = _map_initial_marker_size(
-            len(self.dframeobs[attributes[0]].index),
+            min(
+                len(self.dframeobs[attributes[0]].index),
+                self.map_max_points * len(self.ens_names),
+            ),
             len(self.ens_names),
         )
 
@@ -1679,6 +1717,7 @@ class SeismicMisfit(WebvizPluginABC):
             Input(self.uuid("obsdata-obsmap_scale_col_range"), "value"),
             Input(self.uuid("obsdata-obsmap-marker_size"), "value"),
             Input(self.uuid("obsdata-obsmap-polygon"), "value"),
+            Input(self.uuid("obsdata-graph-map"), "relayoutData"),
             # prevent_initial_call=True,
         )
         def _update_obsdata_graph(
@@ -1693,11 +1732,19 @@ class SeismicMisfit(WebvizPluginABC):
             obsmap_scale_col_range: float,
             obsmap_marker_size: int,
             obsmap_polygon: str,
+            obsmap_relayout_data: Optional[dict],
         ) -> Tuple[px.scatter, px.scatter, dict, str, float, float]:
 
             if not regions:
                 raise PreventUpdate
 
+            # --- zooming/panning the map only requires the map to be updated
+            map_zoomed = _is_triggered_by(
+                self.uuid("obsdata-graph-map"), "relayoutData"
+            )
+            if map_zoomed and not is_map_extent_change(obsmap_relayout_data):
+                raise PreventUpdate
+
             # --- ensure int type
             regions = [int(reg) for reg in regions]
 
@@ -1734,7 +1781,13 @@ class SeismicMisfit(WebvizPluginABC):
                 obs_err_range=obs_error_range,
                 scale_col_range=obsmap_scale_col_range,
                 marker_size=obsmap_marker_size,
+                max_points=self.map_max_points,
+                cell_size=self.map_cell_size,
+                extent=map_extent_from_relayout(obsmap_relayout_data),
             )
+            if map_zoomed:
+                return (no_update, fig_map, no_update, no_update, no_update, no_update)
+
             # if fig_raw is run before fig_map some strange value error
             # my arise at init callback --> unknown reason
             fig_raw = update_obsdata_raw(
@@ -1981,6 +2034,7 @@ class SeismicMisfit(WebvizPluginABC):
             Input(self.uuid("map_plot-marker_size"), "value"),
             Input(self.uuid("map_plot-obsmap-polygon"), "value"),
             Input(self.uuid("map_plot-slice_type"), "value"),
+            Input(self.uuid("map_plot-figs"), "relayoutData"),
             # prevent_initial_call=True,
         )
         def _update_map_plot_obs_and_sim(
@@ -1995,11 +2049,17 @@ class SeismicMisfit(WebvizPluginABC):
             marker_size: int,
             map_plot_polygon: str,
             slice_type: str,
+            map_relayout_data: Optional[dict],
         ) -> Tuple[Optional[Any], Optional[Any]]:
 
             if not regions:
                 raise PreventUpdate
 
+            # --- zooming/panning the maps only requires the maps to be updated
+            map_zoomed = _is_triggered_by(self.uuid("map_plot-figs"), "relayoutData")
+            if map_zoomed and not is_map_extent_change(map_relayout_data):
+                raise PreventUpdate
+
             # --- ensure int type
             regions = [int(reg) for reg in regions]
 
@@ -2008,17 +2068,10 @@ class SeismicMisfit(WebvizPluginABC):
                 self.dframeobs[attr_name]["obs"].max(),
             ]
 
-            # --- apply region filter
-            dframe = self.dframe[attr_name].loc[
-                self.dframe[attr_name]["region"].isin(regions)
-            ]
-
-            # --- apply realization filter
-            col_names = ["real-" + str(real) for real in realizations]
-            dframe = dframe.drop(
-                columns=[
-                    col for col in dframe if "real-" in col and col not in col_names
-                ]
+            # --- the selected data and its statistics are memoized, so that
+            # --- zooming/panning only requires the map points to be re-binned
+            ensdf, ensdf_stat = map_plot_ens_data(
+                self.dframe[attr_name], ens_name, regions, realizations
             )
 
             df_poly = pd.DataFrame()
@@ -2026,7 +2079,8 @@ class SeismicMisfit(WebvizPluginABC):
                 df_poly = self.df_polygons[self.df_polygons.name == map_plot_polygon]
 
             fig_maps, fig_slice = update_obs_sim_map_plot(
-                dframe,
+                ensdf,
+                ensdf_stat,
                 ens_name,
                 df_polygon=df_poly,
                 obs_range=obs_range,
@@ -2036,7 +2090,13 @@ class SeismicMisfit(WebvizPluginABC):
                 plot_coverage=plot_coverage,
                 marker_size=marker_size,
                 slice_type=slice_type,
+                max_points=self.map_max_points,
+                cell_size=self.map_cell_size,
+                extent=map_extent_from_relayout(map_relayout_data),
+                include_slice=not map_zoomed,
             )
+            if map_zoomed:
+                return fig_maps, no_update
 
             return fig_maps, fig_slice
 
@@ -2068,29 +2128,22 @@ def update_misfit_plot(
         # --- drop columns (realizations) with no data
         ensdf = ensdf.dropna(axis="columns")
 
-        # --- calculate absolute diff, (|sim - obs| / obs_error), and store in new df
-        ensdf_diff = pd.DataFrame()
-        for col in ensdf.columns:
-            if col.startswith("real-"):
-                ensdf_diff[col] = abs(ensdf[col] - ensdf["obs"])
-                if misfit_weight == "obs_error":
-                    ensdf_diff[col] = ensdf_diff[col] / ensdf["obs_error"]
-                ensdf_diff[col] = ensdf_diff[col] ** misfit_exponent
-
-        # --- make sum of abs diff values over each column (realization)
-        ensdf_diff_sum = ensdf_diff.abs().sum().reset_index()
-        ensdf_diff_sum = ensdf_diff_sum.rename(columns={"index": "REAL", 0: "ABSDIFF"})
-        ensdf_diff_sum["ENSEMBLE"] = ens_name
-
-        if normalize:
-            ensdf_diff_sum["ABSDIFF"] = (
-                ensdf_diff_sum["ABSDIFF"] / len(ensdf_diff)
-            ) ** (1 / misfit_exponent)
-
-        # --- remove "real-" from REAL column values
-        # --- (only keep real number for nicer xaxis label)
-        ensdf_diff_sum = ensdf_diff_sum.replace(
-            to_replace=r"^real-", value="", regex=True
+        # --- sum of (|sim - obs| / obs_error)^exponent over each realization
+        misfit_engine = SeismicMisfitEngine.from_dataframe(ensdf)
+        ensdf_diff_sum = pd.DataFrame(
+            {
+                # --- only keep real number for nicer xaxis label
+                "REAL": [
+                    real_name.replace("real-", "", 1)
+                    for real_name in misfit_engine.real_names
+                ],
+                "ABSDIFF": misfit_engine.misfit_per_realization(
+                    weight_by_obs_error=misfit_weight == "obs_error",
+                    exponent=misfit_exponent,
+                    normalize=normalize,
+                ),
+                "ENSEMBLE": ens_name,
+            }
         )
 
         # --- calculate max from first ensemble, use with color range ---
@@ -2207,15 +2260,30 @@ def update_obsdata_map(
     obs_err_range: List[float],
     scale_col_range: float = 0.6,
     marker_size: int = 10,
+    max_points: int = DEFAULT_MAX_MAP_POINTS,
+    cell_size: Optional[float] = None,
+    extent: Tuple[MapRange, MapRange] = (None, None),
 ) -> Optional[px.scatter]:
     """Plot seismic obsdata; map view plot.
-    Takes dataframe with obsdata and metadata as input"""
+    Takes dataframe with obsdata and metadata as input.
+    Only data points within the extent (x range, y range) are plotted, and if there
+    are more than max_points of them they are binned, see map_points_level_of_detail.
+    """
 
     if ("east" not in df_obs.columns) or ("north" not in df_obs.columns):
         logging.warning("-- Do not have necessary data for making map view plot")
         logging.warning("-- Consider adding east/north coordinates to metafile")
         return None
 
+    df_obs, binned_cell_size = map_points_level_of_detail(
+        df_obs,
+        value_columns=["obs", "obs_error"],
+        first_columns=["region", "data_number"],
+        max_points=max_points,
+        cell_size=cell_size,
+        extent=extent,
+    )
+
     if df_obs[colorby].dtype == "int64" or colorby == "region":
         df_obs = df_obs.sort_values(by=[colorby])
         df_obs = df_obs.astype(
@@ -2236,23 +2304,37 @@ def update_obsdata_map(
         )
 
     # ----------------------------------------
+    title = "obs data map view plot | colorby: " + str(colorby)
+    hover_data = {
+        "east": False,
+        "north": False,
+        "region": True,
+        "obs": ":.2r",
+        "obs_error": ":.2r",
+        "data_number": True,
+    }
+    if binned_cell_size is not None:
+        # obs and obs_error are the mean values of the binned data points
+        title += f" | binned (cell size {binned_cell_size:,.0f})"
+        hover_data.update(
+            {
+                "obs" + MAX_SUFFIX: ":.2r",
+                "obs_error" + MAX_SUFFIX: ":.2r",
+                "data_number": False,
+                COUNT_COLUMN: True,
+            }
+        )
+
     fig = px.scatter(  # map view plot
         df_obs,
         x="east",
         y="north",
         color=colorby,
-        hover_data={
-            "east": False,
-            "north": False,
-            "region": True,
-            "obs": ":.2r",
-            "obs_error": ":.2r",
-            "data_number": True,
-        },
+        hover_data=hover_data,
         color_continuous_scale=color_scale,
         color_continuous_midpoint=scale_midpoint,
         range_color=range_col,
-        title="obs data map view plot | colorby: " + str(colorby),
+        title=title,
     )
 
     # ----------------------------------------
@@ -2281,6 +2363,8 @@ def update_obsdata_map(
     fig.update_layout(coloraxis_colorbar_len=0.9)
     fig.update_layout(coloraxis_colorbar_thickness=20)
     fig.update_traces(marker=dict(size=marker_size), selector=dict(mode="markers"))
+    if binned_cell_size is not None:
+        fig.update_traces(marker_symbol="square", selector=dict(mode="markers"))
 
     fig.update_layout(uirevision="true")  # don't update layout during callbacks
 
@@ -2288,9 +2372,41 @@ def update_obsdata_map(
 
 
 # -------------------------------
-def update_obs_sim_map_plot(
+@fingerprint_memoize(max_bytes=MAP_PLOT_DATA_CACHE_MAX_BYTES)
+def map_plot_ens_data(
     df: pd.DataFrame,
     ens_name: str,
+    regions: List[int],
+    realizations: List[Union[int, str]],
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Returns the data of the selected ensemble, regions and realizations, with
+    realizations without data dropped, along with its statistics per datapoint,
+    see df_seis_ens_stat. The returned dataframes must not be modified."""
+
+    # --- apply ensemble and region filter
+    ensdf = df[df.ENSEMBLE.eq(ens_name) & df["region"].isin(regions)]
+
+    # --- apply realization filter
+    col_names = ["real-" + str(real) for real in realizations]
+    ensdf = ensdf.drop(
+        columns=[col for col in ensdf if "real-" in col and col not in col_names]
+    )
+
+    # --- drop columns (realizations) with no data
+    ensdf = ensdf.dropna(axis="columns")
+
+    if ("east" not in ensdf.columns) or ("north" not in ensdf.columns):
+        return ensdf, pd.DataFrame()
+
+    return ensdf, df_seis_ens_stat(ensdf, ens_name)
+
+
+# -------------------------------
+# pylint: disable=too-many-statements, too-many-branches
+def update_obs_sim_map_plot(
+    ensdf: pd.DataFrame,
+    ensdf_stat: pd.DataFrame,
+    ens_name: str,
     df_polygon: pd.DataFrame,
     obs_range: List[float],
     scale_col_range: float = 0.8,
@@ -2299,25 +2415,25 @@ def update_obs_sim_map_plot(
     plot_coverage: int = 0,
     marker_size: int = 10,
     slice_type: str = "stat",
+    max_points: int = DEFAULT_MAX_MAP_POINTS,
+    cell_size: Optional[float] = None,
+    extent: Tuple[MapRange, MapRange] = (None, None),
+    include_slice: bool = True,
 ) -> Tuple[Optional[Any], Optional[Any]]:
     """Plot seismic obsdata, simdata and diffdata; side by side map view plots.
-    Takes dataframe with obsdata, metadata and simdata as input"""
+    Takes dataframe with obsdata, metadata and simdata for one ensemble as input,
+    along with its statistics per datapoint, see map_plot_ens_data.
+    Only data points within the extent (x range, y range) are plotted in the map
+    view plots, and if there are more than max_points of them they are binned, see
+    map_points_level_of_detail. The slice plot is None if include_slice is False."""
 
     logging.debug(f"Seismic obs vs sim map plot, updating {ens_name}")
 
-    ensdf = df[df.ENSEMBLE.eq(ens_name)]
-
     if ("east" not in ensdf.columns) or ("north" not in ensdf.columns):
         logging.warning("-- Do not have necessary data for making map view plot")
         logging.warning("-- Consider adding east/north coordinates to metafile")
         return None, None
 
-    # --- drop columns (realizations) with no data
-    ensdf = ensdf.dropna(axis="columns")
-
-    # --- get dataframe with statistics per datapoint
-    ensdf_stat = df_seis_ens_stat(ensdf, ens_name)
-
     if ensdf_stat.empty:
         return (
             make_subplots(
@@ -2328,6 +2444,24 @@ def update_obs_sim_map_plot(
             go.Figure(),
         )
 
+    # --- reduce data points to plot in the map views
+    df_map, binned_cell_size = map_points_level_of_detail(
+        ensdf_stat,
+        value_columns=[
+            "obs",
+            "sim_mean",
+            "diff_mean",
+            "sim_coverage",
+            "sim_coverage_adj",
+        ],
+        first_columns=["region"],
+        max_points=max_points,
+        cell_size=cell_size,
+        extent=extent,
+    )
+    binned = binned_cell_size is not None
+    marker_symbol = "square" if binned else "circle"
+
     # ----------------------------------------
     # set obs/sim color scale and ranges
     range_col, _, color_scale = _get_obsdata_col_settings(
@@ -2342,10 +2476,14 @@ def update_obs_sim_map_plot(
     else:
         title3 = "Region plot"
 
+    title1 = "Observed"
+    if binned:
+        title1 += f" (binned, cell size {binned_cell_size:,.0f})"
+
     fig = make_subplots(
         rows=1,
         cols=3,
-        subplot_titles=("Observed", "Simulated (mean)", title3),
+        subplot_titles=(title1, "Simulated (mean)", title3),
         shared_xaxes=True,
         vertical_spacing=0.02,
         shared_yaxes=True,
@@ -2354,12 +2492,13 @@ def update_obs_sim_map_plot(
 
     fig.add_trace(
         go.Scattergl(
-            x=ensdf_stat["east"],
-            y=ensdf_stat["north"],
+            x=df_map["east"],
+            y=df_map["north"],
             mode="markers",
             marker=dict(
                 size=marker_size,
-                color=ensdf["obs"],
+                symbol=marker_symbol,
+                color=df_map["obs"],
                 colorscale=color_scale,
                 colorbar_x=0.29,
                 colorbar_thicknessmode="fraction",
@@ -2370,12 +2509,9 @@ def update_obs_sim_map_plot(
                 showscale=True,
             ),
             showlegend=False,
-            text=ensdf.obs,
-            customdata=list(zip(ensdf.region, ensdf.east)),
-            hovertemplate=(
-                "Obs: %{text:.2r}<br>Region: %{customdata[0]}<br>"
-                "East: %{customdata[1]:,.0f}<extra></extra>"
-            ),
+            text=df_map.obs,
+            customdata=_map_hover_customdata(df_map, "obs", binned),
+            hovertemplate=_map_hovertemplate("Obs", binned),
         ),
         row=1,
         col=1,
@@ -2383,12 +2519,13 @@ def update_obs_sim_map_plot(
 
     fig.add_trace(
         go.Scattergl(
-            x=ensdf_stat["east"],
-            y=ensdf_stat["north"],
+            x=df_map["east"],
+            y=df_map["north"],
             mode="markers",
             marker=dict(
                 size=marker_size,
-                color=ensdf_stat["sim_mean"],
+                symbol=marker_symbol,
+                color=df_map["sim_mean"],
                 colorscale=color_scale,
                 colorbar_x=0.63,
                 colorbar_thicknessmode="fraction",
@@ -2399,12 +2536,9 @@ def update_obs_sim_map_plot(
                 showscale=True,
             ),
             showlegend=False,
-            text=ensdf_stat.sim_mean,
-            customdata=list(zip(ensdf.region, ensdf.east)),
-            hovertemplate=(
-                "Sim (mean): %{text:.2r}<br>Region: %{customdata[0]}<br>"
-                "East: %{customdata[1]:,.0f}<extra></extra>"
-            ),
+            text=df_map.sim_mean,
+            customdata=_map_hover_customdata(df_map, "sim_mean", binned),
+            hovertemplate=_map_hovertemplate("Sim (mean)", binned),
         ),
         row=1,
         col=2,
@@ -2413,12 +2547,13 @@ def update_obs_sim_map_plot(
     if plot_coverage == 0:  # abs diff plot
         fig.add_trace(
             go.Scattergl(
-                x=ensdf_stat["east"],
-                y=ensdf_stat["north"],
+                x=df_map["east"],
+                y=df_map["north"],
                 mode="markers",
                 marker=dict(
                     size=marker_size,
-                    color=ensdf_stat["diff_mean"],
+                    symbol=marker_symbol,
+                    color=df_map["diff_mean"],
                     cmin=0,
                     cmax=obs_range[1] * scale_col_range,
                     colorscale=SEISMIC_DIFF,
@@ -2429,12 +2564,9 @@ def update_obs_sim_map_plot(
                     showscale=True,
                 ),
                 showlegend=False,
-                text=ensdf_stat.diff_mean,
-                customdata=list(zip(ensdf.region, ensdf.east)),
-                hovertemplate=(
-                    "Abs diff (mean): %{text:.2r}<br>Region: %{customdata[0]}<br>"
-                    "East: %{customdata[1]:,.0f}<extra></extra>"
-                ),
+                text=df_map.diff_mean,
+                customdata=_map_hover_customdata(df_map, "diff_mean", binned),
+                hovertemplate=_map_hovertemplate("Abs diff (mean)", binned),
             ),
             row=1,
             col=3,
@@ -2443,12 +2575,13 @@ def update_obs_sim_map_plot(
         coverage = "sim_coverage" if plot_coverage == 1 else "sim_coverage_adj"
         fig.add_trace(
             go.Scattergl(
-                x=ensdf_stat["east"],
-                y=ensdf_stat["north"],
+                x=df_map["east"],
+                y=df_map["north"],
                 mode="markers",
                 marker=dict(
                     size=marker_size,
-                    color=ensdf_stat[coverage],
+                    symbol=marker_symbol,
+                    color=df_map[coverage],
                     cmin=-1.0,
                     cmax=2.0,
                     colorscale=SEISMIC_COVERAGE,
@@ -2465,12 +2598,9 @@ def update_obs_sim_map_plot(
                 ),
                 opacity=0.5,
                 showlegend=False,
-                text=ensdf_stat[coverage],
-                customdata=list(zip(ensdf.region, ensdf.east)),
-                hovertemplate=(
-                    "Coverage value: %{text:.2r}<br>Region: %{customdata[0]}<br>"
-                    "East: %{customdata[1]:,.0f}<extra></extra>"
-                ),
+                text=df_map[coverage],
+                customdata=_map_hover_customdata(df_map, coverage, binned),
+                hovertemplate=_map_hovertemplate("Coverage value", binned),
             ),
             row=1,
             col=3,
@@ -2478,12 +2608,13 @@ def update_obs_sim_map_plot(
     else:  # region plot
         fig.add_trace(
             go.Scattergl(
-                x=ensdf["east"],
-                y=ensdf["north"],
+                x=df_map["east"],
+                y=df_map["north"],
                 mode="markers",
                 marker=dict(
                     size=marker_size,
-                    color=ensdf.region,
+                    symbol=marker_symbol,
+                    color=df_map.region,
                     colorscale=px.colors.qualitative.Plotly,
                     colorbar_x=0.97,
                     colorbar_thicknessmode="fraction",
@@ -2494,7 +2625,7 @@ def update_obs_sim_map_plot(
                 opacity=0.8,
                 showlegend=False,
                 hovertemplate="Region: %{text}<extra></extra>",
-                text=ensdf.region,
+                text=df_map.region,
             ),
             row=1,
             col=3,
@@ -2540,6 +2671,10 @@ def update_obs_sim_map_plot(
     fig.update_layout(hovermode="closest")
     # fig.update_layout(template="plotly_dark")
 
+    # ----------------------------------------
+    if not include_slice:
+        return fig, None
+
     # ----------------------------------------
     if slice_type == "stat":
         # Create lineplot along slice - statistics
@@ -3221,7 +3356,7 @@ def makedf_seis_addsim(
         realno = int(re.search(r"(?<=realization-)\d+", runpath).group(0))  # type: ignore
         real_path[realno] = runpath
 
-    sim_df_list = [df]
+    sim_files = []
     for real in sorted(real_path.keys()):
         if fromreal <= real <= toreal:
 
@@ -3229,21 +3364,20 @@ def makedf_seis_addsim(
                 Path(real_path[real]) / Path(attribute_sim_path) / Path(attribute_name)
             )
             if simfile.exists():
-                # ---read sim data and apply sim multiplier ---
-                colname = "real-" + str(real)
-                sim_df = pd.read_csv(simfile, header=None, names=[colname]) * sim_mult
-                if len(sim_df.index) != obs_size:
-                    raise RuntimeError(
-                        f"---\nThe length of {simfile} is {len(sim_df.index)} which is "
-                        f"different to the obs data which has {obs_size} data points. "
-                        "These must be the same size.\n---"
-                    )
-                sim_df_list.append(sim_df)
+                sim_files.append(simfile)
                 data_found.append(real)
             else:
                 no_data_found.append(real)
                 logging.debug(f"File does not exist: {str(simfile)}")
-    df_addsim = pd.concat(sim_df_list, axis=1)
+
+    # --- read sim data and apply sim multiplier ---
+    sim_matrix = load_sim_data_matrix(
+        sim_files, obs_size, sim_mult=sim_mult, snapshot_dir=_get_snapshot_dir()
+    )
+    df_sim = pd.DataFrame(
+        sim_matrix, columns=[f"real-{real}" for real in data_found], index=df.index
+    )
+    df_addsim = pd.concat([df, df_sim], axis=1)
 
     if len(data_found) == 0:
         logging.warning(
@@ -3259,6 +3393,18 @@ def makedf_seis_addsim(
     return df_addsim
 
 
+def _get_snapshot_dir() -> Optional[Path]:
+    """Folder for snapshots of the sim data. Only used when running non-portable,
+    since the data is already stored by webvizstore in portable apps."""
+    try:
+        if WEBVIZ_INSTANCE_INFO.run_mode != WebvizRunMode.NON_PORTABLE:
+            return None
+        return WEBVIZ_INSTANCE_INFO.storage_folder / "seismic_misfit_sim_data"
+    except RuntimeError:
+        # Not running as part of a webviz app
+        return None
+
+
 def df_seis_ens_stat(
     df: pd.DataFrame, ens_name: str, obs_error_weight: bool = False
 ) -> pd.DataFrame:
@@ -3272,47 +3418,17 @@ def df_seis_ens_stat(
     start, end = x[0], x[-1]
     df_obs_meta = df.loc[:, start:end]
 
-    # --- make dataframe with real- columns only
-    column_names = df.columns.values.tolist()
-    x = [name for name in column_names if name.startswith("real-")]
-    if len(x) > 0:
-        start, end = x[0], x[-1]
-        df_sim = df.loc[:, start:end]
-    else:
+    # --- check that there are real- columns
+    if not any(name.startswith("real-") for name in column_names):
         logging.info(f"{ens_name}: no data found for selected realizations.")
         return pd.DataFrame()
 
-    # --- calculate absolute diff, (|sim - obs| / obs_error), and store in new df
-    df_diff = pd.DataFrame()
-    for col in df.columns:
-        if col.startswith("real-"):
-            df_diff[col] = abs(df[col] - df["obs"])
-            if obs_error_weight:
-                df_diff[col] = df_diff[col] / df["obs_error"]  # divide by obs error
-
-    # --- ensemble statistics of sim and diff for each data point ----
-    # --- calculate statistics per row (data point)
-    sim_mean = df_sim.mean(axis=1)
-    sim_std = df_sim.std(axis=1)
-    sim_p90 = df_sim.quantile(q=0.1, axis=1)
-    sim_p10 = df_sim.quantile(q=0.9, axis=1)
-    sim_min = df_sim.min(axis=1)
-    sim_max = df_sim.max(axis=1)
-    diff_mean = df_diff.mean(axis=1)
-    diff_std = df_diff.std(axis=1)
-
-    df_stat = pd.DataFrame(
-        data={
-            "sim_mean": sim_mean,
-            "sim_std": sim_std,
-            "sim_p90": sim_p90,
-            "sim_p10": sim_p10,
-            "sim_min": sim_min,
-            "sim_max": sim_max,
-            "diff_mean": diff_mean,
-            "diff_std": diff_std,
-        }
+    # --- ensemble statistics of sim and diff (|sim - obs| / obs_error)
+    # --- for each data point
+    df_stat = SeismicMisfitEngine.from_dataframe(df).point_statistics(
+        weight_by_obs_error=obs_error_weight
     )
+    df_stat.index = df.index
 
     # --- add obsdata and metadata to the dataframe
     df_stat = pd.concat([df_stat, df_obs_meta], axis=1, sort=False)
@@ -3469,6 +3585,47 @@ def average_arrow_annotation(mean_value: np.float64, yref: str = "y") -> Dict[st
     }
 
 
+def _map_hover_customdata(
+    df_map: pd.DataFrame, value_column: str, binned: bool
+) -> list:
+    """Customdata for the markers of the map view plots, for use with
+    _map_hovertemplate"""
+    if not binned:
+        return list(zip(df_map.region, df_map.east))
+    return list(
+        zip(
+            df_map.region,
+            df_map.east,
+            df_map[COUNT_COLUMN],
+            df_map[value_column + MAX_SUFFIX],
+        )
+    )
+
+
+def _map_hovertemplate(value_label: str, binned: bool) -> str:
+    """Hovertemplate for the markers of the map view plots. The marker text must be
+    the value, which for binned data points is the mean value of the cell"""
+    if not binned:
+        return (
+            f"{value_label}: %{{text:.2r}}<br>Region: %{{customdata[0]}}<br>"
+            "East: %{customdata[1]:,.0f}<extra></extra>"
+        )
+    return (
+        f"{value_label}, cell mean: %{{text:.2r}}<br>"
+        f"{value_label}, cell max: %{{customdata[3]:.2r}}<br>"
+        "Region: %{customdata[0]}<br>East: %{customdata[1]:,.0f}<br>"
+        "Data points in cell: %{customdata[2]}<extra></extra>"
+    )
+
+
+def _is_triggered_by(component_id: str, component_property: str) -> bool:
+    """Check if the current callback was triggered by the given component property"""
+    return any(
+        trigger["prop_id"] == f"{component_id}.{component_property}"
+        for trigger in callback_context.triggered
+    )
+
+
 def _map_initial_marker_size(total_data_points: int, no_ens: int) -> int:
     """Calculate marker size based on number of datapoints per ensemble"""
     if total_data_points < 1:
@@ -303,31 +303,76 @@ def plugin_callbacks(
             # one single dataframe with vector columns. NB: Assumes equal sampling rate
             # for each vector type - i.e equal number of rows in dataframes
 
-            # Retrive vectors data from accessor
-            vectors_df_list: List[pd.DataFrame] = []
-            if accessor.has_provider_vectors():
+            # Statistics for provider vectors can be retrieved directly from the
+            # provider, which avoids fetching realization data when only statistics
+            # are shown. None if not supported by the accessor.
+            provider_vectors_statistics_df: Optional[pd.DataFrame] = None
+            if accessor.has_provider_vectors() and visualization in [
+                VisualizationOptions.STATISTICS,
+                VisualizationOptions.FANCHART,
+            ]:
+                provider_vectors_statistics_df = (
+                    accessor.get_provider_vectors_statistics_df(
+                        realizations=realizations_query
+                    )
+                )
+
+            # Retrive vectors data from accessor, as pairs of vectors dataframe and
+            # vectors statistics dataframe, where either may be None
+            vectors_df_list: List[
+                Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]
+            ] = []
+            if provider_vectors_statistics_df is not None:
+                vectors_df_list.append((None, provider_vectors_statistics_df))
+            elif accessor.has_provider_vectors():
                 vectors_df_list.append(
-                    accessor.get_provider_vectors_df(realizations=realizations_query)
+                    (
+                        accessor.get_provider_vectors_df(
+                            realizations=realizations_query
+                        ),
+                        None,
+                    )
                 )
             if accessor.has_per_interval_and_per_day_vectors():
                 vectors_df_list.append(
-                    accessor.create_per_interval_and_per_day_vectors_df(
-                        realizations=realizations_query
+                    (
+                        accessor.create_per_interval_and_per_day_vectors_df(
+                            realizations=realizations_query
+                        ),
+                        None,
                     )
                 )
             if accessor.has_vector_calculator_expressions():
                 vectors_df_list.append(
-                    accessor.create_calculated_vectors_df(
-                        realizations=realizations_query
+                    (
+                        accessor.create_calculated_vectors_df(
+                            realizations=realizations_query
+                        ),
+                        None,
                     )
                 )
 
-            for vectors_df in vectors_df_list:
+            for vectors_df, vectors_statistics_df in vectors_df_list:
                 # Ensure rows of data
-                if not vectors_df.shape[0]:
+                if vectors_df is not None and not vectors_df.shape[0]:
+                    continue
+                if (
+                    vectors_statistics_df is not None
+                    and not vectors_statistics_df.shape[0]
+                ):
                     continue
 
-                if visualization == VisualizationOptions.REALIZATIONS:
+                if (
+                    vectors_statistics_df is None
+                    and vectors_df is not None
+                    and visualization != VisualizationOptions.REALIZATIONS
+                ):
+                    vectors_statistics_df = create_vectors_statistics_df(vectors_df)
+
+                if (
+                    visualization == VisualizationOptions.REALIZATIONS
+                    and vectors_df is not None
+                ):
                     # Show selected realizations - only filter df if realizations filter
                     # query is not performed
                     figure_builder.add_realizations_traces(
@@ -336,21 +381,29 @@ def plugin_callbacks(
                         else vectors_df[vectors_df["REAL"].isin(selected_realizations)],
                         ensemble,
                     )
-                if visualization == VisualizationOptions.STATISTICS:
-                    vectors_statistics_df = create_vectors_statistics_df(vectors_df)
+                if (
+                    visualization == VisualizationOptions.STATISTICS
+                    and vectors_statistics_df is not None
+                ):
                     figure_builder.add_statistics_traces(
                         vectors_statistics_df,
                         ensemble,
                         statistics_options,
                     )
-                if visualization == VisualizationOptions.FANCHART:
-                    vectors_statistics_df = create_vectors_statistics_df(vectors_df)
+                if (
+                    visualization == VisualizationOptions.FANCHART
+                    and vectors_statistics_df is not None
+                ):
                     figure_builder.add_fanchart_traces(
                         vectors_statistics_df,
                         ensemble,
                         fanchart_options,
                     )
-                if visualization == VisualizationOptions.STATISTICS_AND_REALIZATIONS:
+                if (
+                    visualization == VisualizationOptions.STATISTICS_AND_REALIZATIONS
+                    and vectors_df is not None
+                    and vectors_statistics_df is not None
+                ):
                     # Configure line width and color scaling to easier separate
                     # statistics traces and realization traces.
                     # Show selected realizations - only filter df if realizations filter
@@ -363,7 +416,6 @@ def plugin_callbacks(
                         color_lightness_scale=150.0,
                     )
                     # Add statistics on top
-                    vectors_statistics_df = create_vectors_statistics_df(vectors_df)
                     figure_builder.add_statistics_traces(
                         vectors_statistics_df,
                         ensemble,
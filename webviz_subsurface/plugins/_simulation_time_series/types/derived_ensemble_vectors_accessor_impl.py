@@ -4,7 +4,11 @@ from typing import List, Optional, Sequence
 import pandas as pd
 from webviz_subsurface_components import ExpressionInfo
 
-from webviz_subsurface._providers import EnsembleSummaryProvider, Frequency
+from webviz_subsurface._providers import (
+    EnsembleSummaryProvider,
+    Frequency,
+    VectorStatistic,
+)
 from webviz_subsurface._utils.vector_calculator import (
     create_calculated_vector_df,
     get_selected_expressions,
@@ -17,6 +21,7 @@ from ..utils.from_timeseries_cumulatives import (
     is_per_interval_or_per_day_vector,
 )
 from .derived_vectors_accessor import DerivedVectorsAccessor
+from .types import StatisticsOptions
 
 
 class DerivedEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
@@ -97,6 +102,35 @@ class DerivedEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
             self._provider_vectors, self._resampling_frequency, realizations
         )
 
+    def get_provider_vectors_statistics_df(
+        self, realizations: Optional[Sequence[int]] = None
+    ) -> Optional[pd.DataFrame]:
+        """Get statistics for the selected provider vectors from the provider
+
+        Not available for relative date, as the statistics must then be calculated
+        from the per realization data relative to the date
+        """
+        if not self.has_provider_vectors():
+            raise ValueError(
+                f'Vector data handler for provider "{self._name}" has no provider vectors'
+            )
+
+        if self._relative_date:
+            return None
+
+        statistics_df = self._provider.get_vectors_statistics_df(
+            self._provider_vectors, self._resampling_frequency, realizations
+        )
+
+        # Rename columns to StatisticsOptions enum types for strongly typed format
+        col_stat_label_map = {
+            statistic.value: StatisticsOptions[statistic.name]
+            for statistic in VectorStatistic
+        }
+        statistics_df.rename(columns=col_stat_label_map, level=1, inplace=True)
+
+        return statistics_df
+
     def create_per_interval_and_per_day_vectors_df(
         self,
         realizations: Optional[Sequence[int]] = None,
@@ -26,6 +26,19 @@ class DerivedVectorsAccessor:
     ) -> pd.DataFrame:
         ...
 
+    def get_provider_vectors_statistics_df(
+        self, realizations: Optional[Sequence[int]] = None
+    ) -> Optional[pd.DataFrame]:
+        """Get statistics dataframe for the provider vectors directly from the provider.
+
+        `Returns:`
+        - None - If the accessor cannot provide the statistics directly, i.e. the statistics
+        must be calculated from the dataframe given by get_provider_vectors_df()
+        - DataFrame - Dataframe with the same format as given by create_vectors_statistics_df()
+        """
+        # pylint: disable=unused-argument
+        return None
+
     @abc.abstractmethod
     def create_per_interval_and_per_day_vectors_df(
         self,
@@ -1,12 +1,15 @@
 import datetime
+import functools
 from pathlib import Path
-from typing import Dict, ItemsView, List, Optional, Sequence, Set
+from typing import Callable, Dict, ItemsView, List, Optional, Sequence, Set
 
 from webviz_subsurface._providers import (
     EnsembleSummaryProvider,
     EnsembleSummaryProviderFactory,
     Frequency,
+    ProviderWarmUp,
     VectorMetadata,
+    prefetch_first_vector_statistics,
 )
 
 
@@ -156,11 +159,16 @@ def create_lazy_provider_set_from_paths(
     Provider set with ensemble summary providers with lazy (on-demand) resampling/interpolation
     """
     provider_factory = EnsembleSummaryProviderFactory.instance()
-    provider_dict: Dict[str, EnsembleSummaryProvider] = {}
-    for name, path in name_path_dict.items():
-        provider_dict[name] = provider_factory.create_from_arrow_unsmry_lazy(
-            str(path), rel_file_pattern
-        )
+    provider_dict = _create_providers_and_add_prefetch_jobs(
+        {
+            name: functools.partial(
+                provider_factory.create_from_arrow_unsmry_lazy,
+                str(path),
+                rel_file_pattern,
+            )
+            for name, path in name_path_dict.items()
+        }
+    )
     return ProviderSet(provider_dict)
 
 
@@ -185,9 +193,30 @@ def create_presampled_provider_set_from_paths(
     """
     # TODO: Make presampling_frequency: Optional[Frequency] when allowing raw data for plugin
     provider_factory = EnsembleSummaryProviderFactory.instance()
-    provider_dict: Dict[str, EnsembleSummaryProvider] = {}
-    for name, path in name_path_dict.items():
-        provider_dict[name] = provider_factory.create_from_arrow_unsmry_presampled(
-            str(path), rel_file_pattern, presampling_frequency
-        )
+    provider_dict = _create_providers_and_add_prefetch_jobs(
+        {
+            name: functools.partial(
+                provider_factory.create_from_arrow_unsmry_presampled,
+                str(path),
+                rel_file_pattern,
+                presampling_frequency,
+            )
+            for name, path in name_path_dict.items()
+        }
+    )
     return ProviderSet(provider_dict)
+
+
+def _create_providers_and_add_prefetch_jobs(
+    create_funcs: Dict[str, Callable[[], EnsembleSummaryProvider]]
+) -> Dict[str, EnsembleSummaryProvider]:
+    warm_up = ProviderWarmUp.instance()
+    provider_dict = warm_up.create_concurrently(
+        "Ensemble summary providers", create_funcs
+    )
+    for name, provider in provider_dict.items():
+        warm_up.add_prefetch_job(
+            f"first vector statistics of {name}",
+            functools.partial(prefetch_first_vector_statistics, provider),
+        )
+    return provider_dict
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, Tuple
 
 import numpy as np
 import pandas as pd
@@ -7,6 +7,7 @@ from webviz_subsurface._utils.dataframe_utils import (
     assert_date_column_is_datetime_object,
     make_date_column_datetime_object,
 )
+from webviz_subsurface._utils.nan_statistics import calc_nan_statistics
 
 from ..types import StatisticsOptions
 
@@ -50,33 +51,37 @@ def create_vectors_statistics_df(vectors_df: pd.DataFrame) -> pd.DataFrame:
             )
         return pd.DataFrame(columns=pd.MultiIndex.from_tuples(columns_tuples))
 
-    # Invert p10 and p90 due to oil industry convention.
-    def p10(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=90)
-
-    def p90(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=10)
-
-    def p50(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=50)
-
-    statistics_df: pd.DataFrame = (
-        vectors_df[["DATE"] + vector_names]
-        .groupby(["DATE"])
-        .agg([np.nanmean, np.nanmin, np.nanmax, p10, p90, p50])
-        .reset_index(level=["DATE"], col_level=0)
+    # Scatter the values into a dense (vectors, dates, realizations) array, where
+    # missing entries are NaN, and calculate the statistics in one vectorized pass
+    date_codes, unique_dates = pd.factorize(vectors_df["DATE"], sort=True)
+    real_codes, unique_reals = pd.factorize(vectors_df["REAL"], sort=True)
+    dense_values = np.full(
+        (len(vector_names), len(unique_dates), len(unique_reals)), np.nan
     )
+    for idx, vector in enumerate(vector_names):
+        dense_values[idx, date_codes, real_codes] = vectors_df[vector].to_numpy(
+            dtype=np.float64
+        )
 
-    # Rename columns to StatisticsOptions enum types for strongly typed format
-    col_stat_label_map = {
-        "nanmin": StatisticsOptions.MIN,
-        "nanmax": StatisticsOptions.MAX,
-        "nanmean": StatisticsOptions.MEAN,
-        "p10": StatisticsOptions.P10,
-        "p90": StatisticsOptions.P90,
-        "p50": StatisticsOptions.P50,
-    }
-    statistics_df.rename(columns=col_stat_label_map, level=1, inplace=True)
+    # Invert p10 and p90 due to oil industry convention.
+    nan_stats = calc_nan_statistics(dense_values, percentiles=[90, 10, 50])
+
+    statistics_data: Dict[Tuple[str, str], np.ndarray] = {("DATE", ""): unique_dates}
+    for idx, vector in enumerate(vector_names):
+        statistics_data[(vector, StatisticsOptions.MEAN)] = nan_stats.mean[idx]
+        statistics_data[(vector, StatisticsOptions.MIN)] = nan_stats.min[idx]
+        statistics_data[(vector, StatisticsOptions.MAX)] = nan_stats.max[idx]
+        statistics_data[(vector, StatisticsOptions.P10)] = nan_stats.percentiles[90][
+            idx
+        ]
+        statistics_data[(vector, StatisticsOptions.P90)] = nan_stats.percentiles[10][
+            idx
+        ]
+        statistics_data[(vector, StatisticsOptions.P50)] = nan_stats.percentiles[50][
+            idx
+        ]
+
+    statistics_df = pd.DataFrame(statistics_data)
 
     make_date_column_datetime_object(statistics_df)
 
@@ -16,7 +16,7 @@ from webviz_subsurface_components import LeafletMap
 from webviz_subsurface._models import SurfaceLeafletModel
 
 from .._datainput.grid import load_grid, load_grid_parameter
-from .._datainput.surface import get_surface_fence
+from .._datainput.surface import get_surface_fence, load_surface
 
 
 class SurfaceWithGridCrossSection(WebvizPluginABC):
@@ -309,7 +309,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
             hillshade,
         ):
 
-            surface = xtgeo.surface_from_file(get_path(surfacepath))
+            surface = load_surface(get_path(surfacepath))
             min_val = None
             max_val = None
 
@@ -365,7 +365,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
                 fence, gridparameter, zincrement=0.5
             )
 
-            surface = xtgeo.surface_from_file(get_path(surfacepath))
+            surface = load_surface(get_path(surfacepath))
             s_arr = get_surface_fence(fence, surface)
             return make_heatmap(
                 values,
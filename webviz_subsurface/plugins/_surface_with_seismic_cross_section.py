@@ -15,7 +15,7 @@ from webviz_subsurface_components import LeafletMap
 from webviz_subsurface._models import SurfaceLeafletModel
 
 from .._datainput.seismic import load_cube_data
-from .._datainput.surface import get_surface_fence
+from .._datainput.surface import get_surface_fence, load_surface
 
 
 class SurfaceWithSeismicCrossSection(WebvizPluginABC):
@@ -297,7 +297,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
             surfacepath, surface_type, cubepath, color_values, hillshade
         ):
 
-            surface = xtgeo.surface_from_file(get_path(surfacepath))
+            surface = load_surface(get_path(surfacepath))
             min_val = None
             max_val = None
             if surface_type == "attribute":
@@ -332,7 +332,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
             fence = get_fencespec(coords)
             hmin, hmax, vmin, vmax, values = cube.get_randomline(fence)
 
-            surface = xtgeo.surface_from_file(get_path(surfacepath))
+            surface = load_surface(get_path(surfacepath))
             s_arr = get_surface_fence(fence, surface)
             return make_heatmap(
                 values,
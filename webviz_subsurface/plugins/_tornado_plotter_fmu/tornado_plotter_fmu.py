@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List
 
 import webviz_core_components as wcc
 from dash import ALL, Dash, Input, Output, callback_context, html
@@ -234,29 +234,29 @@ class TornadoPlotterFMU(WebvizPluginABC):
         ) -> str:
             """Returns a json dump for the tornado plot with the response values per realization"""
 
-            data = self._tableproviderset.ensemble_provider(
-                self._ensemble_name
-            ).get_column_data([response] + self._single_filters + self._multi_filters)
-
-            # Filter data
+            selector_filters: Dict[str, Any] = {}
             if single_filters is not None:
                 for value, input_dict in zip(
                     single_filters, callback_context.inputs_list[1]
                 ):
-                    data = data.loc[data[input_dict["id"]["name"]] == value]
+                    selector_filters[input_dict["id"]["name"]] = value
             if multi_filters is not None:
                 for value, input_dict in zip(
                     multi_filters, callback_context.inputs_list[2]
                 ):
-                    data = data.loc[data[input_dict["id"]["name"]].isin(value)]
+                    selector_filters[input_dict["id"]["name"]] = list(value)
+
+            # Filtering and summing per realization is done by the provider
+            data = self._tableproviderset.ensemble_provider(
+                self._ensemble_name
+            ).get_filtered_column_data(
+                [response], selector_filters=selector_filters, groupby_sum=["REAL"]
+            )
 
             return json.dumps(
                 {
                     "ENSEMBLE": self._ensemble_name,
-                    "data": data.groupby("REAL")
-                    .sum()
-                    .reset_index()[["REAL", response]]
-                    .values.tolist(),
+                    "data": data[["REAL", response]].values.tolist(),
                     "number_format": "#.4g",
                 }
             )
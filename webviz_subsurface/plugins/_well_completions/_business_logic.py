@@ -96,7 +96,7 @@ WellCompletionsDataModel {self.ensemble_name} {self.ensemble_path} {self.compdat
 
         if df_zone_layer.empty:
             if stratigraphy is None:
-                df["ZONE"] = df.agg(lambda x: f"Layer {x['K1']}", axis=1)
+                df["ZONE"] = "Layer " + df["K1"].astype(str)
                 df["COLOR"] = np.nan
             else:
                 raise ValueError(
@@ -209,59 +209,61 @@ def get_kh_unit(ensemble_path: str) -> Tuple[str, int]:
     return ("", 2)
 
 
-def get_time_series(df: pd.DataFrame, time_steps: list) -> tuple:
-    """Create two lists with values for each time step
-    * the first one is on the form [0,0,0,1,1,1,1,-1,-1,-1] where '0' means no event,\
-    '1' is open, '-1' is shut.
-    * the second is with sum of kh values for the open compdats in each zone
-
-    The input data frame is assumed to contain data for single well,
-    single zone and single realization.
-    """
-    if df.empty:
-        return [0] * len(time_steps), [0] * len(time_steps)
-
-    events, kh_values = [], []
-    event_value, kh_value = 0, 0
-    unique_dates = df.DATE.unique()
-
-    for timestep in time_steps:
-        if timestep in unique_dates:
-            df_timestep = df[df.DATE == timestep]
-            df_timestep_open = df_timestep[df_timestep["OP/SH"] == "OPEN"]
-
-            # if minimum one of the compdats for the zone is OPEN then the zone is considered open
-            event_value = 1 if not df_timestep_open.empty else -1
-            kh_value = df_timestep_open.KH.sum()
-
-        events.append(event_value)
-        kh_values.append(kh_value)
-    return events, kh_values
-
-
 def get_completion_events_and_kh(
-    df: pd.DataFrame, zone_names: list, time_steps: list
-) -> tuple:
-    """Extracts completion events ad kh values into two lists of lists of lists,
-    one with completions events and one with kh values
-    * Axis 0 is realization
-    * Axis 1 is zone
-    * Axis 2 is time step
+    real_codes: np.ndarray,
+    zone_codes: np.ndarray,
+    time_codes: np.ndarray,
+    is_open: np.ndarray,
+    kh: np.ndarray,
+    num_zones: int,
+    num_time_steps: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Extracts completion events and kh values for a single well into two arrays
+    with shape (realizations, zones, time steps). The input arrays have one entry per
+    compdat row, where the codes are the indices along each of the axes.
+
+    The events are '0' for no event, '1' for open and '-1' for shut. A zone is
+    considered open at a time step if at least one of the compdats for the zone is
+    OPEN, and the kh value is then the sum of kh for the open compdats. The values are
+    carried forward to the following time steps without data for the zone.
     """
-    compl_events, kh_values = [], []
-    for _, realdata in df.groupby("REAL"):
-        compl_events_real, kh_real = [], []
-        for zone_name in zone_names:
-            zone_data = realdata[realdata.ZONE == zone_name]
-            compl_events_real_zone, kh_real_zone = get_time_series(
-                zone_data, time_steps
-            )
-            compl_events_real.append(compl_events_real_zone)
-            kh_real.append(kh_real_zone)
-
-        compl_events.append(compl_events_real)
-        kh_values.append(kh_real)
-    return compl_events, kh_values
+    # pylint: disable=too-many-locals
+    num_reals = int(real_codes.max()) + 1 if len(real_codes) > 0 else 0
+    num_series = num_reals * num_zones
+
+    # Aggregate the compdat rows per realization, zone and time step. The unique index
+    # is sorted, so the events of each (realization, zone) series are consecutive
+    flat_index = (real_codes * num_zones + zone_codes) * num_time_steps + time_codes
+    event_flat_index, inverse = np.unique(flat_index, return_inverse=True)
+    open_count = np.bincount(inverse, weights=is_open.astype(np.float64))
+    kh_open_sum = np.bincount(inverse, weights=np.where(is_open, kh, 0.0))
+
+    # Lookup tables where entry 0 is used before the first event of a series
+    event_lut = np.concatenate(([0], np.where(open_count > 0, 1, -1))).astype(np.int8)
+    kh_lut = np.concatenate(([0.0], kh_open_sum))
+
+    # Forward fill along time, by doing a cumulative sum of the change in event
+    # number (1-based), which is reset to 0 at the start of each series
+    event_num = np.arange(1, len(event_flat_index) + 1, dtype=np.int32)
+    event_series = event_flat_index // num_time_steps
+    is_first_in_series = np.ones(len(event_series), dtype=bool)
+    is_first_in_series[1:] = event_series[1:] != event_series[:-1]
+    is_last_in_series = np.roll(is_first_in_series, -1)
+
+    event_num_diff = np.zeros(num_series * num_time_steps, dtype=np.int32)
+    event_num_diff[event_flat_index] = np.where(is_first_in_series, event_num, 1)
+    reset_index = (event_series[is_last_in_series] + 1) * num_time_steps
+    is_valid_reset = reset_index < len(event_num_diff)
+    event_num_diff[reset_index[is_valid_reset]] -= event_num[is_last_in_series][
+        is_valid_reset
+    ]
+    filled_event_num = np.cumsum(event_num_diff, dtype=np.int32)
+
+    events = event_lut[filled_event_num]
+    kh_values = kh_lut[filled_event_num]
+
+    shape = (num_reals, num_zones, num_time_steps)
+    return events.reshape(shape), kh_values.reshape(shape)
 
 
 def format_time_series(
@@ -288,58 +290,43 @@ def format_time_series(
         khMean: [600, 1500]
     }
     """
-    output: Dict[str, list] = {
-        "t": [],
-        "open": [],
-        "shut": [],
-        "khMean": [],
-        "khMin": [],
-        "khMax": [],
+    open_arr = np.asarray(open_frac)
+    shut_arr = np.asarray(shut_frac)
+
+    # Only keep the time steps where the values change
+    prev_open_arr = np.concatenate(([0.0], open_arr[:-1]))
+    prev_shut_arr = np.concatenate(([0.0], shut_arr[:-1]))
+    change_idx = np.flatnonzero(
+        (open_arr != prev_open_arr) | (shut_arr != prev_shut_arr)
+    )
+
+    return {
+        "t": change_idx.tolist(),
+        "open": open_arr[change_idx].tolist(),
+        "shut": shut_arr[change_idx].tolist(),
+        "khMean": np.asarray(kh_mean)[change_idx].tolist(),
+        "khMin": np.asarray(kh_min)[change_idx].tolist(),
+        "khMax": np.asarray(kh_max)[change_idx].tolist(),
     }
-    prev_open_val = prev_shut_val = 0.0
-
-    for i, _ in enumerate(open_frac):
-        open_val = open_frac[i]
-        shut_val = shut_frac[i]
-        if open_val != prev_open_val or shut_val != prev_shut_val:
-            output["t"].append(i)
-            output["open"].append(open_val)
-            output["shut"].append(shut_val)
-            output["khMean"].append(kh_mean[i])
-            output["khMin"].append(kh_min[i])
-            output["khMax"].append(kh_max[i])
-        prev_open_val = open_val
-        prev_shut_val = shut_val
-    return output
 
 
 def calc_over_realizations(
-    compl_events: list, kh_values: list, realizations: list
+    compl_events: np.ndarray, kh_values: np.ndarray, realizations: list
 ) -> tuple:
-    """Takes in two three dimensional lists where the levels are: 1. realization \
+    """Takes in two three dimensional arrays where the axes are: 1. realization \
     2. zones and 3. timesteps
 
-    Returns two dimensional lists where calculations have been done over the \
-    realization level.
+    Returns two dimensional arrays where calculations have been done over the \
+    realization axis.
     """
-    # calculate fraction of open realizations
-    open_count = np.maximum(np.asarray(compl_events), 0)  # remove -1
-    open_count_reduced = open_count.sum(axis=0)  # sum over realizations
-    open_frac = (
-        np.asarray(open_count_reduced, dtype=np.float64) / float(len(realizations))
-    ).round(decimals=3)
-
-    # calculate fraction of shut realizations
-    shut_count = (
-        np.minimum(np.asarray(compl_events), 0) * -1
-    )  # remove +1 and convert -1 to 1
-    shut_count_reduced = shut_count.sum(axis=0)  # sum over realizations
-    shut_frac = (
-        np.asarray(shut_count_reduced, dtype=np.float64) / float(len(realizations))
-    ).round(decimals=3)
+    # calculate fraction of open and shut realizations
+    open_count_reduced = np.count_nonzero(compl_events == 1, axis=0)
+    open_frac = (open_count_reduced / float(len(realizations))).round(decimals=3)
+    shut_count_reduced = np.count_nonzero(compl_events == -1, axis=0)
+    shut_frac = (shut_count_reduced / float(len(realizations))).round(decimals=3)
 
     # calculate khMean, khMin and khMax
-    np_kh_values = np.asarray(kh_values)
+    np_kh_values = np.asarray(kh_values, dtype=np.float64)
     kh_mean = (np_kh_values.sum(axis=0) / float(len(realizations))).round(decimals=2)
     kh_min = np_kh_values.min(axis=0).round(decimals=2)
     kh_max = np_kh_values.max(axis=0).round(decimals=2)
@@ -348,30 +335,32 @@ def calc_over_realizations(
 
 
 def extract_well(
-    df: pd.DataFrame, well: str, zone_names: list, time_steps: list, realizations: list
+    well: str,
+    compl_events: np.ndarray,
+    kh_values: np.ndarray,
+    zone_names: list,
+    realizations: list,
 ) -> Dict[str, Any]:
-    # pylint: disable=too-many-locals
-    """Extract completion events and kh values for a single well"""
+    """Extract completion time series per zone for a single well, from the completion
+    events and kh values with shape (realizations, zones, time steps)"""
     well_dict: Dict[str, Any] = {}
     well_dict["name"] = well
 
-    compl_events, kh_values = get_completion_events_and_kh(df, zone_names, time_steps)
     open_frac, shut_frac, kh_mean, kh_min, kh_max = calc_over_realizations(
         compl_events, kh_values, realizations
     )
+
+    # Only include the zones that are open or shut at some time step
+    active_zones = (open_frac != 0.0).any(axis=1) | (shut_frac != 0.0).any(axis=1)
     result = {}
-    for (
-        zone_name,
-        open_frac_zone,
-        shut_frac_zone,
-        kh_mean_zone,
-        kh_min_zone,
-        kh_max_zone,
-    ) in zip(zone_names, open_frac, shut_frac, kh_mean, kh_min, kh_max):
-        if sum(open_frac_zone) != 0.0 or sum(shut_frac_zone) != 0.0:
-            result[zone_name] = format_time_series(
-                open_frac_zone, shut_frac_zone, kh_mean_zone, kh_min_zone, kh_max_zone
-            )
+    for zone_idx in np.flatnonzero(active_zones):
+        result[zone_names[zone_idx]] = format_time_series(
+            open_frac[zone_idx],
+            shut_frac[zone_idx],
+            kh_mean[zone_idx],
+            kh_min[zone_idx],
+            kh_max[zone_idx],
+        )
     well_dict["completions"] = result
     return well_dict
 
@@ -384,10 +373,49 @@ def extract_wells(
     well_attributes: Optional[dict],
 ) -> List[Dict]:
     """Generates the wells part of the input dictionary to the WellCompletions component"""
+    # pylint: disable=too-many-locals
+
+    # Encode all the rows up front, so that each well is just a slice of the arrays
+    well_codes, well_names = pd.factorize(df["WELL"], sort=True)
+    zone_codes = pd.Index(zone_names).get_indexer(df["ZONE"])
+    time_codes = pd.Index(time_steps).get_indexer(df["DATE"])
+    is_open = (df["OP/SH"] == "OPEN").to_numpy()
+    kh = np.nan_to_num(df["KH"].to_numpy(dtype=np.float64))
+    real_arr = df["REAL"].to_numpy()
+
+    sort_order = np.argsort(well_codes, kind="stable")
+    well_start_indices = np.searchsorted(
+        well_codes[sort_order], np.arange(len(well_names) + 1)
+    )
+
     well_list = []
-    for well_name, well_group in df.groupby("WELL"):
+    for well_idx, well_name in enumerate(well_names):
+        rows = sort_order[
+            well_start_indices[well_idx] : well_start_indices[well_idx + 1]
+        ]
+
+        # Only the realizations where the well is present are included, and only
+        # the zones with compdat data since other zones are never open or shut
+        _, well_real_codes = np.unique(real_arr[rows], return_inverse=True)
+        well_zone_indices, well_zone_codes = np.unique(
+            zone_codes[rows], return_inverse=True
+        )
+        compl_events, kh_values = get_completion_events_and_kh(
+            well_real_codes,
+            well_zone_codes,
+            time_codes[rows],
+            is_open[rows],
+            kh[rows],
+            len(well_zone_indices),
+            len(time_steps),
+        )
+
         well_data = extract_well(
-            well_group, well_name, zone_names, time_steps, realizations
+            well_name,
+            compl_events,
+            kh_values,
+            [zone_names[zone_idx] for zone_idx in well_zone_indices],
+            realizations,
         )
         well_data["attributes"] = (
             well_attributes[well_name]
@@ -0,0 +1,158 @@
+import json
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from webviz_subsurface.plugins._well_completions._business_logic import (
+    calc_over_realizations,
+    extract_wells,
+    format_time_series,
+)
+
+
+def _create_compdat_df(
+    num_wells: int, num_zones: int, num_time_steps: int, num_reals: int
+) -> pd.DataFrame:
+    """Synthetic compdat data, where each well penetrates a range of zones with
+    connections that are opened and shut at random time steps"""
+    rng = np.random.default_rng(seed=0)
+    all_dates = np.array(
+        [
+            dte.date()
+            for dte in pd.date_range("2020-01-01", periods=num_time_steps, freq="MS")
+        ]
+    )
+
+    well_first_zone = rng.integers(0, num_zones, num_wells)
+    well_num_zones = rng.integers(1, min(10, num_zones) + 1, num_wells)
+
+    frames = []
+    for real in range(num_reals):
+        num_rows = num_wells * num_zones * 4
+        well_idx = rng.integers(0, num_wells, num_rows)
+        zone_idx = np.minimum(
+            well_first_zone[well_idx] + rng.integers(0, well_num_zones[well_idx]),
+            num_zones - 1,
+        )
+        frames.append(
+            pd.DataFrame(
+                {
+                    "REAL": real,
+                    "DATE": all_dates[rng.integers(0, num_time_steps, num_rows)],
+                    "WELL": [f"W{i}" for i in well_idx],
+                    "ZONE": [f"Zone{i}" for i in zone_idx],
+                    "OP/SH": rng.choice(["OPEN", "SHUT"], num_rows, p=[0.7, 0.3]),
+                    "KH": rng.random(num_rows) * 1000,
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+def _get_time_series_reference(df: pd.DataFrame, time_steps: list) -> tuple:
+    # Time series for a single well, zone and realization, the way it was
+    # implemented before vectorizing
+    if df.empty:
+        return [0] * len(time_steps), [0] * len(time_steps)
+
+    events, kh_values = [], []
+    event_value, kh_value = 0, 0
+    unique_dates = df.DATE.unique()
+
+    for timestep in time_steps:
+        if timestep in unique_dates:
+            df_timestep = df[df.DATE == timestep]
+            df_timestep_open = df_timestep[df_timestep["OP/SH"] == "OPEN"]
+            event_value = 1 if not df_timestep_open.empty else -1
+            kh_value = df_timestep_open.KH.sum()
+
+        events.append(event_value)
+        kh_values.append(kh_value)
+    return events, kh_values
+
+
+def _extract_wells_reference(
+    df: pd.DataFrame, zone_names: list, time_steps: list, realizations: list
+) -> List[Dict[str, Any]]:
+    # pylint: disable=too-many-locals
+    well_list = []
+    for well_name, well_df in df.groupby("WELL"):
+        compl_events, kh_values = [], []
+        for _, realdata in well_df.groupby("REAL"):
+            compl_events_real, kh_real = [], []
+            for zone_name in zone_names:
+                events, kh = _get_time_series_reference(
+                    realdata[realdata.ZONE == zone_name], time_steps
+                )
+                compl_events_real.append(events)
+                kh_real.append(kh)
+            compl_events.append(compl_events_real)
+            kh_values.append(kh_real)
+
+        open_frac, shut_frac, kh_mean, kh_min, kh_max = calc_over_realizations(
+            np.asarray(compl_events), np.asarray(kh_values), realizations
+        )
+        completions = {}
+        for zone_idx, zone_name in enumerate(zone_names):
+            if sum(open_frac[zone_idx]) != 0.0 or sum(shut_frac[zone_idx]) != 0.0:
+                completions[zone_name] = format_time_series(
+                    open_frac[zone_idx],
+                    shut_frac[zone_idx],
+                    kh_mean[zone_idx],
+                    kh_min[zone_idx],
+                    kh_max[zone_idx],
+                )
+        well_list.append(
+            {"name": well_name, "completions": completions, "attributes": {}}
+        )
+    return well_list
+
+
+def _time_s(func: Callable, *args: Any) -> Tuple[float, Any]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    print()
+    print("## Running WellCompletions performance tests")
+    print("## =================================================")
+
+    # (wells, zones, time steps, realizations)
+    sizes = [(10, 5, 50, 5), (50, 20, 100, 20), (300, 40, 500, 100)]
+    for num_wells, num_zones, num_time_steps, num_reals in sizes:
+        df = _create_compdat_df(num_wells, num_zones, num_time_steps, num_reals)
+        zone_names = [f"Zone{i}" for i in range(num_zones)]
+        time_steps = sorted(df.DATE.unique())
+        realizations = sorted(df.REAL.unique())
+
+        print()
+        print(
+            f"## wells={num_wells} zones={num_zones} time_steps={num_time_steps} "
+            f"reals={num_reals}, #rows={len(df)}"
+        )
+
+        vectorized_s, result = _time_s(
+            extract_wells, df, zone_names, time_steps, realizations, None
+        )
+        print(f"## vectorized:  {vectorized_s:.2f}s")
+
+        # The reference implementation takes minutes for the largest case
+        if num_wells * num_zones * num_time_steps * num_reals <= 10_000_000:
+            ref_s, ref_result = _time_s(
+                _extract_wells_reference, df, zone_names, time_steps, realizations
+            )
+            print(
+                f"## reference:   {ref_s:.2f}s  speedup: {ref_s / vectorized_s:.1f}x  "
+                f"identical: {json.dumps(result) == json.dumps(ref_result)}"
+            )
+
+
+# Running:
+#   python -m webviz_subsurface.plugins._well_completions.dev_well_completions_perf_testing
+# -------------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
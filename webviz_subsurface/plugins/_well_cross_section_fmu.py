@@ -23,6 +23,7 @@ from .._datainput.fmu_input import get_realizations
 from .._datainput.seismic import load_cube_data
 from .._datainput.well import load_well
 from .._datainput.xsection import XSectionFigure
+from .._utils.binary_surface import surface_dict_from_bytes, surface_dict_to_bytes
 
 
 # pylint: disable=too-many-instance-attributes
@@ -655,16 +656,16 @@ def calculate_surface_statistics(
     ]
     surfaces = get_surfaces(fns)
     return io.BytesIO(
-        json.dumps(
+        surface_dict_to_bytes(
             {
-                "mean": surface_to_json(surfaces.apply(np.nanmean, axis=0)),
-                "maximum": surface_to_json(surfaces.apply(np.nanmax, axis=0)),
-                "minimum": surface_to_json(surfaces.apply(np.nanmin, axis=0)),
-                "p10": surface_to_json(surfaces.apply(np.nanpercentile, 10, axis=0)),
-                "p90": surface_to_json(surfaces.apply(np.nanpercentile, 90, axis=0)),
-                "stddev": surface_to_json(surfaces.apply(np.nanstd, axis=0)),
+                "mean": surfaces.apply(np.nanmean, axis=0),
+                "maximum": surfaces.apply(np.nanmax, axis=0),
+                "minimum": surfaces.apply(np.nanmin, axis=0),
+                "p10": surfaces.apply(np.nanpercentile, 10, axis=0),
+                "p90": surfaces.apply(np.nanpercentile, 90, axis=0),
+                "stddev": surfaces.apply(np.nanstd, axis=0),
             }
-        ).encode()
+        )
     )
 
 
@@ -672,35 +673,11 @@ def calculate_surface_statistics(
 def get_surface_statistics(
     realdf_dict: list, ensemble: str, surfacefile: str, surfacefolder: Path
 ) -> Dict[str, xtgeo.RegularSurface]:
-    surfaces = json.load(
-        calculate_surface_statistics(realdf_dict, ensemble, surfacefile, surfacefolder)
+    return surface_dict_from_bytes(
+        calculate_surface_statistics(
+            realdf_dict, ensemble, surfacefile, surfacefolder
+        ).getbuffer()
     )
-    return {
-        statistic: surface_from_json(surface) for statistic, surface in surfaces.items()
-    }
-
-
-def surface_to_json(surface: xtgeo.RegularSurface) -> str:
-    return json.dumps(
-        {
-            "ncol": surface.ncol,
-            "nrow": surface.nrow,
-            "xori": surface.xori,
-            "yori": surface.yori,
-            "rotation": surface.rotation,
-            "xinc": surface.xinc,
-            "yinc": surface.yinc,
-            "values": surface.values.copy().filled(np.nan).tolist(),
-        }
-    )
-
-
-def surface_from_json(surfaceobj: Union[str, bytes]) -> xtgeo.RegularSurface:
-    # See https://github.com/equinor/xtgeo/issues/405
-    data = json.loads(surfaceobj)
-    surface = xtgeo.RegularSurface(**data)
-    surface.values = np.array(data["values"])
-    return surface
 
 
 @CACHE.memoize(timeout=CACHE.TIMEOUT)
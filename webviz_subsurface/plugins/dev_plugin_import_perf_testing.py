@@ -0,0 +1,62 @@
+import subprocess
+import sys
+from typing import List, Tuple
+
+from webviz_subsurface.plugins import _PLUGIN_MODULES
+
+# Each measurement is done in a fresh interpreter, so that modules imported by one
+# plugin do not hide the import cost of the next one
+_IMPORT_TIMING_CODE = """
+import time
+start = time.perf_counter()
+import webviz_subsurface.plugins as plugins
+package_done = time.perf_counter()
+{plugin_access}
+end = time.perf_counter()
+print(round((package_done - start) * 1000), round((end - package_done) * 1000))
+"""
+
+
+def _time_import_ms(plugin_names: List[str]) -> Tuple[int, int]:
+    """Returns time in ms for importing the plugins package, and for then accessing
+    the specified plugin classes"""
+    plugin_access = "\n".join(f"plugins.{name}" for name in plugin_names)
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_TIMING_CODE.format(plugin_access=plugin_access)],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+    package_ms, plugins_ms = output.split()[-2:]
+    return int(package_ms), int(plugins_ms)
+
+
+def main() -> None:
+    print()
+    print("## Running plugin import performance tests")
+    print("## =================================================")
+
+    # Warm up the OS file cache so the first measurement is not penalized
+    _time_import_ms([])
+
+    package_ms, _ = _time_import_ms([])
+    print(f"## import webviz_subsurface.plugins: {package_ms}ms")
+    _, all_plugins_ms = _time_import_ms(list(_PLUGIN_MODULES))
+    print(f"## access of all plugins:            {all_plugins_ms}ms")
+    print()
+
+    results: List[Tuple[str, int]] = []
+    for plugin_name in _PLUGIN_MODULES:
+        _, plugin_ms = _time_import_ms([plugin_name])
+        results.append((plugin_name, plugin_ms))
+
+    print("## Import time per plugin (after importing the plugins package):")
+    for plugin_name, plugin_ms in sorted(results, key=lambda x: x[1], reverse=True):
+        print(f"## {plugin_name:40} {plugin_ms:6}ms")
+
+
+# Running:
+#   python -m webviz_subsurface.plugins.dev_plugin_import_perf_testing
+# -------------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,14 @@ import argparse
 import glob
 import logging
 import os
+import sys
+import time
+import uuid
 import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
+from typing import List, Optional, Sequence
 
 import ecl2df
 
@@ -40,10 +46,47 @@ def _get_parser() -> argparse.ArgumentParser:
         help="Eclipse base name",
         default=Path("eclipse/model/*.UNSMRY"),
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of files to convert in parallel, using one process per job",
+        default=1,
+    )
+    parser.add_argument(
+        "--column-keys",
+        action="append",
+        help="Summary vector to include, wildcards are allowed (default: all vectors). "
+        "Repeat the option to include multiple vectors, e.g. "
+        "--column-keys FOPT --column-keys 'WOPR:*'. "
+        "Note that existing output files are not checked against these keys, "
+        "so use --force when changing them",
+        default=None,
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Convert all files, even if the output file is newer than its input",
+    )
     return parser
 
 
-def _convert_single_smry_file(smry_filename: str, arrow_filename: str) -> None:
+@dataclass(frozen=True)
+class _ConversionJob:
+    smry_file: str
+    arrow_file: str
+
+
+@dataclass(frozen=True)
+class _ConversionResult:
+    job: _ConversionJob
+    status: str  # One of "converted", "skipped" or "failed"
+    elapsed_s: float
+    error: Optional[str] = None
+
+
+def _convert_single_smry_file(
+    smry_filename: str, arrow_filename: str, column_keys: Optional[Sequence[str]]
+) -> None:
     """Read summary data for single realization from disk and write it out to .arrow
     file using ecl2df.
     """
@@ -53,21 +96,71 @@ def _convert_single_smry_file(smry_filename: str, arrow_filename: str) -> None:
     )
 
     eclfiles = ecl2df.EclFiles(eclbase)
-    sum_df = ecl2df.summary.df(eclfiles)
+    sum_df = ecl2df.summary.df(
+        eclfiles, column_keys=list(column_keys) if column_keys else None
+    )
 
     # Slight hack here, using ecl2df protected function to gain access to conversion routine
     # pylint: disable=protected-access
     sum_table = ecl2df.summary._df2pyarrow(sum_df)
 
-    ecl2df.summary.write_dframe_stdout_file(sum_table, arrow_filename)
+    # Write to a temporary file first so that an interrupted conversion never leaves
+    # a truncated output file that would be considered up to date by later runs
+    tmp_arrow_filename = f"{arrow_filename}.{uuid.uuid4().hex}.tmp"
+    try:
+        ecl2df.summary.write_dframe_stdout_file(sum_table, tmp_arrow_filename)
+        os.replace(tmp_arrow_filename, arrow_filename)
+    finally:
+        if os.path.exists(tmp_arrow_filename):
+            os.remove(tmp_arrow_filename)
 
 
-def _batch_convert_smry2arrow(
+def _is_output_up_to_date(smry_filename: str, arrow_filename: str) -> bool:
+    """The output is considered up to date if it is non-empty and newer than both
+    the UNSMRY and SMSPEC input files"""
+
+    try:
+        arrow_stat = os.stat(arrow_filename)
+    except FileNotFoundError:
+        return False
+
+    if arrow_stat.st_size == 0:
+        return False
+
+    smry_stem = os.path.splitext(smry_filename)[0]
+    for input_filename in [smry_stem + ".UNSMRY", smry_stem + ".SMSPEC"]:
+        if not os.path.exists(input_filename):
+            continue
+        if os.stat(input_filename).st_mtime_ns > arrow_stat.st_mtime_ns:
+            return False
+
+    return True
+
+
+def _run_conversion_job(
+    job: _ConversionJob, column_keys: Optional[Sequence[str]], force: bool
+) -> _ConversionResult:
+    start_s = time.perf_counter()
+
+    if not force and _is_output_up_to_date(job.smry_file, job.arrow_file):
+        return _ConversionResult(job, "skipped", time.perf_counter() - start_s)
+
+    try:
+        _convert_single_smry_file(job.smry_file, job.arrow_file, column_keys)
+    except Exception as exc:  # pylint: disable=broad-except
+        return _ConversionResult(
+            job, "failed", time.perf_counter() - start_s, error=repr(exc)
+        )
+
+    return _ConversionResult(job, "converted", time.perf_counter() - start_s)
+
+
+def _find_conversion_jobs(
     ens_path: Path, ecl_base: Path, relative_output_dir: Path
-) -> None:
-    """Does batch conversion of UNSMRY files for all realizations within an ensemble."""
+) -> List[_ConversionJob]:
     globbed_real_dirs = sorted(glob.glob(str(ens_path)))
 
+    jobs: List[_ConversionJob] = []
     for real_dir in globbed_real_dirs:
         glob_expr = str(Path(real_dir) / ecl_base)
         globbed_smry_files = sorted(glob.glob(glob_expr))
@@ -78,10 +171,75 @@ def _batch_convert_smry2arrow(
             for smry_file in globbed_smry_files:
                 basename_without_ext = Path(Path(smry_file).name).stem
                 arrow_file = real_output_dir / (basename_without_ext + ".arrow")
+                jobs.append(_ConversionJob(smry_file, str(arrow_file)))
+
+    return jobs
+
 
-                logger.info(f"input(smry):   {smry_file}")
-                logger.info(f"output(arrow): {arrow_file}")
-                _convert_single_smry_file(smry_file, str(arrow_file))
+def _batch_convert_smry2arrow(
+    ens_path: Path,
+    ecl_base: Path,
+    relative_output_dir: Path,
+    column_keys: Optional[Sequence[str]] = None,
+    num_jobs: int = 1,
+    force: bool = False,
+) -> List[_ConversionResult]:
+    """Does batch conversion of UNSMRY files for all realizations within an ensemble."""
+
+    jobs = _find_conversion_jobs(ens_path, ecl_base, relative_output_dir)
+    logger.info(f"Found {len(jobs)} summary files to process")
+
+    results: List[_ConversionResult] = []
+
+    def _log_result(result: _ConversionResult) -> None:
+        logger.info(
+            f"[{len(results)}/{len(jobs)}] {result.status} in {result.elapsed_s:.2f}s: "
+            f"{result.job.smry_file} -> {result.job.arrow_file}"
+        )
+        if result.error:
+            logger.error(f"Conversion of {result.job.smry_file} failed: {result.error}")
+
+    if num_jobs <= 1:
+        for job in jobs:
+            results.append(_run_conversion_job(job, column_keys, force))
+            _log_result(results[-1])
+    else:
+        with ProcessPoolExecutor(max_workers=num_jobs) as executor:
+            futures = [
+                executor.submit(_run_conversion_job, job, column_keys, force)
+                for job in jobs
+            ]
+            for future in as_completed(futures):
+                results.append(future.result())
+                _log_result(results[-1])
+
+    return results
+
+
+def _log_run_summary(results: List[_ConversionResult], elapsed_s: float) -> None:
+    converted = [res for res in results if res.status == "converted"]
+    skipped = [res for res in results if res.status == "skipped"]
+    failed = [res for res in results if res.status == "failed"]
+
+    logger.info(
+        f"Processed {len(results)} files in {elapsed_s:.2f}s "
+        f"(converted={len(converted)}, skipped={len(skipped)}, failed={len(failed)})"
+    )
+
+    if converted:
+        conversion_times = sorted(res.elapsed_s for res in converted)
+        logger.info(
+            f"Per file conversion time: "
+            f"min={conversion_times[0]:.2f}s, "
+            f"median={conversion_times[len(conversion_times) // 2]:.2f}s, "
+            f"max={conversion_times[-1]:.2f}s, "
+            f"total={sum(conversion_times):.2f}s"
+        )
+        for res in sorted(converted, key=lambda res: res.elapsed_s, reverse=True)[:5]:
+            logger.info(f"  {res.elapsed_s:.2f}s: {res.job.smry_file}")
+
+    for res in failed:
+        logger.error(f"Failed: {res.job.smry_file}: {res.error}")
 
 
 def main() -> None:
@@ -114,11 +272,25 @@ def main() -> None:
 
     logger.info(f"enspath: {enspath}")
     logger.info(f"eclbase: {eclbase}")
-
-    _batch_convert_smry2arrow(enspath, Path(eclbase), relative_output_dir)
+    logger.info(f"jobs: {args.jobs}")
+    logger.info(f"column_keys: {args.column_keys}")
+
+    start_s = time.perf_counter()
+    results = _batch_convert_smry2arrow(
+        enspath,
+        Path(eclbase),
+        relative_output_dir,
+        column_keys=args.column_keys,
+        num_jobs=args.jobs,
+        force=args.force,
+    )
+    _log_run_summary(results, time.perf_counter() - start_s)
 
     logger.info("done")
 
+    if any(res.status == "failed" for res in results):
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)